@@ -0,0 +1,202 @@
+// Unity 배치 모드 자동 처리
+// Tools/unity_cli.py, Tools/build_manager.py에서 다음과 같이 호출됩니다:
+//   Unity.exe -batchmode -quit -projectPath <경로>
+//             -executeMethod Dannect.Toolkit.Editor.BatchProcessor.ProcessBatch
+//             -dannectTasks refresh,validate,configure-webgl,build-webgl
+//             [-dannectBuildJob <작업파일.json>] [-dannectTaskResults <결과파일.json>]
+// 하나의 Unity 실행에서 배치 처리와 WebGL 빌드를 순서대로 수행할 수 있습니다.
+// 패키지 Editor 어셈블리에 고정되어 있으므로 프로젝트 Assets 폴더에 스크립트를 생성하지 않습니다.
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using UnityEditor;
+using UnityEditor.Build.Reporting;
+using UnityEngine;
+using Debug = UnityEngine.Debug;
+
+namespace Dannect.Toolkit.Editor
+{
+    public static class BatchProcessor
+    {
+        // -dannectTasks가 없을 때 실행할 기본 작업 순서
+        public const string DefaultTasks = "refresh,validate,refresh,save";
+
+        // 작업 이름 -> 실행 함수 (성공 여부 반환)
+        private static readonly Dictionary<string, Func<bool>> Tasks = new Dictionary<string, Func<bool>>(StringComparer.OrdinalIgnoreCase)
+        {
+            { "refresh", RefreshAssetDatabase },
+            { "validate", ValidateProjectSettings },
+            { "save", SaveAssets },
+            { "configure-webgl", ConfigureWebGL },
+            { "build-webgl", BuildWebGL },
+        };
+
+        // WebGL 작업에서 공유하는 빌드 설정 (-dannectBuildJob, 최초 사용 시 로드)
+        private static WebGLBuildJob buildJob;
+
+        [Serializable]
+        public class TaskResult
+        {
+            public string name;
+            public string status;  // Succeeded, Failed, Skipped
+            public float seconds;
+            public string message = "";
+        }
+
+        [Serializable]
+        public class TaskResultList
+        {
+            public List<TaskResult> tasks = new List<TaskResult>();
+        }
+
+        [MenuItem("Tools/Process Batch")]
+        public static void ProcessBatch()
+        {
+            Debug.Log("=== 배치 처리 시작 ===");
+
+            string taskList = CommandLineArgs.GetValue("-dannectTasks");
+            if (string.IsNullOrEmpty(taskList))
+            {
+                taskList = DefaultTasks;
+            }
+
+            buildJob = null;
+            TaskResultList results = new TaskResultList();
+            bool failed = false;
+
+            foreach (string rawName in taskList.Split(','))
+            {
+                string taskName = rawName.Trim();
+                if (taskName.Length == 0)
+                {
+                    continue;
+                }
+
+                TaskResult result = new TaskResult { name = taskName };
+                results.tasks.Add(result);
+
+                // 앞선 작업이 실패하면 나머지 작업은 건너뜀
+                if (failed)
+                {
+                    result.status = "Skipped";
+                    Debug.Log("[DannectTask] " + taskName + ": Skipped");
+                    continue;
+                }
+
+                Func<bool> task;
+                if (!Tasks.TryGetValue(taskName, out task))
+                {
+                    Debug.LogError("알 수 없는 배치 작업: " + taskName);
+                    result.status = "Failed";
+                    result.message = "Unknown task";
+                    failed = true;
+                    continue;
+                }
+
+                Debug.Log("▶ 배치 작업 실행: " + taskName);
+                Stopwatch stopwatch = Stopwatch.StartNew();
+                try
+                {
+                    result.status = task() ? "Succeeded" : "Failed";
+                }
+                catch (Exception e)
+                {
+                    Debug.LogError("❌ 배치 작업 예외 (" + taskName + "): " + e.Message);
+                    result.status = "Failed";
+                    result.message = e.Message;
+                }
+                stopwatch.Stop();
+                result.seconds = (float)stopwatch.Elapsed.TotalSeconds;
+                failed = result.status == "Failed";
+
+                Debug.Log("[DannectTask] " + taskName + ": " + result.status + " (" + result.seconds.ToString("0.00") + "s)");
+            }
+
+            WriteTaskResults(results);
+
+            Debug.Log("=== 배치 처리 완료 ===");
+
+            if (failed && Application.isBatchMode)
+            {
+                EditorApplication.Exit(1);
+            }
+        }
+
+        private static void WriteTaskResults(TaskResultList results)
+        {
+            string resultPath = CommandLineArgs.GetValue("-dannectTaskResults");
+            if (string.IsNullOrEmpty(resultPath))
+            {
+                return;
+            }
+
+            try
+            {
+                string directory = Path.GetDirectoryName(resultPath);
+                if (!string.IsNullOrEmpty(directory))
+                {
+                    Directory.CreateDirectory(directory);
+                }
+                File.WriteAllText(resultPath, JsonUtility.ToJson(results, true));
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning("⚠️ 배치 작업 결과 저장 실패: " + e.Message);
+            }
+        }
+
+        private static WebGLBuildJob GetBuildJob()
+        {
+            if (buildJob == null)
+            {
+                buildJob = WebGLBuildJob.FromCommandLine();
+            }
+            return buildJob;
+        }
+
+        private static bool RefreshAssetDatabase()
+        {
+            // 패키지 임포트 및 Asset Database 갱신
+            AssetDatabase.Refresh();
+            return true;
+        }
+
+        private static bool SaveAssets()
+        {
+            AssetDatabase.SaveAssets();
+            return true;
+        }
+
+        private static bool ConfigureWebGL()
+        {
+            WebGLBuilder.ConfigureWebGLPlayerSettings(GetBuildJob());
+            return true;
+        }
+
+        private static bool BuildWebGL()
+        {
+            BuildReport report = WebGLBuilder.Build(GetBuildJob());
+            return report != null && report.summary.result == BuildResult.Succeeded;
+        }
+
+        public static bool ValidateProjectSettings()
+        {
+            Debug.Log("프로젝트 설정 검증 중...");
+
+            // 기본 프로젝트 설정 확인
+            if (string.IsNullOrEmpty(PlayerSettings.productName))
+            {
+                Debug.LogWarning("제품명이 설정되지 않았습니다.");
+            }
+
+            if (string.IsNullOrEmpty(PlayerSettings.companyName))
+            {
+                Debug.LogWarning("회사명이 설정되지 않았습니다.");
+            }
+
+            Debug.Log("프로젝트 설정 검증 완료");
+            return true;
+        }
+    }
+}
@@ -0,0 +1,189 @@
+// BuildReport를 JSON 파일로 저장
+// WebGLBuilder.Build가 빌드 직후 호출하며, Tools/build_report.py가 이 파일을 읽어
+// 로그를 분석하지 않고 빌드 결과를 검증하고 단계별 시간, 출력 파일 크기, 포함된 에셋 크기를 보고합니다.
+// 기본 저장 위치: <빌드 출력 폴더의 상위>/_Reports/<빌드 출력 폴더명>.json (작업 파일의 reportPath로 변경 가능)
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using UnityEditor.Build.Reporting;
+using UnityEngine;
+
+namespace Dannect.Toolkit.Editor
+{
+    public static class BuildReportWriter
+    {
+        // 보고서에 포함할 최대 메시지 / 에셋 수 (대형 프로젝트에서도 파일 크기를 일정하게 유지)
+        private const int MaxMessages = 200;
+        private const int MaxPackedAssets = 500;
+
+        [Serializable]
+        public class SummaryData
+        {
+            public string result;
+            public string platform;
+            public string outputPath;
+            public string buildStartedAt;
+            public string buildEndedAt;
+            public double totalSeconds;
+            public long totalSize;
+            public int totalErrors;
+            public int totalWarnings;
+            public string codeOptimization;
+        }
+
+        [Serializable]
+        public class StepData
+        {
+            public string name;
+            public int depth;
+            public double seconds;
+            public int messageCount;
+        }
+
+        [Serializable]
+        public class MessageData
+        {
+            public string type;  // Error, Exception, Warning
+            public string step;
+            public string content;
+        }
+
+        [Serializable]
+        public class FileData
+        {
+            public string path;
+            public string role;
+            public long size;
+        }
+
+        [Serializable]
+        public class PackedAssetData
+        {
+            public string sourceAssetPath;
+            public string type;
+            public long packedSize;
+        }
+
+        [Serializable]
+        public class ReportData
+        {
+            public int version = 1;
+            public SummaryData summary = new SummaryData();
+            public List<StepData> steps = new List<StepData>();
+            public List<MessageData> messages = new List<MessageData>();
+            public List<FileData> files = new List<FileData>();
+            public List<PackedAssetData> packedAssets = new List<PackedAssetData>();
+        }
+
+        public static string GetReportPath(WebGLBuildJob job)
+        {
+            if (!string.IsNullOrEmpty(job.reportPath))
+            {
+                return job.reportPath;
+            }
+
+            string outputPath = Path.GetFullPath(job.outputPath).TrimEnd(Path.DirectorySeparatorChar, Path.AltDirectorySeparatorChar);
+            string parent = Path.GetDirectoryName(outputPath);
+            return Path.Combine(parent, "_Reports", Path.GetFileName(outputPath) + ".json");
+        }
+
+        public static void Write(BuildReport report, WebGLBuildJob job)
+        {
+            string reportPath = GetReportPath(job);
+
+            try
+            {
+                ReportData data = Serialize(report, job);
+                Directory.CreateDirectory(Path.GetDirectoryName(reportPath));
+                File.WriteAllText(reportPath, JsonUtility.ToJson(data, true));
+                Debug.Log("📄 BuildReport 저장: " + reportPath);
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning("⚠️ BuildReport 저장 실패: " + e.Message);
+            }
+        }
+
+        private static ReportData Serialize(BuildReport report, WebGLBuildJob job)
+        {
+            ReportData data = new ReportData();
+
+            BuildSummary summary = report.summary;
+            data.summary.result = summary.result.ToString();
+            data.summary.platform = summary.platform.ToString();
+            data.summary.outputPath = summary.outputPath;
+            data.summary.buildStartedAt = summary.buildStartedAt.ToString("o");
+            data.summary.buildEndedAt = summary.buildEndedAt.ToString("o");
+            data.summary.totalSeconds = summary.totalTime.TotalSeconds;
+            data.summary.totalSize = (long)summary.totalSize;
+            data.summary.totalErrors = summary.totalErrors;
+            data.summary.totalWarnings = summary.totalWarnings;
+            data.summary.codeOptimization = job.codeOptimization;
+
+            // 빌드 단계별 소요 시간 및 에러/경고 메시지
+            foreach (BuildStep step in report.steps)
+            {
+                data.steps.Add(new StepData
+                {
+                    name = step.name,
+                    depth = step.depth,
+                    seconds = step.duration.TotalSeconds,
+                    messageCount = step.messages.Length
+                });
+
+                foreach (BuildStepMessage message in step.messages)
+                {
+                    if (message.type == LogType.Log || data.messages.Count >= MaxMessages)
+                    {
+                        continue;
+                    }
+                    data.messages.Add(new MessageData
+                    {
+                        type = message.type.ToString(),
+                        step = step.name,
+                        content = message.content
+                    });
+                }
+            }
+
+            // 출력 파일 (Unity 6: GetFiles)
+            foreach (BuildFile file in report.GetFiles())
+            {
+                data.files.Add(new FileData
+                {
+                    path = file.path,
+                    role = file.role,
+                    size = (long)file.size
+                });
+            }
+
+            // 빌드에 포함된 에셋 (원본 에셋별 합계, 큰 순서)
+            Dictionary<string, PackedAssetData> assets = new Dictionary<string, PackedAssetData>();
+            foreach (PackedAssets packed in report.packedAssets)
+            {
+                foreach (PackedAssetInfo info in packed.contents)
+                {
+                    string sourcePath = string.IsNullOrEmpty(info.sourceAssetPath) ? "(built-in)" : info.sourceAssetPath;
+                    PackedAssetData asset;
+                    if (!assets.TryGetValue(sourcePath, out asset))
+                    {
+                        asset = new PackedAssetData
+                        {
+                            sourceAssetPath = sourcePath,
+                            type = info.type != null ? info.type.Name : ""
+                        };
+                        assets.Add(sourcePath, asset);
+                    }
+                    asset.packedSize += (long)info.packedSize;
+                }
+            }
+            data.packedAssets = assets.Values
+                .OrderByDescending(asset => asset.packedSize)
+                .Take(MaxPackedAssets)
+                .ToList();
+
+            return data;
+        }
+    }
+}
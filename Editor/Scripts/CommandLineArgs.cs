@@ -0,0 +1,48 @@
+// Unity 배치 모드 명령행 인수 파서
+// Tools/*.py 자동화 도구가 전달하는 -dannectXxx 인수를 읽습니다.
+using System;
+
+namespace Dannect.Toolkit.Editor
+{
+    public static class CommandLineArgs
+    {
+        // 지정된 인수 바로 뒤의 값을 반환합니다 (없으면 null)
+        public static string GetValue(string name)
+        {
+            string[] args = Environment.GetCommandLineArgs();
+            for (int i = 0; i < args.Length - 1; i++)
+            {
+                if (string.Equals(args[i], name, StringComparison.OrdinalIgnoreCase))
+                {
+                    return args[i + 1];
+                }
+            }
+            return null;
+        }
+
+        // 정수 인수를 반환합니다 (없거나 잘못된 값이면 기본값)
+        public static int GetInt(string name, int defaultValue)
+        {
+            string value = GetValue(name);
+            int parsed;
+            if (!string.IsNullOrEmpty(value) && int.TryParse(value, out parsed))
+            {
+                return parsed;
+            }
+            return defaultValue;
+        }
+
+        // 플래그 인수가 존재하는지 확인합니다
+        public static bool HasFlag(string name)
+        {
+            foreach (string arg in Environment.GetCommandLineArgs())
+            {
+                if (string.Equals(arg, name, StringComparison.OrdinalIgnoreCase))
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+    }
+}
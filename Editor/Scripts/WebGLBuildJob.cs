@@ -0,0 +1,82 @@
+// WebGL 빌드 작업 설정
+// Tools/build_manager.py가 JSON 작업 파일(-dannectBuildJob)로 전달하며,
+// 개별 명령행 인수(-dannectOutputPath 등)가 있으면 JSON 값보다 우선합니다.
+using System;
+using System.IO;
+using UnityEngine;
+
+namespace Dannect.Toolkit.Editor
+{
+    [Serializable]
+    public class WebGLBuildJob
+    {
+        // 빌드 출력 경로 (비어있으면 프로젝트 폴더/Build/WebGL)
+        public string outputPath = "";
+
+        // Unity 6 WasmCodeOptimization: BuildTimes, RuntimeSpeed, RuntimeSpeedLTO, DiskSize, DiskSizeLTO
+        public string codeOptimization = "RuntimeSpeedLTO";
+
+        // Memory Settings (MB)
+        public int memorySize = 32;
+        public int maximumMemorySize = 2048;
+
+        // WebGLMemoryGrowthMode: None, Linear, Geometric
+        public string memoryGrowthMode = "Geometric";
+
+        // BuildReport JSON 저장 경로 (비어있으면 <출력 폴더의 상위>/_Reports/<출력 폴더명>.json)
+        public string reportPath = "";
+
+        public static WebGLBuildJob FromCommandLine()
+        {
+            WebGLBuildJob job = new WebGLBuildJob();
+
+            string jobFile = CommandLineArgs.GetValue("-dannectBuildJob");
+            if (!string.IsNullOrEmpty(jobFile))
+            {
+                if (File.Exists(jobFile))
+                {
+                    JsonUtility.FromJsonOverwrite(File.ReadAllText(jobFile), job);
+                    Debug.Log("📄 빌드 작업 파일 로드: " + jobFile);
+                }
+                else
+                {
+                    Debug.LogWarning("⚠️ 빌드 작업 파일을 찾을 수 없습니다: " + jobFile);
+                }
+            }
+
+            string outputPath = CommandLineArgs.GetValue("-dannectOutputPath");
+            if (!string.IsNullOrEmpty(outputPath))
+            {
+                job.outputPath = outputPath;
+            }
+
+            string codeOptimization = CommandLineArgs.GetValue("-dannectCodeOptimization");
+            if (!string.IsNullOrEmpty(codeOptimization))
+            {
+                job.codeOptimization = codeOptimization;
+            }
+
+            job.memorySize = CommandLineArgs.GetInt("-dannectMemorySize", job.memorySize);
+            job.maximumMemorySize = CommandLineArgs.GetInt("-dannectMaximumMemorySize", job.maximumMemorySize);
+
+            string memoryGrowthMode = CommandLineArgs.GetValue("-dannectMemoryGrowthMode");
+            if (!string.IsNullOrEmpty(memoryGrowthMode))
+            {
+                job.memoryGrowthMode = memoryGrowthMode;
+            }
+
+            string reportPath = CommandLineArgs.GetValue("-dannectReportPath");
+            if (!string.IsNullOrEmpty(reportPath))
+            {
+                job.reportPath = reportPath;
+            }
+
+            if (string.IsNullOrEmpty(job.outputPath))
+            {
+                job.outputPath = Path.Combine(Directory.GetParent(Application.dataPath).FullName, "Build", "WebGL");
+            }
+
+            return job;
+        }
+    }
+}
@@ -0,0 +1,596 @@
+// Unity 6 전용 WebGL 빌드 자동화 (Player Settings 완전 반영)
+// Tools/build_manager.py에서 다음과 같이 호출됩니다:
+//   Unity.exe -batchmode -quit -projectPath <경로> -buildTarget WebGL
+//             -executeMethod Dannect.Toolkit.Editor.WebGLBuilder.BuildFromCommandLine
+//             -dannectBuildJob <작업파일.json>
+// 패키지 Editor 어셈블리에 고정되어 있으므로 빌드마다 스크립트 재컴파일이 발생하지 않습니다.
+using System;
+using System.IO;
+using UnityEditor;
+using UnityEditor.Build;
+using UnityEditor.Build.Reporting;
+using UnityEditor.WebGL;
+using UnityEngine;
+
+namespace Dannect.Toolkit.Editor
+{
+    public static class WebGLBuilder
+    {
+        // 같은 Unity 실행에서 이미 Player Settings를 적용한 작업 (배치 파이프라인의 configure-webgl 작업)
+        private static WebGLBuildJob configuredJob;
+
+        [MenuItem("Build/Auto Build WebGL (Player Settings)")]
+        public static void BuildWebGLWithPlayerSettings()
+        {
+            Build(WebGLBuildJob.FromCommandLine());
+        }
+
+        // -executeMethod 진입점
+        public static void BuildFromCommandLine()
+        {
+            Build(WebGLBuildJob.FromCommandLine());
+        }
+
+        public static BuildReport Build(WebGLBuildJob job)
+        {
+            Debug.Log("=== WebGL Player Settings 자동 설정 및 빌드 시작 ===");
+
+            // WebGL Player Settings 자동 설정 (파이프라인에서 이미 적용했다면 생략)
+            if (configuredJob != job)
+            {
+                ConfigureWebGLPlayerSettings(job);
+            }
+
+            // 설정된 Player Settings 정보 출력
+            LogCurrentPlayerSettings();
+
+            // 프로젝트명 추출 (Unity에서 스크립트가 실행되는 프로젝트의 이름)
+            string projectName = Application.productName;
+            if (string.IsNullOrEmpty(projectName))
+            {
+                // ProductName이 없으면 프로젝트 폴더명 사용
+                projectName = new DirectoryInfo(Application.dataPath).Parent.Name;
+            }
+
+            // 특수문자 제거 및 안전한 파일명 생성
+            string safeProjectName = projectName.Replace(" ", "_");
+            safeProjectName = System.Text.RegularExpressions.Regex.Replace(safeProjectName, @"[^\w\-_\.]", "");
+
+            string buildPath = job.outputPath;
+
+            // 출력 디렉토리 생성 (상위 폴더까지 모두 생성)
+            try
+            {
+                if (!Directory.Exists(buildPath))
+                {
+                    Directory.CreateDirectory(buildPath);
+                    Debug.Log("빌드 출력 디렉토리 생성: " + buildPath);
+                }
+                else
+                {
+                    Debug.Log("빌드 출력 디렉토리 확인 완료: " + buildPath);
+                }
+            }
+            catch (Exception e)
+            {
+                Debug.LogError("빌드 출력 디렉토리 생성 실패: " + e.Message);
+                Debug.LogError("경로: " + buildPath);
+                return null;
+            }
+
+            Debug.Log("📁 프로젝트명: " + projectName + " -> 안전한 파일명: " + safeProjectName);
+            Debug.Log("🌐 빌드 경로: " + buildPath);
+
+            // 빌드할 씬들 가져오기 (Build Settings에서 활성화된 씬만)
+            string[] scenes = GetBuildScenes();
+            if (scenes.Length == 0)
+            {
+                Debug.LogError("빌드할 씬이 없습니다. Build Settings에서 씬을 추가하세요.");
+                return null;
+            }
+
+            // WebGL 빌드 옵션 설정 (Player Settings 완전 반영)
+            BuildPlayerOptions buildPlayerOptions = new BuildPlayerOptions();
+            buildPlayerOptions.scenes = scenes;
+            buildPlayerOptions.locationPathName = buildPath;
+            buildPlayerOptions.target = BuildTarget.WebGL;
+
+            // 빌드 옵션을 Player Settings에 따라 설정
+            buildPlayerOptions.options = GetBuildOptionsFromPlayerSettings();
+
+            // WebGL 특수 설정 적용
+            ApplyWebGLSettings(job);
+
+            Debug.Log("🌐 WebGL 빌드 시작");
+            Debug.Log("📁 빌드 경로: " + buildPlayerOptions.locationPathName);
+            Debug.Log("📂 프로젝트명: " + safeProjectName);
+            Debug.Log("🎮 제품명: " + PlayerSettings.productName);
+            Debug.Log("🏢 회사명: " + PlayerSettings.companyName);
+            Debug.Log("📋 버전: " + PlayerSettings.bundleVersion);
+
+            // WebGL 빌드 실행
+            Debug.Log("🔄 BuildPipeline.BuildPlayer 호출 시작...");
+            BuildReport report = null;
+
+            try
+            {
+                report = BuildPipeline.BuildPlayer(buildPlayerOptions);
+                Debug.Log("✅ BuildPipeline.BuildPlayer 호출 완료");
+            }
+            catch (Exception e)
+            {
+                Debug.LogError("❌ BuildPipeline.BuildPlayer 예외 발생: " + e.Message);
+                Debug.LogError("스택 트레이스: " + e.StackTrace);
+                return null;
+            }
+
+            // 빌드 결과 확인
+            if (report == null)
+            {
+                Debug.LogError("❌ BuildReport가 null입니다. 빌드가 실행되지 않았습니다.");
+                return null;
+            }
+
+            // 빌드 결과를 JSON으로 저장 (Tools/build_report.py가 로그 대신 사용)
+            BuildReportWriter.Write(report, job);
+
+            Debug.Log("📊 빌드 결과: " + report.summary.result);
+            Debug.Log("📦 빌드 크기: " + FormatBytes(report.summary.totalSize));
+            Debug.Log("⏱️ 빌드 시간: " + report.summary.totalTime);
+            Debug.Log("❗ 에러 수: " + report.summary.totalErrors);
+            Debug.Log("⚠️ 경고 수: " + report.summary.totalWarnings);
+
+            if (report.summary.result == BuildResult.Succeeded)
+            {
+                Debug.Log("✅ WebGL 빌드 성공!");
+                Debug.Log("📁 빌드 경로: " + buildPath);
+                Debug.Log("📂 프로젝트명: " + safeProjectName);
+
+                // Build 폴더 내용 확인
+                string buildFolder = Path.Combine(buildPath, "Build");
+                if (Directory.Exists(buildFolder))
+                {
+                    var files = Directory.GetFiles(buildFolder);
+                    Debug.Log("📦 Build 폴더 파일 수: " + files.Length);
+                    foreach (var file in files)
+                    {
+                        var fileInfo = new FileInfo(file);
+                        Debug.Log("   - " + fileInfo.Name + " (" + FormatBytes((ulong)fileInfo.Length) + ")");
+                    }
+                }
+                else
+                {
+                    Debug.LogError("⚠️ Build 폴더가 생성되지 않았습니다: " + buildFolder);
+                }
+
+                Debug.Log("🌐 WebGL 빌드 완료!");
+            }
+            else
+            {
+                Debug.LogError("❌ WebGL 빌드 실패: " + report.summary.result);
+
+                // 상세 에러 정보 출력
+                if (report.summary.totalErrors > 0)
+                {
+                    Debug.LogError("총 에러 수: " + report.summary.totalErrors);
+
+                    // BuildReport의 steps 확인
+                    foreach (var step in report.steps)
+                    {
+                        if (step.messages.Length > 0)
+                        {
+                            Debug.LogError("빌드 단계: " + step.name);
+                            foreach (var message in step.messages)
+                            {
+                                if (message.type == LogType.Error || message.type == LogType.Exception)
+                                {
+                                    Debug.LogError("  - " + message.content);
+                                }
+                            }
+                        }
+                    }
+                }
+
+                if (report.summary.totalWarnings > 0)
+                {
+                    Debug.LogWarning("총 경고 수: " + report.summary.totalWarnings);
+                }
+            }
+
+            Debug.Log("=== WebGL Player Settings 반영 빌드 완료 ===");
+            return report;
+        }
+
+        public static void ConfigureWebGLPlayerSettings(WebGLBuildJob job)
+        {
+            Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 적용 중...");
+
+            // 기본 제품 정보 설정 (비어있는 경우에만)
+            if (string.IsNullOrEmpty(PlayerSettings.productName))
+            {
+                PlayerSettings.productName = "Science Experiment Simulation";
+                Debug.Log("✅ 제품명 설정: Science Experiment Simulation");
+            }
+
+            if (string.IsNullOrEmpty(PlayerSettings.companyName))
+            {
+                PlayerSettings.companyName = "Educational Software";
+                Debug.Log("✅ 회사명 설정: Educational Software");
+            }
+
+            if (string.IsNullOrEmpty(PlayerSettings.bundleVersion))
+            {
+                PlayerSettings.bundleVersion = "1.0.0";
+                Debug.Log("✅ 버전 설정: 1.0.0");
+            }
+
+            // === 이미지 기반 고정 설정 적용 ===
+
+            // Resolution and Presentation 설정 (이미지 기반)
+            PlayerSettings.defaultWebScreenWidth = 1655;
+            PlayerSettings.defaultWebScreenHeight = 892;
+            PlayerSettings.runInBackground = true;
+            Debug.Log("✅ 해상도 설정: 1655x892, Run In Background 활성화");
+
+            // WebGL Template 설정 (이미지 기반: Minimal)
+            PlayerSettings.WebGL.template = "APPLICATION:Minimal";
+            Debug.Log("✅ WebGL 템플릿 설정: Minimal");
+
+            // Publishing Settings - Brotli 압축 및 WebAssembly 2023 타겟
+            PlayerSettings.WebGL.compressionFormat = WebGLCompressionFormat.Brotli;
+            PlayerSettings.WebGL.nameFilesAsHashes = false;  // 프로젝트명.data 등으로 파일명 설정
+            PlayerSettings.WebGL.dataCaching = true;
+            // Unity 6에서 debugSymbols -> debugSymbolMode로 변경
+            PlayerSettings.WebGL.debugSymbolMode = WebGLDebugSymbolMode.Off;
+            PlayerSettings.WebGL.showDiagnostics = false;
+            PlayerSettings.WebGL.decompressionFallback = true;  // Decompression Fallback 활성화
+            // WebAssembly 2023 타겟 설정 (Unity 6에서 자동 관리)
+            Debug.Log("✅ WebAssembly 2023: Unity 6에서 자동 관리됨");
+            Debug.Log("✅ Publishing Settings: Brotli 압축 활성화, Decompression Fallback 활성화");
+
+            // WebAssembly Language Features (이미지 기반)
+            PlayerSettings.WebGL.exceptionSupport = WebGLExceptionSupport.ExplicitlyThrownExceptionsOnly;
+            PlayerSettings.WebGL.threadsSupport = false;
+            // Unity 6에서 wasmStreaming 제거됨 (decompressionFallback에 따라 자동 결정)
+            Debug.Log("✅ WebAssembly 설정: 명시적 예외만, 멀티스레딩 비활성화, 스트리밍 자동");
+
+            // Memory Settings (작업 설정 기반, 기본값: 초기 32MB / 최대 2048MB / Geometric)
+            SetMemorySettings(job);
+
+            // Splash Screen 설정 (이미지 기반)
+            PlayerSettings.SplashScreen.show = true;
+            PlayerSettings.SplashScreen.showUnityLogo = false;
+            PlayerSettings.SplashScreen.animationMode = PlayerSettings.SplashScreen.AnimationMode.Dolly;
+            // Unity 6에서 logoAnimationMode 제거됨
+            PlayerSettings.SplashScreen.overlayOpacity = 0.0f;
+            PlayerSettings.SplashScreen.blurBackgroundImage = true;
+            Debug.Log("✅ 스플래시 화면: Unity 로고 숨김, Dolly 애니메이션, 오버레이 투명");
+
+            // WebGL 링커 타겟 설정 (Unity 6 최적화)
+            PlayerSettings.WebGL.linkerTarget = WebGLLinkerTarget.Wasm;
+            Debug.Log("✅ WebGL 링커 타겟 설정: WebAssembly (Unity 6 최적화)");
+
+            // Code Optimization 설정 (Unity 6 WasmCodeOptimization 사용)
+            SetCodeOptimization(job.codeOptimization);
+
+            // Managed Stripping Level 설정 (Medium - Unity 6)
+            try
+            {
+                // Unity 6: ManagedStrippingLevel enum 사용
+                PlayerSettings.SetManagedStrippingLevel(NamedBuildTarget.WebGL, ManagedStrippingLevel.Medium);
+                Debug.Log("✅ Managed Stripping Level: Medium (Unity 6)");
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning("⚠️ Managed Stripping Level 설정 실패: " + e.Message);
+            }
+
+            Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 완료");
+            configuredJob = job;
+        }
+
+        private static void SetMemorySettings(WebGLBuildJob job)
+        {
+            PlayerSettings.WebGL.memorySize = job.memorySize;  // Initial Memory Size
+
+            WebGLMemoryGrowthMode growthMode;
+            if (!Enum.TryParse(job.memoryGrowthMode, true, out growthMode))
+            {
+                Debug.LogWarning("⚠️ 알 수 없는 Memory Growth Mode: " + job.memoryGrowthMode + " (기본값 Geometric 사용)");
+                growthMode = WebGLMemoryGrowthMode.Geometric;
+            }
+            PlayerSettings.WebGL.memoryGrowthMode = growthMode;
+            PlayerSettings.WebGL.maximumMemorySize = job.maximumMemorySize;
+
+            Debug.Log("✅ 메모리 설정: 초기 " + job.memorySize + "MB, 최대 " + job.maximumMemorySize + "MB, " + growthMode + " 증가");
+        }
+
+        private static void SetCodeOptimization(string codeOptimizationType)
+        {
+            // Unity 6 Code Optimization 설정 (WasmCodeOptimization)
+            // Build Profiles의 Code Optimization 드롭다운과 일치합니다
+            try
+            {
+                WasmCodeOptimization codeOpt;
+
+                if (codeOptimizationType == "RuntimeSpeedLTO")
+                {
+                    codeOpt = WasmCodeOptimization.RuntimeSpeedLTO;
+                    Debug.Log("✅ Code Optimization: Runtime Speed with LTO (최고 성능, LTO 적용)");
+                }
+                else if (codeOptimizationType == "RuntimeSpeed")
+                {
+                    codeOpt = WasmCodeOptimization.RuntimeSpeed;
+                    Debug.Log("✅ Code Optimization: Runtime Speed (성능 최적화)");
+                }
+                else if (codeOptimizationType == "BuildTimes")
+                {
+                    codeOpt = WasmCodeOptimization.BuildTimes;
+                    Debug.Log("✅ Code Optimization: Build Times (빠른 빌드)");
+                }
+                else if (codeOptimizationType == "DiskSize")
+                {
+                    codeOpt = WasmCodeOptimization.DiskSize;
+                    Debug.Log("✅ Code Optimization: Disk Size (크기 최적화)");
+                }
+                else if (codeOptimizationType == "DiskSizeLTO")
+                {
+                    codeOpt = WasmCodeOptimization.DiskSizeLTO;
+                    Debug.Log("✅ Code Optimization: Disk Size with LTO (최소 크기, LTO 적용)");
+                }
+                else
+                {
+                    // 기본값: Runtime Speed with LTO
+                    codeOpt = WasmCodeOptimization.RuntimeSpeedLTO;
+                    Debug.LogWarning("⚠️ 알 수 없는 Code Optimization: " + codeOptimizationType);
+                    Debug.Log("ℹ️ 기본값 사용: Runtime Speed with LTO");
+                }
+
+                // Unity 6: UserBuildSettings.codeOptimization 사용
+                UserBuildSettings.codeOptimization = codeOpt;
+            }
+            catch (Exception e)
+            {
+                Debug.LogError("❌ Code Optimization 설정 실패: " + e.Message);
+                Debug.Log("ℹ️ Unity Editor에서 수동으로 설정해주세요.");
+            }
+        }
+
+        private static void LogCurrentPlayerSettings()
+        {
+            Debug.Log("=== 현재 WebGL Player Settings ===");
+            Debug.Log("🎮 제품명: " + PlayerSettings.productName);
+            Debug.Log("🏢 회사명: " + PlayerSettings.companyName);
+            Debug.Log("📋 버전: " + PlayerSettings.bundleVersion);
+
+            // Unity 6: 아이콘 API
+            var icons = PlayerSettings.GetIcons(NamedBuildTarget.WebGL, IconKind.Application);
+            Debug.Log("🖼️ 기본 아이콘: " + (icons != null && icons.Length > 0 ? "설정됨" : "없음"));
+
+            // WebGL 전용 설정들
+            Debug.Log("🌐 WebGL 템플릿: " + PlayerSettings.WebGL.template);
+            Debug.Log("💾 WebGL 메모리 크기: " + PlayerSettings.WebGL.memorySize + "MB");
+            Debug.Log("📦 WebGL 압축 포맷: " + PlayerSettings.WebGL.compressionFormat);
+            Debug.Log("🔙 WebGL Decompression Fallback: " + PlayerSettings.WebGL.decompressionFallback);
+            // WebAssembly 2023 (Unity 6에서 자동 관리)
+            Debug.Log("🌐 WebGL WebAssembly 2023: Unity 6에서 자동 관리됨");
+            Debug.Log("⚠️ WebGL 예외 지원: " + PlayerSettings.WebGL.exceptionSupport);
+            Debug.Log("💽 WebGL 데이터 캐싱: " + PlayerSettings.WebGL.dataCaching);
+            Debug.Log("📂 WebGL 파일명 방식: " + (PlayerSettings.WebGL.nameFilesAsHashes ? "해시" : "프로젝트명") + " 기반");
+            Debug.Log("🔧 WebGL 링커 타겟: " + PlayerSettings.WebGL.linkerTarget);
+            Debug.Log("⚡ Code Optimization: " + UserBuildSettings.codeOptimization);
+            Debug.Log("📦 Managed Stripping Level: " + PlayerSettings.GetManagedStrippingLevel(NamedBuildTarget.WebGL));
+            Debug.Log("🎯 WebGL 최적화: Unity 6에서 자동 관리");
+            Debug.Log("=====================================");
+        }
+
+        private static BuildOptions GetBuildOptionsFromPlayerSettings()
+        {
+            BuildOptions options = BuildOptions.None;
+
+            // Development Build 설정 확인
+            if (EditorUserBuildSettings.development)
+            {
+                options |= BuildOptions.Development;
+                Debug.Log("✅ Development Build 모드 활성화");
+            }
+
+            // Script Debugging 설정 확인
+            if (EditorUserBuildSettings.allowDebugging)
+            {
+                options |= BuildOptions.AllowDebugging;
+                Debug.Log("✅ Script Debugging 활성화");
+            }
+
+            // Profiler 설정 확인
+            if (EditorUserBuildSettings.connectProfiler)
+            {
+                options |= BuildOptions.ConnectWithProfiler;
+                Debug.Log("✅ Profiler 연결 활성화");
+            }
+
+            // Deep Profiling 설정 확인
+            if (EditorUserBuildSettings.buildWithDeepProfilingSupport)
+            {
+                options |= BuildOptions.EnableDeepProfilingSupport;
+                Debug.Log("✅ Deep Profiling 지원 활성화");
+            }
+
+            // Unity 6에서 autoRunPlayer 제거됨
+            // WebGL은 브라우저에서 실행되므로 AutoRunPlayer 옵션 불필요
+            Debug.Log("ℹ️ WebGL 빌드는 브라우저에서 수동 실행");
+
+            return options;
+        }
+
+        private static void ApplyWebGLSettings(WebGLBuildJob job)
+        {
+            Debug.Log("🌐 WebGL 특수 설정 적용 및 검증 중...");
+
+            Debug.Log("🌐 WebGL 템플릿 사용: " + PlayerSettings.WebGL.template);
+            Debug.Log("💾 WebGL 메모리 크기: " + PlayerSettings.WebGL.memorySize + "MB");
+            Debug.Log("📦 WebGL 압축 포맷: " + PlayerSettings.WebGL.compressionFormat);
+            Debug.Log("⚠️ WebGL 예외 지원: " + PlayerSettings.WebGL.exceptionSupport);
+            Debug.Log("💽 WebGL 데이터 캐싱: " + PlayerSettings.WebGL.dataCaching);
+
+            // WebGL 최적화 설정 확인 및 권장사항
+            if (PlayerSettings.WebGL.memorySize < 256)
+            {
+                Debug.LogWarning("⚠️ WebGL 메모리 크기가 256MB 미만입니다. 과학실험 시뮬레이션에는 512MB 이상 권장합니다.");
+            }
+            else if (PlayerSettings.WebGL.memorySize >= 512)
+            {
+                Debug.Log("✅ WebGL 메모리 크기가 적절합니다 (512MB 이상).");
+            }
+
+            if (string.IsNullOrEmpty(PlayerSettings.WebGL.template) || PlayerSettings.WebGL.template == "APPLICATION:Default")
+            {
+                Debug.LogWarning("⚠️ WebGL 템플릿이 기본값입니다. 교육용 템플릿 사용을 권장합니다.");
+            }
+            else
+            {
+                Debug.Log("✅ WebGL 템플릿 설정됨: " + PlayerSettings.WebGL.template);
+            }
+
+            // WebGL 압축 설정 확인
+            if (PlayerSettings.WebGL.compressionFormat == WebGLCompressionFormat.Disabled)
+            {
+                Debug.LogWarning("⚠️ WebGL 압축이 비활성화되어 있습니다. 파일 크기가 클 수 있습니다.");
+            }
+            else
+            {
+                Debug.Log("✅ WebGL 압축 활성화: " + PlayerSettings.WebGL.compressionFormat);
+            }
+
+            // Decompression Fallback 확인
+            if (PlayerSettings.WebGL.decompressionFallback)
+            {
+                Debug.Log("✅ WebGL Decompression Fallback 활성화 (압축 해제 실패 시 대체 사용)");
+            }
+
+            // WebAssembly 2023 (Unity 6에서 자동 관리)
+            Debug.Log("✅ WebAssembly 2023: Unity 6에서 자동 관리됨");
+
+            // Code Optimization 확인 (Unity 6 WasmCodeOptimization)
+            var codeOpt = UserBuildSettings.codeOptimization;
+            Debug.Log("✅ Code Optimization: " + codeOpt + " (설정값: " + job.codeOptimization + ")");
+
+            // Managed Stripping Level 확인 (Unity 6)
+            var strippingLevel = PlayerSettings.GetManagedStrippingLevel(NamedBuildTarget.WebGL);
+            Debug.Log("✅ Managed Stripping Level: " + strippingLevel);
+
+            // WebGL 빌드 최적화 권장사항
+            Debug.Log("📚 WebGL 빌드 최적화 권장사항:");
+            Debug.Log("  - 메모리: 512MB 이상");
+            Debug.Log("  - 압축: Brotli (현재 설정됨)");
+            Debug.Log("  - Decompression Fallback: 활성화 (현재 설정됨)");
+            Debug.Log("  - WebAssembly 2023: 활성화 (현재 설정됨)");
+            Debug.Log("  - Managed Stripping Level: Medium (현재 설정됨)");
+            Debug.Log("  - Code Optimization: " + job.codeOptimization + " (현재 설정됨)");
+            Debug.Log("  - 예외 지원: ExplicitlyThrownExceptionsOnly");
+            Debug.Log("  - 데이터 캐싱: 활성화");
+        }
+
+        private static string[] GetBuildScenes()
+        {
+            var enabledScenes = new System.Collections.Generic.List<string>();
+
+            // 1순위: Build Settings에 등록된 씬 확인
+            foreach (var scene in EditorBuildSettings.scenes)
+            {
+                if (scene.enabled)
+                {
+                    enabledScenes.Add(scene.path);
+                }
+            }
+
+            if (enabledScenes.Count > 0)
+            {
+                Debug.Log("✅ Build Settings에서 씬 로드 완료");
+                Debug.Log("📋 빌드할 씬 수: " + enabledScenes.Count);
+                foreach (var scene in enabledScenes)
+                {
+                    Debug.Log("  - " + scene);
+                }
+                return enabledScenes.ToArray();
+            }
+
+            // 2순위: 가장 최근 수정된 씬 자동 검색
+            Debug.LogWarning("⚠️ Build Settings에 씬이 없습니다. 가장 최근 수정된 씬을 자동으로 검색합니다.");
+
+            string[] sceneGuids = AssetDatabase.FindAssets("t:Scene", new[] { "Assets" });
+
+            if (sceneGuids.Length == 0)
+            {
+                Debug.LogError("❌ 프로젝트에 씬이 하나도 없습니다!");
+                return new string[0];
+            }
+
+            // 씬 경로와 수정 시간 수집
+            var scenesWithTime = new System.Collections.Generic.List<Tuple<string, DateTime>>();
+
+            foreach (string guid in sceneGuids)
+            {
+                string scenePath = AssetDatabase.GUIDToAssetPath(guid);
+
+                // Unity 내부 경로를 실제 파일 시스템 경로로 변환
+                // scenePath = "Assets/Scenes/Main.unity"
+                // Application.dataPath = "C:/Project/Assets"
+                string fullPath = scenePath.Replace("Assets", Application.dataPath);
+
+                try
+                {
+                    if (File.Exists(fullPath))
+                    {
+                        DateTime lastWriteTime = File.GetLastWriteTime(fullPath);
+                        scenesWithTime.Add(new Tuple<string, DateTime>(scenePath, lastWriteTime));
+                        Debug.Log("  • " + Path.GetFileName(scenePath) + " - 수정: " + lastWriteTime.ToString("yyyy-MM-dd HH:mm:ss"));
+                    }
+                }
+                catch (Exception e)
+                {
+                    Debug.LogWarning("⚠️ 씬 파일 시간 확인 실패: " + scenePath + " - " + e.Message);
+                }
+            }
+
+            if (scenesWithTime.Count == 0)
+            {
+                Debug.LogError("❌ 유효한 씬 파일을 찾을 수 없습니다!");
+                return new string[0];
+            }
+
+            // 수정 시간 기준 내림차순 정렬 (최신이 먼저)
+            scenesWithTime.Sort((a, b) => b.Item2.CompareTo(a.Item2));
+
+            // 가장 최근 수정된 씬 선택
+            string latestScene = scenesWithTime[0].Item1;
+            DateTime latestTime = scenesWithTime[0].Item2;
+
+            Debug.Log("✅ 가장 최근 수정된 씬 선택: " + latestScene);
+            Debug.Log("   수정 시간: " + latestTime.ToString("yyyy-MM-dd HH:mm:ss"));
+
+            enabledScenes.Add(latestScene);
+
+            Debug.Log("📋 빌드할 씬 수: " + enabledScenes.Count);
+            foreach (var scene in enabledScenes)
+            {
+                Debug.Log("  - " + scene);
+            }
+
+            return enabledScenes.ToArray();
+        }
+
+        private static string FormatBytes(ulong bytes)
+        {
+            string[] sizes = { "B", "KB", "MB", "GB", "TB" };
+            double len = bytes;
+            int order = 0;
+            while (len >= 1024 && order < sizes.Length - 1)
+            {
+                order++;
+                len = len / 1024;
+            }
+            return len.ToString("0.##") + " " + sizes[order];
+        }
+    }
+}
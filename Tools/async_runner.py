@@ -0,0 +1,361 @@
+"""
+asyncio 기반 프로세스 실행 코어
+- 이벤트 루프 하나에서 수백 개의 Git 명령과 여러 Unity 실행을 작업별 스레드 없이 감시
+  (기존 경로: 작업마다 subprocess.run을 기다리는 스레드 + 빌드마다 로그 모니터 스레드)
+- 프로세스는 새 프로세스 그룹/세션으로 실행하고 process_tree에 등록
+  (타임아웃/취소/Ctrl+C 시 kill_process_tree로 자식 프로세스까지 종료)
+- stdout/stderr는 청크 단위로 읽어 줄마다 콜백 호출, 로그 파일(-logFile)은 LogTailer로 증분 읽기
+  (Linux: inotify fd를 이벤트 루프에 등록하여 변경 즉시 읽기, 그 외: polling)
+- 작업별 제한 시간, 정지 감시(출력 없이 지난 시간), 취소(task.cancel / 상위 작업 취소) 지원
+- 동시 실행 상한(semaphore)으로 여러 명령 실행, 동기 코드에서는 run_async로 호출
+- 적용 범위: 공개 API는 run_process, run_git_command, get_git_states (Git 상태 일괄 조회, toolkit_benchmark).
+  Unity 배치 모드(unity_cli), WebGL 빌드(build_manager.run_unity_webgl_build),
+  단계 파이프라인(stage_pipeline), main.py 명령은 기존 스레드 기반 경로를 그대로 사용
+
+사용 예:
+    states = get_git_states(project_dirs)  # 브랜치/HEAD/작업 트리 상태 일괄 조회
+"""
+import os
+import sys
+import time
+import signal
+import asyncio
+import subprocess
+from config import Config
+from git_utils import GitUtils, STATUS_DIGEST_COMMAND, get_project_name_from_path, is_git_repository
+from log_tailer import LogTailer, CHUNK_SIZE, MAX_LINE_BYTES, POLL_INTERVAL
+from process_tree import (
+    register_process, release_process, kill_process_tree, kill_all_process_trees, new_process_group, process_group
+)
+
+# 전역 변수 참조 (호환성 유지)
+PROCESS_KILL_GRACE_SECONDS = Config.PROCESS_KILL_GRACE_SECONDS
+ASYNC_GIT_CONCURRENCY = Config.ASYNC_GIT_CONCURRENCY
+ASYNC_GIT_TIMEOUT = Config.ASYNC_GIT_TIMEOUT
+
+# 정지 감시 확인 최대 주기 (초, 제한 시간/정지 기한이 더 가까우면 그 시각에 깨어남)
+WATCHDOG_INTERVAL = 1.0
+
+# 프로세스 상태
+STATUS_COMPLETED = "completed"
+STATUS_TIMEOUT = "timeout"
+STATUS_STALLED = "stalled"
+STATUS_ERROR = "error"
+
+_child_watcher_installed = False
+
+
+class _AsyncProcessHandle:
+    """asyncio 프로세스를 process_tree가 사용하는 Popen 형태(pid, poll, wait, kill)로 감쌉니다.
+
+    kill_process_tree는 실행기 스레드에서 호출되며, 종료 코드는 이벤트 루프가 갱신합니다.
+    """
+
+    def __init__(self, process):
+        self.process = process
+        self.pid = process.pid
+
+    def poll(self):
+        return self.process.returncode
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.time() + timeout
+        while self.process.returncode is None:
+            if deadline is not None and time.time() >= deadline:
+                raise subprocess.TimeoutExpired(str(self.pid), timeout)
+            time.sleep(0.05)
+        return self.process.returncode
+
+    def kill(self):
+        # 실행기 스레드에서 호출되므로 이벤트 루프의 transport 대신 pid로 직접 신호 전송 (이미 종료되었으면 무시)
+        if self.process.returncode is not None:
+            return
+        try:
+            os.kill(self.pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        except (ProcessLookupError, OSError):
+            pass
+
+
+def _install_child_watcher():
+    """Linux + Python 3.9~3.11: 자식 프로세스마다 대기 스레드를 만드는 기본 ThreadedChildWatcher 대신
+    pidfd 기반 감시(PidfdChildWatcher)를 사용합니다 (Python 3.12부터는 기본값, Windows는 IOCP 사용)."""
+    global _child_watcher_installed
+    if _child_watcher_installed:
+        return
+    _child_watcher_installed = True
+    if not sys.platform.startswith("linux") or sys.version_info >= (3, 12):
+        return
+    if not hasattr(asyncio, "PidfdChildWatcher") or not hasattr(os, "pidfd_open"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return  # pidfd를 지원하지 않는 커널
+    asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+
+def run_async(coroutine):
+    """동기 코드에서 코루틴을 실행하고 결과를 반환합니다.
+
+    Ctrl+C 시 실행 중인 작업이 취소되면서 각 프로세스 트리를 종료하고, 이 실행이 시작한 남은 프로세스도 정리합니다.
+    """
+    _install_child_watcher()
+    with process_group(new_process_group()) as group:
+        try:
+            return asyncio.run(coroutine)
+        except KeyboardInterrupt:
+            print("\n⛔ 비동기 작업 취소: 실행 중인 프로세스 트리 종료 중...")
+            kill_all_process_trees("사용자 취소 (Ctrl+C)", group)
+            raise
+
+def _process_group_kwargs():
+    """새 프로세스 그룹/세션으로 실행하기 위한 인수 (process_tree.start_process_group과 동일)."""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+async def _kill_tree(handle, reason, label):
+    """프로세스 트리 종료 (종료 대기 중에도 이벤트 루프가 종료 코드를 갱신하도록 실행기 스레드에서 실행)."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, kill_process_tree, handle, reason, label)
+
+async def _read_stream(stream, emit, chunks=None):
+    """스트림을 청크 단위로 읽어 완전한 줄마다 emit(line)을 호출합니다 (log_tailer와 같은 줄 처리).
+
+    chunks(list)가 주어지면 읽은 원본 바이트도 그대로 보관합니다 (줄 나눔/자르기와 무관한 전체 출력).
+    """
+    partial = b""
+    while True:
+        chunk = await stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        if chunks is not None:
+            chunks.append(chunk)
+        lines = (partial + chunk).split(b"\n")
+        partial = lines.pop()
+        if len(partial) > MAX_LINE_BYTES:
+            # 줄바꿈 없이 너무 긴 출력은 잘라서 전달 (메모리 상한 유지)
+            lines.append(partial)
+            partial = b""
+        for line in lines:
+            emit(line.rstrip(b"\r").decode('utf-8', errors='replace'))
+    if partial:
+        emit(partial.rstrip(b"\r").decode('utf-8', errors='replace'))
+
+def _decode_output(chunks):
+    """보관한 출력 바이트를 문자열로 변환합니다 (subprocess text 모드처럼 줄바꿈을 \\n으로 통일)."""
+    return b"".join(chunks).decode('utf-8', errors='replace').replace("\r\n", "\n")
+
+async def follow_log_file(path, on_line, stop_event, poll_interval=POLL_INTERVAL):
+    """로그 파일에 추가되는 줄을 stop_event가 설정될 때까지 읽어 on_line(line)을 호출합니다.
+
+    Linux에서는 LogTailer의 inotify fd를 이벤트 루프에 등록하여 로그가 바뀌면 즉시 깨어나고,
+    그 외에는 poll_interval마다 확인합니다. 종료 시 마지막 미완성 줄까지 전달합니다.
+    """
+    loop = asyncio.get_running_loop()
+    tailer = LogTailer(path, poll_interval=poll_interval)
+    changed = asyncio.Event()
+    fd = tailer.fileno()
+
+    def on_readable():
+        tailer.consume_events()
+        changed.set()
+        if tailer.fileno() is None:
+            loop.remove_reader(fd)  # inotify 오류로 polling 전환
+
+    if fd is not None:
+        loop.add_reader(fd, on_readable)
+    try:
+        while True:
+            stopping = stop_event.is_set()
+            if tailer.wait_for_change(0):
+                for line in tailer.read_lines():
+                    on_line(line)
+            if stopping:
+                break
+            changed.clear()
+            waiters = [asyncio.ensure_future(changed.wait()), asyncio.ensure_future(stop_event.wait())]
+            try:
+                await asyncio.wait(waiters, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+        last_line = tailer.flush_partial()
+        if last_line:
+            on_line(last_line)
+    finally:
+        if fd is not None and tailer.fileno() is not None:
+            loop.remove_reader(fd)
+        tailer.close()
+
+async def _supervise(waiter, started, activity, timeout, stall_timeout):
+    """프로세스 종료를 기다리며 제한 시간 / 정지 감시를 수행하고 상태를 반환합니다."""
+    if timeout is None and stall_timeout is None:
+        await asyncio.shield(waiter)
+        return STATUS_COMPLETED
+
+    while True:
+        # 가장 가까운 기한(제한 시간 / 마지막 출력 + 정지 제한)까지만 기다려 기한을 넘기지 않고 종료
+        now = time.time()
+        deadlines = [now + WATCHDOG_INTERVAL]
+        if timeout is not None:
+            deadlines.append(started + timeout)
+        if stall_timeout is not None:
+            deadlines.append(activity["last_output"] + stall_timeout)
+        done, _ = await asyncio.wait({waiter}, timeout=max(0.0, min(deadlines) - now))
+        if done:
+            return STATUS_COMPLETED
+        now = time.time()
+        if timeout is not None and now - started >= timeout:
+            return STATUS_TIMEOUT
+        if stall_timeout is not None and now - activity["last_output"] >= stall_timeout:
+            return STATUS_STALLED
+
+async def run_process(cmd, cwd=None, label=None, timeout=None, stall_timeout=None, shell=False,
+                      on_line=None, log_file=None, capture=True, env=None):
+    """프로세스를 실행하고 출력을 줄 단위로 읽으며 종료를 기다립니다.
+
+    Args:
+        cmd: 실행할 명령 목록 (shell=True면 명령 문자열)
+        cwd: 작업 폴더
+        label: 종료 보고에 표시할 이름 (기본값: 실행 파일명)
+        timeout: 전체 제한 시간 (초, None이면 제한 없음)
+        stall_timeout: 출력(stdout/stderr/로그 파일) 없이 지날 수 있는 최대 시간 (초, None이면 감시 안 함)
+        on_line: 새 줄마다 호출할 함수 on_line(line, source) (source: "stdout", "stderr", "log")
+        log_file: 함께 따라 읽을 로그 파일 경로 (예: Unity -logFile)
+        capture: True면 stdout/stderr 전체를 결과에 포함 (False면 on_line으로만 전달)
+        env: 환경 변수 (None이면 현재 환경)
+
+    Returns:
+        dict: {"returncode", "stdout", "stderr", "seconds", "status"}
+              status: "completed", "timeout", "stalled" (프로세스 트리 종료됨), "error" (실행 실패)
+
+    작업이 취소되면 (asyncio.CancelledError) 프로세스 트리를 종료한 뒤 예외를 다시 발생시킵니다.
+    """
+    if label is None:
+        label = os.path.basename(cmd.split()[0] if shell else cmd[0])
+    started = time.time()
+    activity = {"last_output": started}
+    captured = {"stdout": [], "stderr": []}
+
+    def make_emit(source):
+        def emit(line):
+            activity["last_output"] = time.time()
+            if on_line:
+                on_line(line, source)
+        return emit
+
+    try:
+        if shell:
+            process = await asyncio.create_subprocess_shell(
+                cmd, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, **_process_group_kwargs())
+        else:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, **_process_group_kwargs())
+    except (OSError, ValueError) as e:
+        return {"returncode": None, "stdout": "", "stderr": str(e),
+                "seconds": round(time.time() - started, 3), "status": STATUS_ERROR}
+
+    handle = _AsyncProcessHandle(process)
+    register_process(handle, label)
+
+    stream_readers = [
+        asyncio.ensure_future(_read_stream(process.stdout, make_emit("stdout"), captured["stdout"] if capture else None)),
+        asyncio.ensure_future(_read_stream(process.stderr, make_emit("stderr"), captured["stderr"] if capture else None))
+    ]
+    stop_log = asyncio.Event()
+    log_follower = None
+    if log_file:
+        log_follower = asyncio.ensure_future(follow_log_file(log_file, make_emit("log"), stop_log))
+    waiter = asyncio.ensure_future(asyncio.gather(process.wait(), *stream_readers))
+
+    status = STATUS_COMPLETED
+    try:
+        status = await _supervise(waiter, started, activity, timeout, stall_timeout)
+        if status == STATUS_TIMEOUT:
+            await _kill_tree(handle, f"타임아웃 {timeout}초", label)
+        elif status == STATUS_STALLED:
+            await _kill_tree(handle, f"출력 없음 {stall_timeout}초 (정지 감시)", label)
+    except asyncio.CancelledError:
+        await _kill_tree(handle, "작업 취소", label)
+        raise
+    finally:
+        # 종료된 프로세스의 남은 출력을 마저 읽고 (손자 프로세스가 파이프를 잡고 있으면 포기) 로그 감시 종료
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), PROCESS_KILL_GRACE_SECONDS)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            waiter.cancel()
+            for reader in stream_readers:
+                reader.cancel()
+        except Exception:
+            pass
+        stop_log.set()
+        if log_follower is not None:
+            try:
+                await log_follower
+            except Exception:
+                pass
+        release_process(handle)
+
+    return {
+        "returncode": process.returncode,
+        "stdout": _decode_output(captured["stdout"]),
+        "stderr": _decode_output(captured["stderr"]),
+        "seconds": round(time.time() - started, 3),
+        "status": status
+    }
+
+async def run_git_command(command, cwd, timeout=ASYNC_GIT_TIMEOUT, semaphore=None, strip=True):
+    """GitUtils.run_command의 비동기 버전입니다 (같은 셸 명령 문자열 사용).
+
+    semaphore가 주어지면 여러 호출의 동시 실행 수를 제한하고, strip이 False이면 stdout 앞뒤 공백을 유지합니다.
+
+    Returns:
+        tuple: (성공 여부, stdout, stderr)
+    """
+    label = f"git ({get_project_name_from_path(cwd)})"
+    if semaphore is None:
+        result = await run_process(command, cwd=cwd, label=label, timeout=timeout, shell=True)
+    else:
+        async with semaphore:
+            result = await run_process(command, cwd=cwd, label=label, timeout=timeout, shell=True)
+
+    stdout = result["stdout"].strip() if strip else result["stdout"]
+    if result["status"] == STATUS_TIMEOUT:
+        return False, stdout, f"Git 명령 타임아웃 ({timeout}초): {command}"
+    return result["returncode"] == 0, stdout, result["stderr"].strip()
+
+async def collect_git_state(project_path, semaphore=None):
+    """프로젝트의 현재 브랜치, HEAD 커밋, 작업 트리 상태 요약을 동시에 조회합니다.
+
+    Returns:
+        dict: {"branch", "head", "status_digest", "dirty"} (Git 리포지토리가 아니면 None)
+    """
+    if not is_git_repository(project_path):
+        return None
+    (branch_ok, branch, _), (head_ok, head, _), (status_ok, status, _) = await asyncio.gather(
+        run_git_command("git branch --show-current", project_path, semaphore=semaphore),
+        run_git_command("git rev-parse HEAD", project_path, semaphore=semaphore),
+        run_git_command(STATUS_DIGEST_COMMAND, project_path, semaphore=semaphore, strip=False)
+    )
+    return {
+        "branch": branch if branch_ok and branch else None,
+        "head": head if head_ok and head else None,
+        "status_digest": GitUtils.digest_status_output(project_path, status) if status_ok else None,
+        "dirty": bool(status) if status_ok else None
+    }
+
+async def collect_git_states(project_dirs, max_concurrency=ASYNC_GIT_CONCURRENCY):
+    """여러 프로젝트의 Git 상태를 이벤트 루프 하나에서 조회합니다 (Git 명령 최대 max_concurrency개 동시 실행).
+
+    Returns:
+        dict: {project_dir: collect_git_state 결과}
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    states = await asyncio.gather(*(collect_git_state(project_dir, semaphore) for project_dir in project_dirs))
+    return dict(zip(project_dirs, states))
+
+def get_git_states(project_dirs, max_concurrency=ASYNC_GIT_CONCURRENCY):
+    """collect_git_states의 동기 버전입니다."""
+    return run_async(collect_git_states(project_dirs, max_concurrency))
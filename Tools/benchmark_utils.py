@@ -0,0 +1,233 @@
+"""
+벤치마크 공통 도구
+- 설정 덮어쓰기: Config 값과 이미 import된 Tools 모듈의 같은 이름 전역 변수(호환성 유지 복사본)를 함께 변경/복원
+  (모듈 전역 변수는 import 시점에 복사되므로 Config만 바꾸면 반영되지 않음)
+- 측정: 실행 시간, 현재 프로세스의 최대 메모리(RSS 주기 측정) / 최대 스레드 수, Python 힙 최대 사용량(tracemalloc)
+- 출력 숨기기 (측정 중 툴킷 함수의 print 출력 제외)
+- 결과 표 출력과 BUILD_OUTPUT_DIR/_Benchmarks/<이름>_<시각>.json 저장
+- 명령줄 옵션 해석 (--projects 1,10,50 형식)
+"""
+import os
+import sys
+import json
+import math
+import time
+import threading
+import tracemalloc
+import contextlib
+from config import Config
+
+BENCHMARK_DIR_NAME = "_Benchmarks"
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def override_config(**values):
+    """Config 값과 Tools 모듈의 같은 이름 전역 변수를 변경합니다.
+
+    Returns:
+        dict: 변경 전 값 (restore_config에 전달하여 복원)
+    """
+    previous = {name: getattr(Config, name) for name in values}
+    for name, value in values.items():
+        setattr(Config, name, value)
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if not module_file or os.path.dirname(os.path.abspath(module_file)) != TOOLS_DIR:
+            continue
+        for name, value in values.items():
+            if hasattr(module, name) and not callable(getattr(module, name)):
+                setattr(module, name, value)
+    return previous
+
+def restore_config(previous):
+    """override_config로 변경한 값을 복원합니다."""
+    override_config(**previous)
+
+def read_process_rss_mb():
+    """현재 프로세스의 메모리 사용량(RSS, MB)을 반환합니다 (측정할 수 없으면 None)."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/status", 'r') as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) / 1024
+        except (OSError, ValueError, IndexError):
+            return None
+        return None
+
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / (1024 * 1024)
+        except (OSError, AttributeError):
+            return None
+    return None
+
+
+class PeakMemorySampler:
+    """현재 프로세스의 최대 메모리(RSS)와 최대 스레드 수를 주기적으로 측정합니다.
+
+    host_resources.ProcessResourceSampler는 자식 프로세스(Unity)까지 합산하므로,
+    오케스트레이터 자체의 사용량은 이 클래스로 측정합니다.
+    """
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.start_memory_mb = None
+        self.peak_memory_mb = None
+        self.peak_threads = 0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.start_memory_mb = read_process_rss_mb()
+        self._sample()
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        memory_mb = read_process_rss_mb()
+        if memory_mb is not None:
+            self.peak_memory_mb = max(self.peak_memory_mb or 0.0, memory_mb)
+        self.peak_threads = max(self.peak_threads, threading.active_count())
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._sample()
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        """측정을 중지하고 {"start_memory_mb", "peak_memory_mb", "peak_threads"}를 반환합니다."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=self.interval + 1)
+        self._sample()
+        return {
+            "start_memory_mb": _round_optional(self.start_memory_mb),
+            "peak_memory_mb": _round_optional(self.peak_memory_mb),
+            "peak_threads": self.peak_threads
+        }
+
+def _round_optional(value, digits=1):
+    return round(value, digits) if value is not None else None
+
+def measure(func, *args, trace_memory=False, **kwargs):
+    """함수를 실행하고 실행 시간과 메모리 사용량을 측정합니다.
+
+    trace_memory가 True이면 tracemalloc으로 Python 힙 최대 사용량도 측정합니다 (실행이 느려지므로
+    시간과 메모리를 따로 측정할 때만 사용).
+
+    Returns:
+        tuple: (함수 결과, {"seconds", "start_memory_mb", "peak_memory_mb", "peak_threads", "peak_heap_mb"})
+    """
+    sampler = PeakMemorySampler().start()
+    if trace_memory:
+        tracemalloc.start()
+    start_time = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start_time
+        peak_heap_mb = None
+        if trace_memory:
+            peak_heap_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+        measurement = sampler.stop()
+    measurement["seconds"] = round(seconds, 4)
+    measurement["peak_heap_mb"] = _round_optional(peak_heap_mb, 2)
+    return result, measurement
+
+@contextlib.contextmanager
+def quiet_output(verbose=False):
+    """측정하는 동안 표준 출력(다른 스레드 포함)을 숨깁니다 (verbose이면 그대로 출력)."""
+    if verbose:
+        yield
+        return
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def percentile(values, percent):
+    """값 목록의 백분위수를 반환합니다 (최근접 순위, 값이 없으면 None)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def parse_int_list(text):
+    """"1,10,50" 형식의 정수 목록을 해석합니다 (잘못된 값은 제외)."""
+    values = []
+    for item in text.split(","):
+        item = item.strip()
+        if item.isdigit() and int(item) > 0:
+            values.append(int(item))
+    return values
+
+def get_option_value(argv, name, default=None):
+    """명령줄 인수에서 옵션 값을 반환합니다 (예: --projects 1,10 → "1,10", 없으면 default)."""
+    if name in argv:
+        index = argv.index(name)
+        if index + 1 < len(argv) and not argv[index + 1].startswith("--"):
+            return argv[index + 1]
+    return default
+
+def print_table(title, columns, rows):
+    """결과 표를 출력합니다.
+
+    Args:
+        title: 표 제목
+        columns: [(제목, 폭), ...] (첫 열은 왼쪽 정렬, 나머지는 오른쪽 정렬)
+        rows: [[값, ...], ...] (None은 "-"로 표시)
+    """
+    print(f"\n📊 {title}")
+    header = "".join(f"{name:<{width}}" if index == 0 else f"{name:>{width}}"
+                     for index, (name, width) in enumerate(columns))
+    print("   " + header)
+    print("   " + "-" * len(header))
+    for row in rows:
+        cells = []
+        for index, ((_, width), value) in enumerate(zip(columns, row)):
+            text = "-" if value is None else str(value)
+            cells.append(f"{text:<{width}}" if index == 0 else f"{text:>{width}}")
+        print("   " + "".join(cells))
+
+def save_benchmark_json(name, payload, output_path=None):
+    """벤치마크 결과를 JSON으로 저장합니다 (기본 경로: BUILD_OUTPUT_DIR/_Benchmarks/<이름>_<시각>.json).
+
+    Returns:
+        str: 저장 경로 (실패 시 None)
+    """
+    if output_path is None:
+        output_path = os.path.join(Config.BUILD_OUTPUT_DIR, BENCHMARK_DIR_NAME,
+                                   f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    try:
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(dict({"created_at": time.strftime('%Y-%m-%d %H:%M:%S')}, **payload),
+                      f, indent=2, ensure_ascii=False)
+        return output_path
+    except OSError as e:
+        print(f"⚠️ 벤치마크 결과 저장 실패: {e}")
+        return None
@@ -0,0 +1,330 @@
+"""
+WebGL 빌드 캐시 (콘텐츠 해시 / Git 리비전 기반)
+- Assets/, ProjectSettings/, Packages/manifest.json, Packages/packages-lock.json,
+  Unity 에디터 버전, 빌드 옵션(WEBGL_CODE_OPTIMIZATION 등)으로 프로젝트 지문(fingerprint) 계산
+- 파일별 (mtime, size)가 이전과 같으면 저장된 해시를 재사용하고, 바뀐 파일만 다시 해시
+- "git" 모드: 파일 해시 대신 HEAD 커밋 + git status --porcelain 요약으로 변경 여부 판단 (더 빠름)
+- 캐시는 BUILD_OUTPUT_DIR/_Cache/프로젝트명.json 에 프로젝트별로 저장 (병렬 빌드 시 충돌 없음)
+"""
+import os
+import json
+import time
+import hashlib
+from config import Config
+from git_utils import get_project_name_from_path, is_git_repository, get_head_commit, get_status_digest
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+UNITY_EDITOR_PATH = Config.UNITY_EDITOR_PATH
+BUILD_CACHE_MODE = Config.BUILD_CACHE_MODE
+
+CACHE_DIR_NAME = "_Cache"
+CACHE_MODES = ["content", "git"]
+
+# 지문 계산 대상 (프로젝트 기준 상대 경로)
+FINGERPRINT_DIRS = ["Assets", "ProjectSettings"]
+FINGERPRINT_FILES = [
+    os.path.join("Packages", "manifest.json"),
+    os.path.join("Packages", "packages-lock.json")
+]
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_cache_dir():
+    """빌드 캐시 디렉토리 경로를 반환합니다."""
+    return os.path.join(BUILD_OUTPUT_DIR, CACHE_DIR_NAME)
+
+def get_unity_editor_version(unity_path=None):
+    """Unity 에디터 경로에서 버전을 추출합니다 (예: ...\\Editor\\6000.0.59f2\\Editor\\Unity.exe -> 6000.0.59f2)."""
+    if unity_path is None:
+        unity_path = UNITY_EDITOR_PATH
+
+    normalized = unity_path.replace("\\", "/").rstrip("/")
+    parts = normalized.split("/")
+    # Unity Hub 구조: <버전>/Editor/Unity.exe
+    if len(parts) >= 3 and parts[-2] == "Editor":
+        return parts[-3]
+    return normalized
+
+def get_build_options():
+    """빌드 결과에 영향을 주는 빌드 옵션을 반환합니다."""
+    return {
+        "codeOptimization": Config.WEBGL_CODE_OPTIMIZATION,
+        "memorySize": Config.WEBGL_MEMORY_SIZE,
+        "maximumMemorySize": Config.WEBGL_MAXIMUM_MEMORY_SIZE,
+        "memoryGrowthMode": Config.WEBGL_MEMORY_GROWTH_MODE
+    }
+
+def _iter_files(directory):
+    """디렉토리의 파일들을 (DirEntry) 재귀적으로 순회합니다. Unity가 무시하는 숨김/~ 폴더는 제외합니다."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or entry.name.endswith('~'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except (FileNotFoundError, PermissionError):
+        return
+
+def _hash_file(file_path):
+    """파일 내용의 SHA-1 해시를 계산합니다."""
+    hasher = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def compute_project_fingerprint(project_path, previous_files=None):
+    """프로젝트 지문을 계산합니다.
+
+    Args:
+        project_path: Unity 프로젝트 경로
+        previous_files: 이전 계산의 파일 인덱스 {상대경로: [mtime_ns, size, hash]}
+            (mtime/size가 같은 파일은 다시 읽지 않고 해시를 재사용)
+
+    Returns:
+        tuple: (fingerprint, files, hashed_count)
+            - fingerprint: 프로젝트 전체 지문 (hex 문자열)
+            - files: 새 파일 인덱스 {상대경로: [mtime_ns, size, hash]}
+            - hashed_count: 실제로 내용을 읽어 해시한 파일 수
+    """
+    if previous_files is None:
+        previous_files = {}
+
+    files = {}
+    hashed_count = 0
+
+    def add_file(rel_path, file_path, stat):
+        nonlocal hashed_count
+        rel_path = rel_path.replace(os.sep, '/')
+        previous = previous_files.get(rel_path)
+        if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+            file_hash = previous[2]
+        else:
+            file_hash = _hash_file(file_path)
+            hashed_count += 1
+        files[rel_path] = [stat.st_mtime_ns, stat.st_size, file_hash]
+
+    for dir_name in FINGERPRINT_DIRS:
+        for entry in _iter_files(os.path.join(project_path, dir_name)):
+            rel_path = os.path.relpath(entry.path, project_path)
+            add_file(rel_path, entry.path, entry.stat(follow_symlinks=False))
+
+    for rel_path in FINGERPRINT_FILES:
+        file_path = os.path.join(project_path, rel_path)
+        if os.path.isfile(file_path):
+            add_file(rel_path, file_path, os.stat(file_path))
+
+    hasher = hashlib.sha256()
+    hasher.update(f"editor={get_unity_editor_version()}\n".encode('utf-8'))
+    hasher.update(f"options={json.dumps(get_build_options(), sort_keys=True)}\n".encode('utf-8'))
+    for rel_path in sorted(files):
+        hasher.update(f"{rel_path}\0{files[rel_path][2]}\n".encode('utf-8'))
+
+    return hasher.hexdigest(), files, hashed_count
+
+def compute_git_fingerprint(project_path):
+    """Git 리비전 기반 프로젝트 지문을 계산합니다.
+
+    Returns:
+        tuple: (fingerprint, head_commit) (Git 리포지토리가 아니거나 실패하면 (None, None))
+    """
+    if not is_git_repository(project_path):
+        return None, None
+
+    head_commit = get_head_commit(project_path)
+    status_digest = get_status_digest(project_path)
+    if head_commit is None or status_digest is None:
+        return None, None
+
+    hasher = hashlib.sha256()
+    hasher.update(f"editor={get_unity_editor_version()}\n".encode('utf-8'))
+    hasher.update(f"options={json.dumps(get_build_options(), sort_keys=True)}\n".encode('utf-8'))
+    hasher.update(f"head={head_commit}\nstatus={status_digest}\n".encode('utf-8'))
+    return hasher.hexdigest(), head_commit
+
+def load_cache_entry(project_name):
+    """프로젝트의 빌드 캐시 항목을 읽습니다 (없으면 None)."""
+    cache_path = os.path.join(get_cache_dir(), f"{project_name}.json")
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ 빌드 캐시 읽기 실패 ({project_name}): {e}")
+        return None
+
+def save_cache_entry(project_name, entry):
+    """프로젝트의 빌드 캐시 항목을 저장합니다."""
+    cache_dir = get_cache_dir()
+    cache_path = os.path.join(cache_dir, f"{project_name}.json")
+    temp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+        return True
+    except Exception as e:
+        print(f"⚠️ 빌드 캐시 저장 실패 ({project_name}): {e}")
+        return False
+
+def clear_cache_entry(project_name):
+    """프로젝트의 빌드 캐시 항목을 삭제합니다 (설정과 다른 옵션으로 빌드하여 출력물이 바뀐 경우)."""
+    cache_path = os.path.join(get_cache_dir(), f"{project_name}.json")
+    try:
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+    except OSError as e:
+        print(f"⚠️ 빌드 캐시 삭제 실패 ({project_name}): {e}")
+
+def has_build_output(project_name):
+    """빌드 출력물(Build 폴더)이 남아있는지 확인합니다."""
+    build_folder = os.path.join(BUILD_OUTPUT_DIR, project_name, "Build")
+    try:
+        return os.path.isdir(build_folder) and len(os.listdir(build_folder)) > 0
+    except OSError:
+        return False
+
+def is_build_cached(project_path, mode=None):
+    """마지막 성공 빌드 이후 프로젝트가 변경되지 않았는지 확인합니다.
+
+    Args:
+        project_path: Unity 프로젝트 경로
+        mode: "content" (파일 해시) 또는 "git" (HEAD + 작업 트리 상태), 기본값 Config.BUILD_CACHE_MODE
+            Git 리포지토리가 아니면 "content" 방식으로 확인합니다.
+
+    Returns:
+        bool: 캐시 적중 여부 (지문이 같고 빌드 출력물이 남아있으면 True)
+    """
+    if mode is None:
+        mode = BUILD_CACHE_MODE
+
+    project_name = get_project_name_from_path(project_path)
+    entry = load_cache_entry(project_name)
+    if not entry or not has_build_output(project_name):
+        return False
+
+    if mode == "git":
+        git_fingerprint, _ = compute_git_fingerprint(project_path)
+        if git_fingerprint is not None:
+            return git_fingerprint == entry.get("git_fingerprint")
+
+    if not entry.get("fingerprint"):
+        return False
+
+    fingerprint, files, hashed_count = compute_project_fingerprint(project_path, entry.get("files"))
+    if fingerprint != entry.get("fingerprint"):
+        return False
+
+    # 내용은 같지만 mtime만 바뀐 파일이 있으면 인덱스를 갱신하여 다음 확인을 빠르게 함
+    if hashed_count > 0:
+        entry["files"] = files
+        save_cache_entry(project_name, entry)
+    return True
+
+def capture_build_fingerprint(project_path, mode=None):
+    """Unity를 실행하기 전 프로젝트 지문을 계산합니다 (빌드 성공 시 record_successful_build에 전달).
+
+    빌드 중에 수정된 파일이 이미 빌드된 것으로 기록되지 않도록 빌드 시작 시점의 상태를 사용합니다.
+    Git 지문(HEAD + 작업 트리 상태)은 항상 계산하고, 파일 해시 지문은 "content" 모드이거나
+    Git 리포지토리가 아닐 때만 계산합니다.
+
+    Returns:
+        dict: {"fingerprint", "files", "git_fingerprint", "head_commit"}
+    """
+    if mode is None:
+        mode = BUILD_CACHE_MODE
+    if mode not in CACHE_MODES:
+        mode = "content"  # filter_cached_projects와 같은 방식으로 확인되도록
+
+    project_name = get_project_name_from_path(project_path)
+    git_fingerprint, head_commit = compute_git_fingerprint(project_path)
+    snapshot = {
+        "fingerprint": None,
+        "files": {},
+        "git_fingerprint": git_fingerprint,
+        "head_commit": head_commit
+    }
+
+    if mode == "content" or git_fingerprint is None:
+        previous = load_cache_entry(project_name) or {}
+        fingerprint, files, _ = compute_project_fingerprint(project_path, previous.get("files"))
+        snapshot["fingerprint"] = fingerprint
+        snapshot["files"] = files
+    return snapshot
+
+def record_successful_build(project_path, elapsed_time=0.0, mode=None, snapshot=None):
+    """성공한 빌드의 프로젝트 지문을 캐시에 기록합니다.
+
+    snapshot은 빌드 시작 전에 capture_build_fingerprint로 계산한 지문입니다. 주어지지 않으면 지금 계산합니다
+    (빌드 중 변경된 파일까지 빌드된 것으로 기록되므로 빌드 직후에는 snapshot 사용을 권장).
+    빌드 중 Unity가 ProjectSettings를 다시 저장하면 다음 확인에서 한 번 더 빌드한 뒤 적중합니다.
+    """
+    if snapshot is None:
+        snapshot = capture_build_fingerprint(project_path, mode)
+
+    project_name = get_project_name_from_path(project_path)
+    entry = dict(snapshot)
+    entry.update({
+        "editor_version": get_unity_editor_version(),
+        "build_options": get_build_options(),
+        "built_at": time.strftime('%Y-%m-%d %H:%M:%S'),
+        "elapsed_time": elapsed_time
+    })
+    return save_cache_entry(project_name, entry)
+
+def check_build_cache(project_dir, mode=None):
+    """프로젝트가 빌드 캐시에 적중하는지 확인하고 적중하면 알립니다 (확인 실패 시 빌드 필요로 처리).
+
+    filter_cached_projects(빌드 전 일괄 확인)와 단계 파이프라인(빌드 단계 직전 확인)이 함께 사용합니다.
+    """
+    project_name = get_project_name_from_path(project_dir)
+    try:
+        cached = is_build_cached(project_dir, mode)
+    except Exception as e:
+        print(f"⚠️ 빌드 캐시 확인 실패 ({project_name}): {e}")
+        return False
+    if cached:
+        print(f"♻️ 빌드 캐시 적중 (변경사항 없음, 빌드 생략): {project_name}")
+    return cached
+
+def filter_cached_projects(project_dirs, mode=None):
+    """캐시 적중 프로젝트를 제외한 빌드 대상 목록을 반환합니다.
+
+    Returns:
+        tuple: (projects_to_build, cached_results)
+            - projects_to_build: 빌드가 필요한 프로젝트 경로 목록
+            - cached_results: [(project_name, True, 0.0), ...] 캐시 적중 프로젝트 결과
+    """
+    if mode is None:
+        mode = BUILD_CACHE_MODE
+    if mode not in CACHE_MODES:
+        print(f"⚠️ 알 수 없는 빌드 캐시 모드: {mode} (content 사용)")
+        mode = "content"
+
+    projects_to_build = []
+    cached_results = []
+    check_start_time = time.time()
+
+    for project_dir in project_dirs:
+        if not os.path.exists(project_dir):
+            projects_to_build.append(project_dir)
+            continue
+
+        if check_build_cache(project_dir, mode):
+            cached_results.append((get_project_name_from_path(project_dir), True, 0.0))
+        else:
+            projects_to_build.append(project_dir)
+
+    check_elapsed = time.time() - check_start_time
+    print(f"♻️ 빌드 캐시 확인 완료 ({mode} 모드): {len(cached_results)}개 적중, {len(projects_to_build)}개 빌드 필요 ({check_elapsed:.2f}초)")
+    return projects_to_build, cached_results
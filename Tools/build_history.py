@@ -0,0 +1,232 @@
+"""
+WebGL 빌드 시간 기록 및 병렬 빌드 스케줄링
+- 프로젝트별 최근 빌드 소요 시간을 BUILD_OUTPUT_DIR/_History/프로젝트명.json 에 저장
+- 병렬 빌드 시 예상 시간이 긴 프로젝트부터 제출 (LPT: Longest Processing Time first)
+  → 오래 걸리는 프로젝트가 마지막에 시작되어 전체 빌드 시간이 늘어나는 것을 방지
+- 기록이 없는 프로젝트는 Assets 폴더 크기로 예상 시간 추정 (기록이 있는 프로젝트로 MB당 시간 보정)
+- Unity 프로세스의 최대 메모리 / 평균 CPU 사용량도 기록하여 적응형 동시 실행 기준으로 사용
+- 빌드 단계별 소요 시간(스크립트 컴파일, 에셋 임포트, IL2CPP, C++ 컴파일, WASM 링크 등) 기록
+"""
+import os
+import json
+import time
+import heapq
+from config import Config
+from git_utils import get_project_name_from_path
+from build_report import format_duration
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+BUILD_HISTORY_SIZE = Config.BUILD_HISTORY_SIZE
+BUILD_ESTIMATE_BASE_SECONDS = Config.BUILD_ESTIMATE_BASE_SECONDS
+BUILD_ESTIMATE_SECONDS_PER_MB = Config.BUILD_ESTIMATE_SECONDS_PER_MB
+BUILD_MEMORY_PER_BUILD_MB = Config.BUILD_MEMORY_PER_BUILD_MB
+BUILD_CPU_PER_BUILD = Config.BUILD_CPU_PER_BUILD
+
+HISTORY_DIR_NAME = "_History"
+
+
+def get_history_dir():
+    """빌드 기록 디렉토리 경로를 반환합니다."""
+    return os.path.join(BUILD_OUTPUT_DIR, HISTORY_DIR_NAME)
+
+def get_assets_size(project_path):
+    """프로젝트 Assets 폴더의 전체 크기(바이트)를 반환합니다."""
+    total_size = 0
+    for root, dirs, files in os.walk(os.path.join(project_path, "Assets")):
+        # Unity가 무시하는 숨김/~ 폴더는 제외
+        dirs[:] = [d for d in dirs if not d.startswith('.') and not d.endswith('~')]
+        for file_name in files:
+            try:
+                total_size += os.path.getsize(os.path.join(root, file_name))
+            except OSError:
+                pass
+    return total_size
+
+def load_build_history(project_name):
+    """프로젝트의 빌드 기록을 읽습니다 (없으면 None)."""
+    history_path = os.path.join(get_history_dir(), f"{project_name}.json")
+    if not os.path.exists(history_path):
+        return None
+    try:
+        with open(history_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ 빌드 기록 읽기 실패 ({project_name}): {e}")
+        return None
+
+def save_build_history(project_name, history):
+    """프로젝트의 빌드 기록을 저장합니다."""
+    history_dir = get_history_dir()
+    history_path = os.path.join(history_dir, f"{project_name}.json")
+    temp_path = history_path + ".tmp"
+    try:
+        os.makedirs(history_dir, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, history_path)
+        return True
+    except Exception as e:
+        print(f"⚠️ 빌드 기록 저장 실패 ({project_name}): {e}")
+        return False
+
+def record_build_duration(project_path, elapsed_time):
+    """성공한 빌드의 소요 시간을 기록합니다 (최근 BUILD_HISTORY_SIZE개 유지)."""
+    project_name = get_project_name_from_path(project_path)
+    history = load_build_history(project_name) or {}
+
+    durations = history.get("durations", [])
+    durations.append(round(elapsed_time, 1))
+    history["durations"] = durations[-BUILD_HISTORY_SIZE:]
+    history["assets_size"] = get_assets_size(project_path)
+    history["updated_at"] = time.strftime('%Y-%m-%d %H:%M:%S')
+
+    return save_build_history(project_name, history)
+
+def record_build_resources(project_path, peak_memory_mb, cpu_cores):
+    """빌드 중 측정한 Unity 프로세스 트리의 최대 메모리(MB)와 평균 CPU 코어 사용량을 기록합니다."""
+    project_name = get_project_name_from_path(project_path)
+    history = load_build_history(project_name) or {}
+
+    resources = history.get("resources", [])
+    resources.append([round(peak_memory_mb), round(cpu_cores, 2)])
+    history["resources"] = resources[-BUILD_HISTORY_SIZE:]
+
+    return save_build_history(project_name, history)
+
+def record_build_phases(project_path, phase_timings, success, elapsed_time):
+    """빌드 단계별 소요 시간을 기록합니다 (성공/실패 모두, 최근 BUILD_HISTORY_SIZE회 유지).
+
+    Args:
+        phase_timings: build_phases.compute_phase_timings 결과 {"segments": [...], "totals": {...}}
+    """
+    project_name = get_project_name_from_path(project_path)
+    history = load_build_history(project_name) or {}
+
+    builds = history.get("phases", [])
+    builds.append({
+        "built_at": time.strftime('%Y-%m-%d %H:%M:%S'),
+        "success": success,
+        "elapsed_time": round(elapsed_time, 1),
+        "totals": phase_timings["totals"],
+        "segments": phase_timings["segments"]
+    })
+    history["phases"] = builds[-BUILD_HISTORY_SIZE:]
+
+    return save_build_history(project_name, history)
+
+def get_build_requirements(project_dirs):
+    """프로젝트별 빌드 필요 자원(메모리 MB, CPU 코어)을 추정합니다.
+
+    기록이 있으면 최근 측정값 중 최대값을 사용하고, 없으면 다른 프로젝트 기록의 중앙값,
+    아무 기록도 없으면 설정값(BUILD_MEMORY_PER_BUILD_MB, BUILD_CPU_PER_BUILD)을 사용합니다.
+
+    Returns:
+        tuple: ({project_dir: (memory_mb, cpu_cores)}, (default_memory_mb, default_cpu_cores))
+    """
+    measured = {}
+    for project_dir in project_dirs:
+        history = load_build_history(get_project_name_from_path(project_dir))
+        resources = (history or {}).get("resources")
+        if resources:
+            measured[project_dir] = (
+                max(memory_mb for memory_mb, _ in resources),
+                max(cpu_cores for _, cpu_cores in resources)
+            )
+
+    if measured:
+        default = (
+            _median([memory_mb for memory_mb, _ in measured.values()]),
+            _median([cpu_cores for _, cpu_cores in measured.values()])
+        )
+    else:
+        default = (BUILD_MEMORY_PER_BUILD_MB, BUILD_CPU_PER_BUILD)
+
+    requirements = {project_dir: measured.get(project_dir, default) for project_dir in project_dirs}
+    return requirements, default
+
+def _median(values):
+    """값 목록의 중앙값을 반환합니다."""
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2 == 1:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+def get_recorded_duration(history):
+    """빌드 기록의 대표 소요 시간(최근 기록의 중앙값)을 반환합니다 (기록이 없으면 None)."""
+    if not history or not history.get("durations"):
+        return None
+    return _median(history["durations"])
+
+def estimate_seconds_per_mb(histories):
+    """기록이 있는 프로젝트들로 Assets 1MB당 빌드 시간을 보정합니다 (보정 불가 시 설정값)."""
+    # 프로젝트별 비율의 평균 대신 전체 합의 비율을 사용 (작은 프로젝트 하나가 결과를 좌우하지 않도록)
+    total_seconds = 0.0
+    total_mb = 0.0
+    for history in histories:
+        duration = get_recorded_duration(history)
+        size_mb = (history or {}).get("assets_size", 0) / (1024 * 1024)
+        if duration is not None and size_mb >= 1:
+            total_seconds += max(duration - BUILD_ESTIMATE_BASE_SECONDS, 0)
+            total_mb += size_mb
+    if total_mb == 0:
+        return BUILD_ESTIMATE_SECONDS_PER_MB
+    return total_seconds / total_mb
+
+def schedule_longest_first(project_dirs):
+    """예상 빌드 시간이 긴 순서로 프로젝트를 정렬합니다.
+
+    Returns:
+        list: [(project_dir, expected_seconds, source), ...] (source: "history" 또는 "size")
+    """
+    histories = {}
+    for project_dir in project_dirs:
+        histories[project_dir] = load_build_history(get_project_name_from_path(project_dir))
+
+    seconds_per_mb = None
+    schedule = []
+    for project_dir in project_dirs:
+        recorded = get_recorded_duration(histories[project_dir])
+        if recorded is not None:
+            schedule.append((project_dir, recorded, "history"))
+            continue
+
+        # 기록이 없으면 Assets 크기로 추정 (보정값은 한 번만 계산)
+        if seconds_per_mb is None:
+            seconds_per_mb = estimate_seconds_per_mb(histories.values())
+        size_mb = get_assets_size(project_dir) / (1024 * 1024)
+        schedule.append((project_dir, BUILD_ESTIMATE_BASE_SECONDS + size_mb * seconds_per_mb, "size"))
+
+    # 안정 정렬: 예상 시간이 같으면 원래 순서 유지
+    schedule.sort(key=lambda item: item[1], reverse=True)
+    return schedule
+
+def order_longest_first(project_dirs, max_workers):
+    """예상 빌드 시간이 긴 순서(LPT)로 정렬한 프로젝트 경로 목록을 반환하고 빌드 순서를 출력합니다.
+
+    병렬 빌드(build_manager)와 단계 파이프라인(stage_pipeline)이 함께 사용합니다.
+    """
+    schedule = schedule_longest_first(project_dirs)
+    print_build_schedule(schedule, max_workers)
+    return [project_dir for project_dir, _, _ in schedule]
+
+def estimate_makespan(durations, max_workers):
+    """주어진 순서로 작업자에게 배정했을 때의 예상 전체 소요 시간을 계산합니다."""
+    if not durations:
+        return 0.0
+    workers = [0.0] * max(1, min(max_workers, len(durations)))
+    for duration in durations:
+        heapq.heapreplace(workers, workers[0] + duration)
+    return max(workers)
+
+def print_build_schedule(schedule, max_workers):
+    """병렬 빌드 순서와 예상 전체 소요 시간을 출력합니다."""
+    if not schedule:
+        return
+    print("🗓️ 병렬 빌드 순서 (예상 시간이 긴 프로젝트부터):")
+    for index, (project_dir, expected_seconds, source) in enumerate(schedule, 1):
+        source_text = "기록" if source == "history" else "크기 추정"
+        print(f"   {index}. {get_project_name_from_path(project_dir)}: 약 {format_duration(expected_seconds)} ({source_text})")
+    makespan = estimate_makespan([item[1] for item in schedule], max_workers)
+    print(f"⏱️ 예상 전체 소요 시간: 약 {format_duration(makespan)} ({max_workers}개 동시 실행)")
@@ -5,30 +5,72 @@ Unity 6 전용 WebGL 빌드 자동화 함수들 (Player Settings 완전 반영)
 - UnityEditor.WebGL.UserBuildSettings.codeOptimization 사용
 """
 import os
+import re
+import json
 import subprocess
 import time
 import shutil
 import traceback
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from string import Template
 from config import Config
 from git_utils import get_project_name_from_path
-from unity_cli import find_unity_editor_path
+from unity_cli import find_unity_editor_path, BATCH_PROCESS_METHOD
+from build_cache import filter_cached_projects, capture_build_fingerprint, record_successful_build, clear_cache_entry
+from build_history import (
+    record_build_duration, record_build_resources, record_build_phases, get_build_requirements, order_longest_first
+)
+from host_resources import AdaptiveConcurrencyController, ProcessResourceSampler, get_host_worker_limit
+from process_tree import (
+    start_process_group, release_process, kill_process_tree, kill_all_process_trees, new_process_group, process_group
+)
+from log_tailer import LogTailer
+from log_analyzer import analyze_build_log, print_log_analysis
+from build_phases import detect_phase, get_phase_name, compute_phase_timings, format_phase_summary
+from build_report import (
+    get_build_report_path, clear_build_report, load_build_report, validate_build_report,
+    get_build_folder_files, get_report_errors, get_step_durations, is_build_file_kind, describe_file_kind, format_size
+)
+from build_metrics import record_build_metrics, get_build_output_files
+from payload_budget import check_payload_budgets, is_budget_failure, print_payload_budget_report
+from build_trace import acquire_slot, release_slot, add_build_spans, trace_span
 
 # 전역 변수 참조 (호환성 유지)
 BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
 BUILD_TIMEOUT = Config.BUILD_TIMEOUT
 WEBGL_CODE_OPTIMIZATION = Config.WEBGL_CODE_OPTIMIZATION
 UNITY_EDITOR_PATH = Config.UNITY_EDITOR_PATH
-def create_unity_webgl_build_script(project_path, output_path=None, auto_configure=True, code_optimization=None):
-    """Unity WebGL 빌드를 위한 Editor 스크립트를 생성합니다. (Player Settings 자동 설정 포함)"""
-    editor_dir = os.path.join(project_path, "Assets", "Editor")
-    if not os.path.exists(editor_dir):
-        os.makedirs(editor_dir)
+WEBGL_MEMORY_SIZE = Config.WEBGL_MEMORY_SIZE
+WEBGL_MAXIMUM_MEMORY_SIZE = Config.WEBGL_MAXIMUM_MEMORY_SIZE
+WEBGL_MEMORY_GROWTH_MODE = Config.WEBGL_MEMORY_GROWTH_MODE
+ADAPTIVE_CONCURRENCY = Config.ADAPTIVE_CONCURRENCY
+BUILD_STALL_TIMEOUT = Config.BUILD_STALL_TIMEOUT
+BUILD_STALL_PHASE_TIMEOUTS = Config.BUILD_STALL_PHASE_TIMEOUTS
+BUILD_FAIL_FAST_ON_COMPILE_ERRORS = Config.BUILD_FAIL_FAST_ON_COMPILE_ERRORS
+
+# Unity 6.0 WasmCodeOptimization 옵션
+WEBGL_CODE_OPTIMIZATION_OPTIONS = ["BuildTimes", "RuntimeSpeed", "RuntimeSpeedLTO", "DiskSize", "DiskSizeLTO"]
+
+# 패키지 Editor 어셈블리의 WebGL 빌드 진입점 (Editor/Scripts/WebGLBuilder.cs)
+WEBGL_BUILD_METHOD = "Dannect.Toolkit.Editor.WebGLBuilder.BuildFromCommandLine"
+
+# 빌드 성공 / 출력 파일 보고 로그 (BuildReport가 없을 때 검증에 사용, 빌드 중 모니터가 줄마다 확인)
+BUILD_SUCCESS_MARKERS = ["✅ WebGL 빌드 성공!", "📊 빌드 결과: Succeeded", "BuildResult.Succeeded"]
+BUILD_FILE_COUNT_PATTERN = re.compile(r'📦 Build 폴더 파일 수: (\d+)')
+BUILD_COMPLETED_MARKER = "🌐 WebGL 빌드 완료!"
+
+# 스크립트 컴파일 실패 로그 (빌드 중 발견 즉시 중단)
+COMPILE_ERROR_SIGNATURES = ["error CS", "Compilation failed", "Scripts have compiler errors"]
+MAX_COMPILE_ERRORS = 50
+
+def create_webgl_build_job(project_path, output_path=None, code_optimization=None):
+    """패키지 Editor 어셈블리의 WebGLBuilder에 전달할 빌드 작업 파일(JSON)을 생성합니다.
     
-    script_path = os.path.join(editor_dir, "AutoWebGLBuildScript.cs")
+    빌드 로직은 com.dannect.toolkit 패키지(Editor/Scripts/WebGLBuilder.cs)에 고정되어 있으므로
+    프로젝트의 Assets 폴더에는 아무 파일도 쓰지 않습니다 (스크립트 재컴파일 없음).
     
+    Returns:
+        str: 작업 파일 경로 (실패 시 None)
+    """
     # 프로젝트명 추출
     project_name = get_project_name_from_path(project_path)
     
@@ -36,604 +78,70 @@ def create_unity_webgl_build_script(project_path, output_path=None, auto_configu
         # 빌드 출력 경로: C:\Users\wkzkx\Desktop\Lim\GitHub\Build\프로젝트명\
         output_path = os.path.join(BUILD_OUTPUT_DIR, project_name)
     
-    output_path_formatted = output_path.replace(os.sep, '/')
-    
     # Code Optimization 설정 (기본값 또는 매개변수로 전달된 값)
     if code_optimization is None:
         code_optimization = WEBGL_CODE_OPTIMIZATION
     
     # 유효성 검사 (Unity 6.0 WasmCodeOptimization 5가지 옵션)
-    valid_options = ["BuildTimes", "RuntimeSpeed", "RuntimeSpeedLTO", "DiskSize", "DiskSizeLTO"]
+    valid_options = WEBGL_CODE_OPTIMIZATION_OPTIONS
     if code_optimization not in valid_options:
         print(f"⚠️ 잘못된 Code Optimization 설정: {code_optimization}")
         print(f"   사용 가능한 옵션: {', '.join(valid_options)}")
         print(f"   기본값 'RuntimeSpeedLTO' 사용")
         code_optimization = "RuntimeSpeedLTO"
     
-    # Template 시스템을 사용하여 Unity 스크립트 생성
-    script_template = Template("""// Unity 6 전용 WebGL 빌드 자동화 스크립트
-// dannect.unity.toolkit.py에 의해 자동 생성됨
-using UnityEngine;
-using UnityEditor;
-using UnityEditor.Build;
-using UnityEditor.WebGL;
-using System.IO;
-
-public class AutoWebGLBuildScript
-{
-    // Unity 6 Code Optimization 설정 (WasmCodeOptimization)
-    // Unity 6.0에서 사용 가능한 옵션: BuildTimes, RuntimeSpeed, RuntimeSpeedLTO, DiskSize, DiskSizeLTO
-    // 이 값은 dannect.unity.toolkit.py의 Config.WEBGL_CODE_OPTIMIZATION에서 자동 설정됩니다
-    private static string CODE_OPTIMIZATION_TYPE = "$code_optimization";
-    
-    [MenuItem("Build/Auto Build WebGL (Player Settings)")]
-    public static void BuildWebGLWithPlayerSettings()
-    {
-        Debug.Log("=== WebGL Player Settings 자동 설정 및 빌드 시작 ===");
-        
-        // WebGL Player Settings 자동 설정
-        ConfigureWebGLPlayerSettings();
-        
-        // 설정된 Player Settings 정보 출력
-        LogCurrentPlayerSettings();
-        
-        // 프로젝트명 추출 (Unity에서 스크립트가 실행되는 프로젝트의 이름)
-        string projectName = Application.productName;
-        if (string.IsNullOrEmpty(projectName))
-        {
-            // ProductName이 없으면 프로젝트 폴더명 사용
-            projectName = new DirectoryInfo(Application.dataPath).Parent.Name;
-        }
-        
-        // 특수문자 제거 및 안전한 파일명 생성
-        string safeProjectName = projectName.Replace(" ", "_");
-        safeProjectName = System.Text.RegularExpressions.Regex.Replace(safeProjectName, @"[^\\w\\-_\\.]", "");
-        
-        // 빌드 출력 경로: C:/Users/wkzkx/Desktop/Lim/GitHub/Build/프로젝트명
-        string buildPath = @"$output_path";
-        
-        // 출력 디렉토리 생성 (상위 폴더까지 모두 생성)
-        try
-        {
-            if (!Directory.Exists(buildPath))
-            {
-                Directory.CreateDirectory(buildPath);
-                Debug.Log("빌드 출력 디렉토리 생성: " + buildPath);
-            }
-            else
-            {
-                Debug.Log("빌드 출력 디렉토리 확인 완료: " + buildPath);
-            }
-        }
-        catch (System.Exception e)
-        {
-            Debug.LogError("빌드 출력 디렉토리 생성 실패: " + e.Message);
-            Debug.LogError("경로: " + buildPath);
-            return;
-        }
-        
-        Debug.Log("📁 프로젝트명: " + projectName + " -> 안전한 파일명: " + safeProjectName);
-        Debug.Log("🌐 빌드 경로: " + buildPath);
-        
-        // 빌드할 씬들 가져오기 (Build Settings에서 활성화된 씬만)
-        string[] scenes = GetBuildScenes();
-        if (scenes.Length == 0)
-        {
-            Debug.LogError("빌드할 씬이 없습니다. Build Settings에서 씬을 추가하세요.");
-            return;
-        }
-        
-        // WebGL 빌드 옵션 설정 (Player Settings 완전 반영)
-        BuildPlayerOptions buildPlayerOptions = new BuildPlayerOptions();
-        buildPlayerOptions.scenes = scenes;
-        buildPlayerOptions.locationPathName = buildPath;
-        buildPlayerOptions.target = BuildTarget.WebGL;
-        
-        // 빌드 옵션을 Player Settings에 따라 설정
-        buildPlayerOptions.options = GetBuildOptionsFromPlayerSettings();
-        
-        // WebGL 특수 설정 적용
-        ApplyWebGLSettings();
-        
-        Debug.Log("🌐 WebGL 빌드 시작");
-        Debug.Log("📁 빌드 경로: " + buildPlayerOptions.locationPathName);
-        Debug.Log("📂 프로젝트명: " + safeProjectName);
-        Debug.Log("🎮 제품명: " + PlayerSettings.productName);
-        Debug.Log("🏢 회사명: " + PlayerSettings.companyName);
-        Debug.Log("📋 버전: " + PlayerSettings.bundleVersion);
-        
-        // WebGL 빌드 실행
-        Debug.Log("🔄 BuildPipeline.BuildPlayer 호출 시작...");
-        UnityEditor.Build.Reporting.BuildReport report = null;
-        
-        try
-        {
-            report = BuildPipeline.BuildPlayer(buildPlayerOptions);
-            Debug.Log("✅ BuildPipeline.BuildPlayer 호출 완료");
-        }
-        catch (System.Exception e)
-        {
-            Debug.LogError("❌ BuildPipeline.BuildPlayer 예외 발생: " + e.Message);
-            Debug.LogError("스택 트레이스: " + e.StackTrace);
-            return;
-        }
-        
-        // 빌드 결과 확인
-        if (report == null)
-        {
-            Debug.LogError("❌ BuildReport가 null입니다. 빌드가 실행되지 않았습니다.");
-            return;
-        }
-        
-        Debug.Log("📊 빌드 결과: " + report.summary.result);
-        Debug.Log("📦 빌드 크기: " + FormatBytes(report.summary.totalSize));
-        Debug.Log("⏱️ 빌드 시간: " + report.summary.totalTime);
-        Debug.Log("❗ 에러 수: " + report.summary.totalErrors);
-        Debug.Log("⚠️ 경고 수: " + report.summary.totalWarnings);
-        
-        if (report.summary.result == UnityEditor.Build.Reporting.BuildResult.Succeeded)
-        {
-            Debug.Log("✅ WebGL 빌드 성공!");
-            Debug.Log("📁 빌드 경로: " + buildPath);
-            Debug.Log("📂 프로젝트명: " + safeProjectName);
-            
-            // Build 폴더 내용 확인
-            string buildFolder = System.IO.Path.Combine(buildPath, "Build");
-            if (Directory.Exists(buildFolder))
-            {
-                var files = Directory.GetFiles(buildFolder);
-                Debug.Log("📦 Build 폴더 파일 수: " + files.Length);
-                foreach (var file in files)
-                {
-                    var fileInfo = new FileInfo(file);
-                    Debug.Log("   - " + fileInfo.Name + " (" + FormatBytes((ulong)fileInfo.Length) + ")");
-                }
-            }
-            else
-            {
-                Debug.LogError("⚠️ Build 폴더가 생성되지 않았습니다: " + buildFolder);
-            }
-            
-            Debug.Log("🌐 WebGL 빌드 완료!");
-        }
-        else
-        {
-            Debug.LogError("❌ WebGL 빌드 실패: " + report.summary.result);
-            
-            // 상세 에러 정보 출력
-            if (report.summary.totalErrors > 0)
-            {
-                Debug.LogError("총 에러 수: " + report.summary.totalErrors);
-                
-                // BuildReport의 steps 확인
-                foreach (var step in report.steps)
-                {
-                    if (step.messages.Length > 0)
-                    {
-                        Debug.LogError("빌드 단계: " + step.name);
-                        foreach (var message in step.messages)
-                        {
-                            if (message.type == LogType.Error || message.type == LogType.Exception)
-                            {
-                                Debug.LogError("  - " + message.content);
-                            }
-                        }
-                    }
-                }
-            }
-            
-            if (report.summary.totalWarnings > 0)
-            {
-                Debug.LogWarning("총 경고 수: " + report.summary.totalWarnings);
-            }
-        }
-        
-        Debug.Log("=== WebGL Player Settings 반영 빌드 완료 ===");
-    }
-    
-    private static void ConfigureWebGLPlayerSettings()
-    {
-        Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 적용 중...");
-        
-        // 기본 제품 정보 설정 (비어있는 경우에만)
-        if (string.IsNullOrEmpty(PlayerSettings.productName))
-        {
-            PlayerSettings.productName = "Science Experiment Simulation";
-            Debug.Log("✅ 제품명 설정: Science Experiment Simulation");
-        }
-        
-        if (string.IsNullOrEmpty(PlayerSettings.companyName))
-        {
-            PlayerSettings.companyName = "Educational Software";
-            Debug.Log("✅ 회사명 설정: Educational Software");
-        }
-        
-        if (string.IsNullOrEmpty(PlayerSettings.bundleVersion))
-        {
-            PlayerSettings.bundleVersion = "1.0.0";
-            Debug.Log("✅ 버전 설정: 1.0.0");
-        }
-        
-        // === 이미지 기반 고정 설정 적용 ===
-        
-        // Resolution and Presentation 설정 (이미지 기반)
-        PlayerSettings.defaultWebScreenWidth = 1655;
-        PlayerSettings.defaultWebScreenHeight = 892;
-        PlayerSettings.runInBackground = true;
-        Debug.Log("✅ 해상도 설정: 1655x892, Run In Background 활성화");
-        
-        // WebGL Template 설정 (이미지 기반: Minimal)
-        PlayerSettings.WebGL.template = "APPLICATION:Minimal";
-        Debug.Log("✅ WebGL 템플릿 설정: Minimal");
-        
-        // Publishing Settings - Brotli 압축 및 WebAssembly 2023 타겟
-        PlayerSettings.WebGL.compressionFormat = WebGLCompressionFormat.Brotli;
-        PlayerSettings.WebGL.nameFilesAsHashes = false;  // 프로젝트명.data 등으로 파일명 설정
-        PlayerSettings.WebGL.dataCaching = true;
-        // Unity 6에서 debugSymbols -> debugSymbolMode로 변경
-        PlayerSettings.WebGL.debugSymbolMode = WebGLDebugSymbolMode.Off;
-        PlayerSettings.WebGL.showDiagnostics = false;
-        PlayerSettings.WebGL.decompressionFallback = true;  // Decompression Fallback 활성화
-        // WebAssembly 2023 타겟 설정 (Unity 6에서 자동 관리)
-        Debug.Log("✅ WebAssembly 2023: Unity 6에서 자동 관리됨");
-        Debug.Log("✅ Publishing Settings: Brotli 압축 활성화, Decompression Fallback 활성화");
-        
-        // WebAssembly Language Features (이미지 기반)
-        PlayerSettings.WebGL.exceptionSupport = WebGLExceptionSupport.ExplicitlyThrownExceptionsOnly;
-        PlayerSettings.WebGL.threadsSupport = false;
-        // Unity 6에서 wasmStreaming 제거됨 (decompressionFallback에 따라 자동 결정)
-        Debug.Log("✅ WebAssembly 설정: 명시적 예외만, 멀티스레딩 비활성화, 스트리밍 자동");
-        
-        // Memory Settings (이미지 기반)
-        PlayerSettings.WebGL.memorySize = 32;  // Initial Memory Size
-        PlayerSettings.WebGL.memoryGrowthMode = WebGLMemoryGrowthMode.Geometric;
-        PlayerSettings.WebGL.maximumMemorySize = 2048;
-        Debug.Log("✅ 메모리 설정: 초기 32MB, 최대 2048MB, Geometric 증가");
-        
-        // Splash Screen 설정 (이미지 기반)
-        PlayerSettings.SplashScreen.show = true;
-        PlayerSettings.SplashScreen.showUnityLogo = false;
-        PlayerSettings.SplashScreen.animationMode = PlayerSettings.SplashScreen.AnimationMode.Dolly;
-        // Unity 6에서 logoAnimationMode 제거됨
-        PlayerSettings.SplashScreen.overlayOpacity = 0.0f;
-        PlayerSettings.SplashScreen.blurBackgroundImage = true;
-        Debug.Log("✅ 스플래시 화면: Unity 로고 숨김, Dolly 애니메이션, 오버레이 투명");
-        
-        // WebGL 링커 타겟 설정 (Unity 6 최적화)
-        PlayerSettings.WebGL.linkerTarget = WebGLLinkerTarget.Wasm;
-        Debug.Log("✅ WebGL 링커 타겟 설정: WebAssembly (Unity 6 최적화)");
-        
-        // Code Optimization 설정 (Unity 6 Il2CppCodeGeneration 사용)
-        SetCodeOptimization();
-        
-        // Managed Stripping Level 설정 (Medium - Unity 6)
-        try
-        {
-            // Unity 6: ManagedStrippingLevel enum 사용
-            PlayerSettings.SetManagedStrippingLevel(NamedBuildTarget.WebGL, ManagedStrippingLevel.Medium);
-            Debug.Log("✅ Managed Stripping Level: Medium (Unity 6)");
-        }
-        catch (System.Exception e)
-        {
-            Debug.LogWarning("⚠️ Managed Stripping Level 설정 실패: " + e.Message);
-        }
-        
-        Debug.Log("🔧 WebGL Player Settings 이미지 기반 고정 설정 완료");
+    job = {
+        "outputPath": output_path.replace(os.sep, '/'),
+        "codeOptimization": code_optimization,
+        "memorySize": WEBGL_MEMORY_SIZE,
+        "maximumMemorySize": WEBGL_MAXIMUM_MEMORY_SIZE,
+        "memoryGrowthMode": WEBGL_MEMORY_GROWTH_MODE,
+        "reportPath": get_build_report_path(project_name).replace(os.sep, '/')
     }
     
-    private static void SetCodeOptimization()
-    {
-        // Unity 6 Code Optimization 설정 (WasmCodeOptimization)
-        // Build Profiles의 Code Optimization 드롭다운과 일치합니다
-        try
-        {
-            WasmCodeOptimization codeOpt;
-            
-            if (CODE_OPTIMIZATION_TYPE == "RuntimeSpeedLTO")
-            {
-                codeOpt = WasmCodeOptimization.RuntimeSpeedLTO;
-                Debug.Log("✅ Code Optimization: Runtime Speed with LTO (최고 성능, LTO 적용)");
-            }
-            else if (CODE_OPTIMIZATION_TYPE == "RuntimeSpeed")
-            {
-                codeOpt = WasmCodeOptimization.RuntimeSpeed;
-                Debug.Log("✅ Code Optimization: Runtime Speed (성능 최적화)");
-            }
-            else if (CODE_OPTIMIZATION_TYPE == "BuildTimes")
-            {
-                codeOpt = WasmCodeOptimization.BuildTimes;
-                Debug.Log("✅ Code Optimization: Build Times (빠른 빌드)");
-            }
-            else if (CODE_OPTIMIZATION_TYPE == "DiskSize")
-            {
-                codeOpt = WasmCodeOptimization.DiskSize;
-                Debug.Log("✅ Code Optimization: Disk Size (크기 최적화)");
-            }
-            else if (CODE_OPTIMIZATION_TYPE == "DiskSizeLTO")
-            {
-                codeOpt = WasmCodeOptimization.DiskSizeLTO;
-                Debug.Log("✅ Code Optimization: Disk Size with LTO (최소 크기, LTO 적용)");
-            }
-            else
-            {
-                // 기본값: Runtime Speed with LTO
-                codeOpt = WasmCodeOptimization.RuntimeSpeedLTO;
-                Debug.LogWarning("⚠️ 알 수 없는 CODE_OPTIMIZATION_TYPE: " + CODE_OPTIMIZATION_TYPE);
-                Debug.Log("ℹ️ 기본값 사용: Runtime Speed with LTO");
-            }
-            
-            // Unity 6: UserBuildSettings.codeOptimization 사용
-            UnityEditor.WebGL.UserBuildSettings.codeOptimization = codeOpt;
-        }
-        catch (System.Exception e)
-        {
-            Debug.LogError("❌ Code Optimization 설정 실패: " + e.Message);
-            Debug.Log("ℹ️ Unity Editor에서 수동으로 설정해주세요.");
-        }
-    }
-    
-    private static void LogCurrentPlayerSettings()
-    {
-        Debug.Log("=== 현재 WebGL Player Settings ===");
-        Debug.Log("🎮 제품명: " + PlayerSettings.productName);
-        Debug.Log("🏢 회사명: " + PlayerSettings.companyName);
-        Debug.Log("📋 버전: " + PlayerSettings.bundleVersion);
-        
-        // Unity 6: 아이콘 API
-        var icons = PlayerSettings.GetIcons(NamedBuildTarget.WebGL, IconKind.Application);
-        Debug.Log("🖼️ 기본 아이콘: " + (icons != null && icons.Length > 0 ? "설정됨" : "없음"));
-        
-        // WebGL 전용 설정들
-        Debug.Log("🌐 WebGL 템플릿: " + PlayerSettings.WebGL.template);
-        Debug.Log("💾 WebGL 메모리 크기: " + PlayerSettings.WebGL.memorySize + "MB");
-        Debug.Log("📦 WebGL 압축 포맷: " + PlayerSettings.WebGL.compressionFormat);
-        Debug.Log("🔙 WebGL Decompression Fallback: " + PlayerSettings.WebGL.decompressionFallback);
-        // WebAssembly 2023 (Unity 6에서 자동 관리)
-        Debug.Log("🌐 WebGL WebAssembly 2023: Unity 6에서 자동 관리됨");
-        Debug.Log("⚠️ WebGL 예외 지원: " + PlayerSettings.WebGL.exceptionSupport);
-        Debug.Log("💽 WebGL 데이터 캐싱: " + PlayerSettings.WebGL.dataCaching);
-        Debug.Log("📂 WebGL 파일명 방식: " + (PlayerSettings.WebGL.nameFilesAsHashes ? "해시" : "프로젝트명") + " 기반");
-        Debug.Log("🔧 WebGL 링커 타겟: " + PlayerSettings.WebGL.linkerTarget);
-        Debug.Log("⚡ Code Optimization: " + UnityEditor.WebGL.UserBuildSettings.codeOptimization);
-        Debug.Log("📦 Managed Stripping Level: " + PlayerSettings.GetManagedStrippingLevel(NamedBuildTarget.WebGL));
-        Debug.Log("🎯 WebGL 최적화: Unity 6에서 자동 관리");
-        Debug.Log("=====================================");
-    }
-    
-    private static BuildOptions GetBuildOptionsFromPlayerSettings()
-    {
-        BuildOptions options = BuildOptions.None;
-        
-        // Development Build 설정 확인
-        if (EditorUserBuildSettings.development)
-        {
-            options |= BuildOptions.Development;
-            Debug.Log("✅ Development Build 모드 활성화");
-        }
-        
-        // Script Debugging 설정 확인
-        if (EditorUserBuildSettings.allowDebugging)
-        {
-            options |= BuildOptions.AllowDebugging;
-            Debug.Log("✅ Script Debugging 활성화");
-        }
-        
-        // Profiler 설정 확인
-        if (EditorUserBuildSettings.connectProfiler)
-        {
-            options |= BuildOptions.ConnectWithProfiler;
-            Debug.Log("✅ Profiler 연결 활성화");
-        }
-        
-        // Deep Profiling 설정 확인
-        if (EditorUserBuildSettings.buildWithDeepProfilingSupport)
-        {
-            options |= BuildOptions.EnableDeepProfilingSupport;
-            Debug.Log("✅ Deep Profiling 지원 활성화");
-        }
-        
-        // Unity 6에서 autoRunPlayer 제거됨
-        // WebGL은 브라우저에서 실행되므로 AutoRunPlayer 옵션 불필요
-        Debug.Log("ℹ️ WebGL 빌드는 브라우저에서 수동 실행");
-        
-        return options;
-    }
-    
-    private static void ApplyWebGLSettings()
-    {
-        Debug.Log("🌐 WebGL 특수 설정 적용 및 검증 중...");
-        
-        Debug.Log("🌐 WebGL 템플릿 사용: " + PlayerSettings.WebGL.template);
-        Debug.Log("💾 WebGL 메모리 크기: " + PlayerSettings.WebGL.memorySize + "MB");
-        Debug.Log("📦 WebGL 압축 포맷: " + PlayerSettings.WebGL.compressionFormat);
-        Debug.Log("⚠️ WebGL 예외 지원: " + PlayerSettings.WebGL.exceptionSupport);
-        Debug.Log("💽 WebGL 데이터 캐싱: " + PlayerSettings.WebGL.dataCaching);
-        
-        // WebGL 최적화 설정 확인 및 권장사항
-        if (PlayerSettings.WebGL.memorySize < 256)
-        {
-            Debug.LogWarning("⚠️ WebGL 메모리 크기가 256MB 미만입니다. 과학실험 시뮬레이션에는 512MB 이상 권장합니다.");
-        }
-        else if (PlayerSettings.WebGL.memorySize >= 512)
-        {
-            Debug.Log("✅ WebGL 메모리 크기가 적절합니다 (512MB 이상).");
-        }
-        
-        if (string.IsNullOrEmpty(PlayerSettings.WebGL.template) || PlayerSettings.WebGL.template == "APPLICATION:Default")
-        {
-            Debug.LogWarning("⚠️ WebGL 템플릿이 기본값입니다. 교육용 템플릿 사용을 권장합니다.");
-        }
-        else
-        {
-            Debug.Log("✅ WebGL 템플릿 설정됨: " + PlayerSettings.WebGL.template);
-        }
-        
-        // WebGL 압축 설정 확인
-        if (PlayerSettings.WebGL.compressionFormat == WebGLCompressionFormat.Disabled)
-        {
-            Debug.LogWarning("⚠️ WebGL 압축이 비활성화되어 있습니다. 파일 크기가 클 수 있습니다.");
-        }
-        else
-        {
-            Debug.Log("✅ WebGL 압축 활성화: " + PlayerSettings.WebGL.compressionFormat);
-        }
-        
-        // Decompression Fallback 확인
-        if (PlayerSettings.WebGL.decompressionFallback)
-        {
-            Debug.Log("✅ WebGL Decompression Fallback 활성화 (압축 해제 실패 시 대체 사용)");
-        }
-        
-        // WebAssembly 2023 (Unity 6에서 자동 관리)
-        Debug.Log("✅ WebAssembly 2023: Unity 6에서 자동 관리됨");
-        
-        // Code Optimization 확인 (Unity 6 WasmCodeOptimization)
-        var codeOpt = UnityEditor.WebGL.UserBuildSettings.codeOptimization;
-        string codeOptStr = codeOpt.ToString();
-        Debug.Log("✅ Code Optimization: " + codeOptStr + " (설정값: " + CODE_OPTIMIZATION_TYPE + ")");
-        
-        // Managed Stripping Level 확인 (Unity 6)
-        var strippingLevel = PlayerSettings.GetManagedStrippingLevel(NamedBuildTarget.WebGL);
-        Debug.Log("✅ Managed Stripping Level: " + strippingLevel);
-        
-        // WebGL 빌드 최적화 권장사항
-        Debug.Log("📚 WebGL 빌드 최적화 권장사항:");
-        Debug.Log("  - 메모리: 512MB 이상");
-        Debug.Log("  - 압축: Brotli (현재 설정됨)");
-        Debug.Log("  - Decompression Fallback: 활성화 (현재 설정됨)");
-        Debug.Log("  - WebAssembly 2023: 활성화 (현재 설정됨)");
-        Debug.Log("  - Managed Stripping Level: Medium (현재 설정됨)");
-        Debug.Log("  - Code Optimization: " + CODE_OPTIMIZATION_TYPE + " (현재 설정됨)");
-        Debug.Log("  - 예외 지원: ExplicitlyThrownExceptionsOnly");
-        Debug.Log("  - 데이터 캐싱: 활성화");
-    }
-    
-    private static string[] GetBuildScenes()
-    {
-        var enabledScenes = new System.Collections.Generic.List<string>();
-        
-        // 1순위: Build Settings에 등록된 씬 확인
-        foreach (var scene in EditorBuildSettings.scenes)
-        {
-            if (scene.enabled)
-            {
-                enabledScenes.Add(scene.path);
-            }
-        }
-        
-        if (enabledScenes.Count > 0)
-        {
-            Debug.Log("✅ Build Settings에서 씬 로드 완료");
-            Debug.Log("📋 빌드할 씬 수: " + enabledScenes.Count);
-            foreach (var scene in enabledScenes)
-            {
-                Debug.Log("  - " + scene);
-            }
-            return enabledScenes.ToArray();
-        }
-        
-        // 2순위: 가장 최근 수정된 씬 자동 검색
-        Debug.LogWarning("⚠️ Build Settings에 씬이 없습니다. 가장 최근 수정된 씬을 자동으로 검색합니다.");
-        
-        string[] sceneGuids = AssetDatabase.FindAssets("t:Scene", new[] { "Assets" });
-        
-        if (sceneGuids.Length == 0)
-        {
-            Debug.LogError("❌ 프로젝트에 씬이 하나도 없습니다!");
-            return new string[0];
-        }
-        
-        // 씬 경로와 수정 시간 수집
-        var scenesWithTime = new System.Collections.Generic.List<System.Tuple<string, System.DateTime>>();
-        
-        foreach (string guid in sceneGuids)
-        {
-            string scenePath = AssetDatabase.GUIDToAssetPath(guid);
-            
-            // Unity 내부 경로를 실제 파일 시스템 경로로 변환
-            // scenePath = "Assets/Scenes/Main.unity"
-            // Application.dataPath = "C:/Project/Assets"
-            string fullPath = scenePath.Replace("Assets", Application.dataPath);
-            
-            try
-            {
-                if (System.IO.File.Exists(fullPath))
-                {
-                    System.DateTime lastWriteTime = System.IO.File.GetLastWriteTime(fullPath);
-                    scenesWithTime.Add(new System.Tuple<string, System.DateTime>(scenePath, lastWriteTime));
-                    Debug.Log("  • " + System.IO.Path.GetFileName(scenePath) + " - 수정: " + lastWriteTime.ToString("yyyy-MM-dd HH:mm:ss"));
-                }
-            }
-            catch (System.Exception e)
-            {
-                Debug.LogWarning("⚠️ 씬 파일 시간 확인 실패: " + scenePath + " - " + e.Message);
-            }
-        }
-        
-        if (scenesWithTime.Count == 0)
-        {
-            Debug.LogError("❌ 유효한 씬 파일을 찾을 수 없습니다!");
-            return new string[0];
-        }
-        
-        // 수정 시간 기준 내림차순 정렬 (최신이 먼저)
-        scenesWithTime.Sort((a, b) => b.Item2.CompareTo(a.Item2));
-        
-        // 가장 최근 수정된 씬 선택
-        string latestScene = scenesWithTime[0].Item1;
-        System.DateTime latestTime = scenesWithTime[0].Item2;
-        
-        Debug.Log("✅ 가장 최근 수정된 씬 선택: " + latestScene);
-        Debug.Log("   수정 시간: " + latestTime.ToString("yyyy-MM-dd HH:mm:ss"));
-        
-        enabledScenes.Add(latestScene);
-        
-        Debug.Log("📋 빌드할 씬 수: " + enabledScenes.Count);
-        foreach (var scene in enabledScenes)
-        {
-            Debug.Log("  - " + scene);
-        }
-        
-        return enabledScenes.ToArray();
-    }
-    
-    private static string FormatBytes(ulong bytes)
-    {
-        string[] sizes = { "B", "KB", "MB", "GB", "TB" };
-        double len = bytes;
-        int order = 0;
-        while (len >= 1024 && order < sizes.Length - 1)
-        {
-            order++;
-            len = len / 1024;
-        }
-        return len.ToString("0.##") + " " + sizes[order];
-    }
-}
-""")
+    job_dir = os.path.join(BUILD_OUTPUT_DIR, "_Jobs")
+    job_path = os.path.join(job_dir, f"{project_name}.json")
     
     try:
-        formatted_content = script_template.substitute(
-            output_path=output_path_formatted,
-            code_optimization=code_optimization
-        )
-        
-        with open(script_path, 'w', encoding='utf-8') as f:
-            f.write(formatted_content)
-        print(f"WebGL 전용 빌드 스크립트 생성 완료: {script_path}")
+        os.makedirs(job_dir, exist_ok=True)
+        with open(job_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, indent=4, ensure_ascii=False)
+        print(f"WebGL 빌드 작업 파일 생성 완료: {job_path}")
         print(f"  ⚡ Code Optimization: {code_optimization}")
-        return True
+        return job_path
     except Exception as e:
-        print(f"WebGL 빌드 스크립트 생성 실패: {e}")
-        return False
+        print(f"WebGL 빌드 작업 파일 생성 실패: {e}")
+        return None
+
+def update_build_markers(line, markers):
+    """로그 한 줄에서 빌드 성공 / Build 폴더 파일 수 / 빌드 완료 보고를 찾아 markers(dict)에 기록합니다.
+
+    monitor_build_progress가 빌드 중 모든 줄에 대해 호출하므로, 검증 시 로그를 다시 읽지 않습니다.
+    markers: {"success": 발견한 성공 메시지, "file_count": Build 폴더 파일 수, "completed": 빌드 완료 메시지 여부}
+    """
+    if not markers.get("success"):
+        for pattern in BUILD_SUCCESS_MARKERS:
+            if pattern in line:
+                markers["success"] = pattern
+                break
+    if "📦" in line:
+        match = BUILD_FILE_COUNT_PATTERN.search(line)
+        if match:
+            markers["file_count"] = int(match.group(1))
+    if BUILD_COMPLETED_MARKER in line:
+        markers["completed"] = True
 
-def validate_build_output(build_dir, project_name, log_file_path=None):
+def validate_build_output(build_dir, project_name, log_markers=None, report=None):
     """빌드 출력 폴더를 검증하여 필수 파일들이 생성되었는지 확인합니다.
     
+    report(BuildReport JSON)가 주어지면 보고서의 빌드 결과와 출력 파일로 검증합니다.
+    보고서가 없으면 (이전 버전 패키지 등) 빌드 중 로그에서 찾은 성공 메시지(log_markers)와 Build 폴더 내용으로 검증합니다.
+    
     Args:
         build_dir: 빌드 출력 디렉토리 경로
         project_name: 프로젝트 이름
-        log_file_path: Unity 로그 파일 경로 (선택)
+        log_markers: update_build_markers가 기록한 로그 보고 내용 (선택, 빌드 중 watchdog_state["log_markers"])
+        report: build_report.load_build_report 결과 (선택)
     
     Returns:
         dict: {
@@ -642,6 +150,9 @@ def validate_build_output(build_dir, project_name, log_file_path=None):
             "missing_files": list (누락된 필수 파일 목록)
         }
     """
+    if report:
+        return validate_build_report(report, build_dir)
+    
     result = {
         "valid": False,
         "found_files": [],
@@ -652,45 +163,24 @@ def validate_build_output(build_dir, project_name, log_file_path=None):
         result["missing_files"].append("빌드 디렉토리 자체가 존재하지 않음")
         return result
     
-    # 1단계: 로그 파일에서 Unity 빌드 성공 메시지 확인
+    # 1단계: 빌드 중 로그에서 찾은 Unity 빌드 성공 메시지 확인
     unity_build_success = False
     unity_files_generated = False
+    log_markers = log_markers or {}
     
-    if log_file_path and os.path.exists(log_file_path):
-        try:
-            with open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
-                log_content = f.read()
-                
-                # Unity가 빌드 성공을 보고했는지 확인 (여러 패턴 체크)
-                success_patterns = [
-                    "✅ WebGL 빌드 성공!",
-                    "📊 빌드 결과: Succeeded",
-                    "BuildResult.Succeeded"
-                ]
-                
-                for pattern in success_patterns:
-                    if pattern in log_content:
-                        unity_build_success = True
-                        result["found_files"].append(f"Unity 빌드 성공 보고 ({pattern})")
-                        break
-                
-                # Build 폴더에 파일이 생성되었는지 확인
-                if "📦 Build 폴더 파일 수:" in log_content:
-                    import re
-                    match = re.search(r'📦 Build 폴더 파일 수: (\d+)', log_content)
-                    if match:
-                        file_count = int(match.group(1))
-                        if file_count > 0:
-                            unity_files_generated = True
-                            result["found_files"].append(f"Build 폴더에 {file_count}개 파일 생성됨")
-                
-                # 빌드 완료 메시지도 확인 (fallback)
-                if not unity_files_generated and "🌐 WebGL 빌드 완료!" in log_content:
-                    # 오래된 로그 형식 (파일 수 정보가 없는 경우)
-                    unity_files_generated = True
-                    result["found_files"].append("빌드 완료 메시지 확인됨")
-        except Exception as e:
-            pass  # 로그 파일 파싱 실패는 무시하고 파일 시스템 검증으로 진행
+    if log_markers.get("success"):
+        unity_build_success = True
+        result["found_files"].append(f"Unity 빌드 성공 보고 ({log_markers['success']})")
+    
+    # Build 폴더에 파일이 생성되었는지 확인
+    file_count = log_markers.get("file_count")
+    if file_count:
+        unity_files_generated = True
+        result["found_files"].append(f"Build 폴더에 {file_count}개 파일 생성됨")
+    elif log_markers.get("completed"):
+        # 오래된 로그 형식 (파일 수 정보가 없는 경우) - 빌드 완료 메시지로 대체
+        unity_files_generated = True
+        result["found_files"].append("빌드 완료 메시지 확인됨")
     
     # Unity가 빌드 성공을 보고하고 파일도 생성했다면 성공으로 처리
     if unity_build_success and unity_files_generated:
@@ -728,16 +218,9 @@ def validate_build_output(build_dir, project_name, log_file_path=None):
             
             # 필수 확장자 확인 (압축 파일 포함)
             # Unity 6 + Brotli: .wasm.br, .data.br, .framework.js.br, .loader.js
-            has_wasm = any(
-                ".wasm" in f.lower() and (
-                    f.endswith(".wasm") or f.endswith(".wasm.br") or f.endswith(".wasm.gz")
-                ) for f in build_contents
-            )
-            has_data = any(
-                ".data" in f.lower() and (
-                    f.endswith(".data") or f.endswith(".data.br") or f.endswith(".data.gz")
-                ) for f in build_contents
-            )
+            # (Decompression Fallback 사용 시 .wasm.unityweb, .data.unityweb, .framework.js.unityweb)
+            has_wasm = any(is_build_file_kind(f, ".wasm") for f in build_contents)
+            has_data = any(is_build_file_kind(f, ".data") for f in build_contents)
             has_loader = any(
                 ".loader.js" in f.lower() or (
                     ".loader" in f.lower() and ".js" in f.lower()
@@ -753,13 +236,13 @@ def validate_build_output(build_dir, project_name, log_file_path=None):
                 wasm_files = [f for f in build_contents if ".wasm" in f.lower()]
                 result["found_files"].append(f"WebAssembly: {', '.join(wasm_files)}")
             else:
-                result["missing_files"].append("WebAssembly (.wasm 또는 .wasm.br)")
+                result["missing_files"].append(f"WebAssembly ({describe_file_kind('.wasm')})")
             
             if has_data:
                 data_files = [f for f in build_contents if ".data" in f.lower()]
                 result["found_files"].append(f"Data file: {', '.join(data_files)}")
             else:
-                result["missing_files"].append("Data file (.data 또는 .data.br)")
+                result["missing_files"].append(f"Data file ({describe_file_kind('.data')})")
             
             if has_loader:
                 loader_files = [f for f in build_contents if ".loader" in f.lower()]
@@ -771,7 +254,7 @@ def validate_build_output(build_dir, project_name, log_file_path=None):
                 framework_files = [f for f in build_contents if ".framework" in f.lower()]
                 result["found_files"].append(f"Framework: {', '.join(framework_files)}")
             else:
-                result["missing_files"].append("Framework (.framework.js 또는 .framework.js.br)")
+                result["missing_files"].append(f"Framework ({describe_file_kind('.framework.js')})")
             
             # 엄격한 검증: 모든 필수 파일이 있어야 함
             strict_valid = has_wasm and has_data and has_loader and has_framework
@@ -790,60 +273,192 @@ def validate_build_output(build_dir, project_name, log_file_path=None):
     
     return result
 
-def monitor_build_progress(log_file_path, project_name, stop_event, start_time):
-    """로그 파일을 주기적으로 모니터링하여 빌드 진행 상황을 표시합니다."""
-    last_position = 0
-    check_interval = 60  # 1분마다 체크
-    
-    # 주요 진행 단계 키워드
-    progress_keywords = [
-        "Compiling scripts",
-        "Building Library",
-        "Building player",
-        "Building WebGL Player",
-        "IL2CPP",
-        "Building il2cpp",
-        "Generating code",
-        "Compiling C++ code",
-        "Building WASM",
-        "Emscripten"
-    ]
+def monitor_build_progress(log_file_path, project_name, stop_event, start_time, process=None, watchdog_state=None, tailer=None):
+    """빌드 로그를 실시간으로 따라 읽으며 (LogTailer) 빌드 진행 상황을 표시합니다.
     
-    while not stop_event.is_set():
-        try:
-            if os.path.exists(log_file_path):
-                elapsed = int(time.time() - start_time)
-                minutes = elapsed // 60
-                seconds = elapsed % 60
+    로그가 바뀌면 즉시 (Linux: inotify, 그 외: 0.5초 polling) 새 줄을 청크 단위로 읽고,
+    진행 단계(build_phases.detect_phase)가 바뀔 때마다 시각과 함께 출력하며
+    watchdog_state["phase_transitions"]에 (timestamp, phase_id)로 기록합니다.
+    
+    process가 주어지면 정지 감시(watchdog)도 수행합니다: 마지막 로그 출력 후 경과 시간이
+    마지막으로 인식한 단계의 제한 시간(BUILD_STALL_PHASE_TIMEOUTS, 기본 BUILD_STALL_TIMEOUT)을
+    넘으면 Unity 프로세스 트리를 종료하고 watchdog_state에 정지 정보를 기록합니다.
+    
+    빌드 성공 / Build 폴더 파일 수 보고는 watchdog_state["log_markers"]에 기록합니다 (update_build_markers).
+    
+    스크립트 컴파일 실패(COMPILE_ERROR_SIGNATURES)가 로그에 나타나면 Unity가 스스로 종료할 때까지
+    기다리지 않고 즉시 프로세스 트리를 종료하며, watchdog_state["compile_errors"]에 에러 줄을 기록합니다.
+    
+    tailer(LogTailer)를 넘기면 호출 측이 stop_event 설정 후 tailer.wake()로 대기를 즉시 끝낼 수 있습니다
+    (빌드 종료 시 check_interval만큼 기다리지 않고 남은 로그를 정리). 감시가 끝나면 tailer를 닫습니다.
+    """
+    check_interval = 1.0  # 로그 변경이 없을 때 정지 감시 / 종료 확인 주기 (초)
+    report_interval = 60  # 단계 변화가 없을 때 1분마다 진행 상황 출력
+    last_report_time = start_time
+    
+    if watchdog_state is None:
+        watchdog_state = {}
+    phase_transitions = watchdog_state.setdefault("phase_transitions", [])
+    log_markers = watchdog_state.setdefault("log_markers", {})
+    
+    # 정지 감시 상태
+    last_output_time = start_time
+    current_phase = None
+    compile_failed = False
+    compile_errors = []
+    
+    def format_elapsed(timestamp):
+        elapsed = int(timestamp - start_time)
+        minutes = elapsed // 60
+        seconds = elapsed % 60
+        return f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
+    
+    def handle_line(line, timestamp):
+        nonlocal current_phase, compile_failed
+        # 진행 단계 전환 (같은 단계가 반복되면 무시)
+        phase = detect_phase(line)
+        if phase and phase != current_phase:
+            current_phase = phase
+            phase_transitions.append((timestamp, phase))
+            clock = time.strftime('%H:%M:%S', time.localtime(timestamp))
+            print(f"  ⏳ [{project_name}] {clock} (+{format_elapsed(timestamp)}) - {get_phase_name(phase)}")
+        # 컴파일 에러 확인
+        if BUILD_FAIL_FAST_ON_COMPILE_ERRORS and any(signature in line for signature in COMPILE_ERROR_SIGNATURES):
+            compile_failed = True
+            error_line = line.strip()
+            if "error CS" in error_line and error_line not in compile_errors and len(compile_errors) < MAX_COMPILE_ERRORS:
+                compile_errors.append(error_line)
+        # 빌드 성공 / 출력 파일 보고 (BuildReport가 없을 때 검증에 사용)
+        update_build_markers(line, log_markers)
+    
+    if tailer is None:
+        tailer = LogTailer(log_file_path)
+    try:
+        while not stop_event.is_set():
+            try:
+                # 로그가 바뀌면 즉시 깨어나서 새 줄만 읽음
+                if tailer.wait_for_change(check_interval):
+                    bytes_before = tailer.bytes_read
+                    now = time.time()
+                    for line in tailer.read_lines():
+                        handle_line(line, now)
+                    if tailer.bytes_read != bytes_before:
+                        last_output_time = now
+                now = time.time()
                 
-                # 파일 끝부분만 읽기 (성능 최적화)
-                with open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    f.seek(last_position)
-                    new_lines = f.readlines()
-                    last_position = f.tell()
-                    
-                    # 주요 진행 단계 찾기
-                    progress_found = False
-                    for line in new_lines:
-                        for keyword in progress_keywords:
-                            if keyword in line:
-                                print(f"  ⏳ [{project_name}] {minutes}분 {seconds}초 경과 - {keyword}")
-                                progress_found = True
-                                break
-                        if progress_found:
-                            break
-                    
-                    # 진행 단계가 없으면 단순 상태 메시지
-                    if not progress_found and new_lines:
-                        print(f"  ⏳ [{project_name}] {minutes}분 {seconds}초 경과 - 빌드 진행 중...")
+                # 컴파일 실패: Unity 종료를 기다리지 않고 즉시 중단하여 작업 슬롯 반환
+                if process is not None and compile_failed and process.poll() is None:
+                    print(f"  ⛔ [{project_name}] 스크립트 컴파일 에러 감지: {len(compile_errors)}개 에러, 빌드 즉시 중단")
+                    watchdog_state["compile_errors"] = compile_errors or ["Scripts have compiler errors"]
+                    kill_process_tree(process, "스크립트 컴파일 에러")
+                    break
                 
-            time.sleep(check_interval)
-        except Exception as e:
-            # 오류가 발생해도 모니터링 중단하지 않음
+                # 정지 감시: 단계별 제한 시간 동안 로그 출력이 없으면 빌드 중단
+                stall_limit = BUILD_STALL_PHASE_TIMEOUTS.get(current_phase, BUILD_STALL_TIMEOUT)
+                idle_seconds = now - last_output_time
+                if process is not None and stall_limit and idle_seconds > stall_limit and process.poll() is None:
+                    phase_text = get_phase_name(current_phase) if current_phase else "시작 단계 (로그 출력 전)"
+                    print(f"  ⛔ [{project_name}] 빌드 정지 감지: {int(idle_seconds)}초 동안 로그 출력 없음 (단계: {phase_text}, 제한: {stall_limit}초)")
+                    watchdog_state["stalled"] = True
+                    watchdog_state["phase"] = phase_text
+                    watchdog_state["idle_seconds"] = idle_seconds
+                    watchdog_state["limit"] = stall_limit
+                    kill_process_tree(process, f"진행 정지 ({phase_text}, {int(idle_seconds)}초 동안 로그 출력 없음)")
+                    break
+                
+                # 단계 변화가 없으면 1분마다 상태 메시지
+                last_activity = max(last_report_time, phase_transitions[-1][0] if phase_transitions else start_time)
+                if now - last_activity >= report_interval:
+                    last_report_time = now
+                    phase_text = get_phase_name(current_phase) if current_phase else "빌드 진행 중..."
+                    print(f"  ⏳ [{project_name}] {format_elapsed(now)} 경과 - {phase_text} (마지막 로그 출력 {int(idle_seconds)}초 전)")
+            except Exception as e:
+                # 오류가 발생해도 모니터링 중단하지 않음
+                stop_event.wait(check_interval)
+        
+        # 빌드 종료 후 남은 로그의 단계 전환까지 기록
+        try:
+            now = time.time()
+            for line in tailer.read_lines():
+                handle_line(line, now)
+            last_line = tailer.flush_partial()
+            if last_line:
+                handle_line(last_line, now)
+        except Exception:
             pass
+    finally:
+        tailer.close()
+
+def read_pipeline_task_results(result_path):
+    """BatchProcessor가 -dannectTaskResults로 기록한 작업별 결과를 읽습니다.
+    
+    Returns:
+        list: [{"name", "status", "seconds", "message"}, ...] (파일이 없으면 None)
+    """
+    if not os.path.exists(result_path):
+        return None
+    try:
+        with open(result_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("tasks", [])
+    except Exception as e:
+        print(f"⚠️ 파이프라인 작업 결과 읽기 실패: {e}")
+        return None
+
+def print_pipeline_task_results(project_name, task_results):
+    """파이프라인 작업별 결과를 출력합니다."""
+    if task_results is None:
+        print(f"   ⚠️ [{project_name}] 파이프라인 작업 결과가 없습니다 (Unity가 작업 실행 전에 종료됨)")
+        return
+    
+    status_icons = {"Succeeded": "✅", "Failed": "❌", "Skipped": "⏭️"}
+    print(f"   📋 [{project_name}] 파이프라인 작업 결과:")
+    for task in task_results:
+        icon = status_icons.get(task.get("status"), "❔")
+        line = f"      {icon} {task.get('name')}: {task.get('status')} ({task.get('seconds', 0.0):.1f}초)"
+        if task.get("message"):
+            line += f" - {task['message']}"
+        print(line)
 
-def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
-    """Unity CLI를 사용하여 WebGL 빌드를 실행합니다. (Player Settings 완전 반영)"""
+def print_build_report_errors(report):
+    """BuildReport의 빌드 결과와 에러 메시지를 출력합니다 (보고서가 없으면 아무것도 하지 않음)."""
+    if not report:
+        return
+    summary = report.get("summary", {})
+    print(f"   📄 BuildReport 결과: {summary.get('result', 'Unknown')} "
+          f"(에러 {summary.get('totalErrors', 0)}개, 경고 {summary.get('totalWarnings', 0)}개)")
+    errors = get_report_errors(report)
+    if errors:
+        print("\n" + "="*80)
+        print("❌ BuildReport 에러 메시지:")
+        print("="*80)
+        for error in errors:
+            print(error)
+        print("="*80)
+
+def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT, tasks=None, build_info=None, code_optimization=None, cache_mode=None):
+    """Unity CLI를 사용하여 WebGL 빌드를 실행합니다. (Player Settings 완전 반영)
+    
+    tasks가 주어지면 BatchProcessor 파이프라인으로 실행하여 하나의 Unity 프로세스에서
+    배치 처리(refresh, validate 등)와 WebGL 빌드(configure-webgl, build-webgl)를 순서대로 수행합니다.
+    
+    code_optimization이 주어지면 WEBGL_CODE_OPTIMIZATION 대신 사용합니다. 설정과 다른 옵션으로 빌드한
+    출력물은 빌드 캐시에 기록하지 않고, 기존 캐시 항목도 삭제합니다 (다음 빌드에서 설정대로 다시 빌드).
+    빌드 시간/자원/단계 기록(build_history)도 설정대로 빌드한 경우에만 저장합니다.
+    cache_mode는 빌드 캐시에 기록할 지문 방식입니다 (캐시를 확인한 방식과 같아야 다음 빌드에서 적중, 기본값 Config.BUILD_CACHE_MODE).
+    
+    build_info(dict)가 주어지면 빌드 중 감지한 실패 정보를 채웁니다:
+        - stalled: 정지 감시로 중단되었는지 여부 (phase, idle_seconds, limit)
+        - compile_errors: 빌드 중 감지한 스크립트 컴파일 에러 줄 목록 (즉시 중단된 경우)
+        - phase_transitions: [(timestamp, phase_id), ...] 로그에서 인식한 진행 단계 전환
+        - phases: 단계별 구간/합계 (build_phases.compute_phase_timings 결과)
+        - start_time: 빌드 시작 시각 (phases 구간의 기준 시각)
+        - report: 에디터가 저장한 BuildReport JSON (build_report.load_build_report 결과, 없으면 None)
+        - resources: (최대 메모리 MB, 평균 CPU 코어) Unity 프로세스 트리 측정값 (측정 불가 시 None)
+        - exit_reason: 종료 사유 (success, compile_error, stalled, validation_failed, budget_exceeded,
+          exit_code_N, timeout, exception)
+        - payload_budgets: 다운로드 크기 예산 확인 결과 (payload_budget.check_payload_budgets)
+        - code_optimization: 빌드에 사용한 Code Optimization
+    """
     unity_path = UNITY_EDITOR_PATH
     
     # Unity 경로가 존재하지 않으면 자동 검색
@@ -853,7 +468,7 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
         unity_path = find_unity_editor_path()
         if not unity_path:
             print("Unity Editor를 찾을 수 없습니다. UNITY_EDITOR_PATH를 확인해주세요.")
-            return False
+            return False, 0.0
         print(f"Unity 경로 발견: {unity_path}")
     
     project_name = get_project_name_from_path(project_path)
@@ -872,10 +487,6 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     log_file_path = os.path.join(log_dir, f"{project_name}_{timestamp}.log")
     
-    # 빌드 스크립트 경로 (나중에 정리를 위해 저장)
-    script_path = os.path.join(project_path, "Assets", "Editor", "AutoWebGLBuildScript.cs")
-    script_meta_path = script_path + ".meta"
-    
     try:
         if not os.path.exists(project_build_dir):
             os.makedirs(project_build_dir, exist_ok=True)
@@ -886,8 +497,14 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
         print(f"빌드 출력 디렉토리 생성 실패: {e}")
         return False, 0.0
     
-    # WebGL 전용 빌드 스크립트 생성
-    if not create_unity_webgl_build_script(project_path):
+    # 설정과 다른 Code Optimization으로 빌드하면 출력물이 캐시 지문과 달라지므로 캐시 항목 삭제
+    cache_build = code_optimization is None or code_optimization == WEBGL_CODE_OPTIMIZATION
+    if not cache_build:
+        clear_cache_entry(project_name)
+    
+    # WebGL 빌드 작업 파일 생성 (빌드 스크립트는 패키지 Editor 어셈블리에 포함됨)
+    job_path = create_webgl_build_job(project_path, code_optimization=code_optimization)
+    if not job_path:
         return False, 0.0
     
     # Unity CLI 명령어 구성
@@ -897,61 +514,194 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
         "-quit", 
         "-projectPath", project_path,
         "-buildTarget", "WebGL",
-        "-executeMethod", "AutoWebGLBuildScript.BuildWebGLWithPlayerSettings",
+        "-dannectBuildJob", job_path,
         "-logFile", log_file_path  # 로그 파일 경로 지정
     ]
     
+    # 에디터가 저장할 BuildReport (이전 빌드의 보고서는 삭제하여 실패 시 잘못 읽지 않도록 함)
+    report_path = get_build_report_path(project_name)
+    clear_build_report(report_path)
+    
+    task_result_path = None
+    if tasks:
+        # 단일 실행 파이프라인: 배치 처리 + 빌드를 한 번의 Unity 실행으로 처리
+        task_result_path = os.path.join(os.path.dirname(job_path), f"{project_name}.tasks.json")
+        if os.path.exists(task_result_path):
+            os.remove(task_result_path)
+        cmd.extend([
+            "-executeMethod", BATCH_PROCESS_METHOD,
+            "-dannectTasks", ",".join(tasks),
+            "-dannectTaskResults", task_result_path
+        ])
+        print(f"🔗 파이프라인 작업: {' → '.join(tasks)}")
+    else:
+        cmd.extend(["-executeMethod", WEBGL_BUILD_METHOD])
+    
     # print(f"📝 로그 파일 경로: {log_file_path}")
     
-    # 진행도 모니터링 스레드 준비
+    # 진행도 모니터링 / 정지 감시 상태 (build_info가 주어지면 호출자에게 실패 원인과 컴파일 에러 전달)
     stop_monitor = threading.Event()
-    monitor_thread = threading.Thread(
-        target=monitor_build_progress,
-        args=(log_file_path, project_name, stop_monitor, build_start_time),
-        daemon=True
-    )
+    watchdog_state = build_info if build_info is not None else {}
+    watchdog_state.update({"stalled": False, "compile_errors": [], "phase_transitions": [], "log_markers": {},
+                           "start_time": build_start_time, "report": None,
+                           "resources": None, "exit_reason": "exception",
+                           "code_optimization": code_optimization or WEBGL_CODE_OPTIMIZATION})
+    
+    # 빌드 캐시 지문은 Unity 실행 전에 계산 (빌드 중 수정된 파일이 빌드된 것으로 기록되지 않도록)
+    cache_snapshot = None
+    if cache_build:
+        try:
+            cache_snapshot = capture_build_fingerprint(project_path, cache_mode)
+        except Exception as e:
+            print(f"   ⚠️ 빌드 캐시 지문 계산 실패: {e}")
     
     try:
         print(f"🌐 Unity WebGL 빌드 실행 중... (타임아웃: {timeout}초)")
         # print(f"명령어: {' '.join(cmd)}")
         
-        # 진행도 모니터링 시작
-        monitor_thread.start()
-        
         # Unity는 -logFile로 로그를 직접 파일에 쓰므로 stdout/stderr 캡처 불필요
         # capture_output=True는 거대한 로그를 메모리 버퍼링하여 심각한 성능 저하 유발
-        result = subprocess.run(
+        # 별도 프로세스 그룹으로 실행하여 타임아웃/취소 시 il2cpp, bee_backend, clang 등 자식까지 종료
+        process = start_process_group(
             cmd,
-            timeout=timeout,
+            label=project_name,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
         
-        # 빌드 완료, 모니터링 중지
-        stop_monitor.set()
+        # 진행도 모니터링 및 정지 감시 시작 (로그 출력이 멈추면 프로세스 트리 종료)
+        monitor_tailer = LogTailer(log_file_path)
+        monitor_thread = threading.Thread(
+            target=monitor_build_progress,
+            args=(log_file_path, project_name, stop_monitor, build_start_time, process, watchdog_state, monitor_tailer),
+            daemon=True
+        )
+        monitor_thread.start()
+        
+        # Unity 프로세스 트리의 메모리/CPU 사용량 측정 (다음 빌드의 동시 실행 기준으로 사용)
+        resource_sampler = ProcessResourceSampler(process.pid).start()
+        try:
+            process.wait(timeout=timeout)
+            release_process(process)
+        except subprocess.TimeoutExpired:
+            kill_process_tree(process, f"타임아웃 {timeout}초")
+            raise
+        except KeyboardInterrupt:
+            stop_monitor.set()
+            monitor_tailer.wake()
+            kill_process_tree(process, "사용자 취소 (Ctrl+C)")
+            raise
+        finally:
+            resource_usage = resource_sampler.stop()
+            watchdog_state["resources"] = resource_usage
+        result = process
         
         # 빌드 종료 시간 기록
         build_end_time = time.time()
         elapsed_time = build_end_time - build_start_time
         
+        # 빌드 완료, 모니터링 중지 (대기 중인 감시 스레드를 바로 깨워 남은 로그의 단계 전환까지 기록될 때까지 대기)
+        stop_monitor.set()
+        monitor_tailer.wake()
+        monitor_thread.join(timeout=10)
+        
         # 시간을 읽기 쉬운 형태로 변환
         minutes = int(elapsed_time // 60)
         seconds = int(elapsed_time % 60)
         time_str = f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
         
+        # 단계별 소요 시간 계산 및 기록 (성공/실패 모두)
+        phase_timings = compute_phase_timings(watchdog_state["phase_transitions"], build_start_time, build_end_time)
+        watchdog_state["phases"] = phase_timings
+        if phase_timings["totals"]:
+            print(f"   ⏱️ 단계별 소요 시간: {format_phase_summary(phase_timings['totals'])}")
+        # 빌드 기록(시간/자원/단계)은 설정된 Code Optimization 빌드만 저장 (다른 옵션 빌드가 일정/추정을 왜곡하지 않도록)
+        phase_success = result.returncode == 0 and not watchdog_state["stalled"] and not watchdog_state["compile_errors"]
+        if cache_build:
+            try:
+                record_build_phases(project_path, phase_timings, phase_success, elapsed_time)
+            except Exception as e:
+                print(f"   ⚠️ 단계별 소요 시간 기록 실패: {e}")
+        
+        if task_result_path:
+            print_pipeline_task_results(project_name, read_pipeline_task_results(task_result_path))
+        
+        # 에디터가 저장한 BuildReport (빌드 검증, 출력 크기, 에러 메시지에 로그 대신 사용)
+        report = load_build_report(report_path)
+        watchdog_state["report"] = report
+        
+        if watchdog_state["compile_errors"]:
+            # 컴파일 에러로 즉시 중단된 빌드
+            watchdog_state["exit_reason"] = "compile_error"
+            compile_errors = watchdog_state["compile_errors"]
+            error_msg = f"Unity WebGL 빌드 중단 (스크립트 컴파일 에러 {len(compile_errors)}개): {project_name} (소요 시간: {time_str})"
+            print(f"❌ {error_msg}")
+            print("\n" + "="*80)
+            print("❌ 컴파일 에러 발견:")
+            print("="*80)
+            for line in compile_errors:
+                print(line)
+            print("="*80)
+            try:
+                with open(log_file_path, 'a', encoding='utf-8') as log_file:
+                    log_file.write("\n" + "="*80 + "\n")
+                    log_file.write(f"COMPILE ERROR: {error_msg}\n")
+                    log_file.write(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    log_file.write("="*80 + "\n")
+            except Exception as e:
+                print(f"⚠️ 컴파일 에러 로그 저장 실패: {e}")
+            return False, elapsed_time
+        
+        if watchdog_state["stalled"]:
+            # 정지 감시로 중단된 빌드 (로그 출력이 제한 시간 동안 없었음)
+            watchdog_state["exit_reason"] = "stalled"
+            error_msg = (f"Unity WebGL 빌드 중단 (진행 정지): {project_name} "
+                         f"(단계: {watchdog_state['phase']}, {int(watchdog_state['idle_seconds'])}초 동안 로그 출력 없음, "
+                         f"소요 시간: {time_str})")
+            print(f"❌ {error_msg}")
+            try:
+                with open(log_file_path, 'a', encoding='utf-8') as log_file:
+                    log_file.write("\n" + "="*80 + "\n")
+                    log_file.write(f"STALL ERROR: {error_msg}\n")
+                    log_file.write(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    log_file.write("="*80 + "\n")
+            except Exception as e:
+                print(f"⚠️ 정지 로그 저장 실패: {e}")
+            return False, elapsed_time
+        
         if result.returncode == 0:
             # 빌드 파일 검증: 실제로 필수 파일들이 생성되었는지 확인
-            build_validation = validate_build_output(project_build_dir, project_name, log_file_path)
+            build_validation = validate_build_output(project_build_dir, project_name, watchdog_state.get("log_markers"), report)
+            
+            # 다운로드 크기 예산 확인 (.wasm / .data / .framework.js, 압축 방식 무관)
+            budget_results = []
+            if build_validation["valid"]:
+                budget_results = check_payload_budgets(project_name, get_build_output_files(project_build_dir, report))
+                watchdog_state["payload_budgets"] = budget_results
+            
+            if build_validation["valid"] and is_budget_failure(budget_results):
+                watchdog_state["exit_reason"] = "budget_exceeded"
+                print(f"❌ Unity WebGL 빌드 실패 (다운로드 크기 예산 초과): {project_name} (소요 시간: {time_str})")
+                print_payload_budget_report(budget_results)
+                return False, elapsed_time
             
             if build_validation["valid"]:
+                watchdog_state["exit_reason"] = "success"
                 print(f"✅ Unity WebGL 빌드 성공: {project_name} (소요 시간: {time_str})")
                 print(f"   📦 빌드 파일 검증 완료:")
                 for found_file in build_validation['found_files']:
                     print(f"      ✓ {found_file}")
                 
-                # Build 하위 폴더 파일 크기 정보
+                # Build 하위 폴더 파일 크기 정보 (BuildReport가 있으면 보고서의 파일 크기 사용)
                 build_subfolder = os.path.join(project_build_dir, "Build")
-                if os.path.exists(build_subfolder):
+                if report:
+                    total_size = sum(size for _, size in get_build_folder_files(report))
+                    print(f"   💾 빌드 총 크기: {format_bytes(total_size)}")
+                    slowest_steps = get_step_durations(report)[:3]
+                    if slowest_steps:
+                        steps_text = ", ".join(f"{name} {seconds:.0f}초" for name, seconds in slowest_steps)
+                        print(f"   🧱 Unity 빌드 단계 (BuildReport): {steps_text}")
+                elif os.path.exists(build_subfolder):
                     try:
                         total_size = 0
                         for file in os.listdir(build_subfolder):
@@ -961,14 +711,40 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
                         print(f"   💾 빌드 총 크기: {format_bytes(total_size)}")
                     except:
                         pass
+                print_payload_budget_report(budget_results)
+                
+                # 빌드 캐시 기록 (다음 빌드에서 변경사항이 없으면 생략)
+                if cache_snapshot is not None:
+                    try:
+                        record_successful_build(project_path, elapsed_time, mode=cache_mode, snapshot=cache_snapshot)
+                    except Exception as e:
+                        print(f"   ⚠️ 빌드 캐시 기록 실패: {e}")
+                
+                # 빌드 시간 기록 (병렬 빌드 순서 결정에 사용, 설정된 Code Optimization 빌드만)
+                if cache_build:
+                    try:
+                        record_build_duration(project_path, elapsed_time)
+                    except Exception as e:
+                        print(f"   ⚠️ 빌드 시간 기록 실패: {e}")
+                
+                if resource_usage:
+                    peak_memory_mb, cpu_cores = resource_usage
+                    print(f"   📈 Unity 최대 메모리: {peak_memory_mb:.0f}MB, 평균 CPU: {cpu_cores:.1f}코어")
+                    if cache_build:
+                        try:
+                            record_build_resources(project_path, peak_memory_mb, cpu_cores)
+                        except Exception as e:
+                            print(f"   ⚠️ 빌드 자원 기록 실패: {e}")
                 
                 # if os.path.exists(log_file_path):
                 #     print(f"📝 빌드 로그: {log_file_path}")
                 return True, elapsed_time
             else:
+                watchdog_state["exit_reason"] = "validation_failed"
                 print(f"❌ Unity WebGL 빌드 실패 (파일 검증 실패): {project_name} (소요 시간: {time_str})")
                 print(f"   ⚠️ 빌드가 완료되었으나 필수 파일이 생성되지 않았습니다.")
                 print(f"   ⚠️ 누락된 파일: {', '.join(build_validation['missing_files'])}")
+                print_build_report_errors(report)
                 
                 # 빌드 폴더 내용물 상세 확인
                 if os.path.exists(project_build_dir):
@@ -997,89 +773,18 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
                     except Exception as e:
                         print(f"   ⚠️ 빌드 폴더 확인 실패: {e}")
                 
-                # 로그 파일 확인
-                if os.path.exists(log_file_path):
-                    with open(log_file_path, 'r', encoding='utf-8', errors='replace') as log_file:
-                        log_content = log_file.read()
-                        log_lines = log_content.splitlines()
-                        
-                        # 빌드 스크립트가 실행되었는지 확인
-                        if "WebGL Player Settings 자동 설정 및 빌드 시작" in log_content:
-                            print("   ✓ 빌드 스크립트가 실행되었음")
-                        else:
-                            print("   ❌ 빌드 스크립트가 실행되지 않음 (컴파일 에러 가능성)")
-                        
-                        # 컴파일 에러 검색
-                        error_lines = []
-                        for i, line in enumerate(log_lines):
-                            if any(keyword in line for keyword in ["error CS", "Error:", "error:", "CompilerError", "Compilation failed"]):
-                                # 에러 라인과 전후 컨텍스트 수집
-                                start = max(0, i - 2)
-                                end = min(len(log_lines), i + 3)
-                                error_lines.extend(log_lines[start:end])
-                                error_lines.append("---")
-                        
-                        if error_lines:
-                            print("\n" + "="*80)
-                            print("❌ 컴파일 에러 발견:")
-                            print("="*80)
-                            for line in error_lines[:100]:  # 최대 100줄
-                                print(line)
-                            print("="*80)
-                        
-                        # 로그 마지막 부분도 출력
-                        if log_lines:
-                            print("\n" + "="*80)
-                            print("📝 로그 파일 마지막 100줄 (전체 컨텍스트):")
-                            print("="*80)
-                            last_lines = log_lines[-100:] if len(log_lines) > 100 else log_lines
-                            for line in last_lines:
-                                print(line)
-                            print("="*80)
+                # 로그 분석 (한 번만 스트리밍으로 읽음: 빌드 스크립트 실행 여부, 에러 문맥, 마지막 100줄)
+                print_log_analysis(analyze_build_log(log_file_path), "로그 파일 마지막 100줄 (전체 컨텍스트)")
                 
                 return False, elapsed_time
         else:
+            watchdog_state["exit_reason"] = f"exit_code_{result.returncode}"
             print(f"❌ Unity WebGL 빌드 실패: {project_name} (종료 코드: {result.returncode}, 소요 시간: {time_str})")
+            print_build_report_errors(report)
             
-            # 오류 발생 시 로그 파일 분석
+            # 오류 발생 시 로그 파일 분석 (스트리밍, 메모리 사용량 고정)
             try:
-                if os.path.exists(log_file_path):
-                    with open(log_file_path, 'r', encoding='utf-8', errors='replace') as log_file:
-                        log_content = log_file.read()
-                        log_lines = log_content.splitlines()
-                        
-                        # 빌드 스크립트가 실행되었는지 확인
-                        if "WebGL Player Settings 자동 설정 및 빌드 시작" in log_content:
-                            print("   ✓ 빌드 스크립트가 실행되었음")
-                        else:
-                            print("   ❌ 빌드 스크립트가 실행되지 않음 (컴파일 에러 가능성)")
-                        
-                        # 컴파일 에러 검색
-                        error_lines = []
-                        for i, line in enumerate(log_lines):
-                            if any(keyword in line for keyword in ["error CS", "Error:", "error:", "CompilerError", "Compilation failed"]):
-                                start = max(0, i - 2)
-                                end = min(len(log_lines), i + 3)
-                                error_lines.extend(log_lines[start:end])
-                                error_lines.append("---")
-                        
-                        if error_lines:
-                            print("\n" + "="*80)
-                            print("❌ 컴파일 에러 발견:")
-                            print("="*80)
-                            for line in error_lines[:100]:
-                                print(line)
-                            print("="*80)
-                        
-                        # 로그 마지막 부분 출력
-                        if log_lines:
-                            print("\n" + "="*80)
-                            print("📝 로그 파일 마지막 100줄:")
-                            print("="*80)
-                            last_lines = log_lines[-100:] if len(log_lines) > 100 else log_lines
-                            for line in last_lines:
-                                print(line)
-                            print("="*80)
+                print_log_analysis(analyze_build_log(log_file_path), "로그 파일 마지막 100줄")
             except Exception as e:
                 print(f"⚠️ 로그 파일 읽기 실패: {e}")
             
@@ -1090,6 +795,7 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
     except subprocess.TimeoutExpired:
         # 모니터링 중지
         stop_monitor.set()
+        watchdog_state["exit_reason"] = "timeout"
         
         # 빌드 종료 시간 기록
         build_end_time = time.time()
@@ -1112,25 +818,13 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
                     log_file.write(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
                     log_file.write("="*80 + "\n")
                 
-                # 로그 파일 분석
-                with open(log_file_path, 'r', encoding='utf-8', errors='replace') as log_file:
-                    log_content = log_file.read()
-                    log_lines = log_content.splitlines()
-                    
-                    # 빌드 스크립트가 실행되었는지 확인
-                    if "WebGL Player Settings 자동 설정 및 빌드 시작" in log_content:
-                        print("   ✓ 빌드 스크립트가 실행되었음 (빌드 중 타임아웃)")
-                    else:
-                        print("   ❌ 빌드 스크립트가 실행되지 않음 (타임아웃 전 컴파일 에러 가능성)")
-                    
-                    if log_lines:
-                        print("\n" + "="*80)
-                        print("📝 타임아웃 직전 로그 (마지막 100줄):")
-                        print("="*80)
-                        last_lines = log_lines[-100:] if len(log_lines) > 100 else log_lines
-                        for line in last_lines:
-                            print(line)
-                        print("="*80)
+                # 로그 파일 분석 (빌드 스크립트 실행 여부와 마지막 100줄만 확인)
+                print_log_analysis(
+                    analyze_build_log(log_file_path, search_errors=False),
+                    "타임아웃 직전 로그 (마지막 100줄)",
+                    started_note="(빌드 중 타임아웃)",
+                    not_started_note="(타임아웃 전 컴파일 에러 가능성)"
+                )
         except Exception as e:
             print(f"⚠️ 타임아웃 로그 저장 실패: {e}")
         
@@ -1168,51 +862,59 @@ def run_unity_webgl_build(project_path, timeout=BUILD_TIMEOUT):
                     log_file.write(f"\nTimestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
                     log_file.write("="*80 + "\n")
                 
-                # 로그 파일 분석
-                with open(log_file_path, 'r', encoding='utf-8', errors='replace') as log_file:
-                    log_content = log_file.read()
-                    log_lines = log_content.splitlines()
-                    
-                    # 빌드 스크립트가 실행되었는지 확인
-                    if "WebGL Player Settings 자동 설정 및 빌드 시작" in log_content:
-                        print("   ✓ 빌드 스크립트가 실행되었음 (빌드 중 예외 발생)")
-                    else:
-                        print("   ❌ 빌드 스크립트가 실행되지 않음 (예외 전 컴파일 에러 가능성)")
-                    
-                    if log_lines:
-                        print("\n" + "="*80)
-                        print("📝 예외 발생 직전 로그 (마지막 100줄):")
-                        print("="*80)
-                        last_lines = log_lines[-100:] if len(log_lines) > 100 else log_lines
-                        for line in last_lines:
-                            print(line)
-                        print("="*80)
+                # 로그 파일 분석 (빌드 스크립트 실행 여부와 마지막 100줄만 확인)
+                print_log_analysis(
+                    analyze_build_log(log_file_path, search_errors=False),
+                    "예외 발생 직전 로그 (마지막 100줄)",
+                    started_note="(빌드 중 예외 발생)",
+                    not_started_note="(예외 전 컴파일 에러 가능성)"
+                )
         except Exception as log_error:
             print(f"⚠️ 예외 로그 저장 실패: {log_error}")
         
         # if os.path.exists(log_file_path):
         #     print(f"📝 전체 예외 로그: {log_file_path}")
         return False, elapsed_time
+
+def run_traced_webgl_build(project_dir, tasks=None, code_optimization=None, build_info=None, cache_mode=None):
+    """WebGL 빌드를 실행하고 결과를 빌드 기록 DB에 저장합니다.
+    
+    cache_mode는 빌드 캐시를 확인한 방식으로, 성공한 빌드를 같은 방식의 지문으로 기록합니다.
     
+    트레이스 기록 중이면 작업 슬롯 트랙에 빌드/단계 구간도 남깁니다.
+    build_info(dict)가 주어지면 run_unity_webgl_build가 채운 빌드 정보를 호출자도 사용할 수 있습니다.
+    """
+    slot = acquire_slot()
+    if build_info is None:
+        build_info = {}
+    start_time = time.time()
+    success, elapsed_time = False, 0.0
+    try:
+        success, elapsed_time = run_unity_webgl_build(project_dir, tasks=tasks, build_info=build_info,
+                                                      code_optimization=code_optimization, cache_mode=cache_mode)
+        if "exit_reason" in build_info:
+            # Ctrl+C로 취소된 빌드는 기록하지 않음
+            record_build_metrics(project_dir, success, elapsed_time, build_info,
+                                 os.path.join(BUILD_OUTPUT_DIR, get_project_name_from_path(project_dir)),
+                                 pipeline=bool(tasks))
+        return success, elapsed_time
     finally:
-        # 빌드 스크립트 정리 (성공/실패/예외 모든 경우에 실행)
-        try:
-            cleaned_files = []
-            if os.path.exists(script_path):
-                os.remove(script_path)
-                cleaned_files.append("AutoWebGLBuildScript.cs")
-            if os.path.exists(script_meta_path):
-                os.remove(script_meta_path)
-                cleaned_files.append("AutoWebGLBuildScript.cs.meta")
-            
-            if cleaned_files:
-                print(f"🧹 임시 빌드 스크립트 정리 완료: {', '.join(cleaned_files)}")
-        except Exception as e:
-            print(f"⚠️ 빌드 스크립트 정리 실패: {e}")
+        if slot is not None:
+            add_build_spans(get_project_name_from_path(project_dir), slot,
+                            build_info.get("start_time", start_time), time.time(),
+                            success, build_info.get("phases"))
+        release_slot(slot)
 
-def build_multiple_webgl_projects(project_dirs, parallel=False, max_workers=2):
+def build_multiple_webgl_projects(project_dirs, parallel=False, max_workers=None, tasks=None, use_cache=False, cache_mode=None, adaptive=None, build_infos=None):
     """여러 Unity 프로젝트를 WebGL로 빌드합니다.
     
+    tasks가 주어지면 프로젝트마다 Unity를 한 번만 실행하는 파이프라인 모드로 빌드합니다.
+    use_cache가 True이면 마지막 성공 빌드 이후 변경되지 않은 프로젝트는 빌드를 생략합니다 (캐시 적중).
+    cache_mode는 변경 감지 방식입니다 ("content" 또는 "git", 기본값 Config.BUILD_CACHE_MODE).
+    max_workers는 병렬 빌드 동시 실행 상한이며, None이면 호스트 CPU/메모리로 계산합니다.
+    adaptive가 True이면 (기본값 Config.ADAPTIVE_CONCURRENCY) 호스트 여유 자원에 따라 빌드 시작을 조절합니다.
+    build_infos(dict)가 주어지면 프로젝트명별로 run_unity_webgl_build가 채운 build_info를 저장합니다.
+    
     Returns:
         tuple: (results, total_elapsed_time)
             - results: [(project_name, success, elapsed_time), ...]
@@ -1220,12 +922,21 @@ def build_multiple_webgl_projects(project_dirs, parallel=False, max_workers=2):
     """
     print(f"\n=== Unity WebGL 다중 프로젝트 빌드 시작 ===")
     
+    cached_results = []
+    if use_cache:
+        with trace_span("빌드 캐시 확인", "cache"):
+            project_dirs, cached_results = filter_cached_projects(project_dirs, cache_mode)
+    
     if parallel:
-        return build_multiple_webgl_projects_parallel(project_dirs, max_workers)
+        results, total_elapsed_time = build_multiple_webgl_projects_parallel(project_dirs, max_workers, tasks=tasks, adaptive=adaptive,
+                                                                             build_infos=build_infos, cache_mode=cache_mode)
     else:
-        return build_multiple_webgl_projects_sequential(project_dirs)
+        results, total_elapsed_time = build_multiple_webgl_projects_sequential(project_dirs, tasks=tasks, build_infos=build_infos,
+                                                                               cache_mode=cache_mode)
+    
+    return cached_results + results, total_elapsed_time
 
-def build_multiple_webgl_projects_sequential(project_dirs):
+def build_multiple_webgl_projects_sequential(project_dirs, tasks=None, build_infos=None, cache_mode=None):
     """여러 Unity 프로젝트를 WebGL로 순차적으로 빌드합니다."""
     total_projects = len(project_dirs)
     print(f"📊 총 {total_projects}개 프로젝트 빌드 예정")
@@ -1250,7 +961,8 @@ def build_multiple_webgl_projects_sequential(project_dirs):
         project_name = get_project_name_from_path(project_dir)
         print(f"\n--- {project_name} WebGL 빌드 시작 ---")
         
-        success, elapsed_time = run_unity_webgl_build(project_dir)
+        build_info = build_infos.setdefault(project_name, {}) if build_infos is not None else None
+        success, elapsed_time = run_traced_webgl_build(project_dir, tasks=tasks, build_info=build_info, cache_mode=cache_mode)
         completed_count += 1
         progress_percent = int((completed_count / total_projects) * 100)
         
@@ -1269,59 +981,90 @@ def build_multiple_webgl_projects_sequential(project_dirs):
     
     return results, total_elapsed_time
 
-def build_multiple_webgl_projects_parallel(project_dirs, max_workers=2):
-    """여러 Unity 프로젝트를 WebGL로 병렬로 빌드합니다."""
-    total_projects = len([d for d in project_dirs if os.path.exists(d)])
-    print(f"🌐 WebGL 병렬 빌드 시작 (최대 {max_workers}개 동시 실행)")
+def build_multiple_webgl_projects_parallel(project_dirs, max_workers=None, tasks=None, adaptive=None, build_infos=None, cache_mode=None):
+    """여러 Unity 프로젝트를 WebGL로 병렬로 빌드합니다.
+    
+    예상 빌드 시간이 긴 프로젝트부터 제출하여 (LPT) 전체 빌드 시간을 줄입니다.
+    adaptive 모드에서는 여유 메모리/유휴 CPU가 빌드당 필요량(이전 빌드 측정값)보다 많을 때만
+    다음 빌드를 시작하고, 호스트가 포화 상태이면 실행 중인 빌드가 끝날 때까지 대기합니다.
+    """
+    if adaptive is None:
+        adaptive = ADAPTIVE_CONCURRENCY
+    
+    existing_dirs = [d for d in project_dirs if os.path.exists(d)]
+    total_projects = len(existing_dirs)
+    
+    # 프로젝트별 필요 자원 (이전 빌드의 Unity 프로세스 측정값, 없으면 기본값)
+    requirements, (default_memory_mb, default_cpu_cores) = get_build_requirements(existing_dirs)
+    if max_workers is None:
+        max_workers = get_host_worker_limit(default_memory_mb, default_cpu_cores) if adaptive else 4
+    
+    if adaptive:
+        print(f"🌐 WebGL 병렬 빌드 시작 (최대 {max_workers}개, 호스트 여유 자원에 따라 조절)")
+        print(f"   빌드당 필요 자원: 메모리 {default_memory_mb:.0f}MB, CPU {default_cpu_cores:.1f}코어 (측정 기록이 없는 프로젝트 기준)")
+    else:
+        print(f"🌐 WebGL 병렬 빌드 시작 (최대 {max_workers}개 동시 실행)")
     print(f"📊 총 {total_projects}개 프로젝트 빌드 예정")
     
+    # 예상 빌드 시간이 긴 순서로 정렬 (기록이 없으면 Assets 크기로 추정)
+    ordered_dirs = order_longest_first(existing_dirs, max_workers)
+    
     success_count = 0
     fail_count = 0
     completed_count = 0
     results = []
     total_start_time = time.time()
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # 모든 프로젝트를 병렬로 제출
-        future_to_project = {
-            executor.submit(run_unity_webgl_build, project_dir): project_dir 
-            for project_dir in project_dirs if os.path.exists(project_dir)
-        }
+    controller = AdaptiveConcurrencyController(max_workers, default_memory_mb, default_cpu_cores, adaptive=adaptive)
+    
+    # 이번 병렬 빌드가 시작한 Unity 프로세스만 취소 대상으로 등록
+    group = new_process_group()
+    
+    def build_project(project_dir):
+        build_info = None
+        if build_infos is not None:
+            build_info = build_infos.setdefault(get_project_name_from_path(project_dir), {})
+        with process_group(group):
+            return run_traced_webgl_build(project_dir, tasks=tasks, build_info=build_info, cache_mode=cache_mode)
+    
+    def cancel_builds():
+        # Ctrl+C: 대기 중인 빌드는 취소하고 이번 빌드에서 실행 중인 Unity 프로세스 트리를 종료
+        print("\n⛔ 병렬 빌드 취소: 실행 중인 Unity 프로세스 트리 종료 중...")
+        kill_all_process_trees("사용자 취소 (Ctrl+C)", group)
+    
+    # 예상 시간이 긴 순서로 시작하고, 완료된 작업들을 처리
+    for project_dir, future in controller.run(build_project, ordered_dirs, requirements, on_cancel=cancel_builds):
+        project_name = get_project_name_from_path(project_dir)
         
-        # 완료된 작업들을 처리
-        for future in as_completed(future_to_project):
-            project_dir = future_to_project[future]
-            project_name = get_project_name_from_path(project_dir)
+        try:
+            success, elapsed_time = future.result()
+            completed_count += 1
+            progress_percent = int((completed_count / total_projects) * 100)
             
-            try:
-                success, elapsed_time = future.result()
-                completed_count += 1
-                progress_percent = int((completed_count / total_projects) * 100)
-                
-                if success:
-                    success_count += 1
-                    minutes = int(elapsed_time // 60)
-                    seconds = int(elapsed_time % 60)
-                    time_str = f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
-                    print(f"✅ {project_name} WebGL 병렬 빌드 완료 (소요 시간: {time_str})")
-                else:
-                    fail_count += 1
-                    minutes = int(elapsed_time // 60)
-                    seconds = int(elapsed_time % 60)
-                    time_str = f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
-                    print(f"❌ {project_name} WebGL 병렬 빌드 실패 (소요 시간: {time_str})")
-                
-                # 전체 진행도 표시
-                print(f"📊 전체 진행도: {completed_count}/{total_projects} 완료 ({progress_percent}%)")
-                
-                results.append((project_name, success, elapsed_time))
-            except Exception as e:
+            if success:
+                success_count += 1
+                minutes = int(elapsed_time // 60)
+                seconds = int(elapsed_time % 60)
+                time_str = f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
+                print(f"✅ {project_name} WebGL 병렬 빌드 완료 (소요 시간: {time_str})")
+            else:
                 fail_count += 1
-                completed_count += 1
-                progress_percent = int((completed_count / total_projects) * 100)
-                print(f"❌ {project_name} WebGL 병렬 빌드 예외: {e}")
-                print(f"📊 전체 진행도: {completed_count}/{total_projects} 완료 ({progress_percent}%)")
-                results.append((project_name, False, 0.0))
+                minutes = int(elapsed_time // 60)
+                seconds = int(elapsed_time % 60)
+                time_str = f"{minutes}분 {seconds}초" if minutes > 0 else f"{seconds}초"
+                print(f"❌ {project_name} WebGL 병렬 빌드 실패 (소요 시간: {time_str})")
+            
+            # 전체 진행도 표시
+            print(f"📊 전체 진행도: {completed_count}/{total_projects} 완료 ({progress_percent}%)")
+            
+            results.append((project_name, success, elapsed_time))
+        except Exception as e:
+            fail_count += 1
+            completed_count += 1
+            progress_percent = int((completed_count / total_projects) * 100)
+            print(f"❌ {project_name} WebGL 병렬 빌드 예외: {e}")
+            print(f"📊 전체 진행도: {completed_count}/{total_projects} 완료 ({progress_percent}%)")
+            results.append((project_name, False, 0.0))
     
     total_end_time = time.time()
     total_elapsed_time = total_end_time - total_start_time
@@ -1378,10 +1121,6 @@ def clean_build_outputs(project_dirs):
     print(f"📁 빌드 폴더: {BUILD_OUTPUT_DIR}")
 
 def format_bytes(bytes_size):
-    """바이트 크기를 읽기 쉬운 형태로 변환합니다."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+    """바이트 크기를 읽기 쉬운 형태로 변환합니다 (build_report.format_size와 동일)."""
+    return format_size(bytes_size)
 # endregion
@@ -0,0 +1,310 @@
+"""
+WebGL 빌드 기록 데이터베이스 (SQLite) 및 회귀 보고서
+- 모든 빌드(성공/실패)를 BUILD_OUTPUT_DIR/_Metrics/build_metrics.db 에 저장
+  (프로젝트, 커밋, 에디터 버전, Code Optimization, 소요 시간, 종료 사유, 단계별 시간, 출력 파일별 크기, 자원 사용량)
+- --metrics-report: 프로젝트별 마지막 성공 빌드를 직전 성공 빌드들의 중앙값(기준선)과 비교하여
+  빌드 시간 또는 Build/ 크기가 임계값 이상 늘어난 프로젝트를 표시
+- 표준 라이브러리 sqlite3만 사용 (병렬 빌드에서 동시에 기록해도 잠금 대기 후 저장)
+"""
+import os
+import time
+import sqlite3
+import threading
+from config import Config
+from git_utils import get_project_name_from_path, get_head_commit
+from build_cache import get_unity_editor_version
+from build_report import format_size, format_duration
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+WEBGL_CODE_OPTIMIZATION = Config.WEBGL_CODE_OPTIMIZATION
+BUILD_METRICS_ENABLED = Config.BUILD_METRICS_ENABLED
+BUILD_REGRESSION_BASELINE_SIZE = Config.BUILD_REGRESSION_BASELINE_SIZE
+BUILD_TIME_REGRESSION_THRESHOLD = Config.BUILD_TIME_REGRESSION_THRESHOLD
+BUILD_SIZE_REGRESSION_THRESHOLD = Config.BUILD_SIZE_REGRESSION_THRESHOLD
+
+METRICS_DIR_NAME = "_Metrics"
+METRICS_DB_NAME = "build_metrics.db"
+
+# 잡음으로 인한 오탐 방지: 이보다 작은 증가량은 회귀로 보지 않음
+MIN_TIME_REGRESSION_SECONDS = 30
+MIN_SIZE_REGRESSION_BYTES = 100 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project TEXT NOT NULL,
+    built_at REAL NOT NULL,
+    success INTEGER NOT NULL,
+    exit_reason TEXT,
+    commit_hash TEXT,
+    editor_version TEXT,
+    code_optimization TEXT,
+    duration REAL,
+    build_size INTEGER,
+    peak_memory_mb REAL,
+    cpu_cores REAL,
+    pipeline INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_builds_project ON builds (project, built_at);
+CREATE TABLE IF NOT EXISTS build_phases (
+    build_id INTEGER NOT NULL REFERENCES builds(id),
+    phase TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS build_files (
+    build_id INTEGER NOT NULL REFERENCES builds(id),
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+_db_lock = threading.Lock()
+
+
+def get_metrics_db_path():
+    """빌드 기록 데이터베이스 경로를 반환합니다."""
+    return os.path.join(BUILD_OUTPUT_DIR, METRICS_DIR_NAME, METRICS_DB_NAME)
+
+def connect_metrics_db(db_path=None):
+    """빌드 기록 데이터베이스에 연결합니다 (없으면 생성)."""
+    if db_path is None:
+        db_path = get_metrics_db_path()
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    connection = sqlite3.connect(db_path, timeout=30)
+    try:
+        connection.executescript(SCHEMA)
+    except sqlite3.Error:
+        connection.close()
+        raise
+    return connection
+
+def get_build_output_files(build_dir, report=None):
+    """Build 폴더의 출력 파일별 크기를 반환합니다 (BuildReport가 있으면 보고서 사용).
+
+    Returns:
+        list: [(파일명, 크기), ...]
+    """
+    if report:
+        from build_report import get_build_folder_files
+        files = get_build_folder_files(report)
+        if files:
+            return files
+
+    build_folder = os.path.join(build_dir, "Build")
+    files = []
+    try:
+        for entry in os.scandir(build_folder):
+            if entry.is_file():
+                files.append((entry.name, entry.stat().st_size))
+    except OSError:
+        pass
+    return files
+
+def record_build_metrics(project_path, success, elapsed_time, build_info=None, build_dir=None, pipeline=False, db_path=None):
+    """빌드 한 번의 결과를 데이터베이스에 저장합니다.
+
+    Args:
+        project_path: 프로젝트 경로
+        success: 빌드 성공 여부
+        elapsed_time: 소요 시간 (초)
+        build_info: run_unity_webgl_build가 채운 정보 (exit_reason, phases, resources, report, code_optimization)
+        build_dir: 빌드 출력 폴더 (출력 파일 크기 기록용, 성공한 빌드만)
+        pipeline: 배치 처리 + 빌드 파이프라인으로 실행했는지 여부
+
+    Returns:
+        int: 저장된 빌드 id (실패 시 None)
+    """
+    if not BUILD_METRICS_ENABLED:
+        return None
+
+    build_info = build_info or {}
+    project_name = get_project_name_from_path(project_path)
+
+    files = get_build_output_files(build_dir, build_info.get("report")) if success and build_dir else []
+    build_size = sum(size for _, size in files) if files else None
+    resources = build_info.get("resources") or (None, None)
+    phase_totals = (build_info.get("phases") or {}).get("totals", {})
+    exit_reason = build_info.get("exit_reason") or ("success" if success else "failed")
+
+    try:
+        commit_hash = get_head_commit(project_path)
+    except Exception:
+        commit_hash = None
+
+    with _db_lock:
+        connection = None
+        try:
+            connection = connect_metrics_db(db_path)
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO builds (project, built_at, success, exit_reason, commit_hash, editor_version, "
+                    "code_optimization, duration, build_size, peak_memory_mb, cpu_cores, pipeline) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (project_name, time.time(), 1 if success else 0, exit_reason, commit_hash,
+                     get_unity_editor_version(), build_info.get("code_optimization") or WEBGL_CODE_OPTIMIZATION, round(elapsed_time, 2), build_size,
+                     resources[0], resources[1], 1 if pipeline else 0)
+                )
+                build_id = cursor.lastrowid
+                connection.executemany(
+                    "INSERT INTO build_phases (build_id, phase, seconds) VALUES (?, ?, ?)",
+                    [(build_id, phase, seconds) for phase, seconds in phase_totals.items()]
+                )
+                connection.executemany(
+                    "INSERT INTO build_files (build_id, name, size) VALUES (?, ?, ?)",
+                    [(build_id, name, size) for name, size in files]
+                )
+            return build_id
+        except sqlite3.Error as e:
+            print(f"⚠️ 빌드 기록 DB 저장 실패 ({project_name}): {e}")
+            return None
+        finally:
+            if connection is not None:
+                connection.close()
+
+def load_successful_builds(connection, project_name, limit):
+    """프로젝트의 최근 성공 빌드를 최신 순으로 반환합니다.
+
+    Returns:
+        list: [(id, built_at, duration, build_size, commit_hash), ...]
+    """
+    return connection.execute(
+        "SELECT id, built_at, duration, build_size, commit_hash FROM builds "
+        "WHERE project = ? AND success = 1 ORDER BY built_at DESC LIMIT ?",
+        (project_name, limit)
+    ).fetchall()
+
+def get_latest_successful_build(project_name, db_path=None):
+    """프로젝트의 마지막 성공 빌드 정보를 반환합니다.
+
+    Returns:
+        dict: {"built_at", "commit_hash", "editor_version", "code_optimization"} (기록이 없으면 None)
+    """
+    connection = None
+    try:
+        connection = connect_metrics_db(db_path)
+        row = connection.execute(
+            "SELECT built_at, commit_hash, editor_version, code_optimization FROM builds "
+            "WHERE project = ? AND success = 1 ORDER BY built_at DESC LIMIT 1",
+            (project_name,)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        if connection is not None:
+            connection.close()
+    if not row:
+        return None
+    return {"built_at": row[0], "commit_hash": row[1], "editor_version": row[2], "code_optimization": row[3]}
+
+def _median(values):
+    values = sorted(values)
+    if not values:
+        return None
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+def find_build_regressions(projects=None, baseline_size=None, time_threshold=None, size_threshold=None, db_path=None):
+    """마지막 성공 빌드가 기준선(직전 성공 빌드들의 중앙값)보다 느려지거나 커진 프로젝트를 찾습니다.
+
+    Args:
+        projects: 확인할 프로젝트 이름 목록 (None이면 DB의 모든 프로젝트)
+        baseline_size: 기준선에 사용할 직전 성공 빌드 수 (기본값 Config.BUILD_REGRESSION_BASELINE_SIZE)
+        time_threshold: 빌드 시간 증가 비율 임계값 (예: 0.2 = 20%)
+        size_threshold: Build/ 크기 증가 비율 임계값 (예: 0.05 = 5%)
+
+    Returns:
+        list: 프로젝트별 비교 결과 [{"project", "duration", "baseline_duration", "duration_change",
+              "build_size", "baseline_size", "size_change", "time_regressed", "size_regressed", "samples"}, ...]
+    """
+    if baseline_size is None:
+        baseline_size = BUILD_REGRESSION_BASELINE_SIZE
+    if time_threshold is None:
+        time_threshold = BUILD_TIME_REGRESSION_THRESHOLD
+    if size_threshold is None:
+        size_threshold = BUILD_SIZE_REGRESSION_THRESHOLD
+
+    if db_path is None:
+        db_path = get_metrics_db_path()
+    if not os.path.exists(db_path):
+        return []
+
+    connection = connect_metrics_db(db_path)
+    try:
+        if projects is None:
+            projects = [row[0] for row in connection.execute("SELECT DISTINCT project FROM builds ORDER BY project")]
+
+        results = []
+        for project_name in projects:
+            builds = load_successful_builds(connection, project_name, baseline_size + 1)
+            if len(builds) < 2:
+                continue  # 기준선을 만들 기록이 부족함
+
+            latest, previous = builds[0], builds[1:]
+            baseline_duration = _median([build[2] for build in previous if build[2] is not None])
+            baseline_build_size = _median([build[3] for build in previous if build[3] is not None])
+
+            entry = {
+                "project": project_name,
+                "duration": latest[2],
+                "baseline_duration": baseline_duration,
+                "duration_change": None,
+                "build_size": latest[3],
+                "baseline_size": baseline_build_size,
+                "size_change": None,
+                "time_regressed": False,
+                "size_regressed": False,
+                "samples": len(previous),
+                "commit_hash": latest[4]
+            }
+            if latest[2] is not None and baseline_duration:
+                entry["duration_change"] = (latest[2] - baseline_duration) / baseline_duration
+                entry["time_regressed"] = (entry["duration_change"] > time_threshold and
+                                           latest[2] - baseline_duration >= MIN_TIME_REGRESSION_SECONDS)
+            if latest[3] is not None and baseline_build_size:
+                entry["size_change"] = (latest[3] - baseline_build_size) / baseline_build_size
+                entry["size_regressed"] = (entry["size_change"] > size_threshold and
+                                           latest[3] - baseline_build_size >= MIN_SIZE_REGRESSION_BYTES)
+            results.append(entry)
+        return results
+    finally:
+        connection.close()
+
+def _format_change(change):
+    return f"{change * 100:+.1f}%" if change is not None else "-"
+
+def print_regression_report(projects=None):
+    """빌드 시간 / Build 크기 회귀 보고서를 출력합니다.
+
+    Returns:
+        list: 회귀가 감지된 프로젝트 결과 목록
+    """
+    print(f"\n=== 빌드 회귀 보고서 (기준선: 직전 성공 빌드 최대 {BUILD_REGRESSION_BASELINE_SIZE}회 중앙값) ===")
+    print(f"📂 데이터베이스: {get_metrics_db_path()}")
+    print(f"   임계값: 빌드 시간 +{BUILD_TIME_REGRESSION_THRESHOLD * 100:.0f}%, "
+          f"Build 크기 +{BUILD_SIZE_REGRESSION_THRESHOLD * 100:.0f}%")
+
+    results = find_build_regressions(projects)
+    if not results:
+        print("ℹ️ 비교할 빌드 기록이 없습니다 (프로젝트별 성공 빌드가 2회 이상 필요)")
+        return []
+
+    regressions = [entry for entry in results if entry["time_regressed"] or entry["size_regressed"]]
+    for entry in sorted(results, key=lambda item: (not (item["time_regressed"] or item["size_regressed"]), item["project"])):
+        marks = []
+        if entry["time_regressed"]:
+            marks.append("빌드 시간 회귀")
+        if entry["size_regressed"]:
+            marks.append("크기 회귀")
+        icon = "⚠️" if marks else "✅"
+        print(f"{icon} {entry['project']}: "
+              f"시간 {format_duration(entry['duration'])} (기준 {format_duration(entry['baseline_duration'])}, "
+              f"{_format_change(entry['duration_change'])}), "
+              f"크기 {format_size(entry['build_size'])} (기준 {format_size(entry['baseline_size'])}, "
+              f"{_format_change(entry['size_change'])})"
+              + (f" - {', '.join(marks)}" if marks else ""))
+
+    print(f"\n📊 {len(results)}개 프로젝트 비교, 회귀 {len(regressions)}개")
+    return regressions
@@ -0,0 +1,115 @@
+"""
+Unity 빌드 단계 파서 및 단계별 소요 시간 계산
+- 로그 줄에서 빌드 단계(스크립트 컴파일, 에셋 임포트, 플레이어 빌드, IL2CPP 코드 생성,
+  C++ 컴파일, WASM 링크)를 인식
+- 단계 전환 기록 [(timestamp, phase), ...]으로 단계별 시작/종료 시각과 소요 시간 계산
+- 결과는 빌드 기록(build_history)에 저장되어 어떤 단계가 빌드 시간을 차지하는지 분석하는 데 사용
+"""
+import re
+
+# 빌드 단계 (id, 표시 이름, 로그 키워드) - 위에서부터 순서대로 검사 (구체적인 키워드 우선)
+# IL2CPP 코드 생성 / C++ 컴파일 / WASM 링크는 정지 감시 제한이 길어지는 단계이므로 설정 덤프나 경로에도 나오는
+# 일반 단어("IL2CPP", "Emscripten", "Generating code" 등)는 쓰지 않고 아래 BEE_NODE_PHASES와 변환 시작 표식만 사용
+BUILD_PHASES = [
+    ("wasm_link", "WASM 링크", []),
+    ("cpp_compile", "C++ 컴파일", []),
+    ("il2cpp_codegen", "IL2CPP 코드 생성", [
+        "Converting managed assemblies to C++"
+    ]),
+    ("player_build", "플레이어 빌드", [
+        "Building WebGL Player", "Building player", "BuildPlayer", "WebGL Player Settings 자동 설정 및 빌드 시작"
+    ]),
+    ("asset_import", "에셋 임포트", [
+        "Start importing", "Asset Pipeline Refresh", "Refreshing native plugins", "Building Library"
+    ]),
+    ("script_compilation", "스크립트 컴파일", [
+        "Compiling scripts", "Requested script compilation", "Starting script compilation", "[ScriptCompilation]"
+    ]),
+]
+
+# Bee 빌드 노드 진행 줄("[ 594/1204  12s] C_WebGL_wasm Library/Bee/...")의 노드 이름 접두사 -> 단계
+# (노드 이름이 줄 맨 앞 진행 표시 바로 뒤에 올 때만 인식)
+BEE_NODE_PHASES = [
+    ("Link_WebGL_wasm", "wasm_link"),
+    ("C_WebGL_wasm", "cpp_compile"),
+    ("IL2CPP_CodeGen", "il2cpp_codegen"),
+]
+BEE_PROGRESS_PATTERN = re.compile(r"^\s*\[\s*\d+/\d+\s+[^\]]*\]\s+(\S+)")
+
+PHASE_NAMES = {phase_id: name for phase_id, name, _ in BUILD_PHASES}
+PHASE_NAMES["startup"] = "Unity 시작"  # 첫 단계가 로그에 나타나기 전 (Unity 실행 및 프로젝트 열기)
+
+# 단계 표시 순서 (실제 빌드 진행 순서)
+PHASE_ORDER = ["script_compilation", "asset_import", "player_build", "il2cpp_codegen", "cpp_compile", "wasm_link"]
+
+
+def detect_phase(line):
+    """로그 줄이 나타내는 빌드 단계 id를 반환합니다 (해당 없으면 None)."""
+    if "[" in line[:8]:
+        match = BEE_PROGRESS_PATTERN.match(line)
+        if match:
+            node = match.group(1)
+            for prefix, phase_id in BEE_NODE_PHASES:
+                if node.startswith(prefix):
+                    return phase_id
+    for phase_id, _, keywords in BUILD_PHASES:
+        for keyword in keywords:
+            if keyword in line:
+                return phase_id
+    return None
+
+def get_phase_name(phase_id):
+    """빌드 단계 표시 이름을 반환합니다."""
+    return PHASE_NAMES.get(phase_id, phase_id or "빌드 진행 중")
+
+def compute_phase_timings(phase_transitions, start_time, end_time):
+    """단계 전환 기록으로 단계별 구간과 합계를 계산합니다.
+
+    각 단계는 다음 단계 전환(또는 빌드 종료) 시각에 끝납니다. 첫 단계 이전 시간은
+    "startup"(Unity 실행 및 프로젝트 열기)으로 기록합니다.
+
+    Args:
+        phase_transitions: [(timestamp, phase_id), ...]
+        start_time: 빌드 시작 시각
+        end_time: 빌드 종료 시각
+
+    Returns:
+        dict: {
+            "segments": [{"phase", "start", "end", "seconds"}, ...]  (start/end는 빌드 시작 기준 초)
+            "totals": {phase_id: seconds, ...}
+        }
+    """
+    segments = []
+    boundaries = [(start_time, "startup")] + sorted(phase_transitions)
+    for index, (timestamp, phase_id) in enumerate(boundaries):
+        next_time = boundaries[index + 1][0] if index + 1 < len(boundaries) else end_time
+        next_time = max(timestamp, min(next_time, end_time))
+        if next_time <= timestamp and phase_id == "startup":
+            continue
+        segments.append({
+            "phase": phase_id,
+            "start": round(timestamp - start_time, 2),
+            "end": round(next_time - start_time, 2),
+            "seconds": round(next_time - timestamp, 2)
+        })
+
+    totals = {}
+    for segment in segments:
+        totals[segment["phase"]] = round(totals.get(segment["phase"], 0.0) + segment["seconds"], 2)
+
+    return {"segments": segments, "totals": totals}
+
+def format_phase_summary(totals):
+    """단계별 합계를 한 줄 요약 문자열로 변환합니다 (가장 오래 걸린 단계 표시)."""
+    if not totals:
+        return ""
+    parts = []
+    for phase_id in ["startup"] + PHASE_ORDER:
+        if phase_id in totals:
+            seconds = totals[phase_id]
+            minutes = int(seconds // 60)
+            remaining = int(seconds % 60)
+            time_text = f"{minutes}분 {remaining}초" if minutes > 0 else f"{remaining}초"
+            parts.append(f"{get_phase_name(phase_id)} {time_text}")
+    dominant = max(totals, key=totals.get)
+    return " | ".join(parts) + f" (최장: {get_phase_name(dominant)})"
@@ -0,0 +1,170 @@
+"""
+Unity BuildReport JSON 읽기 및 빌드 결과 검증
+- 패키지 WebGLBuilder(BuildReportWriter.cs)가 빌드 직후 BUILD_OUTPUT_DIR/_Reports/프로젝트명.json에 저장
+- 내용: summary(결과, 총 시간/크기, 에러/경고 수), steps(빌드 단계별 시간), messages(에러/경고),
+  files(출력 파일과 크기), packedAssets(빌드에 포함된 에셋별 크기, 큰 순서)
+- 로그 전체를 검색하지 않고 보고서 한 개만 읽어 빌드 성공 여부와 출력 파일을 확인
+- 보고서가 없으면 (이전 버전 패키지, BuildPlayer 호출 전 실패) 호출자는 로그 기반 검증을 사용
+"""
+import os
+import json
+from config import Config
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+
+REPORT_DIR_NAME = "_Reports"
+
+# WebGL 출력 파일의 압축 접미사 (Brotli, Gzip, decompressionFallback 사용 시 .unityweb, 비압축)
+COMPRESSION_SUFFIXES = [".br", ".gz", ".unityweb", ""]
+
+# WebGL 필수 출력 파일 (표시 이름, 압축 접미사를 뺀 확장자)
+REQUIRED_BUILD_FILES = [
+    ("WebAssembly", ".wasm"),
+    ("Data file", ".data"),
+    ("Loader", ".loader.js"),
+    ("Framework", ".framework.js"),
+]
+
+
+def strip_compression_suffix(file_name):
+    """파일명에서 압축 접미사(.br, .gz, .unityweb)를 뺀 이름을 반환합니다."""
+    lower_name = file_name.lower()
+    for suffix in COMPRESSION_SUFFIXES:
+        if suffix and lower_name.endswith(suffix):
+            return file_name[:-len(suffix)]
+    return file_name
+
+def is_build_file_kind(file_name, extension):
+    """파일이 압축 방식과 관계없이 extension(.wasm, .data 등) 종류인지 확인합니다."""
+    return strip_compression_suffix(file_name).lower().endswith(extension)
+
+def describe_file_kind(extension):
+    """누락 메시지용 파일명 형식 (예: ".wasm(.br/.gz/.unityweb)")."""
+    return f"{extension}({'/'.join(suffix for suffix in COMPRESSION_SUFFIXES if suffix)})"
+
+
+def get_build_report_path(project_name):
+    """프로젝트의 BuildReport JSON 경로를 반환합니다."""
+    return os.path.join(BUILD_OUTPUT_DIR, REPORT_DIR_NAME, f"{project_name}.json")
+
+def clear_build_report(report_path):
+    """이전 빌드의 보고서를 삭제합니다 (빌드 실패 시 오래된 보고서를 읽지 않도록)."""
+    try:
+        if os.path.exists(report_path):
+            os.remove(report_path)
+    except OSError as e:
+        print(f"⚠️ 이전 BuildReport 삭제 실패: {e}")
+
+def load_build_report(report_path):
+    """BuildReport JSON을 읽습니다.
+
+    Returns:
+        dict: 보고서 (파일이 없거나 읽을 수 없으면 None)
+    """
+    if not report_path or not os.path.exists(report_path):
+        return None
+    try:
+        with open(report_path, 'r', encoding='utf-8-sig') as f:
+            report = json.load(f)
+        return report if isinstance(report, dict) and "summary" in report else None
+    except (OSError, ValueError) as e:
+        print(f"⚠️ BuildReport 읽기 실패: {e}")
+        return None
+
+def is_report_succeeded(report):
+    """보고서의 빌드 결과가 성공(Succeeded)인지 확인합니다."""
+    return bool(report) and report.get("summary", {}).get("result") == "Succeeded"
+
+def get_build_folder_files(report):
+    """보고서의 출력 파일 중 Build 폴더에 있는 파일 목록을 반환합니다.
+
+    Returns:
+        list: [(파일명, 크기), ...]
+    """
+    files = []
+    for file_info in report.get("files", []):
+        path = file_info.get("path", "").replace("\\", "/")
+        if "/Build/" in path:
+            files.append((os.path.basename(path), file_info.get("size", 0)))
+    return files
+
+def get_report_errors(report, limit=50):
+    """보고서의 에러/예외 메시지를 반환합니다.
+
+    Returns:
+        list: ["[빌드 단계] 메시지", ...]
+    """
+    errors = []
+    for message in report.get("messages", []):
+        if message.get("type") in ("Error", "Exception"):
+            errors.append(f"[{message.get('step', '')}] {message.get('content', '').strip()}")
+            if len(errors) >= limit:
+                break
+    return errors
+
+def get_step_durations(report, max_depth=0):
+    """빌드 단계별 소요 시간을 반환합니다 (max_depth 이하 단계만, 긴 순서).
+
+    Returns:
+        list: [(단계 이름, 초), ...]
+    """
+    steps = [(step.get("name", ""), step.get("seconds", 0.0))
+             for step in report.get("steps", []) if step.get("depth", 0) <= max_depth]
+    return sorted(steps, key=lambda item: item[1], reverse=True)
+
+def validate_build_report(report, build_dir):
+    """BuildReport로 빌드 출력물을 검증합니다 (로그를 읽지 않음).
+
+    보고서의 빌드 결과가 Succeeded이고, 보고된 Build 폴더 파일에 WebGL 필수 파일(.wasm, .data,
+    .loader.js, .framework.js)이 모두 있으며 실제로 존재해야 유효합니다.
+
+    Returns:
+        dict: validate_build_output과 같은 형식 {"valid", "found_files", "missing_files"}
+    """
+    result = {
+        "valid": False,
+        "found_files": [],
+        "missing_files": []
+    }
+
+    build_result = report.get("summary", {}).get("result", "Unknown")
+    if build_result != "Succeeded":
+        result["missing_files"].append(f"BuildReport 결과: {build_result}")
+        return result
+    result["found_files"].append("Unity BuildReport 결과: Succeeded")
+
+    build_files = get_build_folder_files(report)
+    build_folder = os.path.join(build_dir, "Build")
+    all_found = True
+    for label, extension in REQUIRED_BUILD_FILES:
+        matches = [(name, size) for name, size in build_files if is_build_file_kind(name, extension)]
+        # 보고서와 실제 출력 폴더가 일치하는지 확인 (필수 파일만 확인하므로 폴더 전체를 읽지 않음)
+        matches = [(name, size) for name, size in matches if os.path.exists(os.path.join(build_folder, name))]
+        if matches:
+            names = ", ".join(f"{name} ({format_size(size)})" for name, size in matches)
+            result["found_files"].append(f"{label}: {names}")
+        else:
+            result["missing_files"].append(f"{label} ({describe_file_kind(extension)})")
+            all_found = False
+
+    result["valid"] = all_found
+    return result
+
+def format_size(bytes_size):
+    """바이트를 읽기 쉬운 단위로 변환합니다 (None이면 "-")."""
+    if bytes_size is None:
+        return "-"
+    size = float(bytes_size)
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} PB"
+
+def format_duration(seconds):
+    """소요 시간을 'X분 Y초' 형식으로 변환합니다 (None이면 "-")."""
+    if seconds is None:
+        return "-"
+    minutes = int(seconds // 60)
+    return f"{minutes}분 {int(seconds % 60)}초" if minutes else f"{seconds:.1f}초"
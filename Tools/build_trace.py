@@ -0,0 +1,181 @@
+"""
+빌드 실행 트레이스 (Chrome Trace Event JSON)
+- --trace 옵션으로 활성화하면 BUILD_OUTPUT_DIR/_Traces/build_trace_<시각>.json 생성
+- chrome://tracing 또는 https://ui.perfetto.dev 에서 열어 확인
+- 트랙: main (패키지 추가, Git, 배치, 빌드 등 main 단계) + 병렬 빌드 작업 슬롯별 트랙
+- 슬롯 트랙에는 프로젝트별 빌드 구간과 그 안에 빌드 단계(스크립트 컴파일, IL2CPP 등) 구간이 중첩 표시
+- 비활성화 상태에서는 모든 함수가 아무 작업도 하지 않음
+"""
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from config import Config
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+
+TRACE_DIR_NAME = "_Traces"
+MAIN_TRACK = 0
+
+_lock = threading.Lock()
+_trace = None  # {"path", "start", "events", "tracks", "busy_slots"}
+
+
+def start_trace(path=None):
+    """트레이스 기록을 시작합니다.
+
+    Returns:
+        str: 트레이스 파일 경로
+    """
+    global _trace
+    if path is None:
+        path = os.path.join(BUILD_OUTPUT_DIR, TRACE_DIR_NAME, f"build_trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with _lock:
+        _trace = {
+            "path": path,
+            "start": time.time(),
+            "events": [],
+            "tracks": {MAIN_TRACK: "main"},
+            "busy_slots": set()
+        }
+    return path
+
+def is_tracing():
+    """트레이스 기록 중인지 확인합니다."""
+    return _trace is not None
+
+def _to_microseconds(trace, timestamp):
+    return int(round((timestamp - trace["start"]) * 1000000))
+
+def _append_event(event, timestamp):
+    """기록 중이면 이벤트의 시각(ts)을 채워 추가합니다.
+
+    save_trace가 다른 스레드에서 기록을 끝낼 수 있으므로 _lock 안에서 _trace를 한 번만 읽어 사용합니다.
+    """
+    with _lock:
+        trace = _trace
+        if trace is None:
+            return
+        event["ts"] = _to_microseconds(trace, timestamp)
+        trace["events"].append(event)
+
+def add_span(name, category, start_time, end_time, track=MAIN_TRACK, args=None):
+    """완료된 구간(Complete event)을 추가합니다.
+
+    Args:
+        name: 구간 이름 (예: 프로젝트명, 빌드 단계)
+        category: 분류 (예: "build", "phase", "git")
+        start_time, end_time: time.time() 기준 시각
+        track: 트랙 번호 (0: main, 1~: 작업 슬롯)
+        args: 트레이스 뷰어에 표시할 추가 정보
+    """
+    if _trace is None:
+        return
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "pid": 1,
+        "tid": track,
+        "dur": max(0, int(round((end_time - start_time) * 1000000)))
+    }
+    if args:
+        event["args"] = args
+    _append_event(event, start_time)
+
+def add_instant(name, category, timestamp=None, track=MAIN_TRACK, args=None):
+    """순간 이벤트(Instant event)를 추가합니다 (예: 캐시 적중, 취소)."""
+    if _trace is None:
+        return
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "i",
+        "s": "t",
+        "pid": 1,
+        "tid": track
+    }
+    if args:
+        event["args"] = args
+    _append_event(event, timestamp if timestamp is not None else time.time())
+
+@contextmanager
+def trace_span(name, category, track=MAIN_TRACK, args=None):
+    """with 블록 실행 구간을 기록합니다 (예: with trace_span("Git 커밋", "git"): ...)."""
+    start_time = time.time()
+    try:
+        yield
+    finally:
+        add_span(name, category, start_time, time.time(), track, args)
+
+def acquire_slot():
+    """비어있는 작업 슬롯 번호(1부터)를 할당합니다 (트랙 하나 = 동시에 실행되는 빌드 하나)."""
+    if _trace is None:
+        return None
+    with _lock:
+        trace = _trace
+        if trace is None:
+            return None
+        slot = 1
+        while slot in trace["busy_slots"]:
+            slot += 1
+        trace["busy_slots"].add(slot)
+        trace["tracks"].setdefault(slot, f"작업 슬롯 {slot}")
+    return slot
+
+def release_slot(slot):
+    """작업 슬롯을 반환합니다."""
+    if _trace is None or slot is None:
+        return
+    with _lock:
+        if _trace is not None:
+            _trace["busy_slots"].discard(slot)
+
+def add_build_spans(project_name, slot, start_time, end_time, success, phases=None):
+    """프로젝트 빌드 구간과 그 안의 빌드 단계 구간을 작업 슬롯 트랙에 추가합니다.
+
+    Args:
+        phases: build_phases.compute_phase_timings 결과 (segments의 start/end는 빌드 시작 기준 초)
+    """
+    if _trace is None:
+        return
+    from build_phases import get_phase_name
+
+    add_span(project_name, "build", start_time, end_time, slot,
+             {"success": success, "elapsed_seconds": round(end_time - start_time, 1)})
+    for segment in (phases or {}).get("segments", []):
+        add_span(get_phase_name(segment["phase"]), "phase",
+                 start_time + segment["start"], start_time + segment["end"], slot,
+                 {"project": project_name, "phase": segment["phase"]})
+
+def save_trace():
+    """트레이스를 파일로 저장하고 기록을 종료합니다.
+
+    Returns:
+        str: 저장된 파일 경로 (기록 중이 아니거나 실패하면 None)
+    """
+    global _trace
+    if _trace is None:
+        return None
+
+    with _lock:
+        trace = _trace
+        _trace = None
+
+    events = []
+    for track, track_name in sorted(trace["tracks"].items()):
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": track, "args": {"name": track_name}})
+        events.append({"name": "thread_sort_index", "ph": "M", "pid": 1, "tid": track, "args": {"sort_index": track}})
+    events.append({"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "Dannect Unity Toolkit"}})
+    events.extend(sorted(trace["events"], key=lambda event: event["ts"]))
+
+    try:
+        os.makedirs(os.path.dirname(trace["path"]), exist_ok=True)
+        with open(trace["path"], 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        return trace["path"]
+    except Exception as e:
+        print(f"⚠️ 트레이스 저장 실패: {e}")
+        return None
@@ -141,8 +141,84 @@ class Config:
     # Unity 설정
     UNITY_EDITOR_PATH = r"C:\Program Files\Unity\Hub\Editor\6000.0.59f2\Editor\Unity.exe"
     UNITY_TIMEOUT = 300
+    # --unity-batch에서 실행할 배치 작업 순서 (패키지 BatchProcessor: refresh, validate, save)
+    UNITY_BATCH_TASKS = ["refresh", "validate", "refresh", "save"]
+    # --pipeline에서 Unity 1회 실행으로 처리할 작업 순서 (배치 처리 + WebGL 빌드)
+    UNITY_PIPELINE_TASKS = ["refresh", "validate", "configure-webgl", "build-webgl"]
     BUILD_TIMEOUT = 7200
+    # 빌드 정지 감시: 로그 출력 없이 이 시간(초)이 지나면 Unity가 멈춘 것으로 보고 빌드 중단 (0이면 감시 안 함)
+    # (라이선스 대화상자, 임포트 교착 등으로 BUILD_TIMEOUT까지 작업 슬롯을 차지하는 것을 방지)
+    BUILD_STALL_TIMEOUT = 600
+    # 로그 출력 없이 오래 걸리는 단계별 정지 제한 시간 (초, 마지막으로 인식한 진행 단계 기준)
+    # (단계 id: build_phases.py의 script_compilation, asset_import, player_build, il2cpp_codegen, cpp_compile, wasm_link)
+    BUILD_STALL_PHASE_TIMEOUTS = {
+        "il2cpp_codegen": 2400,
+        "cpp_compile": 2400,
+        "wasm_link": 2400
+    }
+    # 빌드 중 로그에서 스크립트 컴파일 에러가 보이면 Unity 종료를 기다리지 않고 즉시 빌드 중단
+    BUILD_FAIL_FAST_ON_COMPILE_ERRORS = True
+    # 타임아웃/취소 시 Unity 프로세스 트리에 SIGTERM 후 SIGKILL까지 기다리는 시간 (초)
+    PROCESS_KILL_GRACE_SECONDS = 5
     BUILD_OUTPUT_DIR = r"C:\Users\wkzkx\Desktop\Lim\GitHub\Build"
+    # 빌드 캐시: 마지막 성공 빌드 이후 변경이 없는 프로젝트는 빌드 생략 (--no-cache로 강제 빌드)
+    BUILD_CACHE_ENABLED = True
+    # 빌드 캐시 변경 감지 방식
+    #   - "content": Assets/ProjectSettings/Packages 파일 해시 (정확, 변경된 파일만 다시 해시)
+    #   - "git": HEAD 커밋 + git status --porcelain 요약 (가장 빠름, Git 리포지토리가 아니면 content 사용)
+    BUILD_CACHE_MODE = "content"
+    # 병렬 빌드 스케줄링: 프로젝트별 최근 빌드 시간 기록 개수 (예상 시간이 긴 프로젝트부터 빌드)
+    BUILD_HISTORY_SIZE = 10
+    # 빌드 기록이 없는 프로젝트의 예상 시간 = 기본 시간 + Assets 크기(MB) x MB당 시간
+    # (기록이 있는 프로젝트가 있으면 MB당 시간은 실제 기록으로 보정됩니다)
+    BUILD_ESTIMATE_BASE_SECONDS = 120
+    BUILD_ESTIMATE_SECONDS_PER_MB = 0.5
+    # 적응형 동시 실행: 여유 메모리/유휴 CPU가 빌드당 필요량보다 많을 때만 다음 빌드 시작
+    # (--max-workers는 상한, 생략하면 호스트 CPU/메모리로 계산, --no-adaptive로 고정 작업자 수 사용)
+    ADAPTIVE_CONCURRENCY = True
+    # 빌드당 필요 자원 기본값 (이전 빌드의 Unity 프로세스 측정값이 있으면 그 값을 사용)
+    BUILD_MEMORY_PER_BUILD_MB = 4096
+    BUILD_CPU_PER_BUILD = 2.0
+    # Unity 배치 모드(--unity-batch --parallel) 작업당 필요 자원
+    UNITY_BATCH_MEMORY_MB = 2048
+    UNITY_BATCH_CPU = 1.0
+    # 프로젝트별 단계 파이프라인: 프로젝트마다 package → batch → build → commit → push를 독립적으로 진행
+    # (앞 단계가 끝난 프로젝트는 다른 프로젝트를 기다리지 않고 다음 단계로 이동)
+    # 단계별 동시 실행 상한 (None이면 호스트 CPU/메모리로 계산, Git/파일 작업은 많이, Unity 실행 단계는 적게)
+    PIPELINE_STAGE_WORKERS = {"package": 8, "batch": None, "build": None, "commit": 8, "push": 4}
+    # Unity를 실행하는 단계(batch + build) 합계 동시 실행 상한 (None이면 두 단계 상한 중 큰 값)
+    PIPELINE_UNITY_WORKERS = None
+    # asyncio 실행 코어 (async_runner.py): 이벤트 루프 하나에서 여러 Git 명령을 스레드 없이 감시
+    # Git 명령 동시 실행 상한 / 명령당 제한 시간 (초, None이면 제한 없음)
+    ASYNC_GIT_CONCURRENCY = 64
+    ASYNC_GIT_TIMEOUT = 300
+    # 항상 남겨둘 여유 메모리 (OS, 에디터 등)
+    HOST_MEMORY_HEADROOM_MB = 2048
+    # 시작 직후 빌드는 아직 자원을 다 쓰지 않으므로 이 시간 동안 예상 사용량을 미리 차감
+    ADAPTIVE_RAMP_UP_SECONDS = 180
+    # 자원 확인 / 프로세스 측정 주기 (초)
+    ADAPTIVE_POLL_SECONDS = 5
+    # WebGL 다운로드 크기 예산 (MB, Build 폴더에 실제로 생성된 파일 기준 - .br / .gz / .unityweb / 비압축 모두 해당,
+    # None 또는 0이면 확인 안 함)
+    WEBGL_PAYLOAD_BUDGET_MB = {
+        ".wasm": 12,
+        ".data": 40,
+        ".framework.js": 0.5
+    }
+    # 프로젝트별 예산 (프로젝트 폴더명 -> 파일 종류별 MB, 기본 예산을 덮어씀)
+    WEBGL_PAYLOAD_BUDGETS_MB = {
+        # "5.1.2.4_ExploreThePlanets": {".data": 60},
+    }
+    # 예산 초과 시 동작: "warn" (경고만 출력) 또는 "fail" (빌드 실패 처리)
+    WEBGL_PAYLOAD_BUDGET_ACTION = "warn"
+    # 빌드 기록 DB (SQLite, BUILD_OUTPUT_DIR/_Metrics/build_metrics.db): 모든 빌드 결과 저장
+    BUILD_METRICS_ENABLED = True
+    # 회귀 보고서 (--metrics-report): 마지막 성공 빌드를 직전 성공 빌드 N회의 중앙값과 비교
+    BUILD_REGRESSION_BASELINE_SIZE = 5
+    BUILD_TIME_REGRESSION_THRESHOLD = 0.2   # 빌드 시간 20% 이상 증가
+    BUILD_SIZE_REGRESSION_THRESHOLD = 0.05  # Build/ 크기 5% 이상 증가
+    # 실행 트레이스 (Chrome Trace Event JSON, BUILD_OUTPUT_DIR/_Traces): True면 --trace 없이도 항상 기록
+    BUILD_TRACE_ENABLED = False
     
     # WebGL 빌드 설정
     # Code Optimization (Unity 6.0의 WasmCodeOptimization)
@@ -154,6 +230,17 @@ class Config:
     #   - "DiskSizeLTO": 크기 최적화 + LTO (최소 크기)
     WEBGL_CODE_OPTIMIZATION = "RuntimeSpeed"
     
+    # WebGL Memory Settings (MB)
+    # 빌드 작업 파일(-dannectBuildJob)을 통해 패키지의 WebGLBuilder로 전달됩니다
+    WEBGL_MEMORY_SIZE = 32
+    WEBGL_MAXIMUM_MEMORY_SIZE = 2048
+    WEBGL_MEMORY_GROWTH_MODE = "Geometric"  # None, Linear, Geometric
+    
+    # Code Optimization 비교 벤치마크 (--benchmark-optimization)
+    # 대상 프로젝트 폴더명 목록 (비어 있으면 PROJECT_DIRS 전체) / 비교할 옵션
+    OPTIMIZATION_BENCHMARK_PROJECTS = []
+    OPTIMIZATION_BENCHMARK_MODES = ["BuildTimes", "RuntimeSpeed", "RuntimeSpeedLTO", "DiskSize", "DiskSizeLTO"]
+    
     # 패키지 설정
     GIT_PACKAGES = {
         "com.dannect.toolkit": "https://github.com/Dannect/SimGround_Package.git"
@@ -204,7 +291,43 @@ DEV_BRANCH = Config.DEV_BRANCH
 COMMIT_MESSAGES = Config.COMMIT_MESSAGES
 UNITY_EDITOR_PATH = Config.UNITY_EDITOR_PATH
 UNITY_TIMEOUT = Config.UNITY_TIMEOUT
+UNITY_BATCH_TASKS = Config.UNITY_BATCH_TASKS
+UNITY_PIPELINE_TASKS = Config.UNITY_PIPELINE_TASKS
 BUILD_TIMEOUT = Config.BUILD_TIMEOUT
+BUILD_STALL_TIMEOUT = Config.BUILD_STALL_TIMEOUT
+BUILD_STALL_PHASE_TIMEOUTS = Config.BUILD_STALL_PHASE_TIMEOUTS
+BUILD_FAIL_FAST_ON_COMPILE_ERRORS = Config.BUILD_FAIL_FAST_ON_COMPILE_ERRORS
+PROCESS_KILL_GRACE_SECONDS = Config.PROCESS_KILL_GRACE_SECONDS
 BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+BUILD_CACHE_ENABLED = Config.BUILD_CACHE_ENABLED
+BUILD_CACHE_MODE = Config.BUILD_CACHE_MODE
+BUILD_HISTORY_SIZE = Config.BUILD_HISTORY_SIZE
+BUILD_ESTIMATE_BASE_SECONDS = Config.BUILD_ESTIMATE_BASE_SECONDS
+BUILD_ESTIMATE_SECONDS_PER_MB = Config.BUILD_ESTIMATE_SECONDS_PER_MB
+ADAPTIVE_CONCURRENCY = Config.ADAPTIVE_CONCURRENCY
+BUILD_MEMORY_PER_BUILD_MB = Config.BUILD_MEMORY_PER_BUILD_MB
+BUILD_CPU_PER_BUILD = Config.BUILD_CPU_PER_BUILD
+UNITY_BATCH_MEMORY_MB = Config.UNITY_BATCH_MEMORY_MB
+UNITY_BATCH_CPU = Config.UNITY_BATCH_CPU
+PIPELINE_STAGE_WORKERS = Config.PIPELINE_STAGE_WORKERS
+PIPELINE_UNITY_WORKERS = Config.PIPELINE_UNITY_WORKERS
+ASYNC_GIT_CONCURRENCY = Config.ASYNC_GIT_CONCURRENCY
+ASYNC_GIT_TIMEOUT = Config.ASYNC_GIT_TIMEOUT
+HOST_MEMORY_HEADROOM_MB = Config.HOST_MEMORY_HEADROOM_MB
+ADAPTIVE_RAMP_UP_SECONDS = Config.ADAPTIVE_RAMP_UP_SECONDS
+ADAPTIVE_POLL_SECONDS = Config.ADAPTIVE_POLL_SECONDS
+BUILD_TRACE_ENABLED = Config.BUILD_TRACE_ENABLED
+BUILD_METRICS_ENABLED = Config.BUILD_METRICS_ENABLED
+WEBGL_PAYLOAD_BUDGET_MB = Config.WEBGL_PAYLOAD_BUDGET_MB
+WEBGL_PAYLOAD_BUDGETS_MB = Config.WEBGL_PAYLOAD_BUDGETS_MB
+WEBGL_PAYLOAD_BUDGET_ACTION = Config.WEBGL_PAYLOAD_BUDGET_ACTION
+BUILD_REGRESSION_BASELINE_SIZE = Config.BUILD_REGRESSION_BASELINE_SIZE
+BUILD_TIME_REGRESSION_THRESHOLD = Config.BUILD_TIME_REGRESSION_THRESHOLD
+BUILD_SIZE_REGRESSION_THRESHOLD = Config.BUILD_SIZE_REGRESSION_THRESHOLD
 WEBGL_CODE_OPTIMIZATION = Config.WEBGL_CODE_OPTIMIZATION
+WEBGL_MEMORY_SIZE = Config.WEBGL_MEMORY_SIZE
+WEBGL_MAXIMUM_MEMORY_SIZE = Config.WEBGL_MAXIMUM_MEMORY_SIZE
+WEBGL_MEMORY_GROWTH_MODE = Config.WEBGL_MEMORY_GROWTH_MODE
+OPTIMIZATION_BENCHMARK_PROJECTS = Config.OPTIMIZATION_BENCHMARK_PROJECTS
+OPTIMIZATION_BENCHMARK_MODES = Config.OPTIMIZATION_BENCHMARK_MODES
 
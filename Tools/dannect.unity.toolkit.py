@@ -17,9 +17,28 @@ from config import (
     COMMIT_MESSAGES,
     UNITY_EDITOR_PATH,
     UNITY_TIMEOUT,
+    UNITY_BATCH_TASKS,
+    UNITY_PIPELINE_TASKS,
     BUILD_TIMEOUT,
     BUILD_OUTPUT_DIR,
-    WEBGL_CODE_OPTIMIZATION
+    BUILD_CACHE_ENABLED,
+    BUILD_CACHE_MODE,
+    WEBGL_CODE_OPTIMIZATION,
+    WEBGL_MEMORY_SIZE,
+    WEBGL_MAXIMUM_MEMORY_SIZE,
+    WEBGL_MEMORY_GROWTH_MODE,
+    ADAPTIVE_CONCURRENCY,
+    PIPELINE_STAGE_WORKERS,
+    PIPELINE_UNITY_WORKERS,
+    ASYNC_GIT_CONCURRENCY,
+    ASYNC_GIT_TIMEOUT,
+    BUILD_TRACE_ENABLED,
+    BUILD_METRICS_ENABLED,
+    OPTIMIZATION_BENCHMARK_PROJECTS,
+    OPTIMIZATION_BENCHMARK_MODES,
+    WEBGL_PAYLOAD_BUDGET_MB,
+    WEBGL_PAYLOAD_BUDGETS_MB,
+    WEBGL_PAYLOAD_BUDGET_ACTION
 )
 
 from git_utils import (
@@ -30,6 +49,8 @@ from git_utils import (
     is_git_repository,
     initialize_git_repository,
     get_current_branch,
+    get_head_commit,
+    get_status_digest,
     get_all_branches,
     get_branch_hierarchy_info,
     find_deepest_branch,
@@ -49,7 +70,6 @@ from unity_cli import (
     find_unity_editor_path,
     run_unity_batch_mode,
     process_unity_project_batch,
-    create_unity_batch_script,
     process_multiple_projects_parallel
 )
 
@@ -70,7 +90,9 @@ from package_manager import (
 )
 
 from build_manager import (
-    create_unity_webgl_build_script,
+    create_webgl_build_job,
+    read_pipeline_task_results,
+    print_pipeline_task_results,
     run_unity_webgl_build,
     build_multiple_webgl_projects,
     build_multiple_webgl_projects_sequential,
@@ -79,9 +101,155 @@ from build_manager import (
     format_bytes
 )
 
+from build_cache import (
+    get_unity_editor_version,
+    compute_project_fingerprint,
+    compute_git_fingerprint,
+    is_build_cached,
+    record_successful_build,
+    check_build_cache,
+    filter_cached_projects
+)
+
+from build_history import (
+    record_build_duration,
+    record_build_resources,
+    record_build_phases,
+    get_build_requirements,
+    schedule_longest_first,
+    order_longest_first,
+    estimate_makespan
+)
+
+from host_resources import (
+    read_memory_info,
+    read_cpu_times,
+    get_process_tree_usage,
+    get_host_worker_limit,
+    ProcessResourceSampler,
+    AdaptiveConcurrencyController
+)
+
+from process_tree import (
+    start_process_group,
+    list_process_tree,
+    kill_process_tree,
+    kill_all_process_trees,
+    new_process_group,
+    process_group
+)
+
+from log_tailer import LogTailer
+
+from build_phases import (
+    BUILD_PHASES,
+    detect_phase,
+    compute_phase_timings,
+    format_phase_summary
+)
+
+from log_analyzer import (
+    analyze_build_log,
+    read_log_tail,
+    print_log_analysis
+)
+
+from build_report import (
+    get_build_report_path,
+    load_build_report,
+    validate_build_report,
+    get_build_folder_files,
+    get_report_errors,
+    get_step_durations,
+    is_build_file_kind,
+    format_size,
+    format_duration
+)
+
+from build_metrics import (
+    get_metrics_db_path,
+    record_build_metrics,
+    find_build_regressions,
+    get_latest_successful_build,
+    print_regression_report
+)
+
+from webgl_data_analyzer import (
+    analyze_data_file,
+    analyze_project_data,
+    analyze_fleet_data,
+    print_data_analysis
+)
+
+from stage_pipeline import (
+    ProjectStagePipeline,
+    run_stage_pipeline,
+    get_stage_results
+)
+
+from async_runner import (
+    run_async,
+    run_process,
+    run_git_command,
+    get_git_states
+)
+
+from optimization_benchmark import (
+    run_optimization_benchmark,
+    print_benchmark_table
+)
+
+from orchestration_benchmark import (
+    run_orchestration_benchmark,
+    create_fake_projects
+)
+
+from log_benchmark import (
+    run_log_benchmark,
+    generate_synthetic_log
+)
+
+from toolkit_benchmark import (
+    run_toolkit_benchmark
+)
+
+from fleet_generator import (
+    generate_project_fleet,
+    generate_fake_project
+)
+
+from fake_unity import (
+    create_fake_unity_launcher,
+    write_fake_unity_settings
+)
+
+from wasm_analyzer import (
+    analyze_wasm_file,
+    analyze_project_wasm,
+    analyze_fleet_wasm,
+    diff_wasm_profiles,
+    print_wasm_analysis,
+    print_wasm_diff
+)
+
+from payload_budget import (
+    get_payload_budgets,
+    check_payload_budgets,
+    print_payload_budget_report
+)
+
+from build_trace import (
+    start_trace,
+    save_trace,
+    trace_span,
+    add_span,
+    add_build_spans
+)
+
 from main import (
     print_usage,
-    main
+    main,
+    finish_trace
 )
 
 # 호환성을 위한 전역 변수 재선언 (원본 파일과 동일한 구조 유지)
@@ -92,4 +260,7 @@ from main import (
 
 if __name__ == "__main__":
     # 메인 실행부는 main.py에서 import
-    main()
+    try:
+        main()
+    finally:
+        finish_trace()
@@ -0,0 +1,538 @@
+"""
+가짜 Unity Editor (벤치마크 / 오케스트레이션 테스트용 Unity 대역 실행 파일)
+- Unity CLI 인수(-projectPath, -logFile, -executeMethod, -quit, -dannectBuildJob, -dannectTasks,
+  -dannectTaskResults)를 실제 Unity와 같은 방식으로 해석 (-logFile - 이면 stdout으로 출력)
+- 녹화된 Unity 로그를 재생하거나 빌드 단계별 로그를 합성하여 지정한 시간/속도로 출력
+- WebGLBuilder와 같은 로그 메시지, Build 폴더(index.html, loader/framework/wasm/data), BuildReport JSON,
+  BatchProcessor 작업 결과 JSON을 생성하여 build_manager의 검증/기록 경로를 그대로 실행
+  (.br/.unityweb 파일은 비압축 메타 블록으로 만든 유효한 brotli 스트림)
+- 시나리오: success, unityweb(성공, Decompression Fallback처럼 .unityweb 출력 파일),
+  compile_error(error CS 출력 후 종료 코드 1), crash(로그 중간에 비정상 종료),
+  hang(로그 출력 없이 대기), build_failed(BuildReport 결과 Failed, Build 폴더 없음)
+- 동작 설정: 환경 변수 FAKE_UNITY_<키> (예: FAKE_UNITY_SCENARIO=hang) 또는
+  프로젝트의 ProjectSettings/FakeUnity.json (프로젝트별 설정이 환경 변수보다 우선)
+- 사용: create_fake_unity_launcher(폴더)로 실행 스크립트를 만들고 Config.UNITY_EDITOR_PATH에 지정
+"""
+import os
+import re
+import sys
+import json
+import time
+from build_phases import detect_phase
+
+# 기본 동작 (환경 변수 / FakeUnity.json으로 변경)
+DEFAULT_BEHAVIOR = {
+    "scenario": "success",   # success, unityweb, compile_error, crash, hang, build_failed
+    "duration": 2.0,         # 로그 전체 출력 시간 (초, speed로 나눔)
+    "speed": 1.0,            # 재생 속도 배율 (2.0이면 두 배 빠르게)
+    "startup_delay": 0.0,    # 첫 로그 출력 전 대기 시간 (Unity 실행 및 라이선스 확인)
+    "replay_log": "",        # 재생할 녹화 로그 경로 (비어 있으면 합성 로그)
+    "log_lines": 200,        # 합성 로그 줄 수
+    "fail_at": -1.0,         # 실패 시점 (로그 진행 비율 0~1, 음수면 시나리오 기본값)
+    "exit_code": -1,         # crash 종료 코드 (음수면 CRASH_EXIT_CODE)
+    "hang_seconds": 0.0,     # hang 대기 시간 (0이면 종료될 때까지)
+    "memory_mb": 0,          # 실행 중 점유할 메모리 (자원 측정 / 적응형 동시 실행 테스트용)
+    "wasm_kb": 256,
+    "data_kb": 512,
+    "framework_kb": 64,
+    "loader_kb": 16,
+    "write_report": True,    # BuildReport JSON 저장 여부 (False면 로그 기반 검증 경로 실행)
+    "events_dir": "",        # 로그 출력 시각 기록 폴더 (모니터 지연 측정용, 비어 있으면 기록 안 함)
+}
+
+ENV_PREFIX = "FAKE_UNITY_"
+SETTINGS_FILE_NAME = "FakeUnity.json"
+SCENARIOS = ["success", "compile_error", "crash", "hang", "build_failed"]
+CRASH_EXIT_CODE = 139
+
+WEBGL_BUILD_METHOD = "Dannect.Toolkit.Editor.WebGLBuilder.BuildFromCommandLine"
+BATCH_PROCESS_METHOD = "Dannect.Toolkit.Editor.BatchProcessor.ProcessBatch"
+BATCH_TASKS = ["refresh", "validate", "save", "configure-webgl", "build-webgl"]
+DEFAULT_BATCH_TASKS = "refresh,validate,refresh,save"
+
+# 합성 로그 구간 (단계, 전체 줄 수 대비 비율, 첫 줄, 반복 줄 형식)
+SYNTHETIC_SECTIONS = [
+    ("startup", 0.05, "Initialize engine version: 6000.0.59f2 (fake)",
+     "[Licensing::Client] Handshaking with LicensingClient ({index})"),
+    ("script_compilation", 0.10, "Requested script compilation because: Assetdatabase observed changes",
+     "- Compiling assembly Assembly-CSharp part {index}"),
+    ("asset_import", 0.20, "Start importing Assets/Scenes/Main.unity using Guid(00000000000000000000000000000001)",
+     "Start importing Assets/Fake/Asset{index}.prefab using Guid({index:032x})"),
+    ("player_build", 0.10, "=== WebGL Player Settings 자동 설정 및 빌드 시작 ===",
+     "Building WebGL Player: writing scene {index}"),
+    ("il2cpp_codegen", 0.15, "[   1/9999  0s] IL2CPP_CodeGen Library/Bee/artifacts/WebGL/il2cppOutput/cpp",
+     "Generating code for fake method {index}"),
+    ("cpp_compile", 0.25, "[   2/9999  0s] C_WebGL_wasm Library/Bee/artifacts/WebGL/il2cppOutput/cpp/Fake0.cpp",
+     "[{index:4d}/9999  0s] C_WebGL_wasm Library/Bee/artifacts/WebGL/il2cppOutput/cpp/Fake{index}.cpp"),
+    ("wasm_link", 0.15, "[9998/9999  0s] Link_WebGL_wasm Library/Bee/artifacts/WebGL/build/debug_WebGL_wasm/build.js",
+     "wasm-opt pass {index}"),
+]
+
+# 스크립트 컴파일만 수행하는 구간 (배치 처리 모드)
+BATCH_SECTIONS = ["startup", "script_compilation", "asset_import"]
+
+
+def load_behavior(project_path=None):
+    """동작 설정을 반환합니다 (기본값 < 환경 변수 < 프로젝트 ProjectSettings/FakeUnity.json)."""
+    behavior = dict(DEFAULT_BEHAVIOR)
+    for key, default in DEFAULT_BEHAVIOR.items():
+        value = os.environ.get(ENV_PREFIX + key.upper())
+        if value is None:
+            continue
+        try:
+            if isinstance(default, bool):
+                behavior[key] = value.lower() in ("1", "true", "yes")
+            else:
+                behavior[key] = type(default)(value)
+        except ValueError:
+            pass
+
+    if project_path:
+        settings_path = os.path.join(project_path, "ProjectSettings", SETTINGS_FILE_NAME)
+        if os.path.exists(settings_path):
+            try:
+                with open(settings_path, 'r', encoding='utf-8') as f:
+                    behavior.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+    return behavior
+
+def write_fake_unity_settings(project_path, **behavior):
+    """프로젝트별 동작 설정(ProjectSettings/FakeUnity.json)을 저장합니다 (예: scenario="hang")."""
+    settings_dir = os.path.join(project_path, "ProjectSettings")
+    os.makedirs(settings_dir, exist_ok=True)
+    with open(os.path.join(settings_dir, SETTINGS_FILE_NAME), 'w', encoding='utf-8') as f:
+        json.dump(behavior, f, indent=2)
+
+def create_fake_unity_launcher(directory, python_executable=None):
+    """가짜 Unity 실행 스크립트를 만들고 경로를 반환합니다 (Windows: Unity.cmd, 그 외: Unity).
+
+    반환된 경로를 Config.UNITY_EDITOR_PATH로 지정하면 build_manager / unity_cli가 이 스크립트를 실행합니다.
+    """
+    python_executable = python_executable or sys.executable
+    script_path = os.path.abspath(__file__)
+    os.makedirs(directory, exist_ok=True)
+    if sys.platform == "win32":
+        launcher_path = os.path.join(directory, "Unity.cmd")
+        with open(launcher_path, 'w', encoding='utf-8') as f:
+            f.write(f'@echo off\r\n"{python_executable}" "{script_path}" %*\r\n')
+    else:
+        launcher_path = os.path.join(directory, "Unity")
+        with open(launcher_path, 'w', encoding='utf-8') as f:
+            # exec로 셸을 Python 프로세스로 교체하여 프로세스 트리 종료 / 자원 측정 대상을 하나로 유지
+            f.write(f'#!/bin/sh\nexec "{python_executable}" "{script_path}" "$@"\n')
+        os.chmod(launcher_path, 0o755)
+    return launcher_path
+
+def parse_unity_args(argv):
+    """Unity CLI 인수를 해석합니다.
+
+    Returns:
+        dict: {"flags": set(값 없는 옵션), "values": {옵션: 값}} (옵션 이름은 소문자)
+    """
+    flags = set()
+    values = {}
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if arg.startswith("-"):
+            name = arg.lower()
+            next_arg = argv[index + 1] if index + 1 < len(argv) else None
+            # "-logFile -"처럼 값이 "-"인 경우도 값으로 처리
+            if next_arg is not None and (not next_arg.startswith("-") or next_arg == "-"):
+                values[name] = next_arg
+                index += 2
+                continue
+            flags.add(name)
+        index += 1
+    return {"flags": flags, "values": values}
+
+def get_safe_project_name(project_path):
+    """WebGLBuilder와 같은 방식으로 안전한 파일명을 만듭니다 (공백 → _, 특수문자 제거)."""
+    project_name = os.path.basename(os.path.normpath(project_path)).replace(" ", "_")
+    return re.sub(r"[^\w\-_\.]", "", project_name)
+
+
+class FakeUnityLog:
+    """로그를 -logFile 경로(또는 stdout)에 쓰고, 단계 전환 / 에러 줄의 출력 시각을 기록합니다."""
+
+    def __init__(self, log_path):
+        if not log_path or log_path == "-":
+            # unity_cli는 stdout을 UTF-8로 읽음 (Windows 콘솔 기본 인코딩 대신)
+            sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+            self._file = sys.stdout
+            self._owns_file = False
+        else:
+            directory = os.path.dirname(log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(log_path, 'w', encoding='utf-8', buffering=1024 * 64)
+            self._owns_file = True
+        self.events = {"phases": [], "first_output": None, "last_output": None, "error_time": None}
+        self._current_phase = None
+
+    def write(self, line):
+        """한 줄을 씁니다. 단계가 바뀌는 줄은 즉시 flush하고 출력 시각을 기록합니다."""
+        self._file.write(line + "\n")
+        phase = detect_phase(line)
+        if phase and phase != self._current_phase:
+            self._current_phase = phase
+            self.flush()
+            self.events["phases"].append((time.time(), phase))
+
+    def write_error(self, line):
+        """에러 줄을 쓰고 즉시 flush합니다 (첫 에러 출력 시각 기록)."""
+        if self.events["error_time"] is None:
+            self.events["error_time"] = time.time()
+        self._file.write(line + "\n")
+        self.flush()
+
+    def flush(self):
+        self._file.flush()
+        now = time.time()
+        if self.events["first_output"] is None:
+            self.events["first_output"] = now
+        self.events["last_output"] = now
+
+    def close(self):
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+def build_synthetic_lines(total_lines, sections):
+    """합성 로그 줄 목록을 만듭니다 (구간별 비율에 따라 줄 수 배분).
+
+    Returns:
+        list: [(section, line), ...]
+    """
+    lines = []
+    for section, ratio, first_line, line_format in SYNTHETIC_SECTIONS:
+        if section not in sections:
+            continue
+        count = max(1, int(total_lines * ratio))
+        lines.append((section, first_line))
+        for index in range(1, count):
+            lines.append((section, line_format.format(index=index)))
+    return lines
+
+def read_replay_lines(replay_log):
+    """녹화된 로그 파일을 한 줄씩 반환합니다 (구간은 None)."""
+    with open(replay_log, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            yield None, line.rstrip("\r\n")
+
+def get_failure_index(lines, behavior):
+    """실패 시나리오가 발생할 줄 번호를 반환합니다 (실패 시나리오가 아니면 None)."""
+    scenario = behavior["scenario"]
+    if scenario not in ("compile_error", "crash", "hang"):
+        return None
+    if behavior["fail_at"] >= 0:
+        return int(len(lines) * min(behavior["fail_at"], 1.0))
+    if scenario == "compile_error":
+        # 기본값: 스크립트 컴파일 구간 끝 (녹화 로그는 1/4 지점)
+        compile_lines = [index for index, (section, _) in enumerate(lines) if section == "script_compilation"]
+        return compile_lines[-1] + 1 if compile_lines else len(lines) // 4
+    return len(lines) // 2
+
+def play_lines(log, lines, duration, failure_index=None):
+    """줄 목록을 duration초 동안 고르게 출력합니다.
+
+    출력 속도보다 앞서 있을 때만 flush 후 대기하므로 줄 수가 많아도 시스템 호출이 적습니다.
+
+    Returns:
+        bool: failure_index에 도달했으면 True
+    """
+    total = len(lines)
+    interval = duration / total if total else 0
+    start_time = time.time()
+    for index, (_, line) in enumerate(lines):
+        if failure_index is not None and index >= failure_index:
+            return True
+        scheduled = start_time + index * interval
+        now = time.time()
+        if scheduled > now:
+            log.flush()
+            time.sleep(scheduled - now)
+        log.write(line)
+    log.flush()
+    return failure_index is not None and failure_index >= total
+
+def run_failure(log, behavior, project_path):
+    """실패 시나리오를 실행합니다 (compile_error / crash는 종료 코드 반환, hang은 종료될 때까지 대기).
+
+    compile_error / hang은 감시 측이 프로세스를 종료할 수 있으므로 출력 시각 기록을 먼저 저장합니다.
+    """
+    scenario = behavior["scenario"]
+    if scenario == "compile_error":
+        log.events["error_time"] = time.time()
+        write_events(behavior, project_path, log, None)
+        log.write_error("Assets/Scripts/FakeBroken.cs(12,17): error CS0103: The name 'fakeValue' does not exist in the current context")
+        log.write_error("Assets/Scripts/FakeBroken.cs(20,9): error CS1002: ; expected")
+        log.write("Scripts have compiler errors.")
+        log.write("Aborting batchmode due to failure:")
+        log.write("Scripts have compiler errors.")
+        log.close()
+        return 1
+    if scenario == "crash":
+        log.write("Crash!!!")
+        log.write(f"#0 0x00007ff6fake in FakeUnity::Crash (project: {os.path.basename(project_path)})")
+        log.write("#1 0x00007ff6fake in PlayerBuildProgram::Run")
+        log.close()
+        return behavior["exit_code"] if behavior["exit_code"] >= 0 else CRASH_EXIT_CODE
+    # hang: 로그 출력 없이 대기 (정지 감시 / 타임아웃으로 종료되어야 함)
+    log.flush()
+    write_events(behavior, project_path, log, None)
+    hang_until = time.time() + behavior["hang_seconds"] if behavior["hang_seconds"] > 0 else None
+    while hang_until is None or time.time() < hang_until:
+        time.sleep(0.5)
+    log.close()
+    return 0
+
+# brotli 비압축 메타 블록 (RFC 7932): 블록당 최대 64KB, 창 크기 22비트
+BROTLI_BLOCK_SIZE = 65536
+BROTLI_WINDOW_BITS_HEADER = 0b1011  # WBITS 22 (1비트 1 + 3비트 값 5)
+
+def _brotli_block_header(length):
+    """비압축 메타 블록 헤더 비트 (ISLAST 0, MNIBBLES 4자리, MLEN-1, ISUNCOMPRESSED 1, 20비트)."""
+    return ((length - 1) << 3) | (1 << 19)
+
+def write_brotli_stored(f, size, chunk):
+    """size 바이트를 압축하지 않은 메타 블록으로 감싼 유효한 brotli 스트림으로 씁니다.
+
+    실제 압축은 하지 않지만 brotli 디코더(브라우저, webgl_data_analyzer 등)로 풀 수 있는 .br 파일이 됩니다.
+    """
+    first = True
+    while size > 0:
+        length = min(size, BROTLI_BLOCK_SIZE)
+        header = _brotli_block_header(length)
+        if first:
+            header = BROTLI_WINDOW_BITS_HEADER | (header << 4)  # 스트림 헤더 4비트 + 블록 헤더 20비트 = 3바이트
+            first = False
+        f.write(header.to_bytes(3, 'little'))  # 비압축 데이터는 바이트 경계에서 시작
+        f.write(chunk[:length])
+        size -= length
+    # 마지막 빈 메타 블록 (ISLAST 1, ISLASTEMPTY 1)
+    f.write(bytes([0b11]) if not first else bytes([BROTLI_WINDOW_BITS_HEADER | (0b11 << 4)]))
+
+def write_build_output(job, project_path, behavior):
+    """WebGL 빌드 출력 폴더를 생성합니다.
+
+    Returns:
+        list: [(파일 경로, 크기), ...]
+    """
+    output_path = job.get("outputPath") or os.path.join(project_path, "Build", "WebGL")
+    safe_name = get_safe_project_name(project_path)
+    build_folder = os.path.join(output_path, "Build")
+    os.makedirs(build_folder, exist_ok=True)
+    os.makedirs(os.path.join(output_path, "TemplateData"), exist_ok=True)
+
+    # Decompression Fallback을 켜면 Unity는 압축 파일을 .br 대신 .unityweb으로 저장 (내용은 같은 brotli 스트림)
+    compressed_suffix = ".unityweb" if behavior["scenario"] == "unityweb" else ".br"
+    outputs = [
+        (os.path.join(output_path, "index.html"), 0),
+        (os.path.join(output_path, "TemplateData", "style.css"), 0),
+        (os.path.join(build_folder, f"{safe_name}.loader.js"), behavior["loader_kb"]),
+        (os.path.join(build_folder, f"{safe_name}.framework.js{compressed_suffix}"), behavior["framework_kb"]),
+        (os.path.join(build_folder, f"{safe_name}.wasm{compressed_suffix}"), behavior["wasm_kb"]),
+        (os.path.join(build_folder, f"{safe_name}.data{compressed_suffix}"), behavior["data_kb"]),
+    ]
+    files = []
+    chunk = bytes(range(256)) * 4096  # 1MB
+    block = chunk[:BROTLI_BLOCK_SIZE]
+    for path, size_kb in outputs:
+        with open(path, 'wb') as f:
+            if path.endswith("index.html"):
+                f.write(f"<!DOCTYPE html><html><head><title>{safe_name}</title></head>"
+                        f"<body><script src=\"Build/{safe_name}.loader.js\"></script></body></html>".encode('utf-8'))
+            elif path.endswith(".css"):
+                f.write(b"body { padding: 0; margin: 0 }\n")
+            elif path.endswith(compressed_suffix):
+                write_brotli_stored(f, int(size_kb * 1024), block)
+            else:
+                remaining = int(size_kb * 1024)
+                while remaining > 0:
+                    f.write(chunk[:min(remaining, len(chunk))])
+                    remaining -= len(chunk)
+        files.append((path, os.path.getsize(path)))
+    return files
+
+def write_build_report(job, files, succeeded, started_at, code_optimization):
+    """BuildReportWriter와 같은 형식의 BuildReport JSON을 저장합니다."""
+    report_path = job.get("reportPath")
+    if not report_path:
+        return
+    ended_at = time.time()
+    errors = [] if succeeded else [{"type": "Error", "step": "Build player",
+                                    "content": "Fake build failure (FakeUnity build_failed scenario)"}]
+    report = {
+        "version": 1,
+        "summary": {
+            "result": "Succeeded" if succeeded else "Failed",
+            "platform": "WebGL",
+            "outputPath": job.get("outputPath", ""),
+            "buildStartedAt": time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(started_at)),
+            "buildEndedAt": time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(ended_at)),
+            "totalSeconds": round(ended_at - started_at, 3),
+            "totalSize": sum(size for _, size in files),
+            "totalErrors": len(errors),
+            "totalWarnings": 0,
+            "codeOptimization": code_optimization
+        },
+        "steps": [{"name": "Build player", "depth": 0, "seconds": round(ended_at - started_at, 3),
+                   "messageCount": len(errors)}],
+        "messages": errors,
+        "files": [{"path": path.replace(os.sep, '/'), "role": os.path.splitext(path)[1].lstrip('.'), "size": size}
+                  for path, size in files],
+        "packedAssets": []
+    }
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+def run_webgl_build(log, job, project_path, behavior, started_at):
+    """WebGLBuilder의 빌드 결과 메시지와 출력 파일을 생성합니다.
+
+    Returns:
+        bool: 빌드 성공 여부
+    """
+    code_optimization = job.get("codeOptimization", "RuntimeSpeedLTO")
+    log.write(f"📊 빌드 결과: {'Failed' if behavior['scenario'] == 'build_failed' else 'Succeeded'}")
+    if behavior["scenario"] == "build_failed":
+        log.write("❌ WebGL 빌드 실패: Failed")
+        log.write("총 에러 수: 1")
+        if behavior["write_report"]:
+            write_build_report(job, [], False, started_at, code_optimization)
+        log.write("=== WebGL Player Settings 반영 빌드 완료 ===")
+        return False
+
+    files = write_build_output(job, project_path, behavior)
+    build_files = [(path, size) for path, size in files if os.path.basename(os.path.dirname(path)) == "Build"]
+    log.write("✅ WebGL 빌드 성공!")
+    log.write(f"📁 빌드 경로: {job.get('outputPath', '')}")
+    log.write(f"📦 Build 폴더 파일 수: {len(build_files)}")
+    for path, size in build_files:
+        log.write(f"   - {os.path.basename(path)} ({size / 1024:.1f} KB)")
+    log.write("🌐 WebGL 빌드 완료!")
+    if behavior["write_report"]:
+        write_build_report(job, files, True, started_at, code_optimization)
+        log.write(f"📄 BuildReport 저장: {job.get('reportPath')}")
+    log.write("=== WebGL Player Settings 반영 빌드 완료 ===")
+    return True
+
+def write_task_results(result_path, task_results):
+    """BatchProcessor와 같은 형식의 작업 결과 JSON을 저장합니다."""
+    if not result_path:
+        return
+    directory = os.path.dirname(result_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump({"tasks": task_results}, f, indent=2)
+
+def write_events(behavior, project_path, log, exit_code):
+    """모니터 지연 측정용 로그 출력 시각을 저장합니다 (events_dir/프로젝트명.json)."""
+    if not behavior["events_dir"]:
+        return
+    os.makedirs(behavior["events_dir"], exist_ok=True)
+    events = dict(log.events, exit_time=time.time(), exit_code=exit_code)
+    path = os.path.join(behavior["events_dir"], f"{os.path.basename(os.path.normpath(project_path))}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(events, f)
+
+def run(argv):
+    """가짜 Unity를 실행하고 종료 코드를 반환합니다."""
+    started_at = time.time()
+    args = parse_unity_args(argv)
+    values = args["values"]
+    project_path = values.get("-projectpath", "")
+    behavior = load_behavior(project_path)
+    log = FakeUnityLog(values.get("-logfile"))
+
+    if not project_path or not os.path.isdir(project_path):
+        log.write(f"Couldn't set project path to: {project_path}")
+        log.write("Aborting batchmode due to failure:")
+        log.write("Couldn't set project path")
+        log.close()
+        return 1
+
+    memory = bytearray(int(behavior["memory_mb"] * 1024 * 1024)) if behavior["memory_mb"] > 0 else None
+    if memory is not None:
+        # 실제로 페이지를 할당하여 RSS에 반영
+        for offset in range(0, len(memory), 4096):
+            memory[offset] = 1
+
+    if behavior["startup_delay"] > 0:
+        time.sleep(behavior["startup_delay"] / max(behavior["speed"], 0.001))
+
+    method = values.get("-executemethod")
+    task_names = None
+    if method == BATCH_PROCESS_METHOD:
+        task_names = [name.strip() for name in values.get("-dannecttasks", DEFAULT_BATCH_TASKS).split(",") if name.strip()]
+    job = {}
+    if values.get("-dannectbuildjob"):
+        try:
+            with open(values["-dannectbuildjob"], 'r', encoding='utf-8-sig') as f:
+                job = json.load(f)
+        except (OSError, ValueError) as e:
+            log.write(f"빌드 작업 파일 읽기 실패: {e}")
+    builds = method == WEBGL_BUILD_METHOD or (task_names is not None and "build-webgl" in task_names)
+
+    # 로그 준비 (녹화 로그 재생 또는 합성)
+    if behavior["replay_log"]:
+        lines = list(read_replay_lines(behavior["replay_log"]))
+    else:
+        sections = [section for section, _, _, _ in SYNTHETIC_SECTIONS] if builds else BATCH_SECTIONS
+        lines = build_synthetic_lines(behavior["log_lines"], sections)
+    duration = behavior["duration"] / max(behavior["speed"], 0.001)
+
+    exit_code = 0
+    if play_lines(log, lines, duration, get_failure_index(lines, behavior)):
+        exit_code = run_failure(log, behavior, project_path)
+        write_events(behavior, project_path, log, exit_code)
+        return exit_code
+
+    if method and method not in (WEBGL_BUILD_METHOD, BATCH_PROCESS_METHOD):
+        log.write(f"executeMethod method {method} could not be found.")
+        log.write("Aborting batchmode due to failure:")
+        exit_code = 1
+    elif method == WEBGL_BUILD_METHOD:
+        run_webgl_build(log, job, project_path, behavior, started_at)
+    elif task_names is not None:
+        task_results = []
+        failed = False
+        for task_name in task_names:
+            if failed:
+                task_results.append({"name": task_name, "status": "Skipped", "seconds": 0, "message": ""})
+                log.write(f"[DannectTask] {task_name}: Skipped")
+                continue
+            log.write(f"▶ 배치 작업 실행: {task_name}")
+            task_start = time.time()
+            if task_name not in BATCH_TASKS:
+                status, message = "Failed", "Unknown task"
+            elif task_name == "build-webgl":
+                status, message = ("Succeeded", "") if run_webgl_build(log, job, project_path, behavior, started_at) else ("Failed", "")
+            else:
+                status, message = "Succeeded", ""
+            failed = status == "Failed"
+            seconds = round(time.time() - task_start, 2)
+            task_results.append({"name": task_name, "status": status, "seconds": seconds, "message": message})
+            log.write(f"[DannectTask] {task_name}: {status} ({seconds:.2f}s)")
+        write_task_results(values.get("-dannecttaskresults"), task_results)
+        log.write("=== 배치 처리 완료 ===")
+        exit_code = 1 if failed else 0
+
+    if "-quit" not in args["flags"]:
+        # -quit이 없으면 실제 Unity처럼 에디터가 열린 상태로 남음 (외부에서 종료해야 함)
+        log.flush()
+        while True:
+            time.sleep(0.5)
+
+    log.write("Exiting batchmode successfully now!" if exit_code == 0 else f"Exiting batchmode with code {exit_code}")
+    log.close()
+    write_events(behavior, project_path, log, exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1:]))
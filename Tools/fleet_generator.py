@@ -0,0 +1,440 @@
+"""
+가짜 Unity 프로젝트 묶음(fleet) 생성기
+- 툴킷의 프로젝트 단위 작업(프로젝트 검색, SystemManager 검색/수정, manifest.json 수정, Git 커밋/푸시)을
+  실제 규모(프로젝트 수백 개, 프로젝트당 파일 수천 개)로 측정하기 위한 테스트용 프로젝트를 만듭니다
+- 프로젝트 구성:
+  - ProjectSettings (ProjectVersion.txt, ProjectSettings.asset, EditorBuildSettings.asset)
+  - Assets 폴더 트리 (Scenes, Scripts, Prefabs, Materials, Textures, Models, Audio 등 + 하위 폴더),
+    모든 파일과 폴더에 .meta 파일
+  - SystemManager.cs 변형 (기본, 메소드 이미 있음, Hello World 적용됨, namespace 안, 깊은 경로, 중복, 없음)
+  - Packages/manifest.json (Unity 기본 패키지 + 일부 프로젝트는 GIT_PACKAGES가 이미 있거나 다른 URL)
+  - Git 리포지토리와 브랜치 계층 (main → dev → feature/... 순으로 커밋 수 증가, 일부는 형제 브랜치 포함)
+  - 로컬 bare 리포지토리를 origin으로 연결 (네트워크 없이 푸시 측정 가능)
+- 같은 seed로 만든 fleet은 파일 내용과 브랜치 구조가 같음 (Git 커밋 시간 제외)
+
+실행: python fleet_generator.py <폴더> [--count 100] [--assets 1000] [--seed 1] [--no-remote]
+"""
+import os
+import sys
+import json
+import random
+import subprocess
+from config import Config
+from benchmark_utils import get_option_value
+
+# 전역 변수 참조 (호환성 유지)
+git_packages = Config.GIT_PACKAGES
+
+DEFAULT_PROJECT_COUNT = 100
+DEFAULT_ASSETS_PER_PROJECT = 1000
+REMOTE_DIR_NAME = "_Remotes"
+FLEET_INFO_FILE_NAME = "fleet.json"
+UNITY_VERSION = "6000.0.59f2"
+GIT_USER_NAME = "Fleet Generator"
+GIT_USER_EMAIL = "fleet-generator@example.com"
+
+# 최상위 에셋 폴더: (폴더명, 확장자 목록, 바이너리 여부)
+ASSET_FOLDERS = [
+    ("Scenes", [".unity"], False),
+    ("Scripts", [".cs"], False),
+    ("Prefabs", [".prefab"], False),
+    ("Materials", [".mat"], False),
+    ("Textures", [".png", ".jpg"], True),
+    ("Models", [".fbx"], True),
+    ("Audio", [".wav", ".mp3"], True),
+    ("Animations", [".anim", ".controller"], False),
+    ("UI", [".prefab", ".png"], False),
+    ("Resources", [".asset", ".json"], False),
+    ("Plugins", [".dll", ".jslib"], True),
+]
+SUBFOLDER_NAMES = ["Common", "Experiment", "Lab", "Chemistry", "Physics", "Biology", "Shared", "Legacy", "Effects", "Items"]
+ASSET_NAMES = ["Beaker", "Flask", "Burner", "Thermometer", "Magnet", "Lens", "Prism", "Circuit", "Battery", "Bulb",
+               "Microscope", "Cell", "Plant", "Rock", "Water", "Panel", "Button", "Icon", "Arrow", "Table"]
+IMPORTERS = {
+    ".cs": "MonoImporter", ".png": "TextureImporter", ".jpg": "TextureImporter", ".fbx": "ModelImporter",
+    ".wav": "AudioImporter", ".mp3": "AudioImporter", ".dll": "PluginImporter", ".jslib": "PluginImporter",
+    ".unity": "DefaultImporter", ".json": "TextScriptImporter",
+}
+
+# Unity 기본 패키지 (manifest.json dependencies)
+UNITY_PACKAGES = {
+    "com.unity.collab-proxy": "2.5.2",
+    "com.unity.feature.development": "1.0.2",
+    "com.unity.render-pipelines.universal": "17.0.3",
+    "com.unity.textmeshpro": "3.0.9",
+    "com.unity.timeline": "1.8.7",
+    "com.unity.ugui": "2.0.0",
+    "com.unity.visualscripting": "1.9.4",
+    "com.unity.inputsystem": "1.11.2",
+    "com.unity.modules.ai": "1.0.0",
+    "com.unity.modules.animation": "1.0.0",
+    "com.unity.modules.audio": "1.0.0",
+    "com.unity.modules.imgui": "1.0.0",
+    "com.unity.modules.physics": "1.0.0",
+    "com.unity.modules.ui": "1.0.0",
+    "com.unity.modules.uielements": "1.0.0",
+}
+
+# manifest.json의 GIT_PACKAGES 상태: (상태, 비율)
+MANIFEST_VARIANTS = [
+    ("missing", 0.6),       # 패키지 없음 → 추가
+    ("installed", 0.3),     # 같은 URL로 이미 있음 → 변경 없음
+    ("outdated", 0.1),      # 다른 URL(태그 고정) → 수정
+]
+
+# SystemManager.cs 변형: (변형, 비율)
+SYSTEM_MANAGER_VARIANTS = [
+    ("basic", 0.45),
+    ("with_keyboard_input", 0.2),
+    ("with_hello_world", 0.1),
+    ("namespaced", 0.08),
+    ("nested_path", 0.07),
+    ("duplicate", 0.05),
+    ("missing", 0.05),
+]
+
+# 브랜치 계층: ([(브랜치, 부모, 추가 커밋 수), ...], 비율)
+BRANCH_HIERARCHIES = [
+    ([], 0.1),
+    ([("dev", "main", 1)], 0.3),
+    ([("dev", "main", 1), ("feature/experiment", "dev", 2)], 0.3),
+    ([("dev", "main", 1), ("feature/experiment", "dev", 2), ("feature/experiment-ui", "feature/experiment", 1)], 0.2),
+    ([("dev", "main", 1), ("hotfix/text", "dev", 1), ("feature/experiment", "dev", 3),
+      ("fix/experiment-sound", "feature/experiment", 1)], 0.1),
+]
+
+SYSTEM_MANAGER_TEMPLATE = '''using UnityEngine;
+
+public class SystemManager : MonoBehaviour
+{
+    public static SystemManager Instance { get; private set; }
+
+    [SerializeField] private float experimentTime = 60f;
+
+    void Awake()
+    {
+        if (Instance == null)
+        {
+            Instance = this;
+        }
+        else
+        {
+            Destroy(gameObject);
+        }
+    }
+
+    void Start()
+    {
+        Debug.Log("SystemManager 시작: " + experimentTime);
+    }
+%EXTRA%}
+'''
+
+NAMESPACED_SYSTEM_MANAGER_TEMPLATE = '''using UnityEngine;
+
+namespace Dannect.Simulation
+{
+    public class SystemManager : MonoBehaviour
+    {
+        void Start()
+        {
+            Debug.Log("SystemManager 시작");
+        }
+    }
+}
+'''
+
+KEYBOARD_INPUT_METHOD = '''
+    public void AllowKeyboardInput(bool isAllow)
+    {
+        Debug.Log("AllowKeyboardInput!" + isAllow);
+    }
+'''
+
+HELLO_WORLD_METHOD = '''
+    private void PrintHelloWorld()
+    {
+        Debug.Log("Hello World!");
+    }
+'''
+
+
+def _choose(rng, variants):
+    """(값, 비율) 목록에서 비율대로 하나를 선택합니다."""
+    values = [value for value, _ in variants]
+    weights = [weight for _, weight in variants]
+    return rng.choices(values, weights=weights, k=1)[0]
+
+def _random_guid(rng):
+    return f"{rng.getrandbits(128):032x}"
+
+def _write_text(path, text):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+
+def _write_meta(path, rng, is_folder=False):
+    """에셋 또는 폴더의 .meta 파일을 씁니다."""
+    if is_folder:
+        body = "folderAsset: yes\nDefaultImporter:\n  externalObjects: {}\n"
+    else:
+        importer = IMPORTERS.get(os.path.splitext(path)[1].lower(), "NativeFormatImporter")
+        body = f"{importer}:\n  externalObjects: {{}}\n"
+    _write_text(path + ".meta", f"fileFormatVersion: 2\nguid: {_random_guid(rng)}\n{body}"
+                                "  userData: \n  assetBundleName: \n  assetBundleVariant: \n")
+
+def _make_text_asset(name, extension, rng):
+    """텍스트(YAML / C# / JSON) 에셋 내용을 만듭니다 (수백 바이트 ~ 수 KB)."""
+    if extension == ".cs":
+        return (f"using UnityEngine;\n\npublic class {name} : MonoBehaviour\n{{\n"
+                + "".join(f"    public float value{index} = {rng.random():.3f}f;\n" for index in range(rng.randint(3, 30)))
+                + "}\n")
+    if extension == ".json":
+        return json.dumps({"name": name, "values": [rng.randint(0, 1000) for _ in range(rng.randint(10, 100))]})
+    lines = ["%YAML 1.1", "%TAG !u! tag:unity3d.com,2011:"]
+    for _ in range(rng.randint(2, 20)):
+        lines.extend([f"--- !u!1 &{rng.getrandbits(63)}", "GameObject:", f"  m_Name: {name}",
+                      f"  m_IsActive: {rng.randint(0, 1)}", f"  m_Layer: {rng.randint(0, 31)}"])
+    return "\n".join(lines) + "\n"
+
+def _create_asset_folders(assets_dir, rng):
+    """Assets 아래 폴더 트리를 만들고 (폴더 경로, 확장자 목록, 바이너리 여부) 목록을 반환합니다."""
+    folders = []
+    for folder_name, extensions, binary in ASSET_FOLDERS:
+        folder_path = os.path.join(assets_dir, folder_name)
+        os.makedirs(folder_path, exist_ok=True)
+        _write_meta(folder_path, rng, is_folder=True)
+        folders.append((folder_path, extensions, binary))
+        for sub_name in rng.sample(SUBFOLDER_NAMES, rng.randint(1, 4)):
+            sub_path = os.path.join(folder_path, sub_name)
+            os.makedirs(sub_path, exist_ok=True)
+            _write_meta(sub_path, rng, is_folder=True)
+            folders.append((sub_path, extensions, binary))
+            for depth in range(rng.randint(0, 2)):
+                sub_path = os.path.join(sub_path, f"{rng.choice(SUBFOLDER_NAMES)}{depth + 1}")
+                os.makedirs(sub_path, exist_ok=True)
+                _write_meta(sub_path, rng, is_folder=True)
+                folders.append((sub_path, extensions, binary))
+    return folders
+
+def _create_assets(assets_dir, asset_count, rng):
+    """에셋 파일과 .meta 파일을 만듭니다 (폴더에 임의로 분배)."""
+    folders = _create_asset_folders(assets_dir, rng)
+    for index in range(asset_count):
+        folder_path, extensions, binary = rng.choice(folders)
+        extension = rng.choice(extensions)
+        name = f"{rng.choice(ASSET_NAMES)}{index:05d}"
+        path = os.path.join(folder_path, name + extension)
+        if binary and extension not in (".prefab",):
+            size = rng.randint(256, 4096)
+            with open(path, 'wb') as f:
+                f.write(rng.getrandbits(size * 8).to_bytes(size, 'little'))
+        else:
+            _write_text(path, _make_text_asset(name, extension, rng))
+        _write_meta(path, rng)
+
+def _make_system_manager(variant):
+    if variant == "namespaced":
+        return NAMESPACED_SYSTEM_MANAGER_TEMPLATE
+    extra = ""
+    if variant == "with_keyboard_input":
+        extra = KEYBOARD_INPUT_METHOD
+    elif variant == "with_hello_world":
+        extra = HELLO_WORLD_METHOD
+    content = SYSTEM_MANAGER_TEMPLATE.replace("%EXTRA%", extra)
+    if variant == "with_hello_world":
+        content = content.replace('experimentTime);\n    }', 'experimentTime);\n        PrintHelloWorld();\n    }', 1)
+    return content
+
+def _create_system_manager(assets_dir, variant, rng):
+    """SystemManager.cs 변형을 만들고 생성한 파일 경로 목록을 반환합니다."""
+    if variant == "missing":
+        return []
+    folders = [os.path.join(assets_dir, "Scripts")]
+    if variant == "nested_path":
+        folders = [os.path.join(assets_dir, "Scripts", "Managers", "Core")]
+    elif variant == "duplicate":
+        folders.append(os.path.join(assets_dir, "Plugins", "Legacy"))
+
+    paths = []
+    for folder in folders:
+        # 중간 폴더도 Unity처럼 .meta 파일을 가짐
+        current = assets_dir
+        for part in os.path.relpath(folder, assets_dir).split(os.sep):
+            current = os.path.join(current, part)
+            if not os.path.isdir(current):
+                os.makedirs(current)
+                _write_meta(current, rng, is_folder=True)
+        path = os.path.join(folder, "SystemManager.cs")
+        _write_text(path, _make_system_manager(variant))
+        _write_meta(path, rng)
+        paths.append(path)
+    return paths
+
+def _create_project_settings(project_dir, project_name, rng):
+    settings_dir = os.path.join(project_dir, "ProjectSettings")
+    os.makedirs(settings_dir, exist_ok=True)
+    _write_text(os.path.join(settings_dir, "ProjectVersion.txt"),
+                f"m_EditorVersion: {UNITY_VERSION}\nm_EditorVersionWithRevision: {UNITY_VERSION} (a1b2c3d4e5f6)\n")
+    _write_text(os.path.join(settings_dir, "ProjectSettings.asset"),
+                "%YAML 1.1\n%TAG !u! tag:unity3d.com,2011:\n--- !u!129 &1\nPlayerSettings:\n"
+                f"  productGUID: {_random_guid(rng)}\n  companyName: Dannect\n  productName: {project_name}\n"
+                "  defaultScreenWidth: 1920\n  defaultScreenHeight: 1080\n")
+    _write_text(os.path.join(settings_dir, "EditorBuildSettings.asset"),
+                "%YAML 1.1\n%TAG !u! tag:unity3d.com,2011:\n--- !u!1045 &1\nEditorBuildSettings:\n  m_Scenes:\n"
+                f"  - enabled: 1\n    path: Assets/Scenes/Main.unity\n    guid: {_random_guid(rng)}\n")
+
+def _create_manifest(project_dir, variant):
+    dependencies = dict(UNITY_PACKAGES)
+    for name, url in git_packages.items():
+        if variant == "installed":
+            dependencies[name] = url
+        elif variant == "outdated":
+            dependencies[name] = f"{url}#v0.9.0"
+    packages_dir = os.path.join(project_dir, "Packages")
+    os.makedirs(packages_dir, exist_ok=True)
+    with open(os.path.join(packages_dir, "manifest.json"), 'w', encoding='utf-8') as f:
+        json.dump({"dependencies": dict(sorted(dependencies.items()))}, f, indent=2)
+
+def _git(project_dir, *args):
+    """Git 명령을 실행합니다 (사용자 설정과 무관하게 동작하도록 필요한 설정을 직접 지정)."""
+    result = subprocess.run(
+        ["git", "-c", f"user.name={GIT_USER_NAME}", "-c", f"user.email={GIT_USER_EMAIL}",
+         "-c", "commit.gpgsign=false", "-c", "core.autocrlf=false", *args],
+        cwd=project_dir, capture_output=True, text=True, encoding='utf-8'
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} 실패 ({project_dir}): {result.stderr.strip()}")
+    return result.stdout.strip()
+
+def _create_git_repository(project_dir, hierarchy, remote_path, rng):
+    """Git 리포지토리를 만들고 브랜치 계층을 구성합니다.
+
+    툴킷의 commit_changes가 바로 커밋할 수 있도록 user.name / user.email을 리포지토리 설정에 저장하고,
+    생성한 브랜치를 모두 origin에 푸시하여 원격 추적 브랜치(remotes/origin/...)도 실제와 같이 존재하게 합니다.
+    """
+    _git(project_dir, "init", "-q", "-b", "main")
+    _git(project_dir, "config", "user.name", GIT_USER_NAME)
+    _git(project_dir, "config", "user.email", GIT_USER_EMAIL)
+    _write_text(os.path.join(project_dir, ".gitignore"), "/[Ll]ibrary/\n/[Tt]emp/\n/[Oo]bj/\n/[Bb]uild/\n/[Ll]ogs/\n/[Uu]ser[Ss]ettings/\n")
+    _git(project_dir, "add", "-A")
+    _git(project_dir, "commit", "-q", "-m", "Initial commit")
+
+    # 브랜치마다 변경 기록 파일에 한 줄씩 추가하여 커밋 (부모보다 커밋 수가 많아지도록)
+    notes_path = os.path.join(project_dir, "Assets", "Scripts", "ChangeNotes.txt")
+    for branch, parent, commit_count in hierarchy:
+        _git(project_dir, "checkout", "-q", "-b", branch, parent)
+        for index in range(commit_count):
+            with open(notes_path, 'a', encoding='utf-8', newline='\n') as f:
+                f.write(f"{branch}: 변경 {index + 1}\n")
+            _git(project_dir, "add", "-A")
+            _git(project_dir, "commit", "-q", "-m", f"{branch} 작업 {index + 1}")
+
+    # 작업자가 마지막으로 사용한 브랜치가 남아 있는 상태 (main 또는 임의의 브랜치)
+    branches = ["main"] + [branch for branch, _, _ in hierarchy]
+    _git(project_dir, "checkout", "-q", rng.choice(branches))
+
+    if remote_path:
+        os.makedirs(os.path.dirname(remote_path), exist_ok=True)
+        _git(os.path.dirname(remote_path), "init", "-q", "--bare", remote_path)
+        _git(project_dir, "remote", "add", "origin", remote_path)
+        _git(project_dir, "push", "-q", "origin", "--all")
+    return branches
+
+def generate_fake_project(project_dir, asset_count=DEFAULT_ASSETS_PER_PROJECT, seed=1, remote_path=None, git=True):
+    """가짜 Unity 프로젝트 하나를 생성합니다.
+
+    Args:
+        project_dir: 생성할 프로젝트 경로 (폴더명이 프로젝트명)
+        asset_count: Assets 아래 에셋 파일 수 (파일마다 .meta 파일이 추가로 생성됨)
+        seed: 내용 / 변형 선택용 seed
+        remote_path: origin으로 연결할 bare 리포지토리 경로 (None이면 원격 없음)
+        git: False이면 Git 리포지토리를 만들지 않음
+
+    Returns:
+        dict: {"name", "path", "system_manager", "system_manager_files", "manifest", "branches", "remote"}
+    """
+    rng = random.Random(f"{seed}:{os.path.basename(project_dir)}")
+    project_name = os.path.basename(project_dir.rstrip(os.sep))
+    assets_dir = os.path.join(project_dir, "Assets")
+    os.makedirs(assets_dir, exist_ok=True)
+
+    _create_project_settings(project_dir, project_name, rng)
+    _create_assets(assets_dir, asset_count, rng)
+    system_manager_variant = _choose(rng, SYSTEM_MANAGER_VARIANTS)
+    system_manager_files = _create_system_manager(assets_dir, system_manager_variant, rng)
+    manifest_variant = _choose(rng, MANIFEST_VARIANTS)
+    _create_manifest(project_dir, manifest_variant)
+
+    branches = []
+    hierarchy = _choose(rng, BRANCH_HIERARCHIES)
+    if git:
+        branches = _create_git_repository(project_dir, hierarchy, remote_path, rng)
+
+    return {
+        "name": project_name,
+        "path": project_dir,
+        "system_manager": system_manager_variant,
+        "system_manager_files": system_manager_files,
+        "manifest": manifest_variant,
+        "branches": branches,
+        "remote": remote_path if git else None
+    }
+
+def generate_project_fleet(root_dir, count=DEFAULT_PROJECT_COUNT, asset_count=DEFAULT_ASSETS_PER_PROJECT, seed=1,
+                           prefix="FleetProject", with_remote=True, git=True, verbose=True):
+    """가짜 Unity 프로젝트 여러 개를 root_dir 아래에 생성합니다.
+
+    실제 프로젝트 폴더처럼 Unity 프로젝트가 아닌 폴더(_Docs, 원격 리포지토리 폴더)도 함께 둡니다.
+    생성 정보는 root_dir/fleet.json에 저장합니다.
+
+    Returns:
+        list: 프로젝트별 생성 정보 (generate_fake_project 반환값)
+    """
+    os.makedirs(root_dir, exist_ok=True)
+    os.makedirs(os.path.join(root_dir, "_Docs"), exist_ok=True)
+    _write_text(os.path.join(root_dir, "_Docs", "README.txt"), "Unity 프로젝트가 아닌 폴더 (검색 대상 제외 확인용)\n")
+    remote_dir = os.path.join(root_dir, REMOTE_DIR_NAME)
+
+    projects = []
+    width = max(3, len(str(count)))
+    for index in range(count):
+        project_name = f"{prefix}{index + 1:0{width}d}"
+        remote_path = os.path.join(remote_dir, project_name + ".git") if with_remote and git else None
+        projects.append(generate_fake_project(os.path.join(root_dir, project_name), asset_count, seed,
+                                              remote_path, git))
+        if verbose and (index + 1) % max(1, count // 10) == 0:
+            print(f"   📁 프로젝트 생성: {index + 1}/{count}")
+
+    with open(os.path.join(root_dir, FLEET_INFO_FILE_NAME), 'w', encoding='utf-8') as f:
+        json.dump({"count": count, "asset_count": asset_count, "seed": seed, "projects": projects},
+                  f, indent=2, ensure_ascii=False)
+    return projects
+
+def summarize_fleet(projects):
+    """변형별 프로젝트 수를 반환합니다: {"system_manager": {...}, "manifest": {...}, "branch_depth": {...}}."""
+    summary = {"system_manager": {}, "manifest": {}, "branch_depth": {}}
+    for project in projects:
+        for key in ("system_manager", "manifest"):
+            summary[key][project[key]] = summary[key].get(project[key], 0) + 1
+        depth = str(len(project["branches"]))
+        summary["branch_depth"][depth] = summary["branch_depth"].get(depth, 0) + 1
+    return summary
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0].startswith("--") or "--help" in argv:
+        print(__doc__)
+        return
+    root_dir = os.path.abspath(argv[0])
+    count = int(get_option_value(argv, "--count", DEFAULT_PROJECT_COUNT))
+    asset_count = int(get_option_value(argv, "--assets", DEFAULT_ASSETS_PER_PROJECT))
+    print(f"\n=== 가짜 Unity 프로젝트 생성: {count}개 (프로젝트당 에셋 {asset_count}개) → {root_dir} ===")
+    projects = generate_project_fleet(root_dir, count, asset_count, seed=int(get_option_value(argv, "--seed", 1)),
+                                      with_remote="--no-remote" not in argv)
+    for key, counts in summarize_fleet(projects).items():
+        print(f"   {key}: " + ", ".join(f"{name} {value}" for name, value in sorted(counts.items())))
+    print(f"✅ 생성 완료: {root_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Git 관련 유틸리티 함수들
 """
 import os
+import hashlib
 import subprocess
 from config import Config
 
@@ -12,13 +13,20 @@ DEFAULT_BRANCH = Config.DEFAULT_BRANCH
 DEV_BRANCH = Config.DEV_BRANCH
 COMMIT_MESSAGES = Config.COMMIT_MESSAGES
 
+# 작업 트리 상태 요약에 사용하는 명령 (async_runner의 비동기 조회와 공유)
+# - 프로젝트 폴더(-- .)로 제한: 프로젝트가 리포지토리의 하위 폴더여도 다른 폴더 변경은 무시
+# - -z + core.quotepath=false: 한글 등 비ASCII 경로를 8진수 이스케이프 없이 NUL로 구분하여 출력
+STATUS_DIGEST_COMMAND = "git -c core.quotepath=false status --porcelain -z --untracked-files=all -- ."
 
 class GitUtils:
     """Git 관련 유틸리티 클래스"""
     
     @staticmethod
-    def run_command(command, cwd):
-        """Git 명령어를 실행하고 결과를 반환합니다."""
+    def run_command(command, cwd, strip=True):
+        """Git 명령어를 실행하고 결과를 반환합니다.
+        
+        strip이 False이면 stdout 앞뒤 공백을 유지합니다 (status --porcelain -z처럼 공백이 의미 있는 출력).
+        """
         try:
             result = subprocess.run(
                 command, 
@@ -28,10 +36,23 @@ class GitUtils:
                 shell=True,
                 encoding='utf-8'
             )
-            return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
+            stdout = result.stdout.strip() if strip else result.stdout
+            return result.returncode == 0, stdout, result.stderr.strip()
         except Exception as e:
             return False, "", str(e)
     
+    @staticmethod
+    def find_repository_root(project_path):
+        """프로젝트 폴더 또는 상위 폴더에서 .git이 있는 리포지토리 루트를 찾습니다 (없으면 None)."""
+        current = os.path.abspath(project_path)
+        while True:
+            if os.path.exists(os.path.join(current, ".git")):
+                return current
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+    
     @staticmethod
     def get_project_name(project_path):
         """프로젝트 경로에서 프로젝트명을 추출합니다."""
@@ -75,6 +96,53 @@ class GitUtils:
         success, stdout, stderr = GitUtils.run_command("git branch --show-current", project_path)
         return stdout.strip() if success else None
 
+    @staticmethod
+    def get_head_commit(project_path):
+        """HEAD 커밋 해시를 가져옵니다."""
+        success, stdout, stderr = GitUtils.run_command("git rev-parse HEAD", project_path)
+        return stdout.strip() if success and stdout.strip() else None
+
+    @staticmethod
+    def get_status_digest(project_path):
+        """작업 트리 상태(git status --porcelain)의 요약 해시를 가져옵니다.
+        
+        변경/추가된 파일은 수정 시간과 크기도 포함하므로, 이미 수정된 파일을 다시 수정해도 요약이 바뀝니다.
+        """
+        success, stdout, stderr = GitUtils.run_command(STATUS_DIGEST_COMMAND, project_path, strip=False)
+        if not success:
+            return None
+        return GitUtils.digest_status_output(project_path, stdout)
+
+    @staticmethod
+    def digest_status_output(project_path, stdout):
+        """git status --porcelain -z 출력과 변경 파일의 수정 시간/크기로 요약 해시를 계산합니다.
+        
+        porcelain 경로는 리포지토리 루트 기준이므로 루트에서 파일을 찾습니다 (프로젝트가 하위 폴더인 경우 포함).
+        """
+        root = GitUtils.find_repository_root(project_path) or project_path
+        hasher = hashlib.sha1()
+        records = stdout.split('\0')
+        index = 0
+        while index < len(records):
+            record = records[index]
+            index += 1
+            if len(record) < 4:
+                continue
+            hasher.update(record.encode('utf-8'))
+            status, path = record[:2], record[3:]
+            if 'R' in status or 'C' in status:
+                # 이름 변경/복사: 다음 항목은 원래 경로
+                if index < len(records):
+                    hasher.update(f"\0{records[index]}".encode('utf-8'))
+                index += 1
+            try:
+                stat = os.stat(os.path.join(root, path))
+                hasher.update(f"\0{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8'))
+            except OSError:
+                pass
+            hasher.update(b"\n")
+        return hasher.hexdigest()
+
     @staticmethod
     def get_all_branches(project_path):
         """모든 브랜치 목록을 가져옵니다."""
@@ -277,8 +345,8 @@ class GitUtils:
 
 
 # 호환성을 위한 래퍼 함수들
-def run_git_command(command, cwd):
-    return GitUtils.run_command(command, cwd)
+def run_git_command(command, cwd, strip=True):
+    return GitUtils.run_command(command, cwd, strip)
 
 def get_project_name_from_path(project_path):
     return GitUtils.get_project_name(project_path)
@@ -295,6 +363,12 @@ def initialize_git_repository(project_path):
 def get_current_branch(project_path):
     return GitUtils.get_current_branch(project_path)
 
+def get_head_commit(project_path):
+    return GitUtils.get_head_commit(project_path)
+
+def get_status_digest(project_path):
+    return GitUtils.get_status_digest(project_path)
+
 def get_all_branches(project_path):
     return GitUtils.get_all_branches(project_path)
 
@@ -444,7 +518,7 @@ def push_changes(project_path):
         print(f"푸시할 커밋 없음: {project_name}")
         return True
     else:
-        print(f"푸시할 커밋 발견: {len(stdout.strip().split('\n'))}개")
+        print(f"푸시할 커밋 발견: {len(stdout.strip().splitlines())}개")
     
     # 푸시
     success, stdout, stderr = run_git_command(f"git push -u origin {current_branch}", project_path)
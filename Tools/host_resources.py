@@ -0,0 +1,359 @@
+"""
+호스트 자원 측정 및 적응형 동시 실행 제어
+- 여유 메모리 / 유휴 CPU 측정 (Linux: /proc, Windows: GlobalMemoryStatusEx / GetSystemTimes)
+- Unity 프로세스 트리의 최대 메모리 / 평균 CPU 사용량 측정 (Linux: /proc/<pid>/stat)
+- AdaptiveConcurrencyController: 여유 자원이 작업당 필요량보다 많을 때만 다음 작업을 시작하고,
+  호스트가 포화 상태이면 실행 중인 작업이 끝날 때까지 대기 (고정된 작업자 수 대신 사용)
+"""
+import os
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from config import Config
+
+# 전역 변수 참조 (호환성 유지)
+HOST_MEMORY_HEADROOM_MB = Config.HOST_MEMORY_HEADROOM_MB
+ADAPTIVE_RAMP_UP_SECONDS = Config.ADAPTIVE_RAMP_UP_SECONDS
+ADAPTIVE_POLL_SECONDS = Config.ADAPTIVE_POLL_SECONDS
+
+PROC_DIR = "/proc"
+
+
+def get_cpu_count():
+    """논리 CPU 코어 수를 반환합니다."""
+    return os.cpu_count() or 1
+
+def read_memory_info():
+    """호스트 메모리 정보를 반환합니다.
+
+    Returns:
+        tuple: (total_mb, available_mb) (측정할 수 없으면 None)
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            values = {}
+            with open(os.path.join(PROC_DIR, "meminfo"), 'r') as f:
+                for line in f:
+                    key, _, rest = line.partition(':')
+                    values[key] = int(rest.split()[0])  # kB
+            available_kb = values.get("MemAvailable")
+            if available_kb is None:
+                # 커널 3.14 이전: MemFree + Buffers + Cached로 근사
+                available_kb = values.get("MemFree", 0) + values.get("Buffers", 0) + values.get("Cached", 0)
+            return values["MemTotal"] / 1024, available_kb / 1024
+        except (OSError, KeyError, ValueError, IndexError):
+            return None
+
+    if sys.platform == "win32":
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return status.ullTotalPhys / (1024 * 1024), status.ullAvailPhys / (1024 * 1024)
+        except Exception:
+            return None
+
+    return None
+
+def read_cpu_times():
+    """호스트 전체 CPU 누적 시간을 반환합니다.
+
+    Returns:
+        tuple: (idle, total) 누적 시간 (단위는 플랫폼별, 두 측정값의 차이로만 사용) (측정할 수 없으면 None)
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open(os.path.join(PROC_DIR, "stat"), 'r') as f:
+                fields = [int(value) for value in f.readline().split()[1:]]
+            # user nice system idle iowait irq softirq steal ...
+            idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+            return idle, sum(fields[:8])
+        except (OSError, ValueError, IndexError):
+            return None
+
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            idle = ctypes.c_ulonglong()
+            kernel = ctypes.c_ulonglong()
+            user = ctypes.c_ulonglong()
+            if ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                # kernel 시간에는 idle 시간이 포함되어 있음
+                return idle.value, kernel.value + user.value
+        except Exception:
+            return None
+
+    return None
+
+def calculate_idle_cores(previous_times, current_times):
+    """두 CPU 시간 측정값 사이의 유휴 코어 수를 계산합니다 (계산할 수 없으면 None)."""
+    if previous_times is None or current_times is None:
+        return None
+    idle_delta = current_times[0] - previous_times[0]
+    total_delta = current_times[1] - previous_times[1]
+    if total_delta <= 0:
+        return None
+    return get_cpu_count() * max(0.0, min(1.0, idle_delta / total_delta))
+
+def _read_process_table():
+    """/proc에서 모든 프로세스의 (ppid, cpu_ticks, rss_pages)를 읽습니다 (Linux 전용)."""
+    table = {}
+    try:
+        pids = [name for name in os.listdir(PROC_DIR) if name.isdigit()]
+    except OSError:
+        return table
+
+    for pid in pids:
+        try:
+            with open(os.path.join(PROC_DIR, pid, "stat"), 'r') as f:
+                stat = f.read()
+            # comm 필드에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 파싱
+            fields = stat[stat.rindex(')') + 2:].split()
+            ppid = int(fields[1])
+            cpu_ticks = int(fields[11]) + int(fields[12]) + int(fields[13]) + int(fields[14])
+            table[int(pid)] = (ppid, cpu_ticks, int(fields[21]))
+        except (OSError, ValueError, IndexError):
+            continue
+    return table
+
+def get_process_tree_usage(pid):
+    """프로세스와 모든 자식 프로세스의 메모리/CPU 사용량을 반환합니다 (Linux 전용).
+
+    Returns:
+        tuple: (rss_mb, cpu_seconds) (측정할 수 없으면 None)
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    table = _read_process_table()
+    if pid not in table:
+        return None
+
+    children = {}
+    for child_pid, (ppid, _, _) in table.items():
+        children.setdefault(ppid, []).append(child_pid)
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    rss_bytes = 0
+    cpu_ticks = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        _, ticks, rss_pages = table[current]
+        rss_bytes += rss_pages * page_size
+        cpu_ticks += ticks
+        pending.extend(children.get(current, []))
+
+    return rss_bytes / (1024 * 1024), cpu_ticks / clock_ticks
+
+class ProcessResourceSampler:
+    """Unity 프로세스 트리의 최대 메모리와 평균 CPU 코어 사용량을 주기적으로 측정합니다.
+
+    측정값은 build_history에 기록되어 다음 빌드의 동시 실행 기준(작업당 필요 자원)으로 사용됩니다.
+    """
+
+    def __init__(self, pid, interval=ADAPTIVE_POLL_SECONDS):
+        self.pid = pid
+        self.interval = interval
+        self.peak_memory_mb = 0.0
+        self.cpu_seconds = 0.0
+        self._last_cpu_seconds = None
+        self._start_time = time.time()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._start_time = time.time()
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        usage = get_process_tree_usage(self.pid)
+        if usage is None:
+            return
+        rss_mb, cpu_seconds = usage
+        self.peak_memory_mb = max(self.peak_memory_mb, rss_mb)
+        if self._last_cpu_seconds is not None:
+            # 종료된 자식 프로세스가 빠지면 감소할 수 있으므로 증가분만 누적
+            self.cpu_seconds += max(0.0, cpu_seconds - self._last_cpu_seconds)
+        self._last_cpu_seconds = cpu_seconds
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._sample()
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        """측정을 중지하고 (peak_memory_mb, average_cpu_cores)를 반환합니다 (측정값이 없으면 None)."""
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=self.interval + 1)
+        elapsed = time.time() - self._start_time
+        if self.peak_memory_mb <= 0 or elapsed <= 0:
+            return None
+        return self.peak_memory_mb, self.cpu_seconds / elapsed
+
+def get_host_worker_limit(memory_per_task_mb, cpu_per_task):
+    """호스트 전체 자원 기준 최대 동시 실행 수를 계산합니다."""
+    limit = max(1, int(get_cpu_count() // max(cpu_per_task, 0.1)))
+    memory_info = read_memory_info()
+    if memory_info:
+        total_mb = memory_info[0]
+        limit = min(limit, max(1, int((total_mb - HOST_MEMORY_HEADROOM_MB) // max(memory_per_task_mb, 1))))
+    return limit
+
+class AdaptiveConcurrencyController:
+    """호스트 여유 자원에 따라 작업 시작을 조절하는 동시 실행 제어기.
+
+    - 실행 중인 작업이 max_workers개 미만이고
+    - 여유 메모리 - 헤드룸 >= 작업의 예상 메모리, 유휴 CPU 코어 >= 작업의 예상 CPU 코어일 때만 다음 작업을 시작
+    - 시작 직후(ADAPTIVE_RAMP_UP_SECONDS 이내)의 작업은 아직 자원을 다 쓰지 않았으므로 예상 사용량을 미리 차감
+    - 실행 중인 작업이 없으면 자원과 관계없이 항상 하나는 시작 (교착 방지)
+    """
+
+    def __init__(self, max_workers, memory_per_task_mb, cpu_per_task, adaptive=True,
+                 poll_interval=ADAPTIVE_POLL_SECONDS, ramp_up_seconds=ADAPTIVE_RAMP_UP_SECONDS):
+        self.max_workers = max(1, max_workers)
+        self.memory_per_task_mb = memory_per_task_mb
+        self.cpu_per_task = cpu_per_task
+        self.adaptive = adaptive
+        self.poll_interval = poll_interval
+        self.ramp_up_seconds = ramp_up_seconds
+        self._running = {}  # item -> (start_time, memory_mb, cpu_cores)
+        self._cpu_times = read_cpu_times()
+
+    def _ramp_up_reservation(self):
+        """시작 직후인 작업들의 예상 자원 사용량 합계를 반환합니다."""
+        now = time.time()
+        memory_mb = 0.0
+        cpu_cores = 0.0
+        for start_time, task_memory_mb, task_cpu_cores in self._running.values():
+            if now - start_time < self.ramp_up_seconds:
+                memory_mb += task_memory_mb
+                cpu_cores += task_cpu_cores
+        return memory_mb, cpu_cores
+
+    def can_start(self, memory_mb=None, cpu_cores=None):
+        """다음 작업을 시작할 수 있는지 확인합니다.
+
+        Returns:
+            tuple: (can_start, reason)
+        """
+        if memory_mb is None:
+            memory_mb = self.memory_per_task_mb
+        if cpu_cores is None:
+            cpu_cores = self.cpu_per_task
+
+        if len(self._running) >= self.max_workers:
+            return False, f"최대 동시 실행 수 도달 ({self.max_workers}개)"
+        if not self.adaptive or not self._running:
+            return True, ""
+
+        reserved_memory_mb, reserved_cpu_cores = self._ramp_up_reservation()
+
+        memory_info = read_memory_info()
+        if memory_info:
+            free_mb = memory_info[1] - reserved_memory_mb - HOST_MEMORY_HEADROOM_MB
+            if free_mb < memory_mb:
+                return False, f"여유 메모리 부족 (사용 가능 {free_mb:.0f}MB < 필요 {memory_mb:.0f}MB)"
+
+        current_times = read_cpu_times()
+        idle_cores = calculate_idle_cores(self._cpu_times, current_times)
+        self._cpu_times = current_times
+        if idle_cores is not None:
+            free_cores = idle_cores - reserved_cpu_cores
+            if free_cores < cpu_cores:
+                return False, f"유휴 CPU 부족 (유휴 {free_cores:.1f}코어 < 필요 {cpu_cores:.1f}코어)"
+
+        return True, ""
+
+    @property
+    def running_count(self):
+        """실행 중인 작업 수를 반환합니다."""
+        return len(self._running)
+
+    def task_started(self, item, memory_mb=None, cpu_cores=None):
+        """작업 시작을 기록합니다 (run()을 쓰지 않고 호출자가 직접 작업을 시작할 때, can_start 확인 후 호출)."""
+        if memory_mb is None:
+            memory_mb = self.memory_per_task_mb
+        if cpu_cores is None:
+            cpu_cores = self.cpu_per_task
+        self._running[item] = (time.time(), memory_mb, cpu_cores)
+
+    def task_finished(self, item):
+        """작업 종료를 기록합니다."""
+        self._running.pop(item, None)
+
+    def run(self, func, items, requirements=None, on_cancel=None):
+        """items를 순서대로 func(item)으로 실행하고, 완료되는 순서대로 (item, future)를 반환합니다.
+
+        Args:
+            func: 각 항목에 대해 실행할 함수
+            items: 실행할 항목 목록 (이 순서대로 시작)
+            requirements: {item: (memory_mb, cpu_cores)} 항목별 예상 자원 (없으면 기본값)
+            on_cancel: Ctrl+C 등으로 중단될 때 실행 중인 작업을 정리하는 함수
+                (작업 스레드가 끝나야 종료할 수 있으므로 외부 프로세스를 여기서 종료해야 함,
+                호출 측이 반복을 중간에 멈추면(break, 반복문 본문의 예외) 호출하지 않고 실행 중인 작업이 끝나기를 기다림)
+        """
+        if requirements is None:
+            requirements = {}
+        queue = list(items)
+        future_to_item = {}
+        waiting_reason = None
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while queue or future_to_item:
+                # 자원이 허용하는 만큼 다음 작업 시작 (순서 유지)
+                while queue:
+                    memory_mb, cpu_cores = requirements.get(queue[0], (self.memory_per_task_mb, self.cpu_per_task))
+                    can_start, reason = self.can_start(memory_mb, cpu_cores)
+                    if not can_start:
+                        if reason != waiting_reason and len(self._running) < self.max_workers:
+                            print(f"⏸️ 호스트 자원 대기: {reason} (실행 중 {len(self._running)}개, 대기 {len(queue)}개)")
+                        waiting_reason = reason
+                        break
+                    waiting_reason = None
+                    item = queue.pop(0)
+                    self.task_started(item, memory_mb, cpu_cores)
+                    future_to_item[executor.submit(func, item)] = item
+
+                if not future_to_item:
+                    continue
+
+                done, _ = wait(list(future_to_item), timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = future_to_item.pop(future)
+                    self.task_finished(item)
+                    yield item, future
+        except GeneratorExit:
+            # 호출 측이 반복을 중간에 멈춤 (break 등): 대기 중인 작업만 시작하지 않고 실행 중인 작업은 끝까지 기다림
+            for future in future_to_item:
+                future.cancel()
+            raise
+        except (KeyboardInterrupt, Exception):
+            # 대기 중인 작업은 시작하지 않고, 실행 중인 작업은 on_cancel로 정리
+            for future in future_to_item:
+                future.cancel()
+            if on_cancel:
+                on_cancel()
+            raise
+        finally:
+            executor.shutdown(wait=True)
@@ -0,0 +1,171 @@
+"""
+Unity 빌드 실패 로그 분석 (메모리 사용량 고정)
+- 수백 MB 로그도 한 번에 읽지 않고 청크 단위로 한 번만 훑어 에러 줄과 전후 문맥을 수집
+  (전후 문맥은 고정 크기 창으로 관리, 수집하는 에러 줄 수도 상한 있음)
+- 마지막 N줄은 파일 끝에서부터 블록 단위로 거꾸로 읽어 가져옴 (파일 크기와 무관)
+- 실패/타임아웃/예외 시 병렬 빌드의 다른 작업에 영향을 주지 않도록 메모리와 시간을 일정하게 유지
+"""
+import os
+from collections import deque
+from log_tailer import LogTailer
+
+# 빌드 스크립트 실행 여부 확인용 로그 문구 (WebGLBuilder.Build 시작 로그)
+BUILD_SCRIPT_MARKER = "WebGL Player Settings 자동 설정 및 빌드 시작"
+
+# 에러로 판단할 로그 키워드
+ERROR_KEYWORDS = ["error CS", "Error:", "error:", "CompilerError", "Compilation failed"]
+
+# 에러 줄 전후 문맥 줄 수 / 수집할 최대 줄 수 / 마지막 줄 수
+ERROR_CONTEXT_LINES = 2
+MAX_ERROR_LINES = 100
+TAIL_LINES = 100
+
+# 끝에서부터 읽는 블록 크기 / 마지막 줄을 찾기 위해 읽는 최대 크기
+TAIL_BLOCK_SIZE = 64 * 1024
+TAIL_MAX_BYTES = 4 * 1024 * 1024
+
+
+def read_log_tail(log_file_path, max_lines=TAIL_LINES, block_size=TAIL_BLOCK_SIZE, max_bytes=TAIL_MAX_BYTES):
+    """로그 파일의 마지막 max_lines줄을 파일 끝에서부터 거꾸로 읽어 반환합니다.
+
+    파일 전체를 읽지 않으며, 줄바꿈이 없는 거대한 출력이 있어도 max_bytes까지만 읽습니다.
+
+    Returns:
+        list: 마지막 줄 목록 (파일이 없으면 빈 목록)
+    """
+    try:
+        f = open(log_file_path, 'rb')
+    except OSError:
+        return []
+
+    with f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        position = end
+        data = b""
+        while position > 0 and data.count(b"\n") <= max_lines and end - position < max_bytes:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+
+    lines = data.splitlines()
+    if position > 0 and lines:
+        lines = lines[1:]  # 블록 경계에서 잘린 첫 줄 제외
+    return [line.decode('utf-8', errors='replace') for line in lines[-max_lines:]]
+
+def analyze_build_log(log_file_path, search_errors=True, keywords=None, context_lines=ERROR_CONTEXT_LINES,
+                      max_error_lines=MAX_ERROR_LINES, tail_lines=TAIL_LINES):
+    """빌드 로그를 한 번만 훑어 실패 원인 분석에 필요한 정보를 수집합니다.
+
+    Args:
+        log_file_path: Unity 로그 파일 경로
+        search_errors: 에러 줄과 전후 문맥을 수집할지 여부 (False면 빌드 스크립트 실행 여부와 마지막 줄만 확인)
+        keywords: 에러 키워드 목록 (기본값 ERROR_KEYWORDS)
+        context_lines: 에러 줄 전후로 함께 수집할 줄 수
+        max_error_lines: 수집할 최대 줄 수 (문맥과 구분선 포함, 에러 수는 제한 없이 셈)
+        tail_lines: 마지막 줄 수
+
+    Returns:
+        dict: {
+            "exists": 로그 파일 존재 여부,
+            "script_started": 빌드 스크립트 실행 여부 (BUILD_SCRIPT_MARKER 발견),
+            "error_lines": 에러 줄과 전후 문맥 (겹치는 문맥은 합치고 묶음 사이에 "---"),
+            "error_count": 발견한 에러 줄 수,
+            "tail": 마지막 줄 목록,
+            "bytes_scanned": 읽은 바이트 수
+        }
+    """
+    analysis = {
+        "exists": os.path.exists(log_file_path),
+        "script_started": False,
+        "error_lines": [],
+        "error_count": 0,
+        "tail": [],
+        "bytes_scanned": 0
+    }
+    if not analysis["exists"]:
+        return analysis
+
+    if keywords is None:
+        keywords = ERROR_KEYWORDS
+
+    error_lines = analysis["error_lines"]
+    before = deque(maxlen=context_lines)  # 아직 출력 목록에 넣지 않은 직전 줄들
+    after_remaining = 0
+    errors_full = not search_errors
+    lines_full = False  # 수집 줄 수가 max_error_lines에 도달하면 줄 수집만 멈추고 에러 수는 끝까지 셈
+
+    tailer = LogTailer(log_file_path, use_inotify=False)
+    try:
+        for line in _iterate_lines(tailer):
+            if not analysis["script_started"] and BUILD_SCRIPT_MARKER in line:
+                analysis["script_started"] = True
+
+            if errors_full:
+                if analysis["script_started"]:
+                    break  # 필요한 정보를 모두 찾았으면 나머지는 읽지 않음
+                continue
+
+            if any(keyword in line for keyword in keywords):
+                analysis["error_count"] += 1
+                if lines_full:
+                    continue
+                if after_remaining == 0:
+                    if error_lines:
+                        error_lines.append("---")
+                    error_lines.extend(before)
+                error_lines.append(line)
+                before.clear()
+                after_remaining = context_lines
+            elif lines_full:
+                continue
+            elif after_remaining > 0:
+                error_lines.append(line)
+                after_remaining -= 1
+            else:
+                before.append(line)
+
+            if len(error_lines) >= max_error_lines:
+                del error_lines[max_error_lines:]
+                lines_full = True
+        analysis["bytes_scanned"] = tailer.bytes_read
+    finally:
+        tailer.close()
+
+    analysis["tail"] = read_log_tail(log_file_path, tail_lines)
+    return analysis
+
+def _iterate_lines(tailer):
+    """LogTailer로 파일 전체를 청크 단위로 읽어 줄을 반환합니다 (마지막 미완성 줄 포함)."""
+    for line in tailer.read_lines():
+        yield line
+    last_line = tailer.flush_partial()
+    if last_line is not None:
+        yield last_line
+
+def print_log_analysis(analysis, tail_title, started_note="", not_started_note="(컴파일 에러 가능성)"):
+    """analyze_build_log 결과를 출력합니다 (빌드 스크립트 실행 여부, 에러 문맥, 마지막 줄)."""
+    if not analysis["exists"]:
+        return
+
+    if analysis["script_started"]:
+        print(f"   ✓ 빌드 스크립트가 실행되었음{' ' + started_note if started_note else ''}")
+    else:
+        print(f"   ❌ 빌드 스크립트가 실행되지 않음 {not_started_note}")
+
+    if analysis["error_lines"]:
+        print("\n" + "="*80)
+        print("❌ 컴파일 에러 발견:")
+        print("="*80)
+        for line in analysis["error_lines"]:
+            print(line)
+        print("="*80)
+
+    if analysis["tail"]:
+        print("\n" + "="*80)
+        print(f"📝 {tail_title}:")
+        print("="*80)
+        for line in analysis["tail"]:
+            print(line)
+        print("="*80)
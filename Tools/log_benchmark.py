@@ -0,0 +1,283 @@
+"""
+대용량 빌드 로그 처리 벤치마크
+- 10MB ~ 2GB 크기의 합성 Unity 로그를 생성 (실제 로그와 비슷한 줄 분포: 에셋 임포트 반복 출력, IL2CPP / C++ 컴파일 출력,
+  셰이더 컴파일, 경고, 툴킷의 한글/이모지 메시지, 임의 위치의 컴파일 에러, 빌드 스크립트 시작 문구)
+- 실패 경로에서 로그를 읽는 함수들의 시간과 최대 메모리를 측정:
+  - update_build_markers + validate_build_output (BuildReport가 없을 때 로그 기반 검증: 빌드 중 모니터가
+    줄마다 성공 보고를 기록하는 비용을 로그 전체에 대해 측정, 검증 자체는 로그를 다시 읽지 않음)
+  - analyze_build_log (에러 문맥 + 마지막 100줄, 빌드 실패 시)
+  - analyze_build_log(search_errors=False) (빌드 스크립트 실행 여부 + 마지막 100줄, 타임아웃/예외 시)
+  - read_log_tail (마지막 100줄)
+- 시간은 RSS 측정만 켠 상태로, Python 힙 최대 사용량은 tracemalloc을 켠 별도 실행으로 측정
+- 예상 메모리가 호스트 여유 메모리를 넘는 측정은 건너뜀 (로그 전체를 문자열로 읽는 함수가 호스트를 멈추지 않도록)
+- 결과는 BUILD_OUTPUT_DIR/_Benchmarks/log_handling_<시각>.json에 저장 (--output으로 경로 지정)
+
+실행: python log_benchmark.py [--sizes 10,100,500,2000] [--errors 20] [--seed 1] [--work-dir 폴더] [--keep]
+                             [--no-trace] [--output 경로]
+"""
+import os
+import sys
+import random
+import shutil
+import tempfile
+from itertools import accumulate
+from build_manager import validate_build_output, update_build_markers
+from log_tailer import LogTailer
+from log_analyzer import analyze_build_log, read_log_tail, BUILD_SCRIPT_MARKER
+from host_resources import read_memory_info
+from benchmark_utils import measure, parse_int_list, get_option_value, print_table, save_benchmark_json
+
+DEFAULT_SIZES_MB = [10, 100, 500, 2000]
+DEFAULT_ERROR_COUNT = 20
+LINE_POOL_SIZE = 2000     # 종류별로 미리 만들어 두는 줄 수
+BLOCK_LINES = 20000       # 한 번에 쓰는 줄 수
+MB = 1024 * 1024
+
+# 줄 종류별 비율 (실제 WebGL 빌드 로그 기준: 에셋 임포트와 IL2CPP 출력이 대부분)
+LINE_WEIGHTS = [
+    ("import", 0.55),
+    ("il2cpp", 0.25),
+    ("misc", 0.12),
+    ("warning", 0.07),
+    ("toolkit", 0.01),
+]
+
+ASSET_FOLDERS = ["Prefabs", "Models", "Textures", "Materials", "Scenes", "Audio", "Animations", "UI"]
+ASSET_EXTENSIONS = ["prefab", "fbx", "png", "mat", "unity", "wav", "anim", "asset"]
+SCRIPT_NAMES = ["SystemManager", "ExperimentController", "BeakerInteraction", "UIManager", "DataLogger",
+                "CameraRig", "LabEquipment", "QuizPanel"]
+
+
+def _make_line(kind, rng, index):
+    """줄 종류별 합성 로그 한 줄을 만듭니다."""
+    if kind == "import":
+        folder = rng.choice(ASSET_FOLDERS)
+        extension = rng.choice(ASSET_EXTENSIONS)
+        return (f"Start importing Assets/{folder}/Item{index:05d}.{extension} using Guid({rng.getrandbits(128):032x}) "
+                f"Importer(-1,00000000000000000000000000000000)  -> (artifact id: '{rng.getrandbits(128):032x}') "
+                f"in {rng.random() * 0.2:.6f} seconds")
+    if kind == "il2cpp":
+        return (f"[{index:5d}/{LINE_POOL_SIZE * 4}  {rng.randint(0, 900)}s] C_WebGL_wasm "
+                f"Library/Bee/artifacts/WebGL/il2cppOutput/cpp/Generics{rng.randint(0, 400)}__{index}.cpp")
+    if kind == "misc":
+        return rng.choice([
+            f"Compiling shader \"Universal Render Pipeline/Lit\" pass \"ForwardLit\" (fp) variant {index}",
+            f"    Full variant space: {rng.randint(64, 65536)}",
+            f"Refreshing native plugins compatible for Editor in {rng.random() * 5:.2f} ms, found {rng.randint(0, 9)} plugins.",
+            f"UnloadTime: {rng.random() * 10:.6f} ms",
+            f"Unloading {rng.randint(0, 5000)} unused Assets / ({rng.random() * 300:.1f} MB). Loaded Objects now: {rng.randint(1000, 90000)}.",
+        ])
+    if kind == "warning":
+        return (f"Assets/Scripts/{rng.choice(SCRIPT_NAMES)}.cs({rng.randint(1, 900)},{rng.randint(1, 80)}): "
+                f"warning CS0618: 'Object.FindObjectOfType<T>()' is obsolete: 'Use FindFirstObjectByType instead.'")
+    return rng.choice([
+        f"🔧 WebGL Player Settings 이미지 기반 고정 설정 적용 중... ({index})",
+        f"📦 에셋 번들 처리 중: 항목 {index}",
+        f"✅ 제품명 설정: Science Experiment Simulation ({index})",
+    ])
+
+def _make_error_line(rng):
+    return (f"Assets/Scripts/{rng.choice(SCRIPT_NAMES)}.cs({rng.randint(1, 900)},{rng.randint(1, 80)}): "
+            f"error CS0246: The type or namespace name 'FakeType{rng.randint(0, 99)}' could not be found "
+            f"(are you missing a using directive or an assembly reference?)")
+
+def generate_synthetic_log(log_file_path, size_bytes, error_count=DEFAULT_ERROR_COUNT, seed=1):
+    """실제 Unity 로그와 비슷한 줄 분포의 합성 로그를 생성합니다.
+
+    종류별로 미리 만든 줄에서 비율대로 뽑아 블록 단위로 쓰므로 GB 단위 로그도 빠르게 생성됩니다.
+    컴파일 에러는 임의의 위치에, 빌드 스크립트 시작 문구는 40% 지점에 넣습니다.
+
+    Returns:
+        dict: {"path", "size", "lines", "errors"}
+    """
+    rng = random.Random(seed)
+    population = []
+    weights = []
+    for kind, weight in LINE_WEIGHTS:
+        population.extend(_make_line(kind, rng, index) + "\n" for index in range(LINE_POOL_SIZE))
+        weights.extend([weight / LINE_POOL_SIZE] * LINE_POOL_SIZE)
+    cumulative_weights = list(accumulate(weights))
+    line_sizes = [len(line.encode('utf-8')) for line in population]
+    indices = range(len(population))
+
+    # 삽입할 줄: (바이트 위치, 줄)
+    inserts = sorted([(rng.randrange(size_bytes), _make_error_line(rng) + "\n") for _ in range(error_count)] +
+                     [(int(size_bytes * 0.4), f"=== {BUILD_SCRIPT_MARKER} ===\n")])
+
+    written = 0
+    line_count = 0
+    with open(log_file_path, 'w', encoding='utf-8', newline='\n') as f:
+        header = "Initialize engine version: 6000.0.59f2 (synthetic)\n[Licensing::Module] Successfully connected to LicensingClient\n"
+        f.write(header)
+        written += len(header)
+        while written < size_bytes:
+            picks = rng.choices(indices, cum_weights=cumulative_weights, k=BLOCK_LINES)
+            lines = [population[index] for index in picks]
+            block_size = sum(line_sizes[index] for index in picks)
+            # 이 블록 범위에 들어가는 에러 / 문구를 블록 안 임의 위치에 삽입
+            while inserts and inserts[0][0] < written + block_size:
+                _, line = inserts.pop(0)
+                lines.insert(rng.randrange(len(lines) + 1), line)
+                block_size += len(line.encode('utf-8'))
+            f.write("".join(lines))
+            written += block_size
+            line_count += len(lines)
+        footer = "Scripts have compiler errors.\nAborting batchmode due to failure:\nScripts have compiler errors.\n"
+        f.write(footer)
+        written += len(footer)
+    return {"path": log_file_path, "size": written, "lines": line_count, "errors": error_count}
+
+def create_benchmark_build_dir(root_dir, project_name="BenchmarkProject"):
+    """validate_build_output가 로그를 읽은 뒤 확인할 Build 폴더를 만듭니다 (빈 출력 파일)."""
+    build_dir = os.path.join(root_dir, project_name)
+    build_folder = os.path.join(build_dir, "Build")
+    os.makedirs(build_folder, exist_ok=True)
+    open(os.path.join(build_dir, "index.html"), 'w').close()
+    for suffix in (".loader.js", ".framework.js.br", ".wasm.br", ".data.br"):
+        open(os.path.join(build_folder, project_name + suffix), 'w').close()
+    return build_dir
+
+def estimate_read_memory_mb(size_bytes):
+    """로그 전체를 문자열로 읽을 때의 예상 메모리(MB)입니다.
+
+    이모지가 있으면 문자열이 문자당 4바이트(UCS-4)로 저장되고, 디코딩 중 원본 바이트와 버퍼도 함께 존재합니다
+    (100MB 로그 기준 측정값 약 6배).
+    """
+    return size_bytes * 6 / MB
+
+def validate_with_build_markers(log_file_path, build_dir, project_name):
+    """빌드 모니터처럼 로그를 청크 단위로 한 번 읽으며 성공 보고를 기록한 뒤 검증합니다."""
+    markers = {}
+    tailer = LogTailer(log_file_path, use_inotify=False)
+    try:
+        for line in tailer.read_lines():
+            update_build_markers(line, markers)
+    finally:
+        tailer.close()
+    validation = validate_build_output(build_dir, project_name, markers, None)
+    validation["bytes_scanned"] = tailer.bytes_read
+    return validation
+
+def get_benchmark_operations(log_file_path, build_dir):
+    """측정할 작업 목록을 반환합니다: [(이름, 함수, 로그 전체를 메모리로 읽는지 여부), ...]."""
+    project_name = os.path.basename(build_dir)
+    return [
+        ("update_build_markers + validate_build_output",
+         lambda: validate_with_build_markers(log_file_path, build_dir, project_name), False),
+        ("analyze_build_log", lambda: analyze_build_log(log_file_path), False),
+        ("analyze_build_log (에러 검색 없음)", lambda: analyze_build_log(log_file_path, search_errors=False), False),
+        ("read_log_tail", lambda: read_log_tail(log_file_path), False),
+    ]
+
+def run_log_benchmark(sizes_mb=None, error_count=DEFAULT_ERROR_COUNT, seed=1, work_dir=None, keep=False,
+                      trace_memory=True, output_path=None):
+    """로그 크기별로 합성 로그를 만들고 로그 처리 함수의 시간 / 메모리를 측정합니다.
+
+    Returns:
+        list: [{"size_mb", "operation", "seconds", "mb_per_second", "peak_heap_mb", "rss_delta_mb",
+                "errors_found", "skipped"}, ...]
+    """
+    sizes_mb = sizes_mb or DEFAULT_SIZES_MB
+    created_work_dir = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix="dannect_log_benchmark_")
+    os.makedirs(work_dir, exist_ok=True)
+    build_dir = create_benchmark_build_dir(os.path.join(work_dir, "Build"))
+
+    print(f"\n=== 빌드 로그 처리 벤치마크: {', '.join(f'{size}MB' for size in sizes_mb)} ===")
+    print(f"   작업 폴더: {work_dir} (컴파일 에러 {error_count}개, seed {seed})")
+
+    results = []
+    try:
+        for size_mb in sizes_mb:
+            size_bytes = size_mb * MB
+            log_file_path = os.path.join(work_dir, f"synthetic_{size_mb}MB_seed{seed}.log")
+            if shutil.disk_usage(work_dir).free < size_bytes * 1.1 and not os.path.exists(log_file_path):
+                print(f"   ⚠️ {size_mb}MB: 디스크 여유 공간 부족, 건너뜀")
+                continue
+            if os.path.exists(log_file_path) and os.path.getsize(log_file_path) >= size_bytes:
+                print(f"   ▶ {size_mb}MB 로그 재사용: {log_file_path}")
+            else:
+                print(f"   ▶ {size_mb}MB 로그 생성 중...")
+                (_, generation) = measure(generate_synthetic_log, log_file_path, size_bytes, error_count, seed)
+                print(f"     생성 완료 ({generation['seconds']:.1f}초)")
+
+            for name, func, reads_whole_log in get_benchmark_operations(log_file_path, build_dir):
+                result = {"size_mb": size_mb, "operation": name, "seconds": None, "mb_per_second": None,
+                          "peak_heap_mb": None, "rss_delta_mb": None, "errors_found": None, "skipped": None}
+                results.append(result)
+                memory_info = read_memory_info()
+                if reads_whole_log and memory_info and estimate_read_memory_mb(size_bytes) > memory_info[1] * 0.8:
+                    result["skipped"] = (f"예상 메모리 {estimate_read_memory_mb(size_bytes):.0f}MB > "
+                                         f"여유 메모리 {memory_info[1]:.0f}MB")
+                    print(f"     ⚠️ {name}: 건너뜀 ({result['skipped']})")
+                    continue
+
+                output, timing = measure(func)
+                result["seconds"] = timing["seconds"]
+                # 처리량: 실제로 읽은 양 기준 (read_log_tail처럼 끝부분만 읽는 작업은 제외)
+                scanned_bytes = size_bytes if reads_whole_log else None
+                if isinstance(output, dict) and output.get("bytes_scanned"):
+                    scanned_bytes = output["bytes_scanned"]
+                if scanned_bytes and timing["seconds"]:
+                    result["mb_per_second"] = round(scanned_bytes / MB / timing["seconds"], 1)
+                if timing["peak_memory_mb"] is not None and timing["start_memory_mb"] is not None:
+                    result["rss_delta_mb"] = round(timing["peak_memory_mb"] - timing["start_memory_mb"], 1)
+                if isinstance(output, dict) and output.get("error_count"):
+                    result["errors_found"] = output["error_count"]
+                if trace_memory:
+                    _, traced = measure(func, trace_memory=True)
+                    result["peak_heap_mb"] = traced["peak_heap_mb"]
+                print(f"     {name}: {timing['seconds']:.3f}초"
+                      + (f", 힙 최대 {result['peak_heap_mb']:.1f}MB" if result["peak_heap_mb"] is not None else ""))
+    finally:
+        if keep or not created_work_dir:
+            print(f"📁 작업 폴더 유지: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_log_benchmark_results(results)
+    path = save_benchmark_json("log_handling", {
+        "error_count": error_count,
+        "seed": seed,
+        "results": results
+    }, output_path)
+    if path:
+        print(f"\n💾 벤치마크 결과 저장: {path}")
+    return results
+
+def print_log_benchmark_results(results):
+    columns = [("로그 / 작업", 44), ("시간", 11), ("처리량", 12), ("힙 최대", 11), ("RSS 증가", 11), ("에러", 7)]
+    rows = []
+    for result in results:
+        label = f"{result['size_mb']}MB {result['operation']}"
+        if result["skipped"]:
+            rows.append([label, "건너뜀", None, None, None, None])
+            continue
+        rows.append([
+            label,
+            f"{result['seconds']:.3f}초",
+            f"{result['mb_per_second']:.0f}MB/s" if result["mb_per_second"] is not None else None,
+            f"{result['peak_heap_mb']:.1f}MB" if result["peak_heap_mb"] is not None else None,
+            f"{result['rss_delta_mb']:.0f}MB" if result["rss_delta_mb"] is not None else None,
+            result["errors_found"]
+        ])
+    print_table("빌드 로그 처리 벤치마크", columns, rows)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--help" in argv or "-h" in argv:
+        print(__doc__)
+        return
+    run_log_benchmark(
+        sizes_mb=parse_int_list(get_option_value(argv, "--sizes", "")) or None,
+        error_count=int(get_option_value(argv, "--errors", DEFAULT_ERROR_COUNT)),
+        seed=int(get_option_value(argv, "--seed", 1)),
+        work_dir=get_option_value(argv, "--work-dir"),
+        keep="--keep" in argv,
+        trace_memory="--no-trace" not in argv,
+        output_path=get_option_value(argv, "--output")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Unity 빌드 로그 증분 읽기 (tail -f)
+- Linux: inotify로 로그 파일 변경을 즉시 감지 (1초 미만 지연)
+- 그 외 플랫폼 / inotify 사용 불가: 짧은 주기 polling (파일 크기만 확인하므로 부담 없음)
+- 고정 크기 청크 단위로 읽고 줄 단위로 반환 (대량 출력도 한 번에 메모리에 올리지 않음)
+- 아직 줄바꿈이 없는 마지막 부분(partial line)은 다음 읽기까지 보관
+- 다른 스레드에서 wake()를 호출하면 대기 중인 wait_for_change가 즉시 반환 (빌드 종료 시 감시 스레드 정리)
+"""
+import os
+import sys
+import time
+import select
+import ctypes
+import threading
+import ctypes.util
+
+# 읽기 청크 크기 / 줄 최대 길이 (넘으면 잘라서 반환)
+CHUNK_SIZE = 64 * 1024
+MAX_LINE_BYTES = 64 * 1024
+
+# polling 주기 (초, inotify를 사용할 수 없을 때)
+POLL_INTERVAL = 0.5
+
+# inotify 이벤트 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_NONBLOCK = os.O_NONBLOCK if hasattr(os, "O_NONBLOCK") else 0
+IN_CLOEXEC = 0o2000000
+
+_libc = None
+
+
+def _get_libc():
+    """inotify 함수를 제공하는 libc를 반환합니다 (Linux가 아니거나 실패하면 None)."""
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            _libc = libc
+        except (OSError, AttributeError):
+            _libc = False
+    return _libc or None
+
+class LogTailer:
+    """로그 파일에 새로 추가된 줄을 증분으로 읽습니다.
+
+    사용 예:
+        tailer = LogTailer(log_file_path)
+        while running:
+            tailer.wait_for_change(1.0)
+            for line in tailer.read_lines():
+                ...
+        tailer.close()
+    """
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE, poll_interval=POLL_INTERVAL, use_inotify=True):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.position = 0
+        self.bytes_read = 0
+        self._partial = b""
+        self._inotify_fd = None
+        self._dir_watch = None
+        self._file_watch = None
+        self._wake_event = threading.Event()
+        self._wake_pipe = None  # (읽기 fd, 쓰기 fd) - inotify select 대기를 깨우는 용도
+        self._wake_lock = threading.Lock()  # wake()와 close()가 같은 fd를 쓰고 닫는 경쟁 방지
+        if use_inotify:
+            self._init_inotify()
+
+    @property
+    def uses_inotify(self):
+        return self._inotify_fd is not None
+
+    def fileno(self):
+        """inotify 파일 디스크립터를 반환합니다 (polling 모드이면 None).
+
+        asyncio 이벤트 루프에 등록할 수 있으며, 읽기 가능해지면 consume_events()를 호출합니다.
+        """
+        return self._inotify_fd
+
+    def consume_events(self):
+        """쌓인 inotify 이벤트를 비우고 로그 파일 감시를 갱신합니다 (이벤트 루프의 읽기 콜백용)."""
+        if self._inotify_fd is None:
+            return
+        try:
+            os.read(self._inotify_fd, 4096)  # 내용은 사용하지 않음
+        except BlockingIOError:
+            pass
+        except OSError:
+            # inotify 오류 시 polling으로 전환
+            self.close()
+            return
+        self._watch_file()
+
+    def _init_inotify(self):
+        libc = _get_libc()
+        if libc is None:
+            return
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+        self._inotify_fd = fd
+        try:
+            wake_pipe = os.pipe()
+            os.set_blocking(wake_pipe[1], False)  # 잠금을 잡은 채 쓰기에서 멈추지 않도록
+        except OSError:
+            wake_pipe = None
+        with self._wake_lock:
+            self._wake_pipe = wake_pipe
+        if not self._watch_file():
+            # 파일이 아직 없으면 디렉토리에서 생성 이벤트를 기다림
+            directory = os.path.dirname(os.path.abspath(self.path))
+            wd = libc.inotify_add_watch(fd, directory.encode(), IN_CREATE | IN_MOVED_TO)
+            if wd < 0:
+                self.close()
+                return
+            self._dir_watch = wd
+
+    def _watch_file(self):
+        """로그 파일 자체를 감시합니다 (파일이 있으면 True)."""
+        if self._inotify_fd is None or self._file_watch is not None:
+            return self._file_watch is not None
+        if not os.path.exists(self.path):
+            return False
+        libc = _get_libc()
+        wd = libc.inotify_add_watch(self._inotify_fd, self.path.encode(),
+                                    IN_MODIFY | IN_CLOSE_WRITE | IN_DELETE_SELF | IN_MOVE_SELF)
+        if wd < 0:
+            return False
+        self._file_watch = wd
+        if self._dir_watch is not None:
+            # 다른 빌드 로그 생성으로 깨어나지 않도록 디렉토리 감시 해제
+            libc.inotify_rm_watch(self._inotify_fd, self._dir_watch)
+            self._dir_watch = None
+        return True
+
+    def _has_new_data(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return False
+        return size != self.position
+
+    def wait_for_change(self, timeout):
+        """로그 파일이 바뀌거나 timeout(초)이 지날 때까지 대기합니다.
+
+        wake()가 호출된 뒤에는 대기하지 않고 바로 반환합니다.
+
+        Returns:
+            bool: 읽을 데이터가 있으면 True
+        """
+        if self._has_new_data():
+            return True
+        if self._wake_event.is_set():
+            return False
+
+        if self._inotify_fd is not None:
+            try:
+                with self._wake_lock:
+                    wake_fd = self._wake_pipe[0] if self._wake_pipe else None
+                watched = [self._inotify_fd] + ([wake_fd] if wake_fd is not None else [])
+                ready, _, _ = select.select(watched, [], [], timeout)
+                if self._inotify_fd in ready:
+                    os.read(self._inotify_fd, 4096)  # 이벤트 비우기 (내용은 사용하지 않음)
+                self._watch_file()
+            except (OSError, ValueError):
+                # inotify 오류 시 polling으로 전환
+                self.close()
+            return self._has_new_data()
+
+        deadline = time.time() + timeout
+        while True:
+            if self._has_new_data():
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            if self._wake_event.wait(min(self.poll_interval, remaining)):
+                return self._has_new_data()
+
+    def wake(self):
+        """대기 중인(이후의) wait_for_change를 즉시 반환시킵니다 (다른 스레드에서 호출 가능)."""
+        self._wake_event.set()
+        # close()가 fd를 닫은 뒤 같은 번호가 다른 파일에 재사용되면 엉뚱한 곳에 쓰게 되므로 잠금 안에서 씀
+        with self._wake_lock:
+            if self._wake_pipe is not None:
+                try:
+                    os.write(self._wake_pipe[1], b"\0")
+                except OSError:
+                    pass
+
+    def read_lines(self):
+        """새로 추가된 완전한 줄들을 청크 단위로 읽어 하나씩 반환합니다 (generator)."""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size < self.position:
+            # 파일이 잘리거나 새로 만들어지면 처음부터 다시 읽음
+            self.position = 0
+            self._partial = b""
+
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return
+
+        with f:
+            f.seek(self.position)
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+                self.position += len(chunk)
+                self.bytes_read += len(chunk)
+
+                data = self._partial + chunk
+                lines = data.split(b"\n")
+                self._partial = lines.pop()
+                if len(self._partial) > MAX_LINE_BYTES:
+                    # 줄바꿈 없이 너무 긴 출력은 잘라서 반환 (메모리 상한 유지)
+                    lines.append(self._partial)
+                    self._partial = b""
+
+                for line in lines:
+                    yield line.rstrip(b"\r").decode('utf-8', errors='replace')
+
+    def flush_partial(self):
+        """보관 중인 마지막 미완성 줄을 반환합니다 (프로세스 종료 후 사용)."""
+        line = self._partial
+        self._partial = b""
+        return line.rstrip(b"\r").decode('utf-8', errors='replace') if line else None
+
+    def close(self):
+        if self._inotify_fd is not None:
+            try:
+                os.close(self._inotify_fd)
+            except OSError:
+                pass
+            self._inotify_fd = None
+            self._dir_watch = None
+            self._file_watch = None
+        with self._wake_lock:
+            wake_pipe, self._wake_pipe = self._wake_pipe, None
+            if wake_pipe is not None:
+                for fd in wake_pipe:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
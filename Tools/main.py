@@ -4,11 +4,17 @@
 import os
 import sys
 from config import Config, WEBGL_CODE_OPTIMIZATION
-from git_utils import commit_changes, commit_and_push_changes, get_project_name_from_path
-from package_manager import add_git_packages_to_manifest
-from unity_cli import create_unity_batch_script, process_multiple_projects_parallel, process_unity_project_batch
+from git_utils import commit_changes, get_project_name_from_path
 from system_manager import add_methods_to_system_managers, add_hello_world_to_all_system_managers
-from build_manager import build_multiple_webgl_projects, clean_build_outputs
+from build_manager import clean_build_outputs
+from stage_pipeline import (
+    run_stage_pipeline, get_stage_results, parse_stage_list, parse_stage_workers, STAGE_NAMES, STAGE_ORDER
+)
+from build_metrics import print_regression_report
+from webgl_data_analyzer import analyze_fleet_data, DEFAULT_TOP_COUNT
+from optimization_benchmark import run_optimization_benchmark
+from wasm_analyzer import analyze_fleet_wasm, load_wasm_source, print_wasm_diff, DEFAULT_TOP_FUNCTIONS
+from build_trace import start_trace, save_trace, trace_span
 
 # 전역 변수 참조 (호환성 유지)
 project_dirs = Config.PROJECT_DIRS
@@ -32,10 +38,22 @@ def print_usage():
     print("  --unity-batch    Unity 배치 모드로 Editor 스크립트 실행 (40개 프로젝트 자동화)")
     print("  --parallel       Unity 배치 모드를 병렬로 실행 (빠른 처리, 메모리 사용량 증가)")
     print("  --build-webgl    Unity WebGL 빌드 자동화 (Player Settings 완전 반영)")
-    print("  --build-parallel WebGL 빌드를 병렬로 실행 (기본: 4개씩 동시 빌드)")
-    print("  --max-workers N  병렬 빌드 작업자 수 지정 (기본: 4, 권장: 3-5)")
+    print("  --build-parallel WebGL 빌드를 병렬로 실행 (호스트 여유 메모리/CPU에 따라 동시 빌드 수 조절)")
+    print("  --max-workers N  병렬 동시 실행 상한 지정 (기본: 호스트 CPU/메모리로 자동 계산)")
+    print("  --no-adaptive    여유 자원 확인 없이 --max-workers 개수만큼 고정 실행 (기본 4개)")
     print("  --build-only     WebGL 빌드만 실행 (Git 작업 및 패키지 추가 제외)")
     print("  --clean-builds   빌드 출력물 정리 (프로젝트별 폴더 삭제)")
+    print("  --pipeline       배치 처리 + WebGL 빌드를 프로젝트당 Unity 1회 실행으로 처리")
+    print("  --no-cache       빌드 캐시를 무시하고 모든 프로젝트를 다시 빌드")
+    print("  --cache-mode M   빌드 캐시 변경 감지 방식 (content: 파일 해시, git: HEAD + 작업 트리 상태)")
+    print("  --metrics-report 빌드 기록 DB로 빌드 시간 / Build 크기 회귀 보고서 출력")
+    print("  --analyze-data [N] 빌드된 .data 파일 구성 분석 (프로젝트별 / 전체 큰 파일 상위 N개, 기본 15개)")
+    print("  --analyze-wasm [N] 빌드된 .wasm 섹션/함수 크기 분석 및 이전 빌드와 비교 (큰 함수 상위 N개, 기본 20개)")
+    print("  --wasm-diff A B  두 빌드의 .wasm 비교 (.wasm(.br) 파일, 빌드 폴더 또는 Build/_Wasm 프로파일 JSON)")
+    print("  --benchmark-optimization [옵션,...] Code Optimization 옵션별로 빌드하여 빌드 시간 / 출력 크기 비교")
+    print("  --trace [파일]   실행 트레이스 저장 (Chrome Trace JSON, chrome://tracing / ui.perfetto.dev에서 열기)")
+    print("  --stages [단계,...] 프로젝트마다 package → batch → build → commit → push 중 지정한 단계를 순서대로 실행")
+    print("  --stage-workers 단계=N,... 단계별 동시 실행 상한 (예: build=2,commit=8)")
 
     print("  --add-system-methods SystemManager에 공통 메소드 추가 (AllowKeyboardInput 등)")
     print("  --add-hello-world    SystemManager에 Hello World 메소드 추가 및 Start() 호출 설정")
@@ -51,7 +69,7 @@ def print_usage():
     print("- Unity Editor를 배치 모드로 실행하여 Editor 스크립트 자동 실행")
     print("- 패키지 임포트 및 프로젝트 설정 검증 수행")
     print("- 40개 프로젝트를 순차적으로 자동 처리 (기본)")
-    print("- --parallel 옵션으로 병렬 처리 가능 (3개씩 동시 실행)")
+    print("- --parallel 옵션으로 병렬 처리 가능 (호스트 여유 자원에 따라 동시 실행 수 조절)")
     print("- Unity GUI 없이 백그라운드에서 실행")
     print("- Git 작업과 독립적으로 실행 (자동 커밋/푸시 없음)")
     print("")
@@ -65,10 +83,22 @@ def print_usage():
     print(f"- Code Optimization: {Config.WEBGL_CODE_OPTIMIZATION}")
     print("  (옵션: BuildTimes, RuntimeSpeed, RuntimeSpeedLTO, DiskSize, DiskSizeLTO)")
     print(f"- 빌드 출력: {BUILD_OUTPUT_DIR}\\프로젝트명\\ 폴더")
-    print("- --build-parallel로 병렬 빌드 가능 (기본: 4개씩 동시 빌드)")
-    print("- --max-workers N으로 병렬 작업자 수 조절 가능 (권장: 3-5)")
+    print("- --build-parallel로 병렬 빌드 가능 (여유 메모리/유휴 CPU가 빌드당 필요량보다 많을 때만 다음 빌드 시작)")
+    print("  빌드당 필요량은 이전 빌드의 Unity 최대 메모리/평균 CPU 측정값으로 학습 (Linux)")
+    print("- --max-workers N으로 동시 빌드 상한 지정 가능")
+    print(f"- 정지 감시: 로그 출력 없이 {Config.BUILD_STALL_TIMEOUT}초가 지나면 빌드 중단 (IL2CPP/C++/WASM 단계는 BUILD_STALL_PHASE_TIMEOUTS)")
     print("- 빌드 시간: 프로젝트당 5-15분 (WebGL 최적화 포함)")
     print("- 하나의 폴더에서 모든 프로젝트 빌드 결과 통합 관리")
+    print("- 빌드 캐시: 마지막 성공 빌드 이후 Assets/ProjectSettings/Packages/에디터 버전/빌드 옵션이")
+    print("  바뀌지 않은 프로젝트는 빌드 생략 (캐시 적중, --no-cache로 강제 빌드)")
+    print(f"- --cache-mode git: 마지막 성공 빌드의 HEAD 커밋과 git status 요약이 같으면 빌드 생략 (기본: {Config.BUILD_CACHE_MODE})")
+    print("")
+    print("단일 실행 파이프라인 (--pipeline):")
+    print("- 프로젝트마다 Unity를 한 번만 실행하여 작업을 순서대로 수행")
+    print(f"- 작업 순서: {' → '.join(Config.UNITY_PIPELINE_TASKS)} (config.py의 UNITY_PIPELINE_TASKS)")
+    print("- --unity-batch 후 --build-webgl을 따로 실행할 때보다 Unity 실행/Asset Database 갱신 횟수 절반")
+    print("- 작업별 결과(성공/실패/건너뜀, 소요 시간) 출력")
+    print("- Git 작업 및 패키지 추가 제외, --build-parallel과 함께 사용 가능")
     print("")
     print("WebGL 빌드 전용 모드 (--build-only):")
     print("- Git 작업(커밋, 푸시, 브랜치 변경) 완전 제외")
@@ -78,6 +108,30 @@ def print_usage():
     print("- 빌드 결과만 필요한 경우 최적화된 옵션")
     print("- --build-parallel과 함께 사용 가능")
     print("")
+    print("빌드 기록 / 회귀 보고서 (--metrics-report):")
+    print("- 모든 빌드 결과(커밋, 에디터 버전, 소요 시간, 단계별 시간, 출력 파일 크기, 종료 사유)를")
+    print("  Build/_Metrics/build_metrics.db (SQLite)에 자동 저장")
+    print(f"- 마지막 성공 빌드를 직전 성공 빌드 {Config.BUILD_REGRESSION_BASELINE_SIZE}회의 중앙값과 비교하여")
+    print(f"  빌드 시간 +{Config.BUILD_TIME_REGRESSION_THRESHOLD * 100:.0f}% / Build 크기 +{Config.BUILD_SIZE_REGRESSION_THRESHOLD * 100:.0f}% 이상 늘어난 프로젝트 표시")
+    print("")
+    print(".data 구성 분석 (--analyze-data):")
+    print("- 빌드 출력의 Build/*.data.br (.gz) 압축을 풀어 UnityWebData에 포함된 파일과 크기 목록 출력")
+    print("- data.unity3d 번들 안의 씬(level), sharedassets, resources, 스트리밍 텍스처/오디오 파일까지 표시")
+    print("- 프로젝트별 분류 합계와 큰 파일 순위, 전체 프로젝트 큰 파일 순위 출력 (.br은 brotli 패키지 필요)")
+    print("")
+    print(".wasm 크기 분석 (--analyze-wasm / --wasm-diff):")
+    print("- Build/*.wasm.br (.gz) 압축을 풀어 섹션별 크기(code, data, name 등), 함수 / import / export 수 출력")
+    print("- name 섹션이 있으면 (Debug Symbols) 가장 큰 함수를 이름으로 표시")
+    print("- 분석 결과를 Build/_Wasm/프로젝트명.json에 저장하고 새 빌드가 있으면 이전 빌드와 섹션 / 함수별 크기 비교")
+    print("- Code Optimization, Stripping Level, 패키지 버전 변경 전후 비교에 사용")
+    print("")
+    print("Code Optimization 벤치마크 (--benchmark-optimization):")
+    print("- 프로젝트마다 옵션별로 순차 빌드하여 빌드 시간, 단계별 시간, 압축된 .wasm/.data/.framework.js 크기,")
+    print("  wasm code 섹션 크기와 함수 수를 비교 표로 출력 (결과: Build/_Benchmarks/code_optimization_<시각>.json)")
+    print(f"- 대상: OPTIMIZATION_BENCHMARK_PROJECTS (비어 있으면 전체), 옵션: {', '.join(Config.OPTIMIZATION_BENCHMARK_MODES)}")
+    print("- 옵션을 지정하려면 쉼표로 구분 (예: --benchmark-optimization RuntimeSpeed,DiskSizeLTO)")
+    print(f"- 현재 설정({Config.WEBGL_CODE_OPTIMIZATION})을 마지막에 빌드하여 Build 폴더와 빌드 캐시를 설정과 일치시킴")
+    print("")
     print("SystemManager 메소드 추가 (--add-system-methods):")
     print("- 모든 프로젝트의 SystemManager.cs 파일을 자동 탐색")
     print("- 클래스의 마지막 부분(닫는 중괄호 직전)에 메소드 추가")
@@ -96,6 +150,15 @@ def print_usage():
     print("- 들여쓰기 패턴 자동 분석하여 코드 스타일 유지")
     print("- 변경사항이 있으면 자동으로 Git 커밋 (푸시 제외)")
     print("")
+    print("프로젝트별 단계 실행 (--stages):")
+    print("- 모든 작업은 프로젝트마다 package → batch → build → commit → push 순서로 독립적으로 진행")
+    print("  (한 단계를 모든 프로젝트에서 끝낼 때까지 기다리지 않으므로 Git 작업과 Unity 빌드가 겹쳐 실행)")
+    print("- 다른 옵션(--git-push, --unity-batch, --build-webgl 등)은 실행할 단계를 정하고, --stages는 단계를 직접 지정")
+    print("  (단계 생략 시 전체: --stages, 일부: --stages package,build,commit)")
+    print(f"- 단계별 동시 실행 상한: {Config.PIPELINE_STAGE_WORKERS} (None: 호스트 CPU/메모리로 계산)")
+    print("  --stage-workers build=2,commit=8로 변경, --max-workers는 Unity 실행(batch + build) 합계 상한")
+    print("- 앞 단계가 실패한 프로젝트는 다음 단계를 건너뜀 (빌드 캐시 적중은 성공)")
+    print("")
     print("Git 브랜치 전략:")
     print("- 브랜치 계층구조에서 가장 깊은(아래) 브랜치를 우선 사용")
     print("- 커밋 수가 많고 최근에 작업된 브랜치 선택")
@@ -127,28 +190,102 @@ def main():
     build_parallel = "--build-parallel" in sys.argv
     build_only = "--build-only" in sys.argv
     clean_builds = "--clean-builds" in sys.argv
+    pipeline = "--pipeline" in sys.argv
+    no_cache = "--no-cache" in sys.argv
 
     add_system_methods = "--add-system-methods" in sys.argv
     add_hello_world = "--add-hello-world" in sys.argv
+    metrics_report = "--metrics-report" in sys.argv
+    analyze_data = "--analyze-data" in sys.argv
+    analyze_wasm = "--analyze-wasm" in sys.argv
+    benchmark_optimization = "--benchmark-optimization" in sys.argv
+    
+    # 벤치마크할 Code Optimization 옵션 (--benchmark-optimization [옵션,옵션], 기본값 OPTIMIZATION_BENCHMARK_MODES)
+    benchmark_modes = None
+    for i, arg in enumerate(sys.argv):
+        if arg == "--benchmark-optimization" and i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith("--"):
+            benchmark_modes = [mode.strip() for mode in sys.argv[i + 1].split(",") if mode.strip()]
+    
+    # wasm 비교 대상 (--wasm-diff 이전 현재)
+    wasm_diff = None
+    for i, arg in enumerate(sys.argv):
+        if arg == "--wasm-diff":
+            if i + 2 < len(sys.argv):
+                wasm_diff = (sys.argv[i + 1], sys.argv[i + 2])
+            else:
+                print("⚠️ --wasm-diff에는 비교할 대상 두 개가 필요합니다 (이전 현재)")
+                return
     
-    # max_workers 파싱 (기본값: 4)
-    max_workers = 4
+    # max_workers 파싱 (동시 실행 상한, 기본값: 호스트 CPU/메모리로 자동 계산)
+    max_workers = None
     for i, arg in enumerate(sys.argv):
         if arg == "--max-workers" and i + 1 < len(sys.argv):
             try:
                 max_workers = int(sys.argv[i + 1])
                 if max_workers < 1:
-                    print("⚠️ max_workers는 1 이상이어야 합니다. 기본값 4 사용")
-                    max_workers = 4
-                elif max_workers > 8:
-                    print("⚠️ max_workers가 8을 초과하면 시스템 리소스 부족 위험. 8로 제한")
-                    max_workers = 8
+                    print("⚠️ max_workers는 1 이상이어야 합니다. 자동 계산 사용")
+                    max_workers = None
             except ValueError:
-                print("⚠️ max_workers 값이 유효하지 않습니다. 기본값 4 사용")
-                max_workers = 4
+                print("⚠️ max_workers 값이 유효하지 않습니다. 자동 계산 사용")
+                max_workers = None
+    
+    # 적응형 동시 실행 (호스트 여유 메모리/유휴 CPU에 따라 작업 시작 조절)
+    adaptive = Config.ADAPTIVE_CONCURRENCY and "--no-adaptive" not in sys.argv
+    
+    # cache_mode 파싱 (기본값: Config.BUILD_CACHE_MODE)
+    cache_mode = Config.BUILD_CACHE_MODE
+    for i, arg in enumerate(sys.argv):
+        if arg == "--cache-mode" and i + 1 < len(sys.argv):
+            if sys.argv[i + 1] in ("content", "git"):
+                cache_mode = sys.argv[i + 1]
+            else:
+                print(f"⚠️ cache_mode 값이 유효하지 않습니다: {sys.argv[i + 1]}. 기본값 {cache_mode} 사용")
+    
+    # 실행할 단계 (--stages [단계,...], 생략하면 다른 옵션에 따라 결정) / 단계별 동시 실행 상한 (--stage-workers 단계=N,...)
+    stages = None
+    stage_workers = {}
+    for i, arg in enumerate(sys.argv):
+        if arg == "--stages":
+            if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith("--"):
+                stages = parse_stage_list(sys.argv[i + 1])
+            else:
+                stages = list(STAGE_ORDER)
+        elif arg == "--stage-workers" and i + 1 < len(sys.argv):
+            stage_workers = parse_stage_workers(sys.argv[i + 1])
+    
+    # .data 분석 순위 개수 (--analyze-data [N])
+    data_top_count = DEFAULT_TOP_COUNT
+    for i, arg in enumerate(sys.argv):
+        if arg == "--analyze-data" and i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit():
+            data_top_count = max(1, int(sys.argv[i + 1]))
+    
+    # wasm 큰 함수 출력 개수 (--analyze-wasm [N])
+    wasm_top_count = DEFAULT_TOP_FUNCTIONS
+    for i, arg in enumerate(sys.argv):
+        if arg == "--analyze-wasm" and i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit():
+            wasm_top_count = max(1, int(sys.argv[i + 1]))
+    
+    # 실행 트레이스 (--trace [파일], 기본 경로: BUILD_OUTPUT_DIR/_Traces/build_trace_<시각>.json)
+    trace_path = None
+    trace_enabled = Config.BUILD_TRACE_ENABLED
+    for i, arg in enumerate(sys.argv):
+        if arg == "--trace":
+            trace_enabled = True
+            if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith("--"):
+                trace_path = sys.argv[i + 1]
+    if trace_enabled:
+        trace_path = start_trace(trace_path)
+        print(f"📈 실행 트레이스 기록: {trace_path}")
     
     # 옵션에 따른 모드 설정
-    if build_only:
+    if stages is not None:
+        print(f"🔗 지정한 단계를 프로젝트마다 순서대로 실행합니다: {' → '.join(stages) or '없음'}\n")
+    elif pipeline:
+        print("🔗 단일 실행 파이프라인: 배치 처리 + WebGL 빌드 (Git 작업 및 패키지 추가 제외)\n")
+        build_only = True
+        build_webgl = True
+        unity_batch = False
+    elif build_only:
         print("📦 WebGL 빌드만 실행합니다 (Git 작업 및 패키지 추가 제외)\n")
         build_webgl = True
     elif package_only:
@@ -161,6 +298,14 @@ def main():
         print("⚙️ Unity 배치 모드만 실행합니다\n")
     elif clean_builds:
         print("🧹 빌드 출력물 정리만 실행합니다\n")
+    elif metrics_report:
+        print("📈 빌드 회귀 보고서만 출력합니다\n")
+    elif analyze_data:
+        print("🔬 빌드된 .data 파일 구성 분석만 실행합니다\n")
+    elif benchmark_optimization:
+        print("🏁 Code Optimization 벤치마크만 실행합니다 (옵션별 WebGL 빌드)\n")
+    elif analyze_wasm or wasm_diff:
+        print("🧬 빌드된 .wasm 크기 분석만 실행합니다\n")
     elif not (add_system_methods or add_hello_world):
         print("📦 기본 모드: 패키지 추가만 실행합니다\n")
     
@@ -194,98 +339,79 @@ def main():
             print("ℹ️ 변경사항이 없어 Git 커밋을 생략합니다")
         return
     
-    # 패키지 추가 (git_push나 git_commit이 아닌 경우에만 실행)
-    if not git_push and not git_commit and not build_only and not unity_batch and not clean_builds:
-        print("\n📦 Unity 패키지 추가 작업 시작...")
-        for project_dir in project_dirs:
-            project_name = get_project_name_from_path(project_dir)
-            print(f"\n📦 {project_name} 패키지 추가 중...")
-            add_git_packages_to_manifest(project_dir, git_packages)
-
-    # Git 커밋 및 푸시 (git_push인 경우에만 실행)
-    if git_push:
-        print("\n🔀 Git 커밋 및 푸시 작업 시작...")
-        
-        commit_message_type = "package_update"
-        print(f"📝 커밋 메시지 타입: {commit_message_type}")
-        
-        for project_dir in project_dirs:
-            if os.path.exists(project_dir):
-                commit_and_push_changes(project_dir, commit_message_type)
-            else:
-                print(f"⚠️ 프로젝트 폴더 없음: {project_dir}")
+    # 빌드 회귀 보고서만 출력하는 경우 (빌드 기록 DB의 최근 성공 빌드를 기준선과 비교)
+    if metrics_report:
+        print_regression_report([get_project_name_from_path(project_dir) for project_dir in project_dirs])
+        return
     
-    # Git 커밋만 (git_commit인 경우에만 실행)
-    if git_commit:
-        print("\n💾 Git 커밋 작업 시작 (푸시 제외)...")
-        
-        commit_message_type = "package_update"
-        print(f"📝 커밋 메시지 타입: {commit_message_type}")
-        
-        for project_dir in project_dirs:
-            if os.path.exists(project_dir):
-                commit_changes(project_dir, commit_message_type)
-            else:
-                print(f"⚠️ 프로젝트 폴더 없음: {project_dir}")
-
-    # Unity 배치 모드 실행 (unity-batch인 경우에만 실행)
-    if unity_batch:
-        print("\n⚙️ Unity 배치 모드 실행 시작...")
-        print(f"📊 총 {len(project_dirs)}개 프로젝트 처리 예정")
-        
-        # 모든 프로젝트에 배치 스크립트 생성
-        print("📝 배치 스크립트 생성 중...")
-        for project_dir in project_dirs:
-            if os.path.exists(project_dir):
-                create_unity_batch_script(project_dir)
-        
-        if parallel:
-            # 병렬 처리
-            print("⚡ 병렬 처리 모드로 실행합니다 (최대 3개 동시 실행)")
-            process_multiple_projects_parallel(project_dirs, max_workers=3)
-        else:
-            # 순차 처리 (기본)
-            print("📋 순차 처리 모드로 실행합니다")
-            success_count = 0
-            fail_count = 0
-            
-            for i, project_dir in enumerate(project_dirs, 1):
-                project_name = get_project_name_from_path(project_dir)
-                print(f"\n[{i}/{len(project_dirs)}] {project_name} 처리 중...")
-                
-                if not os.path.exists(project_dir):
-                    print(f"⚠️ 프로젝트 폴더 없음: {project_dir}")
-                    fail_count += 1
-                    continue
-                
-                # Unity 배치 모드 실행
-                if process_unity_project_batch(project_dir):
-                    success_count += 1
-                    print(f"✅ {project_name} 처리 완료")
-                else:
-                    fail_count += 1
-                    print(f"❌ {project_name} 처리 실패")
-            
-            print(f"\n=== Unity 배치 모드 결과 ===")
-            print(f"✅ 성공: {success_count}개")
-            print(f"❌ 실패: {fail_count}개")
-            print(f"📊 총 처리: {success_count + fail_count}개")
+    # .data 파일 구성 분석만 실행하는 경우 (BUILD_OUTPUT_DIR/프로젝트명/Build/*.data.br)
+    if analyze_data:
+        analyze_fleet_data([get_project_name_from_path(project_dir) for project_dir in project_dirs], data_top_count)
+        return
+    
+    # Code Optimization 옵션별 빌드 비교만 실행하는 경우
+    if benchmark_optimization:
+        with trace_span("Code Optimization 벤치마크", "stage"):
+            run_optimization_benchmark(project_dirs, benchmark_modes)
+        return
+    
+    # 두 빌드의 .wasm 비교만 실행하는 경우
+    if wasm_diff:
+        old_wasm = load_wasm_source(wasm_diff[0])
+        new_wasm = load_wasm_source(wasm_diff[1])
+        if old_wasm and new_wasm:
+            print_wasm_diff(old_wasm, new_wasm, wasm_top_count)
+        return
     
-    # 빌드 출력물 정리 (clean-builds인 경우에만 실행)
+    # .wasm 크기 분석만 실행하는 경우 (이전 빌드 프로파일이 있으면 비교)
+    if analyze_wasm:
+        analyze_fleet_wasm([get_project_name_from_path(project_dir) for project_dir in project_dirs], wasm_top_count)
+        return
+    
+    # 빌드 출력물 정리 (clean-builds인 경우에만 실행, 빌드 단계보다 먼저)
     if clean_builds:
         print("\n🧹 빌드 출력물 정리 작업 시작...")
-        clean_build_outputs(project_dirs)
+        with trace_span("빌드 출력물 정리", "stage"):
+            clean_build_outputs(project_dirs)
     
-    # Unity WebGL 프로젝트 빌드 (build-webgl인 경우에만 실행)
-    if build_webgl:
-        print(f"\n🌐 Unity WebGL 프로젝트 빌드 시작...")
-        print(f"📊 총 {len(project_dirs)}개 프로젝트 빌드 예정")
-        
+    # 실행할 단계 결정 (--stages로 지정하지 않으면 옵션에 따라 결정)
+    if stages is None:
+        stages = []
+        # 패키지 추가 (git_push나 git_commit이 아닌 경우에만 실행)
+        if not git_push and not git_commit and not build_only and not unity_batch and not clean_builds:
+            stages.append("package")
+        if unity_batch:
+            stages.append("batch")
+        if build_webgl:
+            stages.append("build")
+        if git_push or git_commit:
+            stages.append("commit")
+        if git_push:
+            stages.append("push")
+        # Unity 단계는 --parallel / --build-parallel일 때만 동시 실행 (None이면 호스트 기준 자동), 그 외에는 순차
+        stage_workers.setdefault("batch", max_workers if parallel else 1)
+        stage_workers.setdefault("build", max_workers if build_parallel else 1)
+    
+    if not stages:
+        print("\n✨ 모든 작업 완료")
+        return
+    
+    print(f"\n🔗 프로젝트별 단계 실행: {' → '.join(STAGE_NAMES[stage] for stage in stages)}")
+    print(f"📊 총 {len(project_dirs)}개 프로젝트 (프로젝트마다 앞 단계가 끝나면 바로 다음 단계 진행)")
+    if "commit" in stages:
+        print(f"📝 커밋 메시지 타입: package_update")
+    if "batch" in stages:
+        print(f"📝 배치 작업: {', '.join(Config.UNITY_BATCH_TASKS)} (패키지 BatchProcessor 사용)")
+    
+    if "build" in stages:
         # 병렬 빌드 설정 표시
-        if build_parallel:
-            print(f"⚡ 병렬 빌드 모드: {max_workers}개 동시 실행")
-        else:
+        if stage_workers.get("build") == 1:
             print(f"📋 순차 빌드 모드")
+        elif adaptive:
+            limit_text = f"최대 {stage_workers['build']}개" if stage_workers.get("build") else "최대 작업자 수 자동"
+            print(f"⚡ 병렬 빌드 모드: {limit_text}, 호스트 여유 메모리/CPU에 따라 동시 실행 수 조절")
+        else:
+            print(f"⚡ 병렬 빌드 모드: {stage_workers.get('build') or 4}개 동시 실행")
         
         # Code Optimization 설정 표시
         if WEBGL_CODE_OPTIMIZATION == "RuntimeSpeedLTO":
@@ -300,13 +426,24 @@ def main():
             print(f"⚡ Code Optimization: Disk Size with LTO (최소 크기, LTO 적용)")
         else:
             print(f"⚡ Code Optimization: {WEBGL_CODE_OPTIMIZATION}")
-        
-        # WebGL 빌드 실행
-        build_results, total_build_time = build_multiple_webgl_projects(
-            project_dirs, 
-            parallel=build_parallel,
-            max_workers=max_workers if build_parallel else 1
+    
+    # 프로젝트마다 단계를 독립적으로 진행 (--pipeline이면 빌드 단계에서 배치 처리까지 Unity 1회 실행으로 처리)
+    with trace_span("프로젝트별 단계 파이프라인", "stage", args={"stages": stages}):
+        pipeline_result = run_stage_pipeline(
+            project_dirs,
+            stages,
+            stage_workers=stage_workers,
+            unity_workers=max_workers,
+            adaptive=adaptive,
+            tasks=Config.UNITY_PIPELINE_TASKS if pipeline else None,
+            use_cache=Config.BUILD_CACHE_ENABLED and not no_cache,
+            cache_mode=cache_mode,
+            commit_message_type="package_update"
         )
+    
+    if "build" in stages:
+        build_results = get_stage_results(pipeline_result, "build")
+        total_build_time = pipeline_result["wall_seconds"]
         
         # 빌드 결과 요약
         success_builds = sum(1 for _, success, _ in build_results if success)
@@ -321,7 +458,7 @@ def main():
         print(f"✅ 성공: {success_builds}개")
         print(f"❌ 실패: {fail_builds}개")
         print(f"📊 총 빌드: {len(build_results)}개")
-        print(f"⏱️ 전체 빌드 소요 시간: {total_time_str}")
+        print(f"⏱️ 전체 소요 시간: {total_time_str}")
         
         if success_builds > 0:
             print(f"\n✅ WebGL 빌드 완료된 프로젝트:")
@@ -343,7 +480,16 @@ def main():
     
     print("\n✨ 모든 작업 완료")
 
+def finish_trace():
+    """실행 트레이스를 저장하고 경로를 출력합니다 (--trace 사용 시, 중단/오류 시에도 저장)."""
+    saved_path = save_trace()
+    if saved_path:
+        print(f"📈 실행 트레이스 저장: {saved_path} (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)")
+
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        finish_trace()
 
 # endregion 
\ No newline at end of file
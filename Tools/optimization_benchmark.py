@@ -0,0 +1,216 @@
+"""
+WebGL Code Optimization 비교 벤치마크
+- 선택한 프로젝트를 WasmCodeOptimization 옵션(BuildTimes, RuntimeSpeed, RuntimeSpeedLTO, DiskSize, DiskSizeLTO)
+  마다 한 번씩 순차 빌드하여 빌드 시간, 단계별 시간, 압축된 출력 파일 크기, wasm 섹션 크기를 기록
+- 프로젝트별 비교 표와 전체 프로젝트 평균(설정된 WEBGL_CODE_OPTIMIZATION 대비 비율)을 출력
+- 결과는 BUILD_OUTPUT_DIR/_Benchmarks/code_optimization_<시각>.json에 저장
+- 설정된 옵션을 마지막에 빌드하여 벤치마크 후 Build 폴더와 빌드 캐시가 설정과 일치하도록 유지
+"""
+import os
+from config import Config
+from git_utils import get_project_name_from_path
+from build_manager import run_traced_webgl_build, WEBGL_CODE_OPTIMIZATION_OPTIONS
+from build_metrics import get_build_output_files
+from build_report import REQUIRED_BUILD_FILES, is_build_file_kind, format_size, format_duration
+from build_phases import PHASE_ORDER, get_phase_name
+from wasm_analyzer import analyze_wasm_file, find_wasm_file
+from benchmark_utils import save_benchmark_json
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+WEBGL_CODE_OPTIMIZATION = Config.WEBGL_CODE_OPTIMIZATION
+OPTIMIZATION_BENCHMARK_PROJECTS = Config.OPTIMIZATION_BENCHMARK_PROJECTS
+OPTIMIZATION_BENCHMARK_MODES = Config.OPTIMIZATION_BENCHMARK_MODES
+
+
+def get_benchmark_modes(modes=None):
+    """비교할 옵션 목록을 반환합니다 (잘못된 옵션 제외, 설정된 옵션은 마지막 순서)."""
+    if modes is None:
+        modes = OPTIMIZATION_BENCHMARK_MODES
+    valid_modes = []
+    for mode in modes:
+        if mode not in WEBGL_CODE_OPTIMIZATION_OPTIONS:
+            print(f"⚠️ 잘못된 Code Optimization 옵션은 제외합니다: {mode}")
+        elif mode not in valid_modes:
+            valid_modes.append(mode)
+    # 설정된 옵션을 마지막에 빌드해야 벤치마크 후 출력물이 설정과 같음
+    if WEBGL_CODE_OPTIMIZATION in valid_modes:
+        valid_modes.remove(WEBGL_CODE_OPTIMIZATION)
+        valid_modes.append(WEBGL_CODE_OPTIMIZATION)
+    return valid_modes
+
+def get_benchmark_projects(project_dirs):
+    """OPTIMIZATION_BENCHMARK_PROJECTS에 지정된 프로젝트만 반환합니다 (비어 있으면 전체)."""
+    if not OPTIMIZATION_BENCHMARK_PROJECTS:
+        return list(project_dirs)
+    return [project_dir for project_dir in project_dirs
+            if get_project_name_from_path(project_dir) in OPTIMIZATION_BENCHMARK_PROJECTS]
+
+def collect_benchmark_result(project_name, mode, success, elapsed_time, build_info):
+    """빌드 한 번의 벤치마크 결과를 수집합니다 (출력 파일 크기, wasm 섹션 크기, 단계별 시간)."""
+    result = {
+        "project": project_name,
+        "mode": mode,
+        "success": success,
+        "exit_reason": build_info.get("exit_reason"),
+        "duration": round(elapsed_time, 2),
+        "phases": (build_info.get("phases") or {}).get("totals", {}),
+        "files": {},
+        "total_size": None,
+        "wasm": None
+    }
+    # 크기 예산 초과로 실패 처리된 빌드도 출력물은 정상이므로 크기를 기록
+    if not success and result["exit_reason"] != "budget_exceeded":
+        return result
+
+    build_dir = os.path.join(BUILD_OUTPUT_DIR, project_name)
+    files = get_build_output_files(build_dir, build_info.get("report"))
+    result["total_size"] = sum(size for _, size in files)
+    for label, extension in REQUIRED_BUILD_FILES:
+        sizes = [size for name, size in files if is_build_file_kind(name, extension)]
+        if sizes:
+            result["files"][label] = sum(sizes)
+
+    wasm_file_path = find_wasm_file(build_dir)
+    if wasm_file_path:
+        try:
+            wasm = analyze_wasm_file(wasm_file_path)
+            result["wasm"] = {
+                "size": wasm["size"],
+                "code_size": wasm["code_size"],
+                "data_size": wasm["data_size"],
+                "functions": wasm["functions"]
+            }
+        except Exception as e:
+            print(f"   ⚠️ wasm 분석 실패 ({mode}): {e}")
+    return result
+
+def save_benchmark_results(results):
+    """벤치마크 결과를 JSON으로 저장합니다.
+
+    Returns:
+        str: 저장 경로 (실패 시 None)
+    """
+    return save_benchmark_json("code_optimization", {
+        "configured_mode": WEBGL_CODE_OPTIMIZATION,
+        "results": results
+    })
+
+def print_benchmark_table(project_name, results):
+    """프로젝트 하나의 옵션별 비교 표를 출력합니다."""
+    print(f"\n📊 {project_name} Code Optimization 비교")
+    header = f"   {'옵션':<16}{'빌드 시간':>10}{'WebAssembly':>13}{'Data':>11}{'Framework':>11}{'Build 전체':>12}{'code 섹션':>12}{'함수 수':>9}"
+    print(header)
+    print("   " + "-" * (len(header) - 3))
+    for result in results:
+        marker = " *" if result["mode"] == WEBGL_CODE_OPTIMIZATION else ""
+        mode_text = f"{result['mode']}{marker}"
+        if not result["files"]:
+            print(f"   {mode_text:<16}{format_duration(result['duration']):>10}  ❌ 빌드 실패 ({result['exit_reason']})")
+            continue
+        wasm = result["wasm"] or {}
+        functions = f"{wasm['functions']:,}" if wasm else "-"
+        print(f"   {mode_text:<16}{format_duration(result['duration']):>10}"
+              f"{format_size(result['files'].get('WebAssembly')):>13}"
+              f"{format_size(result['files'].get('Data file')):>11}"
+              f"{format_size(result['files'].get('Framework')):>11}"
+              f"{format_size(result['total_size']):>12}"
+              f"{format_size(wasm.get('code_size')):>12}"
+              f"{functions:>9}")
+
+    built = [result for result in results if result["files"]]
+    if built:
+        fastest = min(built, key=lambda item: item["duration"])
+        smallest = min(built, key=lambda item: item["files"].get("WebAssembly", item["total_size"]))
+        print(f"   ⚡ 빌드가 가장 빠른 옵션: {fastest['mode']} ({format_duration(fastest['duration'])}), "
+              f"📦 WebAssembly가 가장 작은 옵션: {smallest['mode']} "
+              f"({format_size(smallest['files'].get('WebAssembly'))})")
+
+    # IL2CPP / C++ 컴파일 / WASM 링크 단계가 옵션에 따라 가장 크게 달라짐
+    phase_ids = [phase_id for phase_id in PHASE_ORDER if any(phase_id in result["phases"] for result in built)]
+    if phase_ids:
+        print("   단계별 시간: " + ", ".join(get_phase_name(phase_id) for phase_id in phase_ids))
+        for result in built:
+            phase_text = " / ".join(format_duration(result["phases"].get(phase_id, 0)) for phase_id in phase_ids)
+            print(f"      {result['mode']:<16}{phase_text}")
+    print(f"   (* 현재 설정 WEBGL_CODE_OPTIMIZATION)")
+
+def print_benchmark_summary(results):
+    """전체 프로젝트 평균을 출력합니다 (설정된 옵션 대비 빌드 시간 / WebAssembly / Build 전체 크기 비율)."""
+    by_project = {}
+    for result in results:
+        if result["files"]:
+            by_project.setdefault(result["project"], {})[result["mode"]] = result
+
+    ratios = {}
+    for project_results in by_project.values():
+        baseline = project_results.get(WEBGL_CODE_OPTIMIZATION)
+        if not baseline:
+            continue
+        for mode, result in project_results.items():
+            mode_ratios = ratios.setdefault(mode, {"duration": [], "wasm": [], "total": []})
+            if baseline["duration"]:
+                mode_ratios["duration"].append(result["duration"] / baseline["duration"])
+            if baseline["files"].get("WebAssembly") and result["files"].get("WebAssembly"):
+                mode_ratios["wasm"].append(result["files"]["WebAssembly"] / baseline["files"]["WebAssembly"])
+            if baseline["total_size"]:
+                mode_ratios["total"].append(result["total_size"] / baseline["total_size"])
+
+    if len(by_project) < 2 or not ratios:
+        return
+
+    def average(values):
+        return f"{sum(values) / len(values) * 100:6.1f}%" if values else "     -"
+
+    print("\n" + "="*80)
+    print(f"📊 전체 프로젝트 평균 ({len(by_project)}개, {WEBGL_CODE_OPTIMIZATION} = 100%)")
+    print("="*80)
+    print(f"   {'옵션':<16}{'빌드 시간':>10}{'WebAssembly':>13}{'Build 전체':>12}")
+    for mode in WEBGL_CODE_OPTIMIZATION_OPTIONS:
+        if mode in ratios:
+            mode_ratios = ratios[mode]
+            print(f"   {mode:<16}{average(mode_ratios['duration']):>10}{average(mode_ratios['wasm']):>13}{average(mode_ratios['total']):>12}")
+    print("="*80)
+
+def run_optimization_benchmark(project_dirs, modes=None):
+    """프로젝트마다 Code Optimization 옵션별로 빌드하여 비교합니다 (빌드 시간 비교를 위해 순차 빌드).
+
+    Args:
+        project_dirs: 빌드할 프로젝트 경로 목록 (OPTIMIZATION_BENCHMARK_PROJECTS로 한 번 더 필터링)
+        modes: 비교할 옵션 목록 (기본값 OPTIMIZATION_BENCHMARK_MODES)
+
+    Returns:
+        list: 빌드별 결과 [{"project", "mode", "success", "exit_reason", "duration", "phases",
+              "files", "total_size", "wasm"}, ...]
+    """
+    modes = get_benchmark_modes(modes)
+    project_dirs = [project_dir for project_dir in get_benchmark_projects(project_dirs) if os.path.exists(project_dir)]
+    if not modes or not project_dirs:
+        print("ℹ️ 벤치마크할 프로젝트 또는 옵션이 없습니다")
+        return []
+
+    print(f"\n=== Code Optimization 벤치마크: {len(project_dirs)}개 프로젝트 × {len(modes)}개 옵션 ===")
+    print(f"   옵션 순서: {' → '.join(modes)}")
+
+    results = []
+    try:
+        for project_dir in project_dirs:
+            project_name = get_project_name_from_path(project_dir)
+            project_results = []
+            for mode in modes:
+                print(f"\n--- {project_name} WebGL 빌드 ({mode}) ---")
+                build_info = {}
+                success, elapsed_time = run_traced_webgl_build(project_dir, code_optimization=mode, build_info=build_info)
+                result = collect_benchmark_result(project_name, mode, success, elapsed_time, build_info)
+                project_results.append(result)
+                results.append(result)
+            print_benchmark_table(project_name, project_results)
+    finally:
+        # Ctrl+C로 중단되어도 그때까지의 결과는 저장
+        if results:
+            path = save_benchmark_results(results)
+            if path:
+                print(f"\n💾 벤치마크 결과 저장: {path}")
+
+    print_benchmark_summary(results)
+    return results
@@ -0,0 +1,306 @@
+"""
+오케스트레이션 벤치마크 (가짜 Unity로 빌드 관리 코드 자체의 비용 측정)
+- fake_unity 실행 스크립트를 UNITY_EDITOR_PATH로, 임시 폴더를 BUILD_OUTPUT_DIR로 지정하고
+  build_multiple_webgl_projects를 실제와 같은 경로(프로세스 그룹 실행, 로그 감시, 정지 감시, 결과 검증,
+  빌드 기록 DB / 캐시 / 기록 저장)로 실행
+- 측정 항목:
+  - 오버헤드: 전체 시간 - 이상적인 시간(ceil(프로젝트 수 / 작업자 수) × 가짜 빌드 시간),
+    빌드당 실행/종료 비용(빌드 소요 시간 - 가짜 Unity 실행 시간, Python 인터프리터 시작 포함)
+  - 모니터 지연: 가짜 Unity가 단계 전환 줄을 쓴 시각 → 모니터가 phase_transitions에 기록한 시각
+  - 실패 감지 지연: 컴파일 에러 줄 출력 → 빌드 중단, 로그 정지 → 정지 감시 중단 (제한 시간 초과분),
+    crash / build_failed 시나리오의 종료 사유 분류
+  - 메모리: 오케스트레이터 프로세스의 최대 RSS와 최대 스레드 수 (Unity 프로세스 제외)
+- 프로젝트 수 1~200, 작업자 수 여러 개 조합 (작업자 1개는 순차 빌드 경로)
+- 결과는 BUILD_OUTPUT_DIR/_Benchmarks/orchestration_<시각>.json에 저장 (--output으로 경로 지정)
+
+실행: python orchestration_benchmark.py [--projects 1,10,50,200] [--workers 1,4,16] [--duration 0.5]
+                                       [--log-lines 200] [--replay-log 로그] [--no-failures] [--adaptive]
+                                       [--keep] [--verbose] [--output 경로]
+"""
+import os
+import sys
+import json
+import math
+import shutil
+import tempfile
+from build_manager import build_multiple_webgl_projects
+from fake_unity import create_fake_unity_launcher, write_fake_unity_settings
+from benchmark_utils import (
+    override_config, restore_config, measure, quiet_output, percentile, parse_int_list, get_option_value,
+    print_table, save_benchmark_json
+)
+
+DEFAULT_PROJECT_COUNTS = [1, 10, 50, 200]
+DEFAULT_WORKER_COUNTS = [1, 4, 16]
+DEFAULT_FAKE_DURATION = 0.5
+DEFAULT_LOG_LINES = 200
+FAILURE_STALL_TIMEOUT = 2  # 실패 시나리오의 정지 감시 제한 시간 (초)
+FAILURE_SCENARIOS = ["compile_error", "hang", "crash", "build_failed"]
+
+
+def create_fake_projects(root_dir, count, prefix="FakeProject"):
+    """가짜 Unity 프로젝트 폴더를 만듭니다 (Assets, Packages/manifest.json, ProjectSettings/ProjectVersion.txt).
+
+    Returns:
+        list: 프로젝트 경로 목록
+    """
+    project_dirs = []
+    for index in range(1, count + 1):
+        project_dir = os.path.join(root_dir, f"{prefix}_{index:03d}")
+        os.makedirs(os.path.join(project_dir, "Assets", "Scripts"), exist_ok=True)
+        os.makedirs(os.path.join(project_dir, "Packages"), exist_ok=True)
+        os.makedirs(os.path.join(project_dir, "ProjectSettings"), exist_ok=True)
+        with open(os.path.join(project_dir, "Assets", "Scripts", "SystemManager.cs"), 'w', encoding='utf-8') as f:
+            f.write("using UnityEngine;\n\npublic class SystemManager : MonoBehaviour\n{\n}\n")
+        with open(os.path.join(project_dir, "Packages", "manifest.json"), 'w', encoding='utf-8') as f:
+            json.dump({"dependencies": {"com.unity.ugui": "2.0.0"}}, f, indent=2)
+        with open(os.path.join(project_dir, "ProjectSettings", "ProjectVersion.txt"), 'w', encoding='utf-8') as f:
+            f.write("m_EditorVersion: 6000.0.59f2\n")
+        project_dirs.append(project_dir)
+    return project_dirs
+
+def load_fake_events(events_dir, project_name):
+    """가짜 Unity가 기록한 로그 출력 시각을 읽습니다 (없으면 None)."""
+    path = os.path.join(events_dir, f"{project_name}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def get_monitor_latencies(build_info, events):
+    """단계 전환 줄 출력 시각과 모니터가 기록한 시각의 차이(초) 목록을 반환합니다."""
+    if not events:
+        return []
+    written = {}
+    for timestamp, phase_id in events.get("phases", []):
+        written.setdefault(phase_id, timestamp)
+    latencies = []
+    for timestamp, phase_id in build_info.get("phase_transitions", []):
+        if phase_id in written:
+            latencies.append(max(0.0, timestamp - written.pop(phase_id)))
+    return latencies
+
+def get_build_end_time(build_info, elapsed_time):
+    return build_info.get("start_time", 0) + elapsed_time
+
+def summarize_latencies(latencies):
+    """지연 시간 목록을 ms 단위 p50 / p95 / 최대값으로 요약합니다."""
+    if not latencies:
+        return {"count": 0, "p50_ms": None, "p95_ms": None, "max_ms": None}
+    return {
+        "count": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "max_ms": round(max(latencies) * 1000, 1)
+    }
+
+def run_fleet_benchmark(project_dirs, workers, fake_duration, events_dir, adaptive=False, verbose=False):
+    """프로젝트 목록을 한 번 빌드하고 오버헤드 / 모니터 지연 / 메모리를 측정합니다."""
+    shutil.rmtree(events_dir, ignore_errors=True)
+    build_infos = {}
+    with quiet_output(verbose):
+        (results, _), measurement = measure(
+            build_multiple_webgl_projects, project_dirs, parallel=workers > 1,
+            max_workers=workers, adaptive=adaptive, build_infos=build_infos
+        )
+
+    latencies = []
+    spawn_overheads = []
+    for project_name, _, elapsed_time in results:
+        build_info = build_infos.get(project_name, {})
+        events = load_fake_events(events_dir, project_name)
+        latencies.extend(get_monitor_latencies(build_info, events))
+        if events and events.get("first_output") and events.get("exit_time"):
+            # 빌드 소요 시간 중 가짜 Unity가 실제로 로그를 출력한 시간을 제외한 부분 (실행/종료 비용)
+            fake_seconds = events["exit_time"] - events["first_output"]
+            spawn_overheads.append(max(0.0, elapsed_time - fake_seconds))
+
+    project_count = len(project_dirs)
+    ideal_seconds = math.ceil(project_count / workers) * fake_duration
+    wall_seconds = measurement["seconds"]
+    return {
+        "projects": project_count,
+        "workers": workers,
+        "succeeded": sum(1 for _, success, _ in results if success),
+        "wall_seconds": round(wall_seconds, 3),
+        "ideal_seconds": round(ideal_seconds, 3),
+        "overhead_seconds": round(wall_seconds - ideal_seconds, 3),
+        "overhead_percent": round((wall_seconds - ideal_seconds) / ideal_seconds * 100, 1) if ideal_seconds else None,
+        "spawn_overhead_ms": round(sum(spawn_overheads) / len(spawn_overheads) * 1000, 1) if spawn_overheads else None,
+        "monitor_latency": summarize_latencies(latencies),
+        "start_memory_mb": measurement["start_memory_mb"],
+        "peak_memory_mb": measurement["peak_memory_mb"],
+        "peak_threads": measurement["peak_threads"]
+    }
+
+def run_failure_benchmark(projects_root, events_dir, verbose=False):
+    """실패 시나리오(컴파일 에러, 정지, 비정상 종료, 빌드 실패)를 동시에 빌드하고 감지 결과를 측정합니다."""
+    shutil.rmtree(events_dir, ignore_errors=True)
+    project_dirs = []
+    for scenario in FAILURE_SCENARIOS:
+        project_dir = create_fake_projects(projects_root, 1, prefix=f"FakeFailure_{scenario}")[0]
+        write_fake_unity_settings(project_dir, scenario=scenario)
+        project_dirs.append(project_dir)
+
+    previous = override_config(BUILD_STALL_TIMEOUT=FAILURE_STALL_TIMEOUT, BUILD_STALL_PHASE_TIMEOUTS={})
+    build_infos = {}
+    try:
+        with quiet_output(verbose):
+            results, _ = build_multiple_webgl_projects(project_dirs, parallel=True, max_workers=len(project_dirs),
+                                                       adaptive=False, build_infos=build_infos)
+    finally:
+        restore_config(previous)
+
+    failures = []
+    for project_name, success, elapsed_time in results:
+        scenario = project_name.replace("FakeFailure_", "").rsplit("_", 1)[0]
+        build_info = build_infos.get(project_name, {})
+        events = load_fake_events(events_dir, project_name) or {}
+        end_time = get_build_end_time(build_info, elapsed_time)
+        detection_ms = None
+        if scenario == "compile_error" and events.get("error_time"):
+            detection_ms = round((end_time - events["error_time"]) * 1000, 1)
+        elif scenario == "hang" and events.get("last_output"):
+            # 정지 감시는 제한 시간이 지나야 동작하므로 제한 시간을 넘긴 부분만 지연으로 계산
+            detection_ms = round((end_time - events["last_output"] - FAILURE_STALL_TIMEOUT) * 1000, 1)
+        failures.append({
+            "scenario": scenario,
+            "success": success,
+            "exit_reason": build_info.get("exit_reason"),
+            "elapsed_seconds": round(elapsed_time, 3),
+            "detection_ms": detection_ms
+        })
+    return failures
+
+def print_fleet_results(results):
+    columns = [("프로젝트×작업자", 16), ("성공", 8), ("전체", 10), ("이상적", 10), ("오버헤드", 10),
+               ("실행비용", 10), ("모니터 p50", 12), ("p95", 9), ("최대", 9), ("RSS", 9), ("스레드", 8)]
+    rows = []
+    for result in results:
+        latency = result["monitor_latency"]
+        rows.append([
+            f"{result['projects']}×{result['workers']}",
+            f"{result['succeeded']}/{result['projects']}",
+            f"{result['wall_seconds']:.2f}초",
+            f"{result['ideal_seconds']:.2f}초",
+            f"{result['overhead_percent']}%" if result["overhead_percent"] is not None else None,
+            f"{result['spawn_overhead_ms']:.0f}ms" if result["spawn_overhead_ms"] is not None else None,
+            f"{latency['p50_ms']}ms" if latency["p50_ms"] is not None else None,
+            f"{latency['p95_ms']}ms" if latency["p95_ms"] is not None else None,
+            f"{latency['max_ms']}ms" if latency["max_ms"] is not None else None,
+            f"{result['peak_memory_mb']:.0f}MB" if result["peak_memory_mb"] is not None else None,
+            result["peak_threads"]
+        ])
+    print_table("오케스트레이션 벤치마크 (가짜 Unity)", columns, rows)
+    print("   (오버헤드: 이상적인 시간 대비 추가 시간, 실행비용: 빌드당 Unity 프로세스 실행/종료 시간, 인터프리터 시작 포함)")
+
+def print_failure_results(failures):
+    columns = [("시나리오", 16), ("종료 사유", 16), ("소요 시간", 12), ("감지 지연", 12)]
+    rows = [[failure["scenario"], failure["exit_reason"], f"{failure['elapsed_seconds']:.2f}초",
+             f"{failure['detection_ms']:.0f}ms" if failure["detection_ms"] is not None else None]
+            for failure in failures]
+    print_table(f"실패 감지 (정지 감시 제한 {FAILURE_STALL_TIMEOUT}초)", columns, rows)
+
+def run_orchestration_benchmark(project_counts=None, worker_counts=None, fake_duration=DEFAULT_FAKE_DURATION,
+                                log_lines=DEFAULT_LOG_LINES, replay_log=None, include_failures=True,
+                                adaptive=False, keep=False, verbose=False, output_path=None):
+    """프로젝트 수 × 작업자 수 조합마다 가짜 Unity로 빌드하여 오케스트레이터 비용을 측정합니다.
+
+    Returns:
+        dict: {"fleet": [조합별 결과, ...], "failures": [시나리오별 결과, ...]}
+    """
+    project_counts = project_counts or DEFAULT_PROJECT_COUNTS
+    worker_counts = worker_counts or DEFAULT_WORKER_COUNTS
+    work_dir = tempfile.mkdtemp(prefix="dannect_orchestration_")
+    projects_root = os.path.join(work_dir, "Projects")
+    events_dir = os.path.join(work_dir, "_FakeEvents")
+    launcher_path = create_fake_unity_launcher(os.path.join(work_dir, "FakeUnity"))
+
+    print(f"\n=== 오케스트레이션 벤치마크: 프로젝트 {project_counts} × 작업자 {worker_counts} ===")
+    print(f"   가짜 Unity 빌드 시간: {fake_duration}초, 로그 {replay_log or f'{log_lines}줄 (합성)'}")
+    print(f"   작업 폴더: {work_dir}")
+
+    fake_environment = {
+        "FAKE_UNITY_DURATION": str(fake_duration),
+        "FAKE_UNITY_LOG_LINES": str(log_lines),
+        "FAKE_UNITY_REPLAY_LOG": replay_log or "",
+        "FAKE_UNITY_EVENTS_DIR": events_dir
+    }
+    previous_environment = {name: os.environ.get(name) for name in fake_environment}
+    os.environ.update(fake_environment)
+    previous_config = override_config(
+        UNITY_EDITOR_PATH=launcher_path,
+        BUILD_OUTPUT_DIR=os.path.join(work_dir, "Build"),
+        BUILD_STALL_TIMEOUT=max(60, int(fake_duration * 10))
+    )
+
+    fleet_results = []
+    failures = []
+    try:
+        all_project_dirs = create_fake_projects(projects_root, max(project_counts))
+        for project_count in project_counts:
+            for workers in worker_counts:
+                if workers > 1 and workers > project_count:
+                    continue  # 프로젝트보다 작업자가 많으면 결과가 작업자 수 = 프로젝트 수와 같음
+                print(f"   ▶ {project_count}개 프로젝트 × 작업자 {workers}개 빌드 중...")
+                result = run_fleet_benchmark(all_project_dirs[:project_count], workers, fake_duration,
+                                             events_dir, adaptive=adaptive, verbose=verbose)
+                fleet_results.append(result)
+                print(f"     {result['succeeded']}/{project_count} 성공, {result['wall_seconds']:.2f}초 "
+                      f"(이상적 {result['ideal_seconds']:.2f}초)")
+        if include_failures:
+            print("   ▶ 실패 시나리오 빌드 중 (compile_error, hang, crash, build_failed)...")
+            failures = run_failure_benchmark(projects_root, events_dir, verbose=verbose)
+    finally:
+        restore_config(previous_config)
+        for name, value in previous_environment.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        if keep:
+            print(f"📁 작업 폴더 유지: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if fleet_results:
+        print_fleet_results(fleet_results)
+    if failures:
+        print_failure_results(failures)
+
+    path = save_benchmark_json("orchestration", {
+        "fake_duration": fake_duration,
+        "log_lines": log_lines,
+        "replay_log": replay_log,
+        "adaptive": adaptive,
+        "fleet": fleet_results,
+        "failures": failures
+    }, output_path)
+    if path:
+        print(f"\n💾 벤치마크 결과 저장: {path}")
+    return {"fleet": fleet_results, "failures": failures}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--help" in argv or "-h" in argv:
+        print(__doc__)
+        return
+    run_orchestration_benchmark(
+        project_counts=parse_int_list(get_option_value(argv, "--projects", "")) or None,
+        worker_counts=parse_int_list(get_option_value(argv, "--workers", "")) or None,
+        fake_duration=float(get_option_value(argv, "--duration", DEFAULT_FAKE_DURATION)),
+        log_lines=int(get_option_value(argv, "--log-lines", DEFAULT_LOG_LINES)),
+        replay_log=get_option_value(argv, "--replay-log"),
+        include_failures="--no-failures" not in argv,
+        adaptive="--adaptive" in argv,
+        keep="--keep" in argv,
+        verbose="--verbose" in argv,
+        output_path=get_option_value(argv, "--output")
+    )
+
+
+if __name__ == "__main__":
+    main()
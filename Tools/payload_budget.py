@@ -0,0 +1,106 @@
+"""
+WebGL 다운로드 크기 예산 (payload budget)
+- 빌드 후 .wasm / .data / .framework.js 출력 파일 크기를 예산과 비교
+  (압축 방식과 관계없이 Build 폴더에 생성된 파일 기준: .br / .gz / .unityweb / 비압축)
+- 예산이 있는 파일 종류가 Build 폴더에 없으면 경고 (예산 확인이 조용히 건너뛰어지지 않도록)
+- 기본 예산: Config.WEBGL_PAYLOAD_BUDGET_MB, 프로젝트별 예산: Config.WEBGL_PAYLOAD_BUDGETS_MB
+- 예산 초과 시 Config.WEBGL_PAYLOAD_BUDGET_ACTION에 따라 경고("warn") 또는 빌드 실패("fail")
+- 학교 네트워크에서는 다운로드 크기가 로딩 시간의 대부분을 차지하므로 크기 증가를 빌드 단계에서 차단
+"""
+from config import Config
+from build_report import strip_compression_suffix, is_build_file_kind, describe_file_kind
+
+# 전역 변수 참조 (호환성 유지)
+WEBGL_PAYLOAD_BUDGET_MB = Config.WEBGL_PAYLOAD_BUDGET_MB
+WEBGL_PAYLOAD_BUDGETS_MB = Config.WEBGL_PAYLOAD_BUDGETS_MB
+WEBGL_PAYLOAD_BUDGET_ACTION = Config.WEBGL_PAYLOAD_BUDGET_ACTION
+
+# 예산 대상 파일 (압축 접미사를 뺀 확장자, 표시 이름)
+PAYLOAD_KINDS = [
+    (".wasm", "WebAssembly"),
+    (".data", "Data"),
+    (".framework.js", "Framework"),
+]
+
+MB = 1024 * 1024
+
+
+def get_payload_budgets(project_name):
+    """프로젝트의 파일 종류별 예산(MB)을 반환합니다 (기본 예산에 프로젝트별 예산을 덮어씀).
+
+    예산이 None 또는 0이면 해당 파일은 확인하지 않습니다.
+    이전 형식의 키(".wasm.br" 등)는 압축 접미사를 뺀 확장자(".wasm")로 바꿔 적용합니다.
+    """
+    budgets = {}
+    for source in (WEBGL_PAYLOAD_BUDGET_MB, WEBGL_PAYLOAD_BUDGETS_MB.get(project_name, {})):
+        for extension, budget_mb in source.items():
+            budgets[strip_compression_suffix(extension).lower()] = budget_mb
+    return budgets
+
+def check_payload_budgets(project_name, files):
+    """Build 폴더 파일 크기를 예산과 비교합니다.
+
+    Args:
+        project_name: 프로젝트 이름
+        files: [(파일명, 크기), ...] (build_metrics.get_build_output_files 결과)
+
+    Returns:
+        list: [{"suffix", "label", "file", "size", "budget", "exceeded"}, ...] (예산이 있는 파일만)
+              예산이 있는 종류의 파일이 없으면 file / size가 None이고 "missing"이 True인 항목
+    """
+    budgets = get_payload_budgets(project_name)
+    results = []
+    for suffix, label in PAYLOAD_KINDS:
+        budget_mb = budgets.get(suffix)
+        if not budget_mb:
+            continue
+        matches = [(name, size) for name, size in files if is_build_file_kind(name, suffix)]
+        if not matches:
+            results.append({
+                "suffix": suffix,
+                "label": label,
+                "file": None,
+                "size": None,
+                "budget": int(budget_mb * MB),
+                "exceeded": False,
+                "missing": True
+            })
+            continue
+        for name, size in matches:
+            results.append({
+                "suffix": suffix,
+                "label": label,
+                "file": name,
+                "size": size,
+                "budget": int(budget_mb * MB),
+                "exceeded": size > budget_mb * MB,
+                "missing": False
+            })
+    return results
+
+def is_budget_failure(results):
+    """예산 초과로 빌드를 실패 처리해야 하는지 확인합니다."""
+    return WEBGL_PAYLOAD_BUDGET_ACTION == "fail" and any(result["exceeded"] for result in results)
+
+def print_payload_budget_report(results):
+    """예산 확인 결과를 출력합니다 (초과 / 누락 항목은 파일별로, 나머지는 한 줄 요약)."""
+    if not results:
+        return
+
+    for result in results:
+        if result["missing"]:
+            print(f"   ⚠️ 다운로드 크기 예산 확인 불가: {result['label']} 파일({describe_file_kind(result['suffix'])})이 "
+                  f"Build 폴더에 없습니다 (예산 {result['budget'] / MB:.2f}MB)")
+
+    exceeded = [result for result in results if result["exceeded"]]
+    icon = "❌" if WEBGL_PAYLOAD_BUDGET_ACTION == "fail" else "⚠️"
+    for result in exceeded:
+        over = result["size"] - result["budget"]
+        print(f"   {icon} 다운로드 크기 예산 초과: {result['file']} "
+              f"{result['size'] / MB:.2f}MB / 예산 {result['budget'] / MB:.2f}MB (+{over / MB:.2f}MB)")
+
+    within = [result for result in results if not result["exceeded"] and not result["missing"]]
+    if within:
+        summary = ", ".join(f"{result['label']} {result['size'] / MB:.2f}/{result['budget'] / MB:.2f}MB"
+                            for result in within)
+        print(f"   📏 다운로드 크기 예산 이내: {summary}")
@@ -0,0 +1,256 @@
+"""
+Unity 프로세스 트리 관리
+- Unity를 별도 프로세스 그룹/세션으로 실행 (POSIX: start_new_session, Windows: CREATE_NEW_PROCESS_GROUP)
+- 타임아웃/취소/Ctrl+C 시 Unity뿐 아니라 il2cpp, bee_backend, clang, emscripten(node) 등
+  모든 자식 프로세스까지 종료하고 종료한 프로세스 목록을 출력
+- 실행 중인 프로세스를 등록해두어 병렬 빌드 취소 시 한 번에 정리
+  (process_group으로 실행 단위를 지정하면 그 실행이 시작한 프로세스만 정리)
+"""
+import os
+import sys
+import time
+import signal
+import threading
+import itertools
+import contextlib
+import subprocess
+from config import Config
+
+# 전역 변수 참조 (호환성 유지)
+PROCESS_KILL_GRACE_SECONDS = Config.PROCESS_KILL_GRACE_SECONDS
+
+PROC_DIR = "/proc"
+
+# 실행 중인 프로세스 (병렬 빌드 취소 시 일괄 종료)
+_active_processes = {}  # pid -> (process, label)
+_process_groups = {}  # pid -> 프로세스를 시작할 때 활성화되어 있던 실행 그룹 id 집합
+_active_lock = threading.Lock()
+
+# 스레드별 활성 실행 그룹 (process_group으로 지정, 중첩 가능)
+_thread_state = threading.local()
+_group_ids = itertools.count(1)
+
+
+def new_process_group():
+    """새 실행 그룹 id를 만듭니다 (병렬 처리/파이프라인 실행 1회 단위)."""
+    return next(_group_ids)
+
+@contextlib.contextmanager
+def process_group(group):
+    """블록 안에서 현재 스레드가 시작한 프로세스를 실행 그룹 group에 등록합니다.
+
+    작업 스레드에서 사용하면 kill_all_process_trees(reason, group)가 이 실행이 시작한 프로세스만 종료하므로,
+    같은 Python 프로세스의 다른 실행(다른 스레드의 병렬 빌드 등)이 시작한 프로세스는 영향을 받지 않습니다.
+    """
+    groups = getattr(_thread_state, "groups", ())
+    _thread_state.groups = groups + (group,)
+    try:
+        yield group
+    finally:
+        _thread_state.groups = groups
+
+
+def start_process_group(cmd, label=None, **popen_kwargs):
+    """명령을 새 프로세스 그룹/세션으로 실행하고 등록합니다.
+
+    Args:
+        cmd: 실행할 명령 목록
+        label: 종료 보고에 표시할 이름 (예: 프로젝트명)
+        popen_kwargs: subprocess.Popen 추가 인수
+
+    Returns:
+        subprocess.Popen: 실행된 프로세스
+    """
+    if sys.platform == "win32":
+        popen_kwargs["creationflags"] = popen_kwargs.get("creationflags", 0) | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        popen_kwargs["start_new_session"] = True
+
+    process = subprocess.Popen(cmd, **popen_kwargs)
+    register_process(process, label or os.path.basename(cmd[0]))
+    return process
+
+def register_process(process, label):
+    """직접 실행한 프로세스를 등록하여 kill_all_process_trees로 함께 종료되게 합니다.
+
+    process는 pid, poll(), wait(timeout), kill()을 제공해야 합니다 (async_runner의 asyncio 프로세스 포함).
+    """
+    groups = frozenset(getattr(_thread_state, "groups", ()))
+    with _active_lock:
+        _active_processes[process.pid] = (process, label)
+        _process_groups[process.pid] = groups
+
+def release_process(process):
+    """정상 종료된 프로세스를 등록 목록에서 제거합니다."""
+    with _active_lock:
+        _active_processes.pop(process.pid, None)
+        _process_groups.pop(process.pid, None)
+
+def _read_process_list():
+    """/proc에서 모든 프로세스의 (pid, name, ppid, pgrp, session)을 읽습니다 (Linux 전용)."""
+    processes = []
+    try:
+        pids = [name for name in os.listdir(PROC_DIR) if name.isdigit()]
+    except OSError:
+        return processes
+
+    for pid in pids:
+        try:
+            with open(os.path.join(PROC_DIR, pid, "stat"), 'r') as f:
+                stat = f.read()
+            name = stat[stat.index('(') + 1:stat.rindex(')')]
+            fields = stat[stat.rindex(')') + 2:].split()
+            if fields[0] == 'Z':
+                continue  # 이미 종료된 좀비 프로세스
+            processes.append((int(pid), name, int(fields[1]), int(fields[2]), int(fields[3])))
+        except (OSError, ValueError, IndexError):
+            continue
+    return processes
+
+def list_process_tree(pid):
+    """프로세스와 같은 세션/그룹에 속하거나 자손인 프로세스 목록을 반환합니다.
+
+    Returns:
+        list: [(pid, name), ...] (확인할 수 없으면 빈 목록)
+    """
+    if not os.path.isdir(PROC_DIR):
+        return []
+
+    processes = _read_process_list()
+    children = {}
+    for child_pid, _, ppid, _, _ in processes:
+        children.setdefault(ppid, []).append(child_pid)
+
+    # 자손 프로세스 (setsid로 세션을 벗어난 자식 포함)
+    members = set()
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        if current in members:
+            continue
+        members.add(current)
+        pending.extend(children.get(current, []))
+
+    # 부모가 먼저 종료되어 init으로 옮겨진 자식도 같은 세션/그룹이면 포함
+    for child_pid, _, _, pgrp, session in processes:
+        if session == pid or pgrp == pid:
+            members.add(child_pid)
+
+    return [(child_pid, name) for child_pid, name, _, _, _ in processes if child_pid in members]
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    # 종료되었지만 아직 회수되지 않은 좀비는 제외
+    try:
+        with open(os.path.join(PROC_DIR, str(pid), "stat"), 'r') as f:
+            stat = f.read()
+        return stat[stat.rindex(')') + 2:].split()[0] != 'Z'
+    except (OSError, ValueError, IndexError):
+        return True
+
+def _signal_tree(process, members, sig):
+    """프로세스 그룹과 개별 프로세스에 신호를 보냅니다."""
+    try:
+        os.killpg(process.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+    for member_pid, _ in members:
+        try:
+            os.kill(member_pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+def _kill_posix_tree(process, grace_seconds):
+    """POSIX: SIGTERM → 유예 시간 대기 → SIGKILL 순서로 프로세스 트리를 종료합니다."""
+    members = list_process_tree(process.pid)
+    _signal_tree(process, members, signal.SIGTERM)
+
+    deadline = time.time() + grace_seconds
+    while time.time() < deadline:
+        if process.poll() is not None and not any(_is_alive(member_pid) for member_pid, _ in members):
+            break
+        time.sleep(0.1)
+
+    # 유예 시간 동안 새로 생긴 자식 프로세스도 포함하여 강제 종료
+    remaining = [member for member in list_process_tree(process.pid) if member not in members]
+    members.extend(remaining)
+    survivors = [member for member in members if _is_alive(member[0])]
+    if survivors or process.poll() is None:
+        _signal_tree(process, members, signal.SIGKILL)
+
+    if not members:
+        members = [(process.pid, f"프로세스 그룹 {process.pid}")]
+    return members
+
+def _kill_windows_tree(process):
+    """Windows: taskkill /T /F로 프로세스 트리를 종료합니다."""
+    result = subprocess.run(
+        ["taskkill", "/PID", str(process.pid), "/T", "/F"],
+        capture_output=True,
+        text=True,
+        errors='replace'
+    )
+    # 예: SUCCESS: The process with PID 1234 (child process of PID 1000) has been terminated.
+    members = []
+    for line in result.stdout.splitlines():
+        words = line.replace('(', ' ').replace(')', ' ').split()
+        if "PID" in words:
+            index = words.index("PID")
+            if index + 1 < len(words) and words[index + 1].isdigit():
+                members.append((int(words[index + 1]), line.split(':', 1)[0]))
+    return members
+
+def kill_process_tree(process, reason, label=None):
+    """프로세스와 모든 자식 프로세스를 종료하고 종료한 프로세스 목록을 출력합니다.
+
+    Returns:
+        list: 종료한 프로세스 [(pid, name), ...]
+    """
+    if label is None:
+        with _active_lock:
+            label = _active_processes.get(process.pid, (None, str(process.pid)))[1]
+
+    try:
+        if sys.platform == "win32":
+            killed = _kill_windows_tree(process)
+        else:
+            killed = _kill_posix_tree(process, PROCESS_KILL_GRACE_SECONDS)
+    except Exception as e:
+        print(f"⚠️ 프로세스 트리 종료 실패 ({label}): {e}")
+        process.kill()
+        killed = [(process.pid, "Unity")]
+
+    try:
+        process.wait(timeout=PROCESS_KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        print(f"⚠️ 프로세스가 종료되지 않았습니다 ({label}, PID {process.pid})")
+
+    release_process(process)
+
+    names = ", ".join(f"{name}({pid})" for pid, name in killed[:20])
+    if len(killed) > 20:
+        names += f" 외 {len(killed) - 20}개"
+    print(f"🧹 프로세스 트리 종료 ({label}, 사유: {reason}): {len(killed)}개 - {names}")
+    return killed
+
+def kill_all_process_trees(reason, group=None):
+    """등록된 실행 중 프로세스 트리를 종료합니다 (병렬 빌드 취소 / Ctrl+C).
+
+    group이 주어지면 그 실행 그룹(process_group)에서 시작한 프로세스만 종료합니다.
+    """
+    with _active_lock:
+        active = [entry for pid, entry in _active_processes.items()
+                  if group is None or group in _process_groups.get(pid, ())]
+
+    killed = []
+    for process, label in active:
+        if process.poll() is None:
+            killed.extend(kill_process_tree(process, reason, label))
+        else:
+            release_process(process)
+    return killed
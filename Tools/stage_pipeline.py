@@ -0,0 +1,365 @@
+"""
+프로젝트별 단계 파이프라인 실행기
+- 프로젝트마다 package → batch → build → commit → push 단계를 독립적으로 진행
+  (단계별로 전체 프로젝트를 모두 끝낸 뒤 다음 단계를 시작하지 않으므로, 빠른 프로젝트의 커밋/푸시가
+  느린 프로젝트의 빌드를 기다리지 않고 Git 작업과 Unity 빌드가 겹쳐 실행됨)
+- 단계별 동시 실행 상한 (PIPELINE_STAGE_WORKERS: Git/파일 작업은 많이, Unity 실행 단계는 적게)
+- Unity를 실행하는 단계(batch, build)는 AdaptiveConcurrencyController 하나를 공유하여
+  합계 상한(PIPELINE_UNITY_WORKERS)과 호스트 여유 메모리/유휴 CPU를 함께 확인
+- 앞 단계가 실패한 프로젝트는 다음 단계를 건너뜀 (빌드 캐시 적중은 성공으로 처리)
+- 뒤 단계를 먼저 시작하여 (깊이 우선) 시작한 프로젝트를 먼저 끝냄, 빌드가 있으면 예상 빌드 시간이 긴 프로젝트부터 시작
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from config import Config
+from git_utils import commit_changes, push_changes, get_project_name_from_path
+from package_manager import add_git_packages_to_manifest
+from unity_cli import process_unity_project_batch
+from build_manager import run_traced_webgl_build
+from build_cache import check_build_cache
+from build_report import format_duration
+from build_history import get_build_requirements, order_longest_first
+from host_resources import AdaptiveConcurrencyController, get_host_worker_limit
+from process_tree import kill_all_process_trees, new_process_group, process_group
+from build_trace import acquire_slot, release_slot, add_span
+
+# 전역 변수 참조 (호환성 유지)
+git_packages = Config.GIT_PACKAGES
+ADAPTIVE_CONCURRENCY = Config.ADAPTIVE_CONCURRENCY
+ADAPTIVE_POLL_SECONDS = Config.ADAPTIVE_POLL_SECONDS
+BUILD_CACHE_MODE = Config.BUILD_CACHE_MODE
+UNITY_BATCH_MEMORY_MB = Config.UNITY_BATCH_MEMORY_MB
+UNITY_BATCH_CPU = Config.UNITY_BATCH_CPU
+PIPELINE_STAGE_WORKERS = Config.PIPELINE_STAGE_WORKERS
+PIPELINE_UNITY_WORKERS = Config.PIPELINE_UNITY_WORKERS
+
+# 단계 순서 (프로젝트마다 이 순서로 진행)
+STAGE_ORDER = ["package", "batch", "build", "commit", "push"]
+UNITY_STAGES = ("batch", "build")
+STAGE_NAMES = {
+    "package": "패키지 추가",
+    "batch": "Unity 배치 처리",
+    "build": "WebGL 빌드",
+    "commit": "Git 커밋",
+    "push": "Git 푸시",
+}
+# 고정 작업자 수 모드(--no-adaptive)에서 상한이 None인 Unity 단계의 기본값 (기존 병렬 처리 기본값과 동일)
+DEFAULT_FIXED_WORKERS = {"batch": 3, "build": 4}
+
+
+def parse_stage_list(text):
+    """"package,build,commit" 형식의 단계 목록을 해석합니다 (잘못된 단계 제외, STAGE_ORDER 순서로 정렬)."""
+    stages = []
+    for stage in text.split(","):
+        stage = stage.strip()
+        if not stage:
+            continue
+        if stage not in STAGE_ORDER:
+            print(f"⚠️ 알 수 없는 단계는 제외합니다: {stage} (사용 가능: {', '.join(STAGE_ORDER)})")
+        elif stage not in stages:
+            stages.append(stage)
+    return [stage for stage in STAGE_ORDER if stage in stages]
+
+def parse_stage_workers(text):
+    """"build=2,commit=8" 형식의 단계별 동시 실행 상한을 해석합니다 (잘못된 값 제외)."""
+    workers = {}
+    for item in text.split(","):
+        stage, _, value = item.partition("=")
+        stage = stage.strip()
+        value = value.strip()
+        if stage in STAGE_ORDER and value.isdigit() and int(value) > 0:
+            workers[stage] = int(value)
+        elif item.strip():
+            print(f"⚠️ 잘못된 단계별 동시 실행 상한은 제외합니다: {item.strip()}")
+    return workers
+
+
+class ProjectStagePipeline:
+    """프로젝트마다 단계를 독립적으로 진행하는 실행기.
+
+    스케줄러(run을 호출한 스레드)가 단계별 대기열에서 상한이 허용하는 만큼 작업을 시작하고,
+    작업이 끝나면 그 프로젝트를 다음 단계 대기열에 넣습니다. 단계 작업은 스레드 풀에서 실행되며,
+    결과는 스케줄러 스레드에서만 기록합니다.
+    """
+
+    def __init__(self, stages, stage_workers=None, unity_workers=None, adaptive=None, tasks=None,
+                 use_cache=False, cache_mode=None, commit_message_type="package_update", build_infos=None):
+        """
+        Args:
+            stages: 실행할 단계 목록 (STAGE_ORDER 순서로 정렬됨)
+            stage_workers: {단계: 동시 실행 상한} (PIPELINE_STAGE_WORKERS를 덮어씀, None이면 호스트 기준 자동)
+            unity_workers: batch + build 합계 동시 실행 상한 (기본값 PIPELINE_UNITY_WORKERS)
+            adaptive: 호스트 여유 자원에 따라 Unity 단계 시작 조절 (기본값 Config.ADAPTIVE_CONCURRENCY)
+            tasks: build 단계를 Unity 1회 실행 파이프라인으로 실행할 작업 목록 (--pipeline)
+            use_cache / cache_mode: 빌드 캐시 사용 여부 / 변경 감지 방식
+            commit_message_type: commit 단계의 커밋 메시지 종류 (COMMIT_MESSAGES 키)
+            build_infos: 프로젝트명별 run_unity_webgl_build 빌드 정보를 저장할 dict
+        """
+        self.stages = [stage for stage in STAGE_ORDER if stage in stages]
+        self.adaptive = ADAPTIVE_CONCURRENCY if adaptive is None else adaptive
+        self.tasks = tasks
+        self.use_cache = use_cache
+        self.cache_mode = cache_mode or BUILD_CACHE_MODE
+        self.commit_message_type = commit_message_type
+        self.build_infos = build_infos
+        self.stage_workers = dict(PIPELINE_STAGE_WORKERS)
+        self.stage_workers.update(stage_workers or {})
+        self.unity_workers = unity_workers if unity_workers is not None else PIPELINE_UNITY_WORKERS
+        self.limits = {}
+        self.build_requirements = {}
+        self.controller = None
+        # 이 파이프라인이 시작한 프로세스만 취소 대상으로 등록하는 실행 그룹
+        self.process_group = new_process_group()
+
+    def _resolve_limits(self, project_dirs):
+        """단계별 동시 실행 상한과 Unity 단계 공용 제어기를 준비합니다."""
+        build_memory_mb, build_cpu_cores = None, None
+        if "build" in self.stages:
+            self.build_requirements, (build_memory_mb, build_cpu_cores) = get_build_requirements(project_dirs)
+
+        for stage in self.stages:
+            limit = self.stage_workers.get(stage)
+            if limit is None:
+                if stage == "batch":
+                    limit = get_host_worker_limit(UNITY_BATCH_MEMORY_MB, UNITY_BATCH_CPU) if self.adaptive else DEFAULT_FIXED_WORKERS[stage]
+                elif stage == "build":
+                    limit = get_host_worker_limit(build_memory_mb, build_cpu_cores) if self.adaptive else DEFAULT_FIXED_WORKERS[stage]
+                else:
+                    limit = 1
+            self.limits[stage] = max(1, int(limit))
+
+        unity_limits = [self.limits[stage] for stage in self.stages if stage in UNITY_STAGES]
+        if unity_limits:
+            unity_workers = self.unity_workers or max(unity_limits)
+            # 배치 처리 기준 자원은 작업별 요구량으로 전달하므로 제어기 기본값은 빌드 기준
+            self.controller = AdaptiveConcurrencyController(
+                unity_workers,
+                build_memory_mb or UNITY_BATCH_MEMORY_MB,
+                build_cpu_cores or UNITY_BATCH_CPU,
+                adaptive=self.adaptive
+            )
+
+    def _get_unity_requirement(self, stage, project_dir):
+        if stage == "batch":
+            return UNITY_BATCH_MEMORY_MB, UNITY_BATCH_CPU
+        return self.build_requirements.get(project_dir, (None, None))
+
+    def _run_stage(self, stage, project_dir):
+        """프로젝트 하나의 단계 하나를 실행합니다 (작업 스레드).
+
+        Returns:
+            tuple: (success, detail) (detail: 빌드 캐시 적중이면 "cached", 아니면 None)
+        """
+        project_name = get_project_name_from_path(project_dir)
+        if stage == "package":
+            add_git_packages_to_manifest(project_dir, git_packages)
+            return True, None
+        if stage == "batch":
+            return bool(process_unity_project_batch(project_dir)), None
+        if stage == "build":
+            # 앞 단계(package/batch)가 프로젝트를 바꿀 수 있으므로 빌드 직전에 캐시 확인
+            if self.use_cache and check_build_cache(project_dir, self.cache_mode):
+                return True, "cached"
+            print(f"\n--- {project_name} WebGL 빌드 시작 ---")
+            build_info = self.build_infos.setdefault(project_name, {}) if self.build_infos is not None else None
+            success, _ = run_traced_webgl_build(project_dir, tasks=self.tasks, build_info=build_info, cache_mode=self.cache_mode)
+            return success, None
+        if stage == "commit":
+            return bool(commit_changes(project_dir, self.commit_message_type)), None
+        if stage == "push":
+            return bool(push_changes(project_dir)), None
+        raise ValueError(f"알 수 없는 단계: {stage}")
+
+    def _run_traced_stage(self, stage, project_dir):
+        """단계를 실행하고 트레이스 작업 슬롯 트랙에 구간을 남깁니다 (빌드는 run_traced_webgl_build가 기록)."""
+        start_time = time.time()
+        slot = acquire_slot() if stage != "build" else None
+        success = False
+        try:
+            with process_group(self.process_group):
+                success, detail = self._run_stage(stage, project_dir)
+            return success, detail, start_time, time.time()
+        finally:
+            if slot is not None:
+                add_span(get_project_name_from_path(project_dir), stage, start_time, time.time(), slot,
+                         {"stage": STAGE_NAMES[stage], "success": success})
+            release_slot(slot)
+
+    def _order_projects(self, project_dirs):
+        """빌드 단계가 있고 동시에 여러 개를 빌드하면 예상 빌드 시간이 긴 프로젝트부터 시작합니다 (LPT)."""
+        if "build" not in self.stages or self.limits["build"] <= 1 or len(project_dirs) <= 1:
+            return list(project_dirs)
+        return order_longest_first(project_dirs, min(self.limits["build"], self.controller.max_workers))
+
+    def run(self, project_dirs):
+        """프로젝트들을 단계별로 진행합니다.
+
+        Returns:
+            dict: {"stages", "limits", "wall_seconds",
+                   "projects": {프로젝트명: {단계: {"status", "seconds", "start", "end"}}}}
+                  (status: "success", "cached", "failed", "skipped")
+        """
+        projects = {}
+        existing_dirs = []
+        for project_dir in project_dirs:
+            project_name = get_project_name_from_path(project_dir)
+            projects[project_name] = {}
+            if os.path.exists(project_dir):
+                existing_dirs.append(project_dir)
+            else:
+                print(f"⚠️ 프로젝트 폴더 없음: {project_dir}")
+                for stage in self.stages:
+                    projects[project_name][stage] = {"status": "failed" if stage == self.stages[0] else "skipped",
+                                                     "seconds": 0.0, "start": None, "end": None}
+
+        result = {"stages": self.stages, "limits": {}, "wall_seconds": 0.0, "projects": projects}
+        if not self.stages or not existing_dirs:
+            return result
+
+        self._resolve_limits(existing_dirs)
+        result["limits"] = dict(self.limits)
+        limit_text = ", ".join(f"{STAGE_NAMES[stage]} {self.limits[stage]}" for stage in self.stages)
+        print(f"\n=== 프로젝트별 단계 파이프라인: {' → '.join(self.stages)} ({len(existing_dirs)}개 프로젝트) ===")
+        print(f"   단계별 동시 실행 상한: {limit_text}")
+        if self.controller:
+            adaptive_text = ", 호스트 여유 자원에 따라 조절" if self.adaptive else ""
+            print(f"   Unity 실행 합계 상한: {self.controller.max_workers}개{adaptive_text}")
+
+        queues = {stage: [] for stage in self.stages}
+        queues[self.stages[0]] = self._order_projects(existing_dirs)
+        running = {stage: 0 for stage in self.stages}
+        future_to_task = {}
+        waiting_reason = None
+        start_time = time.time()
+        completed_projects = 0
+
+        executor = ThreadPoolExecutor(max_workers=sum(self.limits.values()))
+        try:
+            while future_to_task or any(queues.values()):
+                # 뒤 단계부터 시작 (이미 진행 중인 프로젝트를 먼저 끝까지 진행)
+                for stage in reversed(self.stages):
+                    queue = queues[stage]
+                    while queue and running[stage] < self.limits[stage]:
+                        project_dir = queue[0]
+                        if stage in UNITY_STAGES:
+                            memory_mb, cpu_cores = self._get_unity_requirement(stage, project_dir)
+                            can_start, reason = self.controller.can_start(memory_mb, cpu_cores)
+                            if not can_start:
+                                if reason != waiting_reason:
+                                    print(f"⏸️ Unity 실행 대기: {reason} (실행 중 {self.controller.running_count}개)")
+                                waiting_reason = reason
+                                break
+                            waiting_reason = None
+                            self.controller.task_started((stage, project_dir), memory_mb, cpu_cores)
+                        queue.pop(0)
+                        running[stage] += 1
+                        future = executor.submit(self._run_traced_stage, stage, project_dir)
+                        future_to_task[future] = (stage, project_dir)
+
+                if not future_to_task:
+                    # 시작할 수 있는 작업이 없음 (Unity 자원 대기)
+                    time.sleep(ADAPTIVE_POLL_SECONDS)
+                    continue
+
+                done, _ = wait(list(future_to_task), timeout=ADAPTIVE_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, project_dir = future_to_task.pop(future)
+                    running[stage] -= 1
+                    if stage in UNITY_STAGES:
+                        self.controller.task_finished((stage, project_dir))
+                    project_name = get_project_name_from_path(project_dir)
+                    try:
+                        success, detail, stage_start, stage_end = future.result()
+                    except Exception as e:
+                        print(f"❌ {project_name} {STAGE_NAMES[stage]} 예외: {e}")
+                        success, detail, stage_start, stage_end = False, None, time.time(), time.time()
+                    status = "cached" if detail == "cached" else ("success" if success else "failed")
+                    projects[project_name][stage] = {
+                        "status": status,
+                        "seconds": round(stage_end - stage_start, 2),
+                        "start": round(stage_start - start_time, 2),
+                        "end": round(stage_end - start_time, 2)
+                    }
+
+                    next_index = self.stages.index(stage) + 1
+                    if success and next_index < len(self.stages):
+                        queues[self.stages[next_index]].append(project_dir)
+                        continue
+                    # 마지막 단계 완료 또는 실패: 남은 단계는 건너뜀
+                    for skipped_stage in self.stages[next_index:]:
+                        projects[project_name][skipped_stage] = {"status": "skipped", "seconds": 0.0,
+                                                                 "start": None, "end": None}
+                    completed_projects += 1
+                    mark = "✅" if success else f"❌ ({STAGE_NAMES[stage]} 실패)"
+                    print(f"📊 프로젝트 진행도: {completed_projects}/{len(existing_dirs)} 완료 - {project_name} {mark}")
+        except BaseException:
+            # Ctrl+C: 대기 중인 작업은 취소하고 이 파이프라인에서 실행 중인 Unity 프로세스 트리를 종료
+            for future in future_to_task:
+                future.cancel()
+            print("\n⛔ 단계 파이프라인 취소: 실행 중인 Unity 프로세스 트리 종료 중...")
+            kill_all_process_trees("사용자 취소 (Ctrl+C)", self.process_group)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+        result["wall_seconds"] = round(time.time() - start_time, 2)
+        return result
+
+
+def run_stage_pipeline(project_dirs, stages, **options):
+    """프로젝트별 단계 파이프라인을 실행하고 결과 요약을 출력합니다 (옵션은 ProjectStagePipeline 참고).
+
+    Returns:
+        dict: ProjectStagePipeline.run 결과
+    """
+    result = ProjectStagePipeline(stages, **options).run(project_dirs)
+    print_stage_pipeline_summary(result)
+    return result
+
+def get_stage_results(result, stage):
+    """단계 하나의 프로젝트별 결과를 [(project_name, success, elapsed_time), ...] 형식으로 반환합니다.
+
+    건너뛴 프로젝트는 제외하고, 빌드 캐시 적중은 (project_name, True, 0.0)으로 반환합니다
+    (build_multiple_webgl_projects 결과와 같은 형식).
+    """
+    stage_results = []
+    for project_name, stage_infos in result["projects"].items():
+        info = stage_infos.get(stage)
+        if not info or info["status"] == "skipped":
+            continue
+        stage_results.append((project_name, info["status"] in ("success", "cached"), info["seconds"]))
+    return stage_results
+
+def print_stage_pipeline_summary(result):
+    """단계별 결과 수, 작업 시간 합계, 최대 동시 실행 수와 단계 간 겹침(작업 시간 합계 / 전체 시간)을 출력합니다."""
+    if not result["stages"] or not result["projects"]:
+        return
+    print(f"\n=== 프로젝트별 단계 파이프라인 결과 ===")
+    print(f"   {'단계':<16}{'성공':>6}{'캐시':>6}{'실패':>6}{'건너뜀':>8}{'작업 시간 합계':>16}{'최대 동시':>10}")
+    total_busy = 0.0
+    for stage in result["stages"]:
+        counts = {"success": 0, "cached": 0, "failed": 0, "skipped": 0}
+        busy = 0.0
+        intervals = []
+        for stage_infos in result["projects"].values():
+            info = stage_infos.get(stage)
+            if not info:
+                continue
+            counts[info["status"]] += 1
+            busy += info["seconds"]
+            if info["start"] is not None:
+                intervals.append((info["start"], info["end"]))
+        # 최대 동시 실행 수: 작업이 시작될 때 실행 중이던 작업 수 (자기 자신 포함)
+        peak = 0
+        for index, (start, _) in enumerate(intervals):
+            peak = max(peak, sum(1 for other_index, (other_start, other_end) in enumerate(intervals)
+                                 if other_index == index or other_start <= start < other_end))
+        total_busy += busy
+        print(f"   {STAGE_NAMES[stage]:<16}{counts['success']:>6}{counts['cached']:>6}{counts['failed']:>6}"
+              f"{counts['skipped']:>8}{format_duration(busy):>16}{peak:>10}")
+
+    wall_seconds = result["wall_seconds"]
+    print(f"⏱️ 전체 소요 시간: {format_duration(wall_seconds)}")
+    if wall_seconds > 0:
+        print(f"🔀 단계 작업 시간 합계 / 전체 시간: {total_busy / wall_seconds:.2f}배 (1보다 크면 작업이 겹쳐 실행됨)")
@@ -0,0 +1,45 @@
+"""
+build_phases 단계 인식(detect_phase) 테스트
+- IL2CPP / C++ 컴파일 / WASM 링크는 Unity/Bee 표식에서만 인식 (정지 감시 제한이 길어지는 단계)
+
+실행: python -m unittest discover -s Tools/tests (또는 python -m pytest Tools/tests)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from build_phases import detect_phase  # noqa: E402
+
+
+class DetectPhaseTest(unittest.TestCase):
+
+    def test_bee_nodes(self):
+        self.assertEqual(detect_phase("[ 140/1204  0s] IL2CPP_CodeGen C:/Project/Library/Bee/artifacts/WebGL/il2cppOutput/cpp"),
+                         "il2cpp_codegen")
+        self.assertEqual(detect_phase("[ 594/1204 12s] C_WebGL_wasm Library/Bee/artifacts/WebGL/Fake.cpp"), "cpp_compile")
+        self.assertEqual(detect_phase("[1203/1204 1m5s] Link_WebGL_wasm Library/Bee/artifacts/WebGL/build.js"), "wasm_link")
+        self.assertEqual(detect_phase("Converting managed assemblies to C++"), "il2cpp_codegen")
+
+    def test_general_mentions_do_not_switch_phase(self):
+        lines = [
+            "Scripting backend: IL2CPP",
+            "Loading Emscripten toolchain from C:/Unity/Editor/Data/PlaybackEngines/WebGLSupport",
+            "Generating code for UnityEngine.UI bindings",
+            "Assets/Plugins/wasm-ld-notes.txt",
+            "Copying C_WebGL_wasm.rsp to Temp",
+            "[DannectTask] Link_WebGL_wasm: Skipped",
+        ]
+        for line in lines:
+            self.assertIsNone(detect_phase(line), line)
+
+    def test_other_phases(self):
+        self.assertEqual(detect_phase("Requested script compilation because: Assetdatabase observed changes"),
+                         "script_compilation")
+        self.assertEqual(detect_phase("Start importing Assets/Scenes/Main.unity using Guid(0)"), "asset_import")
+        self.assertEqual(detect_phase("Building WebGL Player: writing scene 1"), "player_build")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+build_trace 트레이스 기록 테스트
+- 다른 스레드가 구간/슬롯을 기록하는 중에 save_trace로 기록을 끝내도 예외가 발생하지 않음
+
+실행: python -m unittest discover -s Tools/tests (또는 python -m pytest Tools/tests)
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import build_trace  # noqa: E402
+
+
+class SaveTraceRaceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="dannect_build_trace_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_events_while_saving(self):
+        errors = []
+        # 스레드 전환을 자주 일으켜 확인과 기록 사이에 save_trace가 끼어들 기회를 만듦
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+        for index in range(5):
+            build_trace.start_trace(os.path.join(self.work_dir, f"trace_{index}.json"))
+            stop = threading.Event()
+
+            def record():
+                try:
+                    while not stop.is_set():
+                        slot = build_trace.acquire_slot()
+                        now = time.time()
+                        build_trace.add_span("빌드", "build", now, now, slot or 0)
+                        build_trace.add_instant("캐시 적중", "cache")
+                        build_trace.release_slot(slot)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=record) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.01)
+            self.assertIsNotNone(build_trace.save_trace())
+            time.sleep(0.005)
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+가짜 Unity(fake_unity)로 run_unity_webgl_build 전체 경로 테스트
+- 시나리오별 반환값과 종료 사유(build_info["exit_reason"]) 확인:
+  success / unityweb / 로그 기반 검증(BuildReport 없음), compile_error, crash, build_failed, hang(정지 감시)
+- BUILD_OUTPUT_DIR / UNITY_EDITOR_PATH는 override_config로 임시 폴더와 가짜 Unity 실행 스크립트로 변경
+
+실행: python -m unittest discover -s Tools/tests (또는 python -m pytest Tools/tests)
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark_utils import override_config, restore_config, quiet_output  # noqa: E402
+from fake_unity import create_fake_unity_launcher, write_fake_unity_settings  # noqa: E402
+from orchestration_benchmark import create_fake_projects  # noqa: E402
+from build_manager import run_unity_webgl_build  # noqa: E402
+
+FAKE_DURATION = 0.3
+STALL_TIMEOUT = 1
+
+
+class FakeUnityBuildTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.mkdtemp(prefix="dannect_fake_build_test_")
+        cls.launcher_path = create_fake_unity_launcher(os.path.join(cls.work_dir, "FakeUnity"))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir, ignore_errors=True)
+
+    def setUp(self):
+        environment = mock.patch.dict(os.environ, {"FAKE_UNITY_DURATION": str(FAKE_DURATION),
+                                                   "FAKE_UNITY_LOG_LINES": "50"})
+        environment.start()
+        self.addCleanup(environment.stop)
+        previous = override_config(
+            UNITY_EDITOR_PATH=self.launcher_path,
+            BUILD_OUTPUT_DIR=os.path.join(self.work_dir, "Build"),
+            BUILD_STALL_TIMEOUT=STALL_TIMEOUT,
+            BUILD_STALL_PHASE_TIMEOUTS={}
+        )
+        self.addCleanup(restore_config, previous)
+
+    def build(self, scenario, **settings):
+        project_dir = create_fake_projects(os.path.join(self.work_dir, "Projects"), 1, prefix=f"Fake_{scenario}")[0]
+        write_fake_unity_settings(project_dir, scenario=scenario, **settings)
+        build_info = {}
+        with quiet_output(False):
+            success, elapsed_time = run_unity_webgl_build(project_dir, timeout=30, build_info=build_info)
+        return success, elapsed_time, build_info
+
+    def test_success(self):
+        success, elapsed_time, build_info = self.build("success")
+        self.assertTrue(success)
+        self.assertEqual(build_info["exit_reason"], "success")
+        self.assertGreaterEqual(elapsed_time, FAKE_DURATION)
+
+    def test_unityweb_outputs(self):
+        success, _, build_info = self.build("unityweb")
+        self.assertTrue(success)
+        self.assertEqual(build_info["exit_reason"], "success")
+
+    def test_success_without_report_uses_log_markers(self):
+        success, _, build_info = self.build("success", write_report=False)
+        self.assertTrue(success)
+        self.assertEqual(build_info["exit_reason"], "success")
+        self.assertTrue(build_info["log_markers"].get("completed"))
+
+    def test_compile_error(self):
+        success, _, build_info = self.build("compile_error")
+        self.assertFalse(success)
+        self.assertEqual(build_info["exit_reason"], "compile_error")
+
+    def test_crash(self):
+        success, _, build_info = self.build("crash")
+        self.assertFalse(success)
+        self.assertEqual(build_info["exit_reason"], "exit_code_139")
+
+    def test_build_failed(self):
+        success, _, build_info = self.build("build_failed")
+        self.assertFalse(success)
+        self.assertEqual(build_info["exit_reason"], "validation_failed")
+
+    def test_hang_is_stopped_by_stall_watchdog(self):
+        success, elapsed_time, build_info = self.build("hang")
+        self.assertFalse(success)
+        self.assertEqual(build_info["exit_reason"], "stalled")
+        self.assertLess(elapsed_time, STALL_TIMEOUT + 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+git_utils 작업 트리 상태 요약(get_status_digest) 테스트
+- Unity 프로젝트가 리포지토리의 하위 폴더인 경우
+- 한글(비ASCII) 파일명
+
+실행: python -m unittest discover -s Tools/tests (또는 python -m pytest Tools/tests)
+"""
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git_utils import get_status_digest  # noqa: E402
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+def _append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git이 설치되어 있지 않습니다")
+class StatusDigestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.repo_dir = tempfile.mkdtemp(prefix="dannect_git_utils_test_")
+        self.project_dir = os.path.join(self.repo_dir, "Projects", "UnityProject")
+        os.makedirs(os.path.join(self.project_dir, "Assets"))
+        self.tracked_file = os.path.join(self.project_dir, "Assets", "Tracked.cs")
+        self.outside_file = os.path.join(self.repo_dir, "README.md")
+        _append(self.tracked_file, "class Tracked {}\n")
+        _append(self.outside_file, "readme\n")
+        _git(self.repo_dir, "init", "-q")
+        _git(self.repo_dir, "add", "-A")
+        _git(self.repo_dir, "commit", "-q", "-m", "init")
+
+    def tearDown(self):
+        shutil.rmtree(self.repo_dir, ignore_errors=True)
+
+    def test_subfolder_project_detects_repeated_edits(self):
+        _append(self.tracked_file, "// 1\n")
+        first = get_status_digest(self.project_dir)
+        # 이미 수정된 파일을 다시 수정하면 status 줄은 같지만 크기/수정 시간이 바뀜
+        _append(self.tracked_file, "// 2\n")
+        second = get_status_digest(self.project_dir)
+        self.assertIsNotNone(first)
+        self.assertNotEqual(first, second)
+
+    def test_non_ascii_filename_detects_edits(self):
+        korean_file = os.path.join(self.project_dir, "Assets", "한글 에셋.txt")
+        _append(korean_file, "1\n")
+        first = get_status_digest(self.project_dir)
+        _append(korean_file, "2\n")
+        second = get_status_digest(self.project_dir)
+        self.assertIsNotNone(first)
+        self.assertNotEqual(first, second)
+
+    def test_changes_outside_project_are_ignored(self):
+        before = get_status_digest(self.project_dir)
+        _append(self.outside_file, "changed\n")
+        self.assertEqual(before, get_status_digest(self.project_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
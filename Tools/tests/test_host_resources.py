@@ -0,0 +1,46 @@
+"""
+host_resources 동시 실행 조절기(AdaptiveConcurrencyController.run) 테스트
+- 호출 측이 반복을 중간에 멈추면 on_cancel(프로세스 트리 종료)을 호출하지 않고 대기 중인 작업만 취소
+
+실행: python -m unittest discover -s Tools/tests (또는 python -m pytest Tools/tests)
+"""
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host_resources import AdaptiveConcurrencyController  # noqa: E402
+
+
+class ControllerRunTest(unittest.TestCase):
+
+    def test_break_does_not_cancel_running_work(self):
+        controller = AdaptiveConcurrencyController(2, 1, 0.01, adaptive=False)
+        cancelled = []
+        finished = []
+
+        def work(item):
+            time.sleep(0.1 * item)
+            finished.append(item)
+            return item
+
+        for _ in controller.run(work, [0, 1, 2, 3, 4], on_cancel=lambda: cancelled.append(True)):
+            break
+
+        self.assertEqual(cancelled, [])
+        self.assertEqual(sorted(finished), [0, 1])  # 실행 중이던 작업은 끝까지 실행, 대기 중인 작업은 시작하지 않음
+
+    def test_interrupt_while_waiting_calls_on_cancel(self):
+        controller = AdaptiveConcurrencyController(1, 1, 0.01, adaptive=False)
+        cancelled = []
+        runner = controller.run(lambda item: time.sleep(0.2), [0, 1], on_cancel=lambda: cancelled.append(True))
+        next(runner)
+        # 완료 대기 중 Ctrl+C (run 내부에서 KeyboardInterrupt 발생)
+        with self.assertRaises(KeyboardInterrupt):
+            runner.throw(KeyboardInterrupt)
+        self.assertEqual(cancelled, [True])
+
+if __name__ == "__main__":
+    unittest.main()
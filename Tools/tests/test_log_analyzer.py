@@ -0,0 +1,53 @@
+"""
+log_analyzer 빌드 로그 분석(analyze_build_log) 테스트
+- 수집 줄 수 제한(max_error_lines)에 도달한 뒤에도 에러 수는 끝까지 셈
+
+실행: python -m unittest discover -s Tools/tests (또는 python -m pytest Tools/tests)
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from log_analyzer import analyze_build_log, BUILD_SCRIPT_MARKER  # noqa: E402
+
+
+class AnalyzeBuildLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="dannect_log_analyzer_test_")
+        self.log_path = os.path.join(self.work_dir, "build.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _write_log(self, lines):
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def test_error_count_continues_after_line_cap(self):
+        lines = [f"=== {BUILD_SCRIPT_MARKER} ==="]
+        for index in range(50):
+            lines.append(f"info line {index}")
+            lines.append(f"Assets/Scripts/Broken{index}.cs(1,1): error CS0103: missing name")
+        self._write_log(lines)
+
+        analysis = analyze_build_log(self.log_path, context_lines=1, max_error_lines=10)
+        self.assertEqual(analysis["error_count"], 50)
+        self.assertEqual(len(analysis["error_lines"]), 10)
+        self.assertTrue(analysis["script_started"])
+
+    def test_script_marker_after_errors(self):
+        self._write_log(["error CS0001: first", "error CS0002: second", BUILD_SCRIPT_MARKER])
+
+        analysis = analyze_build_log(self.log_path, context_lines=0, max_error_lines=1)
+        self.assertEqual(analysis["error_count"], 2)
+        self.assertEqual(analysis["error_lines"], ["error CS0001: first"])
+        self.assertTrue(analysis["script_started"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+payload_budget 다운로드 크기 예산 확인 테스트
+- .br / .gz / .unityweb / 비압축 출력 모두 예산 대상으로 인식
+- 예산이 있는 파일 종류가 없으면 "missing" 항목으로 남아 예산 이내로 보이지 않음
+
+실행: python -m unittest discover -s Tools/tests (또는 python -m pytest Tools/tests)
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import payload_budget  # noqa: E402
+from payload_budget import check_payload_budgets, MB  # noqa: E402
+
+
+class PayloadBudgetTest(unittest.TestCase):
+
+    def setUp(self):
+        budgets = payload_budget.WEBGL_PAYLOAD_BUDGET_MB
+        self.addCleanup(setattr, payload_budget, "WEBGL_PAYLOAD_BUDGET_MB", budgets)
+        payload_budget.WEBGL_PAYLOAD_BUDGET_MB = {".wasm": 1, ".data": 1, ".framework.js": 1}
+
+    def test_matches_any_compression(self):
+        for suffix in (".br", ".gz", ".unityweb", ""):
+            files = [(f"App.wasm{suffix}", 2 * MB), (f"App.data{suffix}", MB // 2),
+                     (f"App.framework.js{suffix}", 10), ("App.loader.js", 10)]
+            results = check_payload_budgets("App", files)
+            self.assertEqual([result["file"] for result in results],
+                             [f"App.wasm{suffix}", f"App.data{suffix}", f"App.framework.js{suffix}"])
+            self.assertEqual([result["exceeded"] for result in results], [True, False, False])
+
+    def test_missing_kind_is_reported(self):
+        results = check_payload_budgets("App", [("App.wasm.br", 10), ("App.data.br", 10)])
+        missing = [result for result in results if result["missing"]]
+        self.assertEqual([result["label"] for result in missing], ["Framework"])
+        self.assertFalse(missing[0]["exceeded"])
+
+    def test_legacy_budget_keys(self):
+        payload_budget.WEBGL_PAYLOAD_BUDGET_MB = {".wasm.br": 1}
+        results = check_payload_budgets("App", [("App.wasm.unityweb", 2 * MB)])
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0]["exceeded"])
+
+
+if __name__ == "__main__":
+    unittest.main()
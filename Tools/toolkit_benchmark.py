@@ -0,0 +1,228 @@
+"""
+툴킷 프로젝트 작업 벤치마크 (가짜 Unity 프로젝트 fleet 기준)
+- fleet_generator로 프로젝트 수별(10, 100, 500개) fleet을 만들고, 전체 프로젝트에 대해 툴킷 작업을 실제 순서대로 실행:
+  1. get_unity_projects_from_directory (프로젝트 검색)
+  2. find_system_manager_files (Assets 트리 전체 탐색)
+  3. add_methods_to_system_managers (SystemManager 메소드 추가)
+  4. add_git_packages_to_manifest (패키지 추가/수정, 이어서 변경 없는 두 번째 실행)
+  5. Git 도구: is_git_repository + get_current_branch, get_status_digest (변경된 작업 트리),
+     브랜치/HEAD/상태 조회 (순차 실행 vs async_runner.get_git_states 이벤트 루프 동시 실행),
+     get_target_branch (브랜치 계층 분석), commit_changes, push_changes (로컬 bare 원격)
+- 작업별 전체 시간, 프로젝트당 시간, 프로젝트당 Git 명령 실행 횟수, 최대 RSS 증가량을 기록
+  (툴킷 출력은 숨김, fleet 생성 시간은 따로 기록)
+- 결과는 BUILD_OUTPUT_DIR/_Benchmarks/toolkit_fleet_<시각>.json에 저장 (--output으로 경로 지정)
+
+실행: python toolkit_benchmark.py [--sizes 10,100,500] [--assets 1000] [--seed 1] [--no-remote]
+                                 [--work-dir 폴더] [--keep] [--verbose] [--output 경로]
+"""
+import os
+import sys
+import shutil
+import tempfile
+import contextlib
+from config import Config, get_unity_projects_from_directory
+from system_manager import find_system_manager_files, add_methods_to_system_managers
+from package_manager import add_git_packages_to_manifest
+from git_utils import (
+    GitUtils, is_git_repository, get_current_branch, get_head_commit, get_status_digest, get_target_branch,
+    commit_changes, push_changes
+)
+import async_runner
+from fleet_generator import generate_project_fleet, summarize_fleet, DEFAULT_ASSETS_PER_PROJECT
+from benchmark_utils import (
+    measure, quiet_output, parse_int_list, get_option_value, print_table, save_benchmark_json
+)
+
+# 전역 변수 참조 (호환성 유지)
+git_packages = Config.GIT_PACKAGES
+
+DEFAULT_PROJECT_COUNTS = [10, 100, 500]
+BENCHMARK_COMMIT_MESSAGE = "CHORE: 툴킷 벤치마크 변경사항"
+# 에셋 하나당 예상 디스크 사용량 (파일 + .meta의 블록 크기, Git 객체, 원격 pack 포함)
+DISK_BYTES_PER_ASSET = 20 * 1024
+
+
+@contextlib.contextmanager
+def count_git_commands():
+    """블록 안에서 실행된 Git 명령 수를 셉니다 (yield하는 dict의 "count").
+
+    GitUtils.run_command와 async_runner.run_git_command 호출을 모두 셉니다.
+    """
+    counter = {"count": 0}
+    original = GitUtils.run_command
+    original_async = async_runner.run_git_command
+
+    def counting_run_command(command, cwd, *args, **kwargs):
+        counter["count"] += 1
+        return original(command, cwd, *args, **kwargs)
+
+    async def counting_run_git_command(command, cwd, *args, **kwargs):
+        counter["count"] += 1
+        return await original_async(command, cwd, *args, **kwargs)
+
+    GitUtils.run_command = staticmethod(counting_run_command)
+    async_runner.run_git_command = counting_run_git_command
+    try:
+        yield counter
+    finally:
+        GitUtils.run_command = staticmethod(original)
+        async_runner.run_git_command = original_async
+
+def _for_each_project(func, project_dirs):
+    """프로젝트마다 func를 실행하고 성공(참) 결과 수를 반환합니다."""
+    return sum(1 for project_dir in project_dirs if func(project_dir))
+
+def _check_git_state(project_dir):
+    return is_git_repository(project_dir) and get_current_branch(project_dir)
+
+def _read_git_state(project_dir):
+    return get_current_branch(project_dir) and get_head_commit(project_dir) and get_status_digest(project_dir)
+
+def _read_git_states_async(project_dirs):
+    return sum(1 for state in async_runner.get_git_states(project_dirs).values() if state and state["status_digest"])
+
+def _add_packages(project_dir):
+    add_git_packages_to_manifest(project_dir, git_packages)
+    return True
+
+def get_benchmark_operations(fleet_root, with_remote=True):
+    """측정할 작업 목록을 실행 순서대로 반환합니다: [(이름, 함수(project_dirs)), ...].
+
+    앞 작업의 결과(수정된 파일, 커밋)를 다음 작업이 사용하므로 순서를 바꾸면 안 됩니다.
+    함수의 반환값은 결과 요약(찾은 수 / 성공 수 / 성공 여부)입니다.
+    """
+    operations = [
+        ("get_unity_projects_from_directory", lambda project_dirs: len(get_unity_projects_from_directory(fleet_root))),
+        ("find_system_manager_files", lambda project_dirs: len(find_system_manager_files(project_dirs))),
+        ("add_methods_to_system_managers", add_methods_to_system_managers),
+        ("add_git_packages_to_manifest (추가/수정)", lambda project_dirs: _for_each_project(_add_packages, project_dirs)),
+        ("add_git_packages_to_manifest (변경 없음)", lambda project_dirs: _for_each_project(_add_packages, project_dirs)),
+        ("is_git_repository + get_current_branch", lambda project_dirs: _for_each_project(_check_git_state, project_dirs)),
+        ("get_status_digest", lambda project_dirs: _for_each_project(get_status_digest, project_dirs)),
+        ("브랜치 + HEAD + 상태 조회 (순차)", lambda project_dirs: _for_each_project(_read_git_state, project_dirs)),
+        ("브랜치 + HEAD + 상태 조회 (asyncio)", _read_git_states_async),
+        ("get_target_branch", lambda project_dirs: _for_each_project(get_target_branch, project_dirs)),
+        ("commit_changes",
+         lambda project_dirs: _for_each_project(
+             lambda project_dir: commit_changes(project_dir, custom_message=BENCHMARK_COMMIT_MESSAGE), project_dirs)),
+    ]
+    if with_remote:
+        operations.append(("push_changes", lambda project_dirs: _for_each_project(push_changes, project_dirs)))
+    return operations
+
+def run_fleet_operations(fleet_root, project_count, with_remote=True, verbose=False):
+    """fleet 하나에 대해 작업을 순서대로 실행하고 작업별 측정 결과를 반환합니다."""
+    results = []
+    with quiet_output(verbose):
+        project_dirs = sorted(get_unity_projects_from_directory(fleet_root))
+
+    for name, func in get_benchmark_operations(fleet_root, with_remote):
+        with quiet_output(verbose), count_git_commands() as git_counter:
+            output, timing = measure(func, project_dirs)
+        rss_delta_mb = None
+        if timing["peak_memory_mb"] is not None and timing["start_memory_mb"] is not None:
+            rss_delta_mb = round(timing["peak_memory_mb"] - timing["start_memory_mb"], 1)
+        result = {
+            "projects": project_count,
+            "operation": name,
+            "seconds": timing["seconds"],
+            "ms_per_project": round(timing["seconds"] * 1000 / max(1, len(project_dirs)), 2),
+            "git_commands_per_project": round(git_counter["count"] / max(1, len(project_dirs)), 1),
+            "rss_delta_mb": rss_delta_mb,
+            "result": output
+        }
+        results.append(result)
+        print(f"     {name}: {result['seconds']:.3f}초 ({result['ms_per_project']:.1f}ms/프로젝트, 결과 {output})")
+    return results
+
+def run_toolkit_benchmark(project_counts=None, asset_count=DEFAULT_ASSETS_PER_PROJECT, seed=1, with_remote=True,
+                          work_dir=None, keep=False, verbose=False, output_path=None):
+    """프로젝트 수별로 fleet을 만들고 툴킷 작업의 시간을 측정합니다.
+
+    Returns:
+        list: [{"projects", "operation", "seconds", "ms_per_project", "git_commands_per_project",
+                "rss_delta_mb", "result"}, ...]
+    """
+    project_counts = project_counts or DEFAULT_PROJECT_COUNTS
+    created_work_dir = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix="dannect_toolkit_benchmark_")
+    os.makedirs(work_dir, exist_ok=True)
+
+    print(f"\n=== 툴킷 프로젝트 작업 벤치마크: {', '.join(f'{count}개' for count in project_counts)} 프로젝트 ===")
+    print(f"   작업 폴더: {work_dir} (프로젝트당 에셋 {asset_count}개 + .meta, seed {seed}, "
+          f"원격 {'로컬 bare 리포지토리' if with_remote else '없음'})")
+
+    results = []
+    fleets = []
+    try:
+        for project_count in project_counts:
+            fleet_root = os.path.join(work_dir, f"fleet_{project_count}")
+            if os.path.exists(fleet_root):
+                # 이전 실행에서 이미 커밋/수정된 fleet은 측정 조건이 달라지므로 새로 생성
+                shutil.rmtree(fleet_root, ignore_errors=True)
+            required_bytes = project_count * asset_count * DISK_BYTES_PER_ASSET
+            if shutil.disk_usage(work_dir).free < required_bytes * 1.2:
+                print(f"   ⚠️ {project_count}개: 디스크 여유 공간 부족 (예상 {required_bytes / 1024 ** 3:.1f}GB), 건너뜀")
+                continue
+
+            print(f"   ▶ {project_count}개 프로젝트 생성 중...")
+            projects, generation = measure(generate_project_fleet, fleet_root, project_count, asset_count, seed,
+                                           with_remote=with_remote, verbose=verbose)
+            fleet = {"projects": project_count, "generation_seconds": generation["seconds"],
+                     "variants": summarize_fleet(projects)}
+            fleets.append(fleet)
+            print(f"     생성 완료 ({generation['seconds']:.1f}초)")
+
+            results.extend(run_fleet_operations(fleet_root, project_count, with_remote, verbose))
+            if not keep:
+                shutil.rmtree(fleet_root, ignore_errors=True)
+    finally:
+        if keep or not created_work_dir:
+            print(f"📁 작업 폴더 유지: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_toolkit_benchmark_results(results)
+    path = save_benchmark_json("toolkit_fleet", {
+        "asset_count": asset_count,
+        "seed": seed,
+        "with_remote": with_remote,
+        "fleets": fleets,
+        "results": results
+    }, output_path)
+    if path:
+        print(f"\n💾 벤치마크 결과 저장: {path}")
+    return results
+
+def print_toolkit_benchmark_results(results):
+    columns = [("프로젝트 수 / 작업", 48), ("시간", 11), ("프로젝트당", 12), ("Git 명령", 10), ("RSS 증가", 10)]
+    rows = []
+    for result in results:
+        rows.append([
+            f"{result['projects']}개 {result['operation']}",
+            f"{result['seconds']:.3f}초",
+            f"{result['ms_per_project']:.1f}ms",
+            result["git_commands_per_project"] or None,
+            f"{result['rss_delta_mb']:.0f}MB" if result["rss_delta_mb"] is not None else None
+        ])
+    print_table("툴킷 프로젝트 작업 벤치마크 (Git 명령: 프로젝트당 실행 횟수)", columns, rows)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--help" in argv or "-h" in argv:
+        print(__doc__)
+        return
+    run_toolkit_benchmark(
+        project_counts=parse_int_list(get_option_value(argv, "--sizes", "")) or None,
+        asset_count=int(get_option_value(argv, "--assets", DEFAULT_ASSETS_PER_PROJECT)),
+        seed=int(get_option_value(argv, "--seed", 1)),
+        with_remote="--no-remote" not in argv,
+        work_dir=get_option_value(argv, "--work-dir"),
+        keep="--keep" in argv,
+        verbose="--verbose" in argv,
+        output_path=get_option_value(argv, "--output")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,23 @@ Unity CLI 자동화 함수들
 """
 import os
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from config import Config
 from git_utils import get_project_name_from_path
+from host_resources import AdaptiveConcurrencyController, get_host_worker_limit
+from process_tree import (
+    start_process_group, release_process, kill_process_tree, kill_all_process_trees, new_process_group, process_group
+)
 
 # 전역 변수 참조 (호환성 유지)
 UNITY_EDITOR_PATH = Config.UNITY_EDITOR_PATH
 UNITY_TIMEOUT = Config.UNITY_TIMEOUT
+UNITY_BATCH_TASKS = Config.UNITY_BATCH_TASKS
+UNITY_BATCH_MEMORY_MB = Config.UNITY_BATCH_MEMORY_MB
+UNITY_BATCH_CPU = Config.UNITY_BATCH_CPU
+ADAPTIVE_CONCURRENCY = Config.ADAPTIVE_CONCURRENCY
+
+# 패키지 Editor 어셈블리의 배치 처리 진입점 (Editor/Scripts/BatchProcessor.cs)
+BATCH_PROCESS_METHOD = "Dannect.Toolkit.Editor.BatchProcessor.ProcessBatch"
 
 
 def find_unity_editor_path():
@@ -38,8 +48,8 @@ def find_unity_editor_path():
     
     return None
 
-def run_unity_batch_mode(project_path, method_name=None, timeout=UNITY_TIMEOUT):
-    """Unity를 배치 모드로 실행하여 Editor 스크립트를 실행합니다."""
+def resolve_unity_editor_path():
+    """설정된 Unity Editor 경로를 반환하고, 없으면 자동 검색합니다 (찾지 못하면 None)."""
     unity_path = UNITY_EDITOR_PATH
     
     # Unity 경로가 존재하지 않으면 자동 검색
@@ -49,13 +59,12 @@ def run_unity_batch_mode(project_path, method_name=None, timeout=UNITY_TIMEOUT):
         unity_path = find_unity_editor_path()
         if not unity_path:
             print("Unity Editor를 찾을 수 없습니다. UNITY_EDITOR_PATH를 확인해주세요.")
-            return False
+            return None
         print(f"Unity 경로 발견: {unity_path}")
-    
-    project_name = get_project_name_from_path(project_path)
-    print(f"Unity 배치 모드 실행 중: {project_name}")
-    
-    # Unity 명령어 구성
+    return unity_path
+
+def build_unity_batch_command(unity_path, project_path, method_name=None, extra_args=None):
+    """Unity 배치 모드 명령어를 구성합니다 (로그는 콘솔(stdout)로 출력)."""
     cmd = [
         unity_path,
         "-batchmode",           # 배치 모드
@@ -68,16 +77,64 @@ def run_unity_batch_mode(project_path, method_name=None, timeout=UNITY_TIMEOUT):
     if method_name:
         cmd.extend(["-executeMethod", method_name])
     
+    if extra_args:
+        cmd.extend(extra_args)
+    return cmd
+
+def evaluate_unity_batch_result(returncode, stdout, project_name):
+    """Unity 배치 모드 종료 코드와 출력으로 성공 여부를 판단합니다."""
+    # Unity는 성공해도 exit code가 0이 아닐 수 있음
+    if returncode == 0:
+        print(f"Unity 배치 모드 완료: {project_name}")
+        return True
+    else:
+        print(f"Unity 배치 모드 경고 (exit code: {returncode}): {project_name}")
+        # 로그에서 실제 오류 확인
+        output = (stdout or "").lower()
+        if "error" in output or "exception" in output:
+            print("실제 오류 발견, 실패로 처리")
+            return False
+        else:
+            print("경고이지만 정상 처리된 것으로 판단")
+            return True
+
+def run_unity_batch_mode(project_path, method_name=None, timeout=UNITY_TIMEOUT, extra_args=None):
+    """Unity를 배치 모드로 실행하여 Editor 스크립트를 실행합니다.
+    
+    extra_args는 -executeMethod 뒤에 그대로 전달됩니다 (예: ["-dannectTasks", "refresh,save"]).
+    """
+    unity_path = resolve_unity_editor_path()
+    if not unity_path:
+        return False
+    
+    project_name = get_project_name_from_path(project_path)
+    print(f"Unity 배치 모드 실행 중: {project_name}")
+    
+    # Unity 명령어 구성
+    cmd = build_unity_batch_command(unity_path, project_path, method_name, extra_args)
+    
     try:
         print(f"Unity 명령어: {' '.join(cmd)}")
-        result = subprocess.run(
+        # 별도 프로세스 그룹으로 실행하여 타임아웃/취소 시 자식 프로세스까지 종료
+        process = start_process_group(
             cmd,
+            label=project_name,
             cwd=project_path,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
             encoding='utf-8'
         )
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+            release_process(process)
+        except subprocess.TimeoutExpired:
+            kill_process_tree(process, f"타임아웃 {timeout}초")
+            raise
+        except KeyboardInterrupt:
+            kill_process_tree(process, "사용자 취소 (Ctrl+C)")
+            raise
+        result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
         
         # Unity 로그 출력
         if result.stdout:
@@ -88,19 +145,7 @@ def run_unity_batch_mode(project_path, method_name=None, timeout=UNITY_TIMEOUT):
             print("=== Unity 오류 ===")
             print(result.stderr)
         
-        # Unity는 성공해도 exit code가 0이 아닐 수 있음
-        if result.returncode == 0:
-            print(f"Unity 배치 모드 완료: {project_name}")
-            return True
-        else:
-            print(f"Unity 배치 모드 경고 (exit code: {result.returncode}): {project_name}")
-            # 로그에서 실제 오류 확인
-            if "error" in result.stdout.lower() or "exception" in result.stdout.lower():
-                print("실제 오류 발견, 실패로 처리")
-                return False
-            else:
-                print("경고이지만 정상 처리된 것으로 판단")
-                return True
+        return evaluate_unity_batch_result(result.returncode, result.stdout, project_name)
                 
     except subprocess.TimeoutExpired:
         print(f"Unity 실행 타임아웃 ({timeout}초): {project_name}")
@@ -109,8 +154,12 @@ def run_unity_batch_mode(project_path, method_name=None, timeout=UNITY_TIMEOUT):
         print(f"Unity 실행 오류: {e}")
         return False
 
-def process_unity_project_batch(project_path):
-    """Unity 프로젝트를 배치 모드로 처리합니다."""
+def process_unity_project_batch(project_path, tasks=None):
+    """Unity 프로젝트를 배치 모드로 처리합니다.
+    
+    패키지의 BatchProcessor.ProcessBatch를 실행하며, tasks 순서대로
+    refresh / validate / save 작업을 수행합니다 (기본값: Config.UNITY_BATCH_TASKS).
+    """
     project_name = get_project_name_from_path(project_path)
     
     if not os.path.exists(project_path):
@@ -125,8 +174,15 @@ def process_unity_project_batch(project_path):
     
     print(f"\n=== {project_name} Unity 배치 처리 시작 ===")
     
+    if tasks is None:
+        tasks = UNITY_BATCH_TASKS
+    
     # Unity 배치 모드 실행 (패키지 임포트 및 프로젝트 설정 검증)
-    success = run_unity_batch_mode(project_path)
+    success = run_unity_batch_mode(
+        project_path,
+        method_name=BATCH_PROCESS_METHOD,
+        extra_args=["-dannectTasks", ",".join(tasks)]
+    )
     
     if success:
         print(f"=== {project_name} Unity 배치 처리 완료 ===")
@@ -135,99 +191,55 @@ def process_unity_project_batch(project_path):
         print(f"=== {project_name} Unity 배치 처리 실패 ===")
         return False
 
-def create_unity_batch_script(project_path):
-    """Unity Editor에서 실행할 배치 스크립트를 생성합니다."""
-    script_dir = os.path.join(project_path, "Assets", "Editor", "BatchScripts")
-    os.makedirs(script_dir, exist_ok=True)
-    
-    script_path = os.path.join(script_dir, "AutoBatchProcessor.cs")
-    
-    script_content = '''using UnityEngine;
-using UnityEditor;
-using System.IO;
-
-public class AutoBatchProcessor
-{
-    [MenuItem("Tools/Process Batch")]
-    public static void ProcessBatch()
-    {
-        Debug.Log("=== 배치 처리 시작 ===");
-        
-        // 패키지 임포트 및 Asset Database 갱신
-        AssetDatabase.Refresh();
-        
-        // 프로젝트 설정 검증
-        ValidateProjectSettings();
-        
-        // 최종 Asset Database 갱신
-        AssetDatabase.Refresh();
-        AssetDatabase.SaveAssets();
-        
-        Debug.Log("=== 배치 처리 완료 ===");
-    }
+def process_multiple_projects_parallel(project_dirs, max_workers=None, adaptive=None):
+    """여러 Unity 프로젝트를 병렬로 처리합니다.
     
-    private static void ValidateProjectSettings()
-    {
-        Debug.Log("프로젝트 설정 검증 중...");
-        
-        // 기본 프로젝트 설정 확인
-        if (string.IsNullOrEmpty(PlayerSettings.productName))
-        {
-            Debug.LogWarning("제품명이 설정되지 않았습니다.");
-        }
-        
-        if (string.IsNullOrEmpty(PlayerSettings.companyName))
-        {
-            Debug.LogWarning("회사명이 설정되지 않았습니다.");
-        }
-        
-        Debug.Log("프로젝트 설정 검증 완료");
-    }
-}
-'''
+    max_workers는 동시 실행 상한이며, None이면 호스트 CPU/메모리로 계산합니다.
+    adaptive가 True이면 (기본값 Config.ADAPTIVE_CONCURRENCY) 호스트 여유 자원에 따라 시작을 조절합니다.
+    """
+    if adaptive is None:
+        adaptive = ADAPTIVE_CONCURRENCY
+    if max_workers is None:
+        max_workers = get_host_worker_limit(UNITY_BATCH_MEMORY_MB, UNITY_BATCH_CPU) if adaptive else 3
     
-    try:
-        with open(script_path, 'w', encoding='utf-8') as f:
-            f.write(script_content)
-        print(f"배치 스크립트 생성 완료: {script_path}")
-        return True
-    except Exception as e:
-        print(f"배치 스크립트 생성 실패: {e}")
-        return False
-
-def process_multiple_projects_parallel(project_dirs, max_workers=3):
-    """여러 Unity 프로젝트를 병렬로 처리합니다."""
     print(f"\n=== 병렬 처리 시작 (최대 {max_workers}개 동시 실행) ===")
     
     success_count = 0
     fail_count = 0
     results = []
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # 모든 프로젝트를 병렬로 제출
-        future_to_project = {
-            executor.submit(process_unity_project_batch, project_dir): project_dir 
-            for project_dir in project_dirs if os.path.exists(project_dir)
-        }
+    controller = AdaptiveConcurrencyController(max_workers, UNITY_BATCH_MEMORY_MB, UNITY_BATCH_CPU, adaptive=adaptive)
+    existing_dirs = [project_dir for project_dir in project_dirs if os.path.exists(project_dir)]
+    
+    # 이번 병렬 처리가 시작한 Unity 프로세스만 취소 대상으로 등록
+    group = new_process_group()
+    
+    def process_in_group(project_dir):
+        with process_group(group):
+            return process_unity_project_batch(project_dir)
+    
+    def cancel_batches():
+        # Ctrl+C: 대기 중인 작업은 취소하고 이번 처리에서 실행 중인 Unity 프로세스 트리를 종료
+        print("\n⛔ 병렬 처리 취소: 실행 중인 Unity 프로세스 트리 종료 중...")
+        kill_all_process_trees("사용자 취소 (Ctrl+C)", group)
+    
+    # 완료된 작업들을 처리
+    for project_dir, future in controller.run(process_in_group, existing_dirs, on_cancel=cancel_batches):
+        project_name = get_project_name_from_path(project_dir)
         
-        # 완료된 작업들을 처리
-        for future in as_completed(future_to_project):
-            project_dir = future_to_project[future]
-            project_name = get_project_name_from_path(project_dir)
-            
-            try:
-                result = future.result()
-                if result:
-                    success_count += 1
-                    print(f"✅ {project_name} 병렬 처리 완료")
-                else:
-                    fail_count += 1
-                    print(f"❌ {project_name} 병렬 처리 실패")
-                results.append((project_name, result))
-            except Exception as e:
+        try:
+            result = future.result()
+            if result:
+                success_count += 1
+                print(f"✅ {project_name} 병렬 처리 완료")
+            else:
                 fail_count += 1
-                print(f"❌ {project_name} 병렬 처리 예외: {e}")
-                results.append((project_name, False))
+                print(f"❌ {project_name} 병렬 처리 실패")
+            results.append((project_name, result))
+        except Exception as e:
+            fail_count += 1
+            print(f"❌ {project_name} 병렬 처리 예외: {e}")
+            results.append((project_name, False))
     
     print(f"\n=== 병렬 처리 결과 ===")
     print(f"성공: {success_count}개")
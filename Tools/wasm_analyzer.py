@@ -0,0 +1,507 @@
+"""
+WebGL WebAssembly(.wasm) 모듈 크기 분석 및 빌드 간 비교
+- Build/*.wasm.br / .wasm.gz / .wasm.unityweb / .wasm을 스트리밍으로 압축 해제하며 섹션별 크기를 읽음
+  (압축 방식은 파일 앞부분으로 판별: webgl_data_analyzer.detect_compression)
+  (코드 / 데이터 / 함수 이름 등, 함수 본문은 크기만 읽고 건너뛰므로 메모리 사용량 일정)
+- 가져온(import) 함수 / 정의된 함수 / export 수, 데이터 세그먼트 수
+- name 섹션이 있으면 (Debug Symbols 포함 빌드) 가장 큰 함수 목록을 이름으로 표시
+- 분석 결과(프로파일)를 BUILD_OUTPUT_DIR/_Wasm/프로젝트명.json에 저장하고 이전 빌드와 비교
+  (WEBGL_CODE_OPTIMIZATION, Stripping Level, 패키지 버전 변경이 런타임 바이너리에 준 영향 확인)
+"""
+import os
+import json
+import time
+import heapq
+import zlib
+from config import Config
+from webgl_data_analyzer import DecompressedStream
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+
+WASM_MAGIC = b"\0asm"
+WASM_PROFILE_DIR_NAME = "_Wasm"
+
+# 분석 대상 파일 (우선순위 순)
+WASM_FILE_SUFFIXES = [".wasm.br", ".wasm.gz", ".wasm.unityweb", ".wasm"]
+
+# 출력할 큰 함수 수 / 프로파일에 저장할 큰 함수 수 (비교용)
+DEFAULT_TOP_FUNCTIONS = 20
+PROFILE_FUNCTION_LIMIT = 5000
+
+SECTION_NAMES = {
+    0: "custom", 1: "type", 2: "import", 3: "function", 4: "table", 5: "memory", 6: "global",
+    7: "export", 8: "start", 9: "element", 10: "code", 11: "data", 12: "datacount", 13: "tag"
+}
+
+# 작은 섹션은 통째로 읽어 항목 수를 셈 (code / data / custom은 스트리밍)
+SMALL_SECTION_LIMIT = 16 * 1024 * 1024
+
+# code / name 섹션을 나눠 읽는 크기 (함수 수만큼 스트림을 호출하지 않도록 버퍼에서 해석)
+SECTION_READ_SIZE = 256 * 1024
+
+
+def find_wasm_file(build_dir):
+    """프로젝트 빌드 폴더의 Build 하위에서 .wasm 파일을 찾습니다 (.br > .gz > .unityweb > 비압축 순).
+
+    Returns:
+        str: 파일 경로 (없으면 None)
+    """
+    build_folder = os.path.join(build_dir, "Build")
+    try:
+        names = sorted(os.listdir(build_folder))
+    except OSError:
+        return None
+    for suffix in WASM_FILE_SUFFIXES:
+        for name in names:
+            if name.lower().endswith(suffix):
+                return os.path.join(build_folder, name)
+    return None
+
+def _read_stream_leb(stream):
+    """스트림에서 부호 없는 LEB128 정수를 읽습니다."""
+    result = 0
+    shift = 0
+    while True:
+        byte = stream.read_exact(1)[0]
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result
+        shift += 7
+
+def _read_leb(data, offset):
+    """버퍼에서 부호 없는 LEB128 정수를 읽습니다.
+
+    Returns:
+        tuple: (값, 다음 위치)
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+def _read_stream_name(stream):
+    length = _read_stream_leb(stream)
+    return stream.read_exact(length).decode('utf-8', errors='replace')
+
+class _SectionReader:
+    """섹션 내용을 SECTION_READ_SIZE 단위로 읽어 버퍼에서 LEB128 / 이름을 해석합니다."""
+
+    def __init__(self, stream, end):
+        self._stream = stream
+        self._end = end
+        self._buffer = b""
+        self._offset = 0
+
+    def _ensure(self, size):
+        if len(self._buffer) - self._offset < size:
+            read_size = min(max(size, SECTION_READ_SIZE), self._end - self._stream.position)
+            self._buffer = self._buffer[self._offset:] + self._stream.read_exact(max(read_size, 0))
+            self._offset = 0
+
+    def read_leb(self):
+        self._ensure(10)
+        value, self._offset = _read_leb(self._buffer, self._offset)
+        return value
+
+    def read_name(self):
+        length = self.read_leb()
+        self._ensure(length)
+        name = self._buffer[self._offset:self._offset + length].decode('utf-8', errors='replace')
+        self._offset += length
+        return name
+
+    def skip(self, size):
+        self._offset += size
+        if self._offset > len(self._buffer):
+            self._stream.skip_to(self._stream.position + self._offset - len(self._buffer))
+            self._buffer = b""
+            self._offset = 0
+
+def _count_function_imports(data):
+    """import 섹션에서 가져온 함수 수를 셉니다 (함수 인덱스는 가져온 함수부터 시작)."""
+    count, offset = _read_leb(data, 0)
+    functions = 0
+    for _ in range(count):
+        for _ in range(2):  # 모듈 이름, 필드 이름
+            length, offset = _read_leb(data, offset)
+            offset += length
+        kind = data[offset]
+        offset += 1
+        if kind == 0:  # 함수: 타입 인덱스
+            _, offset = _read_leb(data, offset)
+            functions += 1
+        elif kind == 1:  # 테이블: 참조 타입 + limits
+            offset += 1
+            offset = _skip_limits(data, offset)
+        elif kind == 2:  # 메모리: limits
+            offset = _skip_limits(data, offset)
+        elif kind == 3:  # 전역 변수: 값 타입 + 변경 가능 여부
+            offset += 2
+        elif kind == 4:  # 태그: 속성 + 타입 인덱스
+            offset += 1
+            _, offset = _read_leb(data, offset)
+        else:
+            raise ValueError(f"알 수 없는 import 종류: {kind}")
+    return functions
+
+def _skip_limits(data, offset):
+    flags = data[offset]
+    offset += 1
+    _, offset = _read_leb(data, offset)
+    if flags & 1:
+        _, offset = _read_leb(data, offset)
+    return offset
+
+def _read_function_names(stream, end):
+    """name 섹션의 함수 이름(하위 섹션 1)을 읽습니다.
+
+    Returns:
+        dict: {함수 인덱스: 이름}
+    """
+    names = {}
+    while stream.position < end:
+        subsection_id = stream.read_exact(1)[0]
+        subsection_size = _read_stream_leb(stream)
+        subsection_end = stream.position + subsection_size
+        if subsection_id == 1:
+            reader = _SectionReader(stream, subsection_end)
+            count = reader.read_leb()
+            for _ in range(count):
+                index = reader.read_leb()
+                names[index] = reader.read_name()
+        stream.skip_to(subsection_end)
+    return names
+
+def analyze_wasm_file(wasm_file_path):
+    """.wasm 파일 하나를 분석합니다 (압축 해제는 한 번, 함수 본문은 크기만 읽음).
+
+    Returns:
+        dict: {
+            "file", "compressed_size", "size": 압축 해제 크기,
+            "sections": [{"name", "size"}, ...] (파일 순서, custom 섹션은 "custom:이름"),
+            "code_size", "data_size", "imported_functions", "functions", "exports", "data_segments",
+            "has_names": name 섹션 함수 이름 여부,
+            "function_sizes": [(함수 이름, 본문 크기), ...] (큰 순서, 상위 PROFILE_FUNCTION_LIMIT개)
+        }
+    """
+    stream = DecompressedStream(wasm_file_path, plain_magic=WASM_MAGIC)
+    result = {
+        "file": wasm_file_path,
+        "compressed_size": os.path.getsize(wasm_file_path),
+        "size": 0,
+        "sections": [],
+        "code_size": 0,
+        "data_size": 0,
+        "imported_functions": 0,
+        "functions": 0,
+        "exports": 0,
+        "data_segments": 0,
+        "has_names": False,
+        "function_sizes": []
+    }
+    largest = []  # (본문 크기, 정의된 함수 순번) 최소 힙
+    names = {}
+    try:
+        header = stream.read(8)
+        if len(header) < 8 or header[:4] != WASM_MAGIC:
+            raise ValueError("WebAssembly 파일이 아닙니다")
+
+        while True:
+            section_id_byte = stream.read(1)
+            if not section_id_byte:
+                break
+            section_id = section_id_byte[0]
+            section_size = _read_stream_leb(stream)
+            section_start = stream.position
+            section_end = section_start + section_size
+            name = SECTION_NAMES.get(section_id, f"unknown({section_id})")
+
+            if section_id == 0:
+                custom_name = _read_stream_name(stream)
+                name = f"custom:{custom_name}"
+                if custom_name == "name":
+                    names = _read_function_names(stream, section_end)
+            elif section_id == 10:
+                result["code_size"] = section_size
+                reader = _SectionReader(stream, section_end)
+                count = reader.read_leb()
+                result["functions"] = count
+                for index in range(count):
+                    body_size = reader.read_leb()
+                    reader.skip(body_size)
+                    if len(largest) < PROFILE_FUNCTION_LIMIT:
+                        heapq.heappush(largest, (body_size, index))
+                    elif body_size > largest[0][0]:
+                        heapq.heapreplace(largest, (body_size, index))
+            elif section_id == 11:
+                result["data_size"] = section_size
+                result["data_segments"] = _read_stream_leb(stream)
+            elif section_id in (2, 7) and section_size <= SMALL_SECTION_LIMIT:
+                data = stream.read_exact(section_size)
+                if section_id == 2:
+                    result["imported_functions"] = _count_function_imports(data)
+                else:
+                    result["exports"] = _read_leb(data, 0)[0]
+
+            stream.skip_to(section_end)
+            result["sections"].append({"name": name, "size": section_size})
+        result["size"] = stream.position
+    finally:
+        stream.close()
+
+    result["has_names"] = bool(names)
+    imported = result["imported_functions"]
+    result["function_sizes"] = [
+        (names.get(imported + index, f"func[{imported + index}]"), body_size)
+        for body_size, index in sorted(largest, reverse=True)
+    ]
+    return result
+
+def get_wasm_profile_path(project_name, previous=False):
+    """프로젝트의 wasm 분석 결과(프로파일) 경로를 반환합니다 (previous=True면 이전 빌드)."""
+    file_name = f"{project_name}.prev.json" if previous else f"{project_name}.json"
+    return os.path.join(BUILD_OUTPUT_DIR, WASM_PROFILE_DIR_NAME, file_name)
+
+def load_wasm_profile(path):
+    """저장된 프로파일을 읽습니다 (없거나 읽을 수 없으면 None)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_wasm_profile(path, profile):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+def analyze_project_wasm(project_name, label=None):
+    """프로젝트 빌드 출력의 .wasm을 분석하고 이전 빌드 프로파일과 비교할 수 있도록 저장합니다.
+
+    같은 .wasm 파일(크기, 수정 시각)을 다시 분석하면 저장된 프로파일을 그대로 사용하고,
+    새 빌드이면 기존 프로파일을 이전 빌드(.prev.json)로 옮긴 뒤 새로 저장합니다.
+
+    Args:
+        project_name: 프로젝트 이름
+        label: 프로파일에 기록할 설명 (예: Code Optimization 이름)
+
+    Returns:
+        tuple: (현재 프로파일, 이전 빌드 프로파일 또는 None) (.wasm이 없거나 분석 실패 시 (None, None))
+    """
+    wasm_file_path = find_wasm_file(os.path.join(BUILD_OUTPUT_DIR, project_name))
+    if not wasm_file_path:
+        print(f"⚠️ {project_name}: Build 폴더에 .wasm 파일이 없습니다")
+        return None, None
+
+    stat = os.stat(wasm_file_path)
+    profile_path = get_wasm_profile_path(project_name)
+    previous_path = get_wasm_profile_path(project_name, previous=True)
+    saved = load_wasm_profile(profile_path)
+    if saved and saved.get("file_size") == stat.st_size and saved.get("file_mtime") == stat.st_mtime:
+        return saved, load_wasm_profile(previous_path)
+
+    try:
+        profile = analyze_wasm_file(wasm_file_path)
+    except (OSError, ValueError, RuntimeError, IndexError, zlib.error) as e:
+        print(f"⚠️ {project_name}: .wasm 분석 실패 - {e}")
+        return None, None
+    profile.update({
+        "project": project_name,
+        "label": label,
+        "analyzed_at": time.time(),
+        "file_size": stat.st_size,
+        "file_mtime": stat.st_mtime
+    })
+
+    try:
+        if saved:
+            _save_wasm_profile(previous_path, saved)
+        _save_wasm_profile(profile_path, profile)
+    except OSError as e:
+        print(f"⚠️ {project_name}: wasm 프로파일 저장 실패 - {e}")
+    return profile, saved
+
+def load_wasm_source(path):
+    """비교할 대상을 읽습니다: .wasm(.br/.gz/.unityweb) 파일, 프로젝트 빌드 폴더, 또는 저장된 프로파일 JSON.
+
+    Returns:
+        dict: 분석 결과 (읽을 수 없으면 None)
+    """
+    if os.path.isdir(path):
+        wasm_file_path = find_wasm_file(path)
+        if not wasm_file_path:
+            print(f"⚠️ .wasm 파일이 없습니다: {path}")
+            return None
+        path = wasm_file_path
+    if path.lower().endswith(".json"):
+        profile = load_wasm_profile(path)
+        if profile is None:
+            print(f"⚠️ 프로파일을 읽을 수 없습니다: {path}")
+        return profile
+    try:
+        return analyze_wasm_file(path)
+    except (OSError, ValueError, RuntimeError, IndexError, zlib.error) as e:
+        print(f"⚠️ .wasm 분석 실패 ({path}): {e}")
+        return None
+
+def diff_wasm_profiles(old, new, top=DEFAULT_TOP_FUNCTIONS):
+    """두 빌드의 wasm 분석 결과를 비교합니다.
+
+    Returns:
+        dict: {
+            "totals": [(항목, 이전, 현재), ...],
+            "sections": [(섹션 이름, 이전 크기, 현재 크기), ...] (변화량 큰 순서),
+            "functions": [(함수 이름, 이전 크기, 현재 크기), ...] (변화량 큰 순서, 상위 top개,
+                         양쪽 모두 name 섹션이 있을 때만, 없는 함수는 크기 0)
+        }
+    """
+    totals = [
+        ("압축 크기", old["compressed_size"], new["compressed_size"]),
+        ("압축 해제 크기", old["size"], new["size"]),
+        ("코드 섹션", old["code_size"], new["code_size"]),
+        ("데이터 섹션", old["data_size"], new["data_size"]),
+        ("정의된 함수 수", old["functions"], new["functions"]),
+        ("가져온 함수 수", old["imported_functions"], new["imported_functions"]),
+        ("export 수", old["exports"], new["exports"]),
+    ]
+
+    old_sections = {}
+    for section in old["sections"]:
+        old_sections[section["name"]] = old_sections.get(section["name"], 0) + section["size"]
+    new_sections = {}
+    for section in new["sections"]:
+        new_sections[section["name"]] = new_sections.get(section["name"], 0) + section["size"]
+    sections = [(name, old_sections.get(name, 0), new_sections.get(name, 0))
+                for name in set(old_sections) | set(new_sections)]
+    sections.sort(key=lambda item: abs(item[2] - item[1]), reverse=True)
+
+    functions = []
+    if old["has_names"] and new["has_names"]:
+        old_functions = dict((name, size) for name, size in old["function_sizes"])
+        new_functions = dict((name, size) for name, size in new["function_sizes"])
+        # 프로파일에는 큰 함수만 저장되므로 한쪽 목록에서 빠진 함수는 그쪽 최소 크기 이하로 간주
+        old_floor = min(old_functions.values()) if len(old_functions) >= PROFILE_FUNCTION_LIMIT else 0
+        new_floor = min(new_functions.values()) if len(new_functions) >= PROFILE_FUNCTION_LIMIT else 0
+        for name in set(old_functions) | set(new_functions):
+            old_size = old_functions.get(name)
+            new_size = new_functions.get(name)
+            if old_size is None and old_floor:
+                continue
+            if new_size is None and new_floor:
+                continue
+            old_size = old_size or 0
+            new_size = new_size or 0
+            if old_size != new_size:
+                functions.append((name, old_size, new_size))
+        functions.sort(key=lambda item: abs(item[2] - item[1]), reverse=True)
+        functions = functions[:top]
+
+    return {"totals": totals, "sections": sections, "functions": functions}
+
+def _format_delta(old_value, new_value, is_size=True):
+    from build_report import format_size
+    delta = new_value - old_value
+    sign = "+" if delta >= 0 else "-"
+    change = f" ({delta / old_value * 100:+.1f}%)" if old_value else ""
+    if is_size:
+        return f"{sign}{format_size(abs(delta))}{change}"
+    return f"{delta:+d}{change}"
+
+def print_wasm_analysis(profile, top=DEFAULT_TOP_FUNCTIONS):
+    """wasm 분석 결과를 출력합니다 (섹션별 크기, 함수 수, 큰 함수)."""
+    from build_report import format_size
+
+    title = profile.get("project") or os.path.basename(profile["file"])
+    label = f" [{profile['label']}]" if profile.get("label") else ""
+    print(f"\n🧬 {title}{label}: {os.path.basename(profile['file'])} "
+          f"(압축 {format_size(profile['compressed_size'])} / 압축 해제 {format_size(profile['size'])})")
+    print(f"   함수: 정의 {profile['functions']:,}개 / 가져옴 {profile['imported_functions']:,}개 / "
+          f"export {profile['exports']:,}개, 데이터 세그먼트 {profile['data_segments']:,}개")
+
+    total = profile["size"] or 1
+    print("   섹션별 크기:")
+    for section in sorted(profile["sections"], key=lambda item: item["size"], reverse=True):
+        print(f"      {format_size(section['size']):>10}  {section['size'] / total * 100:5.1f}%  {section['name']}")
+
+    functions = profile["function_sizes"][:top]
+    if not functions:
+        return
+    if not profile["has_names"]:
+        print("   ℹ️ name 섹션이 없어 함수 번호로 표시합니다 (Player Settings의 Debug Symbols를 켜면 이름 표시)")
+    code_size = profile["code_size"] or 1
+    print(f"   큰 함수 상위 {len(functions)}개:")
+    for name, size in functions:
+        print(f"      {format_size(size):>10}  {size / code_size * 100:5.1f}%  {name}")
+
+def print_wasm_diff(old, new, top=DEFAULT_TOP_FUNCTIONS):
+    """두 빌드의 wasm 비교 결과를 출력합니다."""
+    from build_report import format_size
+
+    old_label = old.get("label") or os.path.basename(old["file"])
+    new_label = new.get("label") or os.path.basename(new["file"])
+    diff = diff_wasm_profiles(old, new, top)
+
+    print(f"\n🔀 wasm 비교: {old_label} → {new_label}")
+    for name, old_value, new_value in diff["totals"]:
+        is_size = "크기" in name or "섹션" in name
+        old_text = format_size(old_value) if is_size else f"{old_value:,}"
+        new_text = format_size(new_value) if is_size else f"{new_value:,}"
+        print(f"   {name}: {old_text} → {new_text} ({_format_delta(old_value, new_value, is_size)})")
+
+    changed_sections = [section for section in diff["sections"] if section[1] != section[2]]
+    if changed_sections:
+        print("   섹션 변화:")
+        for name, old_size, new_size in changed_sections:
+            print(f"      {_format_delta(old_size, new_size):>20}  {name}")
+
+    if diff["functions"]:
+        print(f"   함수 크기 변화 상위 {len(diff['functions'])}개:")
+        for name, old_size, new_size in diff["functions"]:
+            if not old_size:
+                status = "추가"
+            elif not new_size:
+                status = "삭제"
+            else:
+                status = _format_delta(old_size, new_size)
+            print(f"      {status:>20}  {name}")
+    elif not (old["has_names"] and new["has_names"]):
+        print("   ℹ️ 양쪽 빌드 모두 name 섹션이 있어야 함수별로 비교합니다")
+
+def analyze_fleet_wasm(project_names, top=DEFAULT_TOP_FUNCTIONS):
+    """여러 프로젝트의 .wasm을 분석하고 이전 빌드와의 변화를 출력합니다.
+
+    Returns:
+        list: 분석에 성공한 프로젝트의 프로파일
+    """
+    from build_metrics import get_latest_successful_build
+
+    profiles = []
+    for project_name in project_names:
+        latest_build = get_latest_successful_build(project_name)
+        label = latest_build["code_optimization"] if latest_build else None
+        profile, previous = analyze_project_wasm(project_name, label)
+        if not profile:
+            continue
+        print_wasm_analysis(profile, top)
+        if previous:
+            print_wasm_diff(previous, profile, top)
+        profiles.append(profile)
+
+    if len(profiles) > 1:
+        from build_report import format_size
+        print("\n" + "="*80)
+        print(f"📊 전체 프로젝트 wasm 크기 ({len(profiles)}개, 압축 크기 순)")
+        print("="*80)
+        for profile in sorted(profiles, key=lambda item: item["compressed_size"], reverse=True):
+            print(f"   {format_size(profile['compressed_size']):>10}  코드 {format_size(profile['code_size']):>10}  "
+                  f"함수 {profile['functions']:>7,}개  {profile['project']}")
+        print("="*80)
+    return profiles
@@ -0,0 +1,474 @@
+"""
+WebGL .data 파일 구성 분석 (UnityWebData)
+- Build/*.data.br / .data.gz / .data.unityweb / .data를 압축 해제하며 UnityWebData 헤더에서 포함된 파일 목록과 크기를 읽음
+- 포함된 data.unity3d(UnityFS 번들)는 블록 정보에서 씬(level), sharedassets, resources,
+  스트리밍 텍스처/메시(.resS), 오디오/비디오(.resource) 파일 목록까지 펼쳐서 표시
+- 압축 해제는 청크 단위 스트리밍으로 한 번만 진행하므로 .data 크기와 관계없이 메모리 사용량 일정
+- 프로젝트별 / 전체 프로젝트의 큰 파일 순위로 다운로드 크기를 늘리는 에셋을 에디터 없이 확인
+- 압축 방식은 확장자가 아니라 파일 앞부분으로 판별 (.unityweb은 gzip / brotli 모두 가능)
+- brotli 압축 파일 분석에는 brotli 패키지 필요 (pip install brotli), 없으면 해당 프로젝트만 건너뜀
+"""
+import os
+import re
+import lzma
+import zlib
+import struct
+from config import Config
+from build_report import strip_compression_suffix
+
+try:
+    import brotli
+    BROTLI_ERRORS = (brotli.error,)
+except ImportError:
+    brotli = None
+    BROTLI_ERRORS = ()
+
+# 전역 변수 참조 (호환성 유지)
+BUILD_OUTPUT_DIR = Config.BUILD_OUTPUT_DIR
+
+UNITY_WEB_DATA_MAGIC = b"UnityWebData1.0\0"
+UNITY_FS_SIGNATURE = b"UnityFS\0"
+GZIP_MAGIC = b"\x1f\x8b"
+
+# 분석 대상 파일 (우선순위 순)
+DATA_FILE_SUFFIXES = [".data.br", ".data.gz", ".data.unityweb", ".data"]
+
+# 압축 파일을 읽는 청크 크기 / 순위 출력 개수
+READ_CHUNK_SIZE = 64 * 1024
+DEFAULT_TOP_COUNT = 15
+
+# UnityFS 플래그
+FS_COMPRESSION_MASK = 0x3F
+FS_BLOCKS_INFO_AT_END = 0x80
+FS_COMPRESSION_NAMES = {0: "none", 1: "LZMA", 2: "LZ4", 3: "LZ4HC"}
+
+# 포함된 파일 분류 (경로 패턴, 분류 이름)
+ENTRY_CATEGORIES = [
+    (re.compile(r"(^|/)level\d+$"), "씬"),
+    (re.compile(r"(^|/)sharedassets\d+\.assets$"), "sharedassets"),
+    (re.compile(r"\.resS$"), "스트리밍 텍스처/메시"),
+    (re.compile(r"\.resource$"), "스트리밍 오디오/비디오"),
+    (re.compile(r"(^|/)resources\.assets$"), "Resources"),
+    (re.compile(r"(^|/)(globalgamemanagers|unity default resources|unity_default_resources|unity_builtin_extra)"), "엔진 기본 데이터"),
+    (re.compile(r"^Il2CppData/"), "IL2CPP 메타데이터"),
+    (re.compile(r"^StreamingAssets/"), "StreamingAssets"),
+    (re.compile(r"\.(json|config)$"), "설정"),
+]
+
+
+def classify_entry(path):
+    """포함된 파일 경로로 분류 이름을 반환합니다."""
+    for pattern, category in ENTRY_CATEGORIES:
+        if pattern.search(path):
+            return category
+    return "기타"
+
+def find_data_file(build_dir):
+    """프로젝트 빌드 폴더의 Build 하위에서 .data 파일을 찾습니다 (.br > .gz > .unityweb > 비압축 순).
+
+    Returns:
+        str: 파일 경로 (없으면 None)
+    """
+    build_folder = os.path.join(build_dir, "Build")
+    try:
+        names = sorted(os.listdir(build_folder))
+    except OSError:
+        return None
+    for suffix in DATA_FILE_SUFFIXES:
+        for name in names:
+            if name.lower().endswith(suffix):
+                return os.path.join(build_folder, name)
+    return None
+
+
+def detect_compression(file_path, plain_magic=None):
+    """파일 앞부분으로 압축 방식을 판별합니다.
+
+    gzip은 1f 8b로 시작하고, plain_magic(예: UnityWebData / wasm 헤더)으로 시작하면 비압축입니다.
+    brotli는 고유한 시작 바이트가 없으므로 압축 접미사(.br / .unityweb 등)가 붙은 나머지 파일을 brotli로 봅니다.
+
+    Returns:
+        str: "gzip", "brotli" 또는 None (비압축)
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(max(len(GZIP_MAGIC), len(plain_magic or b"")))
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if plain_magic and head.startswith(plain_magic):
+        return None
+    file_name = os.path.basename(file_path)
+    if strip_compression_suffix(file_name) == file_name:
+        return None
+    return "brotli"
+
+
+class DecompressedStream:
+    """압축된 파일을 앞에서부터 청크 단위로 압축 해제하며 읽는 스트림 (뒤로 이동 불가).
+
+    압축 방식은 detect_compression으로 파일 앞부분에서 판별합니다 (plain_magic: 비압축 파일의 시작 바이트).
+    """
+
+    def __init__(self, file_path, chunk_size=READ_CHUNK_SIZE, plain_magic=None):
+        compression = detect_compression(file_path, plain_magic)
+        if compression == "brotli":
+            if brotli is None:
+                raise RuntimeError("brotli 패키지가 없어 brotli 압축 파일을 압축 해제할 수 없습니다 (pip install brotli)")
+            self._decompress = brotli.Decompressor().process
+        elif compression == "gzip":
+            self._decompress = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+        else:
+            self._decompress = bytes
+        self._file = open(file_path, 'rb')
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._eof = False
+        self.position = 0
+
+    def close(self):
+        self._file.close()
+
+    def _fill(self, size):
+        while len(self._buffer) < size and not self._eof:
+            chunk = self._file.read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+                break
+            try:
+                self._buffer += self._decompress(chunk)
+            except BROTLI_ERRORS as e:
+                raise ValueError(f"brotli 압축 해제 실패 (위치 {self.position}): {e}")
+
+    def read(self, size):
+        """size 바이트를 읽습니다 (파일 끝이면 더 적게 반환)."""
+        self._fill(size)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self.position += len(data)
+        return data
+
+    def read_exact(self, size):
+        data = self.read(size)
+        if len(data) < size:
+            raise ValueError(f"파일이 예상보다 짧습니다 (위치 {self.position})")
+        return data
+
+    def skip_to(self, position):
+        """position까지 읽지 않고 건너뜁니다 (버퍼는 청크 크기 이하로 유지)."""
+        if position < self.position:
+            raise ValueError("스트림은 뒤로 이동할 수 없습니다")
+        while self.position < position:
+            step = min(position - self.position, self._chunk_size * 4)
+            if not self.read(step):
+                raise ValueError(f"파일이 예상보다 짧습니다 (위치 {self.position})")
+
+
+def _read_c_string(data, offset):
+    end = data.index(b"\0", offset)
+    return data[offset:end].decode('utf-8', errors='replace'), end + 1
+
+def parse_unity_web_data_header(stream):
+    """UnityWebData 헤더에서 포함된 파일 목록을 읽습니다.
+
+    Returns:
+        list: [{"path", "offset", "size"}, ...] (offset은 압축 해제된 .data 기준)
+    """
+    magic = stream.read_exact(len(UNITY_WEB_DATA_MAGIC))
+    if magic != UNITY_WEB_DATA_MAGIC:
+        raise ValueError("UnityWebData 파일이 아닙니다")
+    header_size = struct.unpack("<I", stream.read_exact(4))[0]
+    header = stream.read_exact(header_size - stream.position)
+
+    entries = []
+    offset = 0
+    while offset + 12 <= len(header):
+        entry_offset, entry_size, path_length = struct.unpack_from("<III", header, offset)
+        offset += 12
+        path = header[offset:offset + path_length].decode('utf-8', errors='replace')
+        offset += path_length
+        entries.append({"path": path, "offset": entry_offset, "size": entry_size})
+    return entries
+
+def _lz4_block_decompress(data, uncompressed_size):
+    """LZ4 블록을 압축 해제합니다 (UnityFS 블록 정보용, 크기가 작아 순수 Python으로 처리)."""
+    output = bytearray()
+    position = 0
+    while position < len(data):
+        token = data[position]
+        position += 1
+        literal_length = token >> 4
+        if literal_length == 15:
+            while True:
+                extra = data[position]
+                position += 1
+                literal_length += extra
+                if extra != 255:
+                    break
+        output += data[position:position + literal_length]
+        position += literal_length
+        if position >= len(data):
+            break
+
+        match_offset = data[position] | (data[position + 1] << 8)
+        position += 2
+        match_length = token & 0x0F
+        if match_length == 15:
+            while True:
+                extra = data[position]
+                position += 1
+                match_length += extra
+                if extra != 255:
+                    break
+        match_length += 4
+        start = len(output) - match_offset
+        if match_offset >= match_length:
+            output += output[start:start + match_length]
+        else:
+            for index in range(match_length):  # 겹치는 복사 (반복 패턴)
+                output.append(output[start + index])
+    if len(output) != uncompressed_size:
+        raise ValueError("LZ4 블록 크기가 맞지 않습니다")
+    return bytes(output)
+
+def _lzma_decompress(data, uncompressed_size):
+    """Unity LZMA 블록(5바이트 속성 + 원시 LZMA 데이터)을 압축 해제합니다."""
+    properties = data[0]
+    filters = [{
+        "id": lzma.FILTER_LZMA1,
+        "lc": properties % 9,
+        "lp": (properties // 9) % 5,
+        "pb": properties // 45,
+        "dict_size": struct.unpack_from("<I", data, 1)[0]
+    }]
+    decompressor = lzma.LZMADecompressor(format=lzma.FORMAT_RAW, filters=filters)
+    return decompressor.decompress(data[5:], max_length=uncompressed_size)
+
+def _decompress_block(data, compression, uncompressed_size):
+    if compression == 0:
+        return data
+    if compression == 1:
+        return _lzma_decompress(data, uncompressed_size)
+    if compression in (2, 3):
+        return _lz4_block_decompress(data, uncompressed_size)
+    raise ValueError(f"지원하지 않는 UnityFS 압축 방식: {compression}")
+
+def parse_unity_fs_bundle(stream, bundle_size, head=b""):
+    """UnityFS 번들의 블록 정보를 읽어 포함된 파일 목록을 반환합니다.
+
+    Args:
+        stream: 번들 시작 위치(head를 이미 읽었다면 그 다음)에 있는 DecompressedStream
+        bundle_size: 번들 크기
+        head: 번들 시작 부분에서 이미 읽은 바이트
+
+    Returns:
+        dict: {"version", "unity_version", "compression", "nodes": [{"path", "size"}, ...]}
+    """
+    start = stream.position - len(head)
+    prefix = head + stream.read_exact(min(bundle_size, 256) - len(head))
+    if not prefix.startswith(UNITY_FS_SIGNATURE):
+        raise ValueError("UnityFS 번들이 아닙니다")
+
+    offset = len(UNITY_FS_SIGNATURE)
+    version = struct.unpack_from(">I", prefix, offset)[0]
+    offset += 4
+    _, offset = _read_c_string(prefix, offset)
+    unity_version, offset = _read_c_string(prefix, offset)
+    _, compressed_info_size, uncompressed_info_size, flags = struct.unpack_from(">qIII", prefix, offset)
+    offset += 20
+    if version >= 7:
+        offset = (offset + 15) // 16 * 16
+
+    if flags & FS_BLOCKS_INFO_AT_END:
+        info_start = bundle_size - compressed_info_size
+    else:
+        info_start = offset
+    if info_start + compressed_info_size <= len(prefix):
+        info = prefix[info_start:info_start + compressed_info_size]
+    else:
+        consumed = stream.position - start
+        if info_start >= consumed:
+            stream.skip_to(start + info_start)
+            info = stream.read_exact(compressed_info_size)
+        else:
+            info = prefix[info_start:] + stream.read_exact(compressed_info_size - (consumed - info_start))
+
+    info = _decompress_block(info, flags & FS_COMPRESSION_MASK, uncompressed_info_size)
+
+    offset = 16  # 비압축 데이터 해시
+    block_count = struct.unpack_from(">i", info, offset)[0]
+    offset += 4
+    block_compression = None
+    for _ in range(block_count):
+        block_flags = struct.unpack_from(">H", info, offset + 8)[0]
+        if block_compression is None:
+            block_compression = block_flags & FS_COMPRESSION_MASK
+        offset += 10
+
+    node_count = struct.unpack_from(">i", info, offset)[0]
+    offset += 4
+    nodes = []
+    for _ in range(node_count):
+        _, node_size, _ = struct.unpack_from(">qqI", info, offset)
+        path, offset = _read_c_string(info, offset + 20)
+        nodes.append({"path": path, "size": node_size})
+
+    return {
+        "version": version,
+        "unity_version": unity_version,
+        "compression": FS_COMPRESSION_NAMES.get(block_compression, str(block_compression)),
+        "nodes": nodes
+    }
+
+def analyze_data_file(data_file_path):
+    """.data 파일 하나를 분석합니다 (압축 해제는 한 번, 메모리 사용량 일정).
+
+    Returns:
+        dict: {
+            "file": 파일 경로,
+            "compressed_size": 파일 크기,
+            "size": 압축 해제된 .data 크기,
+            "entries": [{"path", "size", "category", "bundle"}, ...] (번들 내부 파일 포함, 큰 순서),
+            "bundles": [{"path", "size", "unity_version", "compression"}, ...]
+        }
+    """
+    stream = DecompressedStream(data_file_path, plain_magic=UNITY_WEB_DATA_MAGIC)
+    try:
+        entries = parse_unity_web_data_header(stream)
+        result_entries = []
+        bundles = []
+        for entry in sorted(entries, key=lambda item: item["offset"]):
+            is_bundle = False
+            if entry["size"] >= len(UNITY_FS_SIGNATURE):
+                stream.skip_to(entry["offset"])
+                head = stream.read_exact(len(UNITY_FS_SIGNATURE))
+                is_bundle = head == UNITY_FS_SIGNATURE
+                if is_bundle:
+                    bundle = parse_unity_fs_bundle(stream, entry["size"], head)
+                    bundles.append({
+                        "path": entry["path"],
+                        "size": entry["size"],
+                        "unity_version": bundle["unity_version"],
+                        "compression": bundle["compression"]
+                    })
+                    for node in bundle["nodes"]:
+                        result_entries.append({
+                            "path": f"{entry['path']}/{node['path']}",
+                            "size": node["size"],
+                            "category": classify_entry(node["path"]),
+                            "bundle": entry["path"]
+                        })
+            if not is_bundle:
+                result_entries.append({
+                    "path": entry["path"],
+                    "size": entry["size"],
+                    "category": classify_entry(entry["path"]),
+                    "bundle": None
+                })
+        # 압축 해제된 전체 크기 (헤더에 기록된 마지막 파일의 끝)
+        total_size = max([entry["offset"] + entry["size"] for entry in entries] or [stream.position])
+    finally:
+        stream.close()
+
+    result_entries.sort(key=lambda item: item["size"], reverse=True)
+    return {
+        "file": data_file_path,
+        "compressed_size": os.path.getsize(data_file_path),
+        "size": total_size,
+        "entries": result_entries,
+        "bundles": bundles
+    }
+
+def analyze_project_data(project_name, build_output_dir=None):
+    """프로젝트 빌드 출력의 .data 파일을 분석합니다.
+
+    Returns:
+        dict: analyze_data_file 결과에 "project" 추가 (파일이 없거나 분석 실패 시 None)
+    """
+    build_dir = os.path.join(build_output_dir or BUILD_OUTPUT_DIR, project_name)
+    data_file_path = find_data_file(build_dir)
+    if not data_file_path:
+        print(f"⚠️ {project_name}: Build 폴더에 .data 파일이 없습니다")
+        return None
+    try:
+        analysis = analyze_data_file(data_file_path)
+    except (OSError, ValueError, RuntimeError, struct.error, lzma.LZMAError, zlib.error) as e:
+        print(f"⚠️ {project_name}: .data 분석 실패 - {e}")
+        return None
+    analysis["project"] = project_name
+    return analysis
+
+def get_category_totals(entries):
+    """분류별 크기 합계를 반환합니다 (큰 순서).
+
+    Returns:
+        list: [(분류 이름, 크기), ...]
+    """
+    totals = {}
+    for entry in entries:
+        totals[entry["category"]] = totals.get(entry["category"], 0) + entry["size"]
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+def print_data_analysis(analysis, top=DEFAULT_TOP_COUNT):
+    """프로젝트 하나의 .data 구성을 출력합니다."""
+    from build_report import format_size
+
+    print(f"\n📦 {analysis['project']}: {os.path.basename(analysis['file'])} "
+          f"(압축 {format_size(analysis['compressed_size'])} / 압축 해제 {format_size(analysis['size'])})")
+    for bundle in analysis["bundles"]:
+        print(f"   🗃️ 번들 {bundle['path']}: {format_size(bundle['size'])} "
+              f"(Unity {bundle['unity_version']}, 블록 압축 {bundle['compression']})")
+
+    # 비율은 포함된 파일 크기 합계 기준 (번들 블록이 압축된 경우 내부 파일 크기 합이 .data보다 클 수 있음)
+    total = sum(entry["size"] for entry in analysis["entries"]) or 1
+    print("   분류별 크기:")
+    for category, size in get_category_totals(analysis["entries"]):
+        print(f"      {format_size(size):>10}  {size / total * 100:5.1f}%  {category}")
+
+    print(f"   큰 파일 상위 {min(top, len(analysis['entries']))}개:")
+    for entry in analysis["entries"][:top]:
+        print(f"      {format_size(entry['size']):>10}  {entry['size'] / total * 100:5.1f}%  {entry['path']}")
+
+def print_fleet_data_report(analyses, top=DEFAULT_TOP_COUNT):
+    """전체 프로젝트의 .data 크기 순위, 분류별 합계, 큰 파일 순위를 출력합니다."""
+    from build_report import format_size
+
+    analyses = [analysis for analysis in analyses if analysis]
+    if not analyses:
+        print("ℹ️ 분석할 .data 파일이 없습니다")
+        return
+
+    print("\n" + "="*80)
+    print(f"📊 전체 프로젝트 .data 분석 ({len(analyses)}개)")
+    print("="*80)
+
+    print("프로젝트별 크기 (압축 / 압축 해제):")
+    for analysis in sorted(analyses, key=lambda item: item["compressed_size"], reverse=True):
+        print(f"   {format_size(analysis['compressed_size']):>10} / {format_size(analysis['size']):>10}  {analysis['project']}")
+
+    all_entries = [dict(entry, project=analysis["project"]) for analysis in analyses for entry in analysis["entries"]]
+    fleet_total = sum(entry["size"] for entry in all_entries) or 1
+    print("\n분류별 합계:")
+    for category, size in get_category_totals(all_entries):
+        print(f"   {format_size(size):>10}  {size / fleet_total * 100:5.1f}%  {category}")
+
+    print(f"\n전체 프로젝트 큰 파일 상위 {min(top, len(all_entries))}개:")
+    all_entries.sort(key=lambda item: item["size"], reverse=True)
+    for entry in all_entries[:top]:
+        print(f"   {format_size(entry['size']):>10}  {entry['project']}: {entry['path']}")
+    print("="*80)
+
+def analyze_fleet_data(project_names, top=DEFAULT_TOP_COUNT, build_output_dir=None):
+    """여러 프로젝트의 .data를 분석하고 프로젝트별 / 전체 보고서를 출력합니다.
+
+    Returns:
+        list: 분석에 성공한 프로젝트의 analyze_project_data 결과
+    """
+    if brotli is None:
+        print("ℹ️ brotli 패키지가 없어 brotli 압축 .data 파일(.data.br 등)은 분석하지 않습니다 (pip install brotli)")
+    analyses = []
+    for project_name in project_names:
+        analysis = analyze_project_data(project_name, build_output_dir)
+        if analysis:
+            print_data_analysis(analysis, top)
+            analyses.append(analysis)
+    print_fleet_data_report(analyses, top)
+    return analyses